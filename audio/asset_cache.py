@@ -0,0 +1,233 @@
+"""
+Decoded audio asset cache.
+
+Creating a ``pygame.mixer.Sound`` from a file decodes the whole file, which
+takes hundreds of milliseconds for a music track on slow hardware. The cache
+keeps decoded sounds keyed by path and modification time, evicts the least
+recently used ones once a memory budget is exceeded, and can be pre-warmed
+from a background thread right after the asset scan.
+
+Long music tracks are not decoded at all: ``StreamedTrack`` plays them
+through ``pygame.mixer.music``, which streams from disk, behind the same
+``play``/``set_volume``/``get_busy``/``stop`` calls the crossfade uses for a
+``Sound`` and its channel.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough decoded-to-file size ratio for compressed formats (128-160 kbps
+# against 1411 kbps CD-quality PCM)
+_COMPRESSED_RATIO = 10
+_COMPRESSED_SUFFIXES = {'.mp3', '.ogg'}
+
+
+def estimate_decoded_bytes(path: Path) -> int:
+    """Guess how much memory *path* takes once decoded to PCM."""
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return 0
+    if path.suffix.lower() in _COMPRESSED_SUFFIXES:
+        return size * _COMPRESSED_RATIO
+    return size
+
+
+class AudioAssetCache:
+    """
+    LRU cache of decoded sounds bounded by an approximate byte budget.
+
+    *loader* decodes a path into a sound object and *size_of* reports how
+    many bytes that object holds. Both run outside the cache lock, so a slow
+    decode never blocks lookups of other assets.
+    """
+
+    def __init__(self, budget_bytes: int, loader: Callable[[Path], Any],
+                 size_of: Callable[[Any], int]):
+        self.budget_bytes = budget_bytes
+        self._loader = loader
+        self._size_of = size_of
+        # str(path) -> (mtime_ns, sound, nbytes), oldest first
+        self._entries: "OrderedDict[str, Tuple[int, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _mtime(path: Path) -> int:
+        return path.stat().st_mtime_ns
+
+    def _lookup(self, key: str, mtime: int) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != mtime:
+                # File changed on disk: forget the stale decode
+                del self._entries[key]
+                self._bytes -= entry[2]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get(self, path: Path) -> Any:
+        """Return the decoded sound for *path*, decoding it on a miss."""
+        path = Path(path)
+        key, mtime = str(path), self._mtime(path)
+        sound = self._lookup(key, mtime)
+        with self._lock:
+            if sound is not None:
+                self.hits += 1
+                return sound
+            self.misses += 1
+        sound = self._loader(path)
+        self._store(key, mtime, sound, self._size_of(sound))
+        return sound
+
+    def _store(self, key: str, mtime: int, sound: Any, nbytes: int) -> None:
+        if nbytes > self.budget_bytes:
+            return  # Never cache something that would evict everything else
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (mtime, sound, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.budget_bytes and len(self._entries) > 1:
+                _key, (_mtime, _sound, size) = self._entries.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+
+    def _used_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def contains(self, path: Path) -> bool:
+        """True if *path* is cached and unchanged on disk."""
+        try:
+            mtime = self._mtime(Path(path))
+        except OSError:
+            return False
+        with self._lock:
+            entry = self._entries.get(str(path))
+            return entry is not None and entry[0] == mtime
+
+    def prewarm(self, paths: Iterable[Path]) -> int:
+        """
+        Decode *paths* in order until the budget is full.
+
+        Unlike ``get``, pre-warming never evicts: assets that do not fit are
+        left to be decoded on first use. Returns how many were decoded.
+        """
+        loaded = 0
+        for path in paths:
+            path = Path(path)
+            if self.contains(path):
+                continue
+            if self._used_bytes() + estimate_decoded_bytes(path) > self.budget_bytes:
+                continue
+            try:
+                mtime = self._mtime(path)
+                sound = self._loader(path)
+            except Exception:
+                logger.debug("Could not pre-warm %s", path, exc_info=True)
+                continue
+            nbytes = self._size_of(sound)
+            if self._used_bytes() + nbytes > self.budget_bytes:
+                continue
+            self._store(str(path), mtime, sound, nbytes)
+            loaded += 1
+        return loaded
+
+    def start_prewarm(self, paths: Iterable[Path]) -> threading.Thread:
+        """Run ``prewarm`` on a background daemon thread."""
+        paths = list(paths)
+        thread = threading.Thread(target=self.prewarm, args=(paths,),
+                                  name="audio-prewarm", daemon=True)
+        self._prewarm_thread = thread
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        """Drop every cached sound."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache counters for diagnostics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class StreamedTrack:
+    """
+    A long music track streamed through ``pygame.mixer.music``.
+
+    Acts as both the sound and the channel in the crossfade code: ``play``
+    returns the track itself, whose ``get_busy`` reports the stream state.
+    Only one track streams at a time; calls on a track that has since been
+    replaced are ignored.  Every use of ``pygame.mixer.music`` goes through
+    this class, so a newer stream always knows what it replaced.
+    """
+
+    _active: Optional["StreamedTrack"] = None
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._volume = 1.0
+
+    @staticmethod
+    def _music():
+        import pygame
+        return pygame.mixer.music
+
+    def play(self, loops: int = 0) -> "StreamedTrack":
+        music = self._music()
+        music.load(str(self.path))
+        music.set_volume(self._volume)
+        music.play(loops)
+        StreamedTrack._active = self
+        return self
+
+    def get_busy(self) -> bool:
+        return StreamedTrack._active is self and bool(self._music().get_busy())
+
+    def get_volume(self) -> float:
+        return self._volume
+
+    def set_volume(self, volume: float) -> None:
+        self._volume = volume
+        if StreamedTrack._active is self:
+            self._music().set_volume(volume)
+
+    def stop(self) -> None:
+        if StreamedTrack._active is self:
+            self._music().stop()
+            StreamedTrack._active = None
+
+    @classmethod
+    def stop_active(cls) -> None:
+        """Stop whichever track is streaming, if any."""
+        active = cls._active
+        if active is not None:
+            active.stop()
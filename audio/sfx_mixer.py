@@ -0,0 +1,336 @@
+"""
+Synthesised sound-effect rendering and the audio dispatcher thread.
+
+``SoundEngine.play_sound`` used to start a thread per effect and synthesise
+every tone sample by sample with ``math.sin``. This module splits that work:
+
+- ``render_tones`` turns a ``SOUND_EFFECTS`` entry into one interleaved
+  stereo int16 buffer (vectorised with NumPy when it is installed).
+- ``EffectCache`` renders each effect once and keeps the PCM and the mixer
+  ``Sound`` built from it, so playing an effect is a dictionary lookup.
+- ``AudioDispatcher`` is a single long-lived thread with a bounded command
+  queue and a timer heap. Every playback call and every timed quack sequence
+  runs on it instead of on its own thread.
+- ``VoiceLimiter`` caps simultaneous effects, stealing a lower-priority voice
+  or dropping the new sound when the mixer is busy.
+
+Usage::
+
+    cache = EffectCache(SOUND_EFFECTS, make_sound=lambda pcm: Sound(buffer=pcm))
+    dispatcher = AudioDispatcher(idle=cache.warm_next)
+    dispatcher.submit(lambda: limiter.play(cache.sound(key), priority))
+    dispatcher.schedule(0.25, quack, SoundPriority.MEDIUM)
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import queue
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from audio.sound_effects import SoundPriority
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 44100
+SFX_GAIN = 0.15  # Synth SFX are scaled down so they don't overpower music
+
+Tone = Tuple[float, float]  # (frequency Hz, duration seconds)
+
+
+# ── Rendering ─────────────────────────────────────────────────────────────
+
+
+def _render_tone_numpy(np, freq: float, duration: float, amplitude: float,
+                       sample_rate: int):
+    n_samples = int(sample_rate * duration)
+    i = np.arange(n_samples, dtype=np.float64)
+    val = np.sin(2 * math.pi * freq * i / sample_rate)
+    fade_len = min(int(n_samples * 0.1), 200)
+    if fade_len > 0:
+        val[:fade_len] *= i[:fade_len] / fade_len
+        tail = i[n_samples - fade_len:]
+        val[n_samples - fade_len:] *= (n_samples - 1 - tail) / fade_len
+    # astype truncates toward zero, like int()
+    return np.repeat((val * amplitude).astype(np.int16), 2)
+
+
+def _render_tone_python(freq: float, duration: float, amplitude: float,
+                        sample_rate: int) -> array:
+    n_samples = int(sample_rate * duration)
+    fade_len = min(int(n_samples * 0.1), 200)
+    buf = array('h', bytes(4 * n_samples))
+    for i in range(n_samples):
+        val = math.sin(2 * math.pi * freq * i / sample_rate)
+        if fade_len > 0:
+            if i < fade_len:
+                val *= i / fade_len
+            elif i >= n_samples - fade_len:
+                val *= (n_samples - 1 - i) / fade_len
+        sample = int(val * amplitude)
+        buf[2 * i] = sample
+        buf[2 * i + 1] = sample
+    return buf
+
+
+def render_tones(tones: Sequence[Tone], gain: float = SFX_GAIN,
+                 sample_rate: int = SAMPLE_RATE) -> bytes:
+    """
+    Render a sequence of tones back to back as interleaved stereo int16 PCM.
+
+    Each tone is a sine with a short linear fade in and out, matching the
+    historical per-call synthesis. Volume is left to the mixer channel, so
+    the buffer only carries the fixed SFX *gain*.
+    """
+    amplitude = 32767 * gain
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        parts = [_render_tone_numpy(np, freq, duration, amplitude, sample_rate)
+                 for freq, duration in tones]
+        if not parts:
+            return b""
+        return np.concatenate(parts).tobytes()
+    return b"".join(_render_tone_python(freq, duration, amplitude, sample_rate).tobytes()
+                    for freq, duration in tones)
+
+
+class EffectCache:
+    """
+    Renders each effect once and memoises the PCM and its mixer sound.
+
+    *make_sound* turns PCM bytes into a playable object (a
+    ``pygame.mixer.Sound``); it is only called on the dispatcher thread.
+    """
+
+    def __init__(self, effects: Dict[Hashable, Sequence[Tone]],
+                 make_sound: Optional[Callable[[bytes], Any]] = None,
+                 render: Callable[[Sequence[Tone]], bytes] = render_tones):
+        self._effects = effects
+        self._make_sound = make_sound
+        self._render = render
+        self._pcm: Dict[Hashable, bytes] = {}
+        self._sounds: Dict[Hashable, Any] = {}
+        self._unwarmed: List[Hashable] = list(effects)
+
+    def pcm(self, key: Hashable) -> bytes:
+        """Return the rendered PCM for *key*, rendering it on first use."""
+        pcm = self._pcm.get(key)
+        if pcm is None:
+            pcm = self._pcm[key] = self._render(self._effects[key])
+        return pcm
+
+    def sound(self, key: Hashable) -> Any:
+        """Return the mixer sound for *key*, building it on first use."""
+        sound = self._sounds.get(key)
+        if sound is None:
+            pcm = self.pcm(key)
+            sound = self._sounds[key] = self._make_sound(pcm) if self._make_sound else pcm
+        return sound
+
+    def warm_next(self) -> bool:
+        """Build one not-yet-used effect. Returns False once all are built."""
+        while self._unwarmed:
+            key = self._unwarmed.pop()
+            if key not in self._sounds:
+                self.sound(key)
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+
+# ── Voice limiting ────────────────────────────────────────────────────────
+
+
+class VoiceLimiter:
+    """
+    Caps how many effects play at once.
+
+    A voice is any channel-like object with ``get_busy()`` and ``stop()``.
+    When every slot is busy, the quietest-ranked voice (lowest priority,
+    then oldest) is stopped if the new sound outranks it; otherwise the new
+    sound is dropped.
+    """
+
+    def __init__(self, max_voices: int = 6):
+        self.max_voices = max(1, max_voices)
+        self._voices: List[Tuple[int, int, Any]] = []  # (priority, seq, channel)
+        self._seq = itertools.count()
+        self.stolen = 0
+        self.dropped = 0
+
+    def _prune(self) -> None:
+        self._voices = [v for v in self._voices if v[2].get_busy()]
+
+    def active(self) -> int:
+        """Number of voices still playing."""
+        self._prune()
+        return len(self._voices)
+
+    def acquire(self, priority: SoundPriority) -> bool:
+        """Make room for a sound of *priority*. False means drop it."""
+        self._prune()
+        if len(self._voices) < self.max_voices:
+            return True
+        victim = min(self._voices, key=lambda v: (v[0], v[1]))
+        if victim[0] >= priority.value:
+            self.dropped += 1
+            return False
+        self._voices.remove(victim)
+        try:
+            victim[2].stop()
+        except Exception:
+            pass
+        self.stolen += 1
+        return True
+
+    def track(self, channel: Any, priority: SoundPriority) -> None:
+        """Register a channel that just started playing."""
+        if channel is not None:
+            self._voices.append((priority.value, next(self._seq), channel))
+
+    def play(self, sound: Any, priority: SoundPriority,
+             volume: Optional[float] = None) -> Any:
+        """Play *sound* if a voice is available; returns its channel or None."""
+        if not self.acquire(priority):
+            return None
+        channel = sound.play()
+        if channel is not None and volume is not None:
+            channel.set_volume(volume)
+        self.track(channel, priority)
+        return channel
+
+
+# ── Dispatcher thread ─────────────────────────────────────────────────────
+
+
+class AudioDispatcher:
+    """
+    One background thread that runs audio commands in order.
+
+    Commands go through a bounded queue; ``schedule`` adds a delay, kept in
+    a timer heap on the dispatcher thread. When the queue is half full,
+    low-priority commands are refused so footsteps and menu blips never
+    crowd out quacks and stingers. *idle* is called whenever there is
+    nothing else to do and should return True while it has more work.
+    """
+
+    def __init__(self, max_queue: int = 32, idle: Optional[Callable[[], bool]] = None,
+                 name: str = "sfx-dispatcher"):
+        self._queue: "queue.Queue[Optional[Tuple[float, int, Callable[[], Any]]]]" = \
+            queue.Queue(maxsize=max(2, max_queue))
+        self._idle = idle
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._running = False
+        self._timers: List[Tuple[float, int, int, Callable[[], Any]]] = []
+        self._seq = itertools.count()
+        self.dropped = 0
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name=self._name,
+                                                daemon=True)
+                self._thread.start()
+
+    def submit(self, fn: Callable[[], Any],
+               priority: SoundPriority = SoundPriority.MEDIUM) -> bool:
+        """Run *fn* on the dispatcher thread. False if it was dropped."""
+        return self.schedule(0.0, fn, priority)
+
+    def schedule(self, delay: float, fn: Callable[[], Any],
+                 priority: SoundPriority = SoundPriority.MEDIUM) -> bool:
+        """Run *fn* after *delay* seconds. False if it was dropped."""
+        self._ensure_started()
+        if priority.value <= SoundPriority.LOW.value and \
+                self._queue.qsize() * 2 >= self._queue.maxsize:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic() + delay, priority.value, fn))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _push_timer(self, entry: Tuple[float, int, Callable[[], Any]]) -> None:
+        due, priority, fn = entry
+        heapq.heappush(self._timers, (due, -priority, next(self._seq), fn))
+
+    def _drain(self, timeout: Optional[float]) -> bool:
+        """Move queued commands onto the timer heap. False on shutdown."""
+        try:
+            if timeout is None:
+                entry = self._queue.get()           # Nothing to do: sleep until work arrives
+            elif timeout <= 0:
+                entry = self._queue.get_nowait()
+            else:
+                entry = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return True
+        while entry is not None:
+            self._push_timer(entry)
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                return True
+        return False
+
+    def _run(self) -> None:
+        idle_work = self._idle is not None
+        while self._running:
+            timeout: Optional[float] = None
+            if idle_work:
+                timeout = 0.0
+            elif self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.monotonic())
+            if not self._drain(timeout):
+                break
+
+            ran = False
+            now = time.monotonic()
+            while self._running and self._timers and self._timers[0][0] <= now:
+                fn = heapq.heappop(self._timers)[3]
+                ran = True
+                try:
+                    fn()
+                except Exception:
+                    logger.debug("Audio command failed", exc_info=True)
+            if idle_work and not ran:
+                try:
+                    idle_work = bool(self._idle())
+                except Exception:
+                    logger.debug("Audio idle task failed", exc_info=True)
+                    idle_work = False
+
+    def pending(self) -> int:
+        """Commands queued or waiting on a timer."""
+        return self._queue.qsize() + len(self._timers)
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the thread, discarding anything not yet run."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._running = False
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # The thread is awake draining the queue and sees the flag
+        thread.join(timeout=timeout)
+        self._thread = None
+        self._timers = []
@@ -24,6 +24,10 @@ import random
 
 os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 
+from audio.asset_cache import AudioAssetCache, StreamedTrack, estimate_decoded_bytes
+from audio.sfx_mixer import AudioDispatcher, EffectCache, VoiceLimiter
+from audio.sound_effects import SoundPriority
+from config import AUDIO_CACHE_BYTES, MUSIC_STREAM_BYTES, SFX_MAX_VOICES, SFX_QUEUE_SIZE
 from core.event_bus import event_bus, ActionPerformedEvent, ItemUsedEvent, AchievementUnlockedEvent
 
 # Configure logging for sound system
@@ -104,6 +108,18 @@ SOUND_EFFECTS = {
     SoundType.STINGER_MILESTONE: [(523, 0.1), (784, 0.1), (1047, 0.1), (784, 0.1), (1047, 0.25)],
 }
 
+# Voice priority under load; anything not listed is MEDIUM
+_EFFECT_PRIORITY = {
+    SoundType.STEP: SoundPriority.LOW,
+    SoundType.MUSIC_NOTE: SoundPriority.LOW,
+    SoundType.ALERT: SoundPriority.HIGH,
+    SoundType.LEVEL_UP: SoundPriority.HIGH,
+    SoundType.STINGER_ACHIEVEMENT: SoundPriority.HIGH,
+    SoundType.STINGER_SEASON_CHANGE: SoundPriority.HIGH,
+    SoundType.STINGER_FRIEND_ARRIVE: SoundPriority.HIGH,
+    SoundType.STINGER_MILESTONE: SoundPriority.HIGH,
+}
+
 
 class MusicContext(Enum):
     """Context that determines which background music plays."""
@@ -271,6 +287,7 @@ class SoundEngine:
         self._crossfade_thread = None
         self._music_sound = None  # pygame Sound object for current music
         self._music_channel = None  # pygame Channel for current music
+        self._background_track: Optional[StreamedTrack] = None  # looping background stream
         self._music_cooldown_until: float = 0  # timestamp when cooldown expires
         self._event_music_end_time: float = 0  # timestamp when event music expires
         # Audio directory — project root where audio files live
@@ -278,6 +295,13 @@ class SoundEngine:
         # Radio player instance (lazy-loaded)
         self._radio = None
         self._radio_was_playing = None
+        # Synth effects are rendered once and played from one dispatcher thread
+        self._effect_cache = EffectCache(SOUND_EFFECTS, make_sound=self._make_effect_sound)
+        self._voices = VoiceLimiter(SFX_MAX_VOICES)
+        self._dispatcher = AudioDispatcher(max_queue=SFX_QUEUE_SIZE, idle=self._warm_effects)
+        # Decoded WAV/music files, keyed by path and mtime
+        self._asset_cache = AudioAssetCache(
+            AUDIO_CACHE_BYTES, loader=self._decode_sound, size_of=self._sound_nbytes)
         self._detect_capabilities()
 
     @classmethod
@@ -396,6 +420,55 @@ class SoundEngine:
                     self._available_music[music_file.stem.lower()] = music_file
                     logger.debug("Found music: %s", music_file.name)
 
+        if self._pygame_available:
+            self._asset_cache.start_prewarm(self._prewarm_paths())
+
+    def _prewarm_paths(self):
+        """Assets worth decoding ahead of time: SFX first, then short music."""
+        seen = set()
+        sfx = [p for p in self._available_wavs.values()
+               if not (p in seen or seen.add(p))]
+        music = [p for p in self._available_music.values()
+                 if not (p in seen or seen.add(p)) and not self._should_stream(p)]
+        return sfx + music
+
+    @staticmethod
+    def _should_stream(path: Path) -> bool:
+        """True for music too large to keep decoded in memory."""
+        return estimate_decoded_bytes(path) > MUSIC_STREAM_BYTES
+
+    def _decode_sound(self, path: Path):
+        """Decode an audio file into a pygame Sound."""
+        import pygame
+        return pygame.mixer.Sound(str(path))
+
+    @staticmethod
+    def _sound_nbytes(sound) -> int:
+        """Bytes held by a decoded pygame Sound."""
+        import pygame
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, fmt, channels = init
+        return int(sound.get_length() * frequency * channels * (abs(fmt) // 8))
+
+    def _load_music_track(self, path: Path):
+        """A playable music track: cached Sound, or a stream for long files."""
+        if self._should_stream(path):
+            return StreamedTrack(path)
+        return self._asset_cache.get(path)
+
+    def _play_background_track(self, path: Path, loops: int) -> None:
+        """Stream *path* as background music, replacing any other stream."""
+        track = StreamedTrack(path)
+        track.set_volume(self.music_volume)
+        track.play(loops)
+        self._background_track = track
+
+    def get_asset_cache_stats(self) -> Dict[str, int]:
+        """Counters for the decoded-asset cache."""
+        return self._asset_cache.get_stats()
+
     def play_background_music(self, track_name: str = None):
         """Play background music. Uses pygame streaming for MP3/OGG, or WAV player."""
         if not self.enabled or self.music_muted:
@@ -423,10 +496,7 @@ class SoundEngine:
         # Use pygame for music (supports MP3/OGG streaming)
         if self._pygame_available:
             try:
-                import pygame
-                pygame.mixer.music.load(str(music_path))
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
+                self._play_background_track(music_path, -1)  # Loop indefinitely
                 self._music_playing = True
                 logger.debug("Playing music: %s", track_name)
                 return
@@ -440,10 +510,10 @@ class SoundEngine:
     def stop_background_music(self):
         """Stop background music."""
         self._music_playing = False
+        self._background_track = None
         if self._pygame_available:
             try:
-                import pygame
-                pygame.mixer.music.stop()
+                StreamedTrack.stop_active()
             except Exception:
                 pass
         self.stop_music()
@@ -469,11 +539,10 @@ class SoundEngine:
                 self._music_sound.set_volume(self.music_volume)
             except Exception:
                 pass
-        # Update pygame streaming music volume if playing
-        if self._pygame_available:
+        # Update the background stream volume if playing
+        if self._background_track:
             try:
-                import pygame
-                pygame.mixer.music.set_volume(self.music_volume)
+                self._background_track.set_volume(self.music_volume)
             except Exception:
                 pass
 
@@ -708,7 +777,6 @@ class SoundEngine:
 
             def do_crossfade():
                 try:
-                    import pygame
                     fade_duration = 2.0  # 2 second crossfade
                     steps = 20
                     step_duration = fade_duration / steps
@@ -743,7 +811,7 @@ class SoundEngine:
                     music_path = self._available_music.get(audio_file)
                     if music_path and music_path.exists():
                         try:
-                            new_sound = pygame.mixer.Sound(str(music_path))
+                            new_sound = self._load_music_track(music_path)
                             new_sound.set_volume(0)
                             new_channel = new_sound.play(loops=0)  # Play once only
                             if new_channel is None:
@@ -865,7 +933,8 @@ class SoundEngine:
         """Get the current music context."""
         return self._current_context
 
-    def play_wav(self, wav_name: str, volume: Optional[float] = None):
+    def play_wav(self, wav_name: str, volume: Optional[float] = None,
+                 priority: SoundPriority = SoundPriority.MEDIUM):
         """Play a WAV file if available."""
         if not self.enabled:
             return
@@ -878,62 +947,43 @@ class SoundEngine:
 
         # Prefer pygame for proper volume control
         if self._pygame_available:
-            def play_pygame():
-                try:
-                    import pygame
-                    sound = pygame.mixer.Sound(str(wav_path))
-                    sound.set_volume(vol)
-                    sound.play()
-                except Exception:
-                    pass
-            thread = threading.Thread(target=play_pygame)
-            thread.daemon = True
-            thread.start()
+            self._dispatcher.submit(
+                lambda: self._play_wav_now(wav_path, vol, priority), priority)
             return
 
         # Fallback to system player
         if not self._wav_player:
             return
+        self._dispatcher.submit(
+            lambda: self._spawn_wav_player(wav_path, vol), priority)
 
-        def play():
-            try:
-                if self._wav_player == 'pw-play':
-                    pw_vol = max(0.0, min(1.0, vol))
-                    subprocess.run(
-                        ['pw-play', '--volume', str(pw_vol), str(wav_path)],
-                        capture_output=True,
-                        timeout=10
-                    )
-                elif self._wav_player == 'paplay':
-                    # PulseAudio volume is 0-65536
-                    pa_volume = int(vol * 65536)
-                    subprocess.run(
-                        ['paplay', '--volume', str(pa_volume), str(wav_path)],
-                        capture_output=True,
-                        timeout=10
-                    )
-                elif self._wav_player == 'aplay':
-                    subprocess.run(
-                        ['aplay', '-q', str(wav_path)],
-                        capture_output=True,
-                        timeout=10
-                    )
-                elif self._wav_player == 'ffplay':
-                    volume_arg = f"volume={vol}"
-                    subprocess.run(
-                        ['ffplay', '-nodisp', '-autoexit', '-volume', str(int(vol * 100)),
-                         str(wav_path)],
-                        capture_output=True,
-                        stderr=subprocess.DEVNULL,
-                        timeout=10
-                    )
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                pass  # Silently fail if playback issues
-
-        # Play in background thread
-        thread = threading.Thread(target=play)
-        thread.daemon = True
-        thread.start()
+    def _play_wav_now(self, wav_path: Path, vol: float, priority: SoundPriority):
+        """Play a cached WAV through pygame (runs on the audio thread)."""
+        try:
+            sound = self._asset_cache.get(wav_path)
+            self._voices.play(sound, priority, volume=vol)
+        except Exception:
+            pass
+
+    def _spawn_wav_player(self, wav_path: Path, vol: float):
+        """Start the system WAV player without waiting for it to finish."""
+        if self._wav_player == 'pw-play':
+            pw_vol = max(0.0, min(1.0, vol))
+            cmd = ['pw-play', '--volume', str(pw_vol), str(wav_path)]
+        elif self._wav_player == 'paplay':
+            # PulseAudio volume is 0-65536
+            cmd = ['paplay', '--volume', str(int(vol * 65536)), str(wav_path)]
+        elif self._wav_player == 'aplay':
+            cmd = ['aplay', '-q', str(wav_path)]
+        elif self._wav_player == 'ffplay':
+            cmd = ['ffplay', '-nodisp', '-autoexit', '-volume', str(int(vol * 100)),
+                   str(wav_path)]
+        else:
+            return
+        try:
+            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (FileNotFoundError, OSError):
+            pass  # Silently fail if playback issues
 
     def play_wav_music(self, wav_name: str, loop: bool = False):
         """Play a WAV file as background music, optionally looping."""
@@ -950,11 +1000,7 @@ class SoundEngine:
         # Prefer pygame for music (proper volume control, no subprocess)
         if self._pygame_available:
             try:
-                import pygame
-                pygame.mixer.music.load(str(wav_path))
-                pygame.mixer.music.set_volume(self.music_volume)
-                loops = -1 if loop else 0
-                pygame.mixer.music.play(loops)
+                self._play_background_track(wav_path, -1 if loop else 0)
                 logger.debug("Playing WAV music via pygame: %s", wav_name)
                 return
             except Exception as e:
@@ -1062,9 +1108,9 @@ class SoundEngine:
     def play_sound(self, sound_type):
         """Play a sound effect. Accepts SoundType enum or string.
 
-        Uses pygame to generate synthesized tones from the SOUND_EFFECTS
-        definitions. Falls back to terminal beep methods if pygame is
-        unavailable.
+        Plays the SOUND_EFFECTS tones from a cache of pre-rendered buffers on
+        the audio dispatcher thread. Falls back to terminal beep methods if
+        pygame is unavailable.
         """
         if not self.enabled:
             return
@@ -1091,43 +1137,50 @@ class SoundEngine:
         if not effects:
             return
 
-        # Try pygame sine-wave synthesis
+        priority = _EFFECT_PRIORITY.get(sound_type, SoundPriority.MEDIUM)
         if self._pygame_available:
-            def _play_tones():
-                try:
-                    import pygame
-                    import array
-                    import math
-                    sample_rate = 44100
-                    for freq, duration in effects:
-                        n_samples = int(sample_rate * duration)
-                        fade_len = min(int(n_samples * 0.1), 200)
-                        buf = array.array('h')  # signed short
-                        for i in range(n_samples):
-                            val = math.sin(2 * math.pi * freq * i / sample_rate)
-                            # Apply fade envelope
-                            if fade_len > 0:
-                                if i < fade_len:
-                                    val *= i / fade_len
-                                elif i >= n_samples - fade_len:
-                                    val *= (n_samples - 1 - i) / fade_len
-                            # Scale down synth SFX so they don't overpower music
-                            sample = int(val * 32767 * self.volume * 0.15)
-                            buf.append(sample)  # left
-                            buf.append(sample)  # right
-                        sound = pygame.mixer.Sound(buffer=buf)
-                        sound.play()
-                        pygame.time.wait(int(duration * 1000))
-                except Exception:
-                    pass
-
-            thread = threading.Thread(target=_play_tones, daemon=True)
-            thread.start()
+            self._dispatcher.submit(
+                lambda: self._play_effect_now(sound_type, priority), priority)
             return
 
-        # Fallback to beep/bell methods
-        for freq, duration in effects:
-            self.play_tone(freq, duration)
+        # Fallback to beep/bell methods, which block while the tone sounds
+        def _play_tones():
+            for freq, duration in effects:
+                self.play_tone(freq, duration)
+        self._dispatcher.submit(_play_tones, priority)
+
+    def _make_effect_sound(self, pcm: bytes):
+        """Wrap rendered effect PCM in a pygame Sound."""
+        import pygame
+        return pygame.mixer.Sound(buffer=pcm)
+
+    def _warm_effects(self) -> bool:
+        """Dispatcher idle task: build effect sounds ahead of first use."""
+        return self._pygame_available and self._effect_cache.warm_next()
+
+    def _play_effect_now(self, sound_type: SoundType, priority: SoundPriority):
+        """Play a cached synth effect (runs on the audio thread)."""
+        try:
+            sound = self._effect_cache.sound(sound_type)
+        except Exception:
+            logger.debug("Could not build sound effect %s", sound_type, exc_info=True)
+            return
+        self._voices.play(sound, priority, volume=self.volume)
+
+    def schedule(self, delay: float, fn, priority: SoundPriority = SoundPriority.MEDIUM) -> bool:
+        """Run *fn* on the audio thread after *delay* seconds."""
+        return self._dispatcher.schedule(delay, fn, priority)
+
+    def get_sfx_stats(self) -> Dict[str, int]:
+        """Counters for the effect dispatcher and voice limiter."""
+        return {
+            "pending": self._dispatcher.pending(),
+            "queue_dropped": self._dispatcher.dropped,
+            "voices_active": self._voices.active(),
+            "voices_stolen": self._voices.stolen,
+            "voices_dropped": self._voices.dropped,
+            "effects_cached": len(self._effect_cache),
+        }
 
     def play_melody(self, melody_name: str, loop: bool = False):
         """Play a melody. Disabled - use play_background_music() instead."""
@@ -1215,6 +1268,8 @@ class SoundEngine:
         except Exception:
             pass
         self.stop_music()
+        self._dispatcher.shutdown()
+        self._asset_cache.clear()
         # Shutdown the shared thread pool executor
         if SoundEngine._sound_executor is not None:
             SoundEngine._sound_executor.shutdown(wait=False)
@@ -1264,6 +1319,10 @@ def count_syllables(text: str) -> int:
     return max(1, total_syllables)  # At least 1 syllable
 
 
+# SOS panic rhythm: (gap after each of 3 quacks, pause after the group)
+_SOS_TIMING = ((0.1, 0.15), (0.25, 0.15), (0.1, 0.6))
+
+
 class DuckSounds:
     """
     Duck-specific sound effects.
@@ -1271,8 +1330,8 @@ class DuckSounds:
 
     def __init__(self, engine: SoundEngine):
         self.engine = engine
-        self._quack_thread = None
         self._panic_active = False
+        self._panic_generation = 0
 
     def quack(self, mood: str = "normal"):
         """Play a quack sound based on mood."""
@@ -1303,17 +1362,11 @@ class DuckSounds:
         # Cap at reasonable number to avoid spam
         syllables = min(syllables, 15)
 
-        def _quack_sequence():
-            for i in range(syllables):
-                self.quack(mood)
-                if i < syllables - 1:
-                    # Vary timing slightly for natural feel
-                    delay = 0.15 + random.uniform(-0.03, 0.05)
-                    time.sleep(delay)
-
-        # Run in thread to not block game
-        self._quack_thread = threading.Thread(target=_quack_sequence, daemon=True)
-        self._quack_thread.start()
+        delay = 0.0
+        for _ in range(syllables):
+            self.engine.schedule(delay, lambda: self.quack(mood))
+            # Vary timing slightly for natural feel
+            delay += 0.15 + random.uniform(-0.03, 0.05)
 
     def eat(self):
         """Play eating sound."""
@@ -1359,30 +1412,26 @@ class DuckSounds:
     def panic(self):
         """Play repeating SOS quack pattern until stop_panic() is called."""
         self._panic_active = True
-        def _panic_loop():
-            while self._panic_active:
-                # SOS: 3 short, 3 long, 3 short
-                for _ in range(3):
-                    if not self._panic_active:
-                        return
-                    self.quack("excited")
-                    time.sleep(0.1)
-                time.sleep(0.15)
-                for _ in range(3):
-                    if not self._panic_active:
-                        return
-                    self.quack("excited")
-                    time.sleep(0.25)
-                time.sleep(0.15)
-                for _ in range(3):
-                    if not self._panic_active:
-                        return
-                    self.quack("excited")
-                    time.sleep(0.1)
-                # Pause between SOS repeats
-                time.sleep(0.6)
-        self._quack_thread = threading.Thread(target=_panic_loop, daemon=True)
-        self._quack_thread.start()
+        self._panic_generation += 1
+        self._schedule_sos(self._panic_generation)
+
+    def _schedule_sos(self, generation: int):
+        """Queue one SOS round on the audio thread, then re-arm the next."""
+        if not self._panic_active or generation != self._panic_generation:
+            return
+        t = 0.0
+        # SOS: 3 short, 3 long, 3 short, then a pause between repeats
+        for gap, pause in _SOS_TIMING:
+            for _ in range(3):
+                self.engine.schedule(t, lambda: self._panic_quack(generation),
+                                     SoundPriority.HIGH)
+                t += gap
+            t += pause
+        self.engine.schedule(t, lambda: self._schedule_sos(generation), SoundPriority.HIGH)
+
+    def _panic_quack(self, generation: int):
+        if self._panic_active and generation == self._panic_generation:
+            self.quack("excited")
 
     def stop_panic(self):
         """Stop the SOS panic loop."""
@@ -1391,13 +1440,8 @@ class DuckSounds:
     def relief(self):
         """Play a relieved sigh-quack — encounter resolved positively."""
         self.stop_panic()
-        def _relief_sequence():
-            time.sleep(0.2)
-            self.quack("happy")
-            time.sleep(0.3)
-            self.quack("happy")
-        self._quack_thread = threading.Thread(target=_relief_sequence, daemon=True)
-        self._quack_thread.start()
+        self.engine.schedule(0.2, lambda: self.quack("happy"))
+        self.engine.schedule(0.5, lambda: self.quack("happy"))
 
     def random_quack(self):
         """Play a random quack variation."""
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Compile the large content tables into memory-mapped content packs.
+
+Run: python build_content_packs.py [pack ...]
+
+Packs are written to data/packs/. The game reads them through
+core.content_pack and falls back to importing the source modules when a
+pack is missing or older than its source, so this step is optional but
+keeps startup time and memory flat as content grows.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from core.content_pack import CONTENT_PACKS, build_content_packs
+from config import CONTENT_PACK_DIR
+
+
+def main(names=None):
+    unknown = [name for name in names or [] if name not in CONTENT_PACKS]
+    if unknown:
+        print(f"Unknown pack(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(CONTENT_PACKS)}")
+        return 1
+
+    print(f"Building content packs in {CONTENT_PACK_DIR}")
+    start = time.perf_counter()
+    for name, size in build_content_packs(names or None).items():
+        module_name, tables = CONTENT_PACKS[name]
+        print(f"  {name + '.pack':30} {size / 1024:7.1f} KiB  ({module_name}: {', '.join(tables)})")
+    print(f"Done in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
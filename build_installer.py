@@ -143,6 +143,9 @@ def main():
     # Check dependencies
     check_pyinstaller()
     
+    # Compile content packs so they ship in data/
+    subprocess.check_call([sys.executable, os.path.join(SCRIPT_DIR, "build_content_packs.py")])
+    
     # Clean previous builds
     if os.path.exists(BUILD_DIR):
         print("Cleaning previous build...")
@@ -341,6 +341,9 @@ def main():
     if not args.skip_pyinstaller:
         clean_build()
         
+        # Compile content packs so they ship in data/
+        subprocess.check_call([sys.executable, str(SCRIPT_DIR / "build_content_packs.py")])
+        
         if is_windows:
             dist_path = build_with_pyinstaller(include_model=args.model)
             if not dist_path:
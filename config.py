@@ -6,6 +6,7 @@ from pathlib import Path
 # Paths
 GAME_DIR = Path(__file__).parent
 DATA_DIR = GAME_DIR / "data"
+CONTENT_PACK_DIR = DATA_DIR / "packs"  # built by build_content_packs.py
 SAVE_DIR = Path.home() / ".cheese_the_duck"
 SAVE_FILE = SAVE_DIR / "save.json"
 
@@ -17,6 +18,19 @@ FPS = 60
 TICK_RATE = 1.0  # Seconds between game ticks
 TIME_MULTIPLIER = 1.0  # Speed up time for testing (1.0 = real time)
 
+# Event-driven loop: block in one inkey() call until input, the next scheduled
+# update or the next animation deadline instead of waking FPS times a second.
+EVENT_DRIVEN_LOOP = True
+IDLE_MAX_WAIT = 0.25   # Longest block when nothing is animating (seconds)
+INPUT_LINGER = 1.0     # Stay at full frame rate this long after a key press
+TALK_STREAM_REFRESH = 0.1  # Redraw interval while a streamed LLM reply arrives
+
+# Frame profiler (debug menu > misc > frame_profiler): per-section timings
+# over a rolling window of frames; frames over budget keep their breakdown.
+FRAME_BUDGET_MS = 16.0
+FRAME_PROFILER_WINDOW = 600    # Frames kept for p50/p95/p99
+FRAME_PROFILER_SLOW_FRAMES = 20  # Over-budget frames kept with their sections
+
 # Need decay rates (per real minute, before difficulty/stage/weather modifiers)
 # Normal difficulty should visibly move bars during a play session without forcing
 # constant upkeep.
@@ -175,6 +189,40 @@ DUCK_NAMES = [
     "Sprocket", "Waffles", "Noodle", "Potato", "Beans",
 ]
 
+# ===== LOGGING =====
+# game_logger writes JSON lines from a background thread
+LOG_MAX_BYTES = 5 * 1024 * 1024   # Rotate game/error logs past this size
+LOG_BACKUP_COUNT = 3              # Rotated files kept per log
+LOG_QUEUE_SIZE = 10000            # Records waiting for the writer; more are dropped
+LOG_ERROR_RING_SIZE = 50          # Recent errors kept in memory for get_latest_errors
+
+# ===== MEMORY TELEMETRY =====
+# core.memory_telemetry samples container sizes in-process and flags growth
+MEMORY_SAMPLE_INTERVAL = 60.0     # Seconds between samples (update scheduler)
+MEMORY_TELEMETRY_WINDOW = 240     # Samples kept (4 hours at the default interval)
+MEMORY_GROWTH_SAMPLES = 10        # A series that never shrinks over this many samples is flagged
+MEMORY_TYPE_COUNT_EVERY = 5       # Count live objects by class every Nth sample (walks the gc heap)
+MEMORY_TRACKED_TYPES = ("Conversation", "Memory", "StateChange", "CacheEntry")
+MEMORY_TRACEMALLOC = False        # Start tracemalloc at launch (slows allocation; debug menu can toggle)
+MEMORY_TRACE_FRAMES = 1           # Stack depth recorded per allocation while tracing
+MEMORY_TOP_ALLOCATIONS = 10       # Allocation sites listed in each tracemalloc diff
+
+# ===== SOAK TEST =====
+# soak_test.py drives the game headless at accelerated time (core.soak_test)
+SOAK_SECONDS_PER_FRAME = 60.0     # Simulated seconds per frame (1440 frames per game day)
+SOAK_TERMINAL_SIZE = (120, 40)    # Fake terminal columns, rows
+SOAK_CARE_INTERVAL = 10 * 60.0    # Simulated seconds between scripted player check-ins
+SOAK_SAMPLE_INTERVAL = 3600.0     # Simulated seconds between memory samples
+SOAK_REGRESSION_TOLERANCE = 0.25  # Fraction over baseline that counts as a regression
+SOAK_BASELINE_FILE = GAME_DIR / "soak_baseline.json"
+
+# ===== AUDIO SETTINGS =====
+# Synthesised sound effects play through one dispatcher thread
+SFX_MAX_VOICES = 6                  # Effects that may sound at once before stealing/dropping
+SFX_QUEUE_SIZE = 32                 # Pending audio commands; low-priority ones stop at half
+AUDIO_CACHE_BYTES = 32 * 1024 * 1024  # Decoded WAV/music kept in memory (LRU beyond this)
+MUSIC_STREAM_BYTES = 8 * 1024 * 1024  # Music tracks bigger than this once decoded stream from disk
+
 # ===== LEARNING ENGINE SETTINGS =====
 # Lightweight conversation learning — no external APIs, learns from every chat
 LEARNING_ENGINE_ENABLED = True      # Master switch for learning engine
@@ -185,6 +233,8 @@ LEARNING_CONFIDENCE_LOW = 0.45      # Confidence threshold for low-priority matc
 # Markov chain text generation in Cheese's voice
 VOICE_GENERATOR_ENABLED = True      # Master switch for voice generator
 VOICE_GENERATOR_IDLE_CHANCE = 0.12  # Chance of using generated line in idle/thoughts (12%)
+VOICE_POOL_SIZE = 64                # Pre-validated lines kept ready (saved next to the brain file)
+VOICE_POOL_REFILL_BUDGET = 0.004    # Seconds of Markov generation per refill slice
 
 # ===== LLM SETTINGS =====
 # Core LLM Configuration
@@ -227,11 +277,17 @@ LLM_CACHE_SIZE = 100            # Max cached responses
 LLM_CACHE_TTL = 300             # Seconds before cache entry expires (5 min)
 LLM_MAX_QUEUE_DEPTH = 3         # Max pending LLM requests before fallback
 LLM_WORKER_TIMEOUT = 8.0        # Max seconds to wait for LLM response
+LLM_CHAT_DEADLINE = 2.5         # Hedged chat: serve the best cheap reply if a direct LLM source misses this (seconds, 0 = wait)
+LLM_FOLLOW_UP_MAX_AGE = 20.0    # A direct LLM reply that missed the deadline is still shown as a follow-up within this many seconds
 LLM_MAX_THREADS = 4             # Cap local model worker threads so chat doesn't monopolize the CPU
 LLM_LOAD_NICE = 8               # Lower OS priority for the local model subprocess on Unix
+LLM_PROMPT_CACHE_BYTES = 256 * 1024 * 1024  # llama.cpp KV-state cache for shared prompt prefixes (0 = off)
+LLM_ACTION_STALE_AFTER = 6.0    # Drop queued action commentary older than this (seconds)
+LLM_VISITOR_STALE_AFTER = 12.0  # Drop queued visitor lines older than this (seconds)
 
 # Conversation Memory
 LLM_MAX_HISTORY = 10            # Messages to keep in conversation history
+LLM_CONTEXT_TOKEN_BUDGET = 750  # Game-world context block in chat prompts (~4 chars per token)
 
 # Ambient Line Generation (background pre-generation of future dialogue)
 LLM_AMBIENT_ENABLED = True      # Generate contextual lines in background
@@ -44,6 +44,11 @@ TRUST_COAX_RETURN_BONUS = 2.0   # Successfully coaxing duck out of hiding
 CASCADE_HUNGER_TO_ENERGY = 1.5   # Low hunger → energy decays this much faster
 CASCADE_SOCIAL_TO_FUN = 1.5      # Low social → fun decays this much faster
 CASCADE_THRESHOLD = 20           # Below this value, cascade kicks in
+# (source need, target need, multiplier): target decays faster while source < threshold
+CASCADE_RULES = (
+    ("hunger", "energy", CASCADE_HUNGER_TO_ENERGY),
+    ("social", "fun", CASCADE_SOCIAL_TO_FUN),
+)
 
 # Sickness effects
 SICKNESS_DECAY_MULTIPLIER = 1.5  # All needs decay faster when sick
@@ -131,13 +136,10 @@ def get_cascade_modifiers(needs) -> Dict[str, float]:
         "social": 1.0,
     }
     
-    # Low hunger cascades into energy drain
-    if needs.hunger < CASCADE_THRESHOLD:
-        modifiers["energy"] = CASCADE_HUNGER_TO_ENERGY
-    
-    # Low social cascades into fun drain
-    if needs.social < CASCADE_THRESHOLD:
-        modifiers["fun"] = CASCADE_SOCIAL_TO_FUN
+    # Low hunger cascades into energy drain, low social into fun drain
+    for source, target, multiplier in CASCADE_RULES:
+        if getattr(needs, source) < CASCADE_THRESHOLD:
+            modifiers[target] = multiplier
     
     return modifiers
 
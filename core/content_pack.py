@@ -0,0 +1,594 @@
+"""
+Compiled content packs for the large literal tables.
+
+Modules like world/expanded_events.py are thousands of lines of dict and
+dataclass literals. Importing one compiles and executes all of it, and every
+string, dict and dataclass then stays resident for the rest of the session.
+
+``build_pack`` compiles tables into a single file:
+
+* a deduplicated UTF-8 string pool with an offset table,
+* a fixed-width node table (one 12 byte node per value: kind plus two
+  operands, or one 64-bit int/float),
+* an index array of node ids for list items, dict entries and record fields.
+
+``ContentPack`` memory-maps that file and hands out read-only views
+(``PackMapping``, ``PackSequence``, ``PackRecord``) that decode only the
+entries and fields that are actually touched. Dataclasses are stored as
+records (the class is only imported if a record is materialised with
+``to_python``), enums by class and value, tuples come back as real tuples.
+
+Consumers call ``content_table(module, name)``. When the pack for *module*
+exists and was built from the current source file, the view is returned;
+otherwise the module is imported and ``module.name`` returned, so a missing
+or stale pack only costs speed. ``python build_content_packs.py`` rebuilds
+every pack listed in ``CONTENT_PACKS``.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import CONTENT_PACK_DIR, GAME_DIR
+
+logger = logging.getLogger(__name__)
+
+PACK_MAGIC = b"CDPK"
+PACK_VERSION = 1
+PACK_SUFFIX = ".pack"
+
+# Pack name -> (source module, tables compiled from it)
+CONTENT_PACKS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "expanded_events": (
+        "world.expanded_events",
+        ("EXPANDED_EVENTS", "EXPANDED_ENCOUNTERS", "EXPANDED_CHAINS"),
+    ),
+    "guest_conversations": (
+        "dialogue.guest_conversations_data",
+        ("GUEST_CONVERSATIONS",),
+    ),
+    "interaction_animations": (
+        "world.interaction_animation_data",
+        ("INTERACTION_ANIMATIONS",),
+    ),
+}
+
+# magic, version, string count, string offsets at, string data at,
+# node count, nodes at, index at, meta node, tables node, shapes node
+_HEADER = struct.Struct("<4sH2xIIIIIIIII")
+_NODE = struct.Struct("<B3xII")
+_NODE_INT = struct.Struct("<B3xq")
+_NODE_FLOAT = struct.Struct("<B3xd")
+_U32 = struct.Struct("<I")
+
+(_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _LIST, _TUPLE,
+ _DICT, _STRDICT, _RECORD, _ENUM) = range(12)
+
+
+class ContentPackError(Exception):
+    """A pack file is missing, truncated or from another format version."""
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+# ── Building ─────────────────────────────────────────────────────────
+
+
+class _PackWriter:
+    """Flattens Python values into the pool, node and index sections."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.nodes: List[bytes] = []
+        self.index: List[int] = []
+        self.shapes: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._scalars: Dict[tuple, int] = {}
+
+    def string(self, text: str) -> int:
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def _node(self, packed: bytes) -> int:
+        self.nodes.append(packed)
+        return len(self.nodes) - 1
+
+    def _scalar(self, key: tuple, packed: bytes) -> int:
+        nid = self._scalars.get(key)
+        if nid is None:
+            nid = self._scalars[key] = self._node(packed)
+        return nid
+
+    def _items(self, node_ids: Iterable[int]) -> int:
+        start = len(self.index)
+        self.index.extend(node_ids)
+        return start
+
+    def add(self, value: Any) -> int:
+        """Append *value* (recursively) and return its node id."""
+        if value is None:
+            return self._scalar((_NONE,), _NODE.pack(_NONE, 0, 0))
+        if value is True or value is False:
+            kind = _TRUE if value else _FALSE
+            return self._scalar((kind,), _NODE.pack(kind, 0, 0))
+        if isinstance(value, Enum):
+            cls_id = self.string(_class_path(type(value)))
+            return self._node(_NODE.pack(_ENUM, cls_id, self.add(value.value)))
+        if isinstance(value, int):
+            return self._scalar((_INT, value), _NODE_INT.pack(_INT, value))
+        if isinstance(value, float):
+            return self._scalar((_FLOAT, value), _NODE_FLOAT.pack(_FLOAT, value))
+        if isinstance(value, str):
+            sid = self.string(value)
+            return self._scalar((_STR, sid), _NODE.pack(_STR, sid, 0))
+        if isinstance(value, (list, tuple)):
+            kind = _TUPLE if isinstance(value, tuple) else _LIST
+            items = [self.add(item) for item in value]
+            return self._node(_NODE.pack(kind, self._items(items), len(items)))
+        if isinstance(value, dict):
+            return self._add_dict(value)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return self._add_record(value)
+        raise TypeError(f"cannot pack {type(value).__name__}: {value!r:.60}")
+
+    def _add_dict(self, value: dict) -> int:
+        pairs = [(self.add(key), self.add(item)) for key, item in value.items()]
+        flat = [nid for pair in pairs for nid in pair]
+        if all(isinstance(key, str) for key in value):
+            # Entries stay in source order; a sorted permutation follows
+            # them for binary-search lookups by key.
+            keys = [key.encode("utf-8") for key in value]
+            flat.extend(sorted(range(len(keys)), key=keys.__getitem__))
+            return self._node(_NODE.pack(_STRDICT, self._items(flat), len(pairs)))
+        return self._node(_NODE.pack(_DICT, self._items(flat), len(pairs)))
+
+    def _add_record(self, value: Any) -> int:
+        fields = tuple(f.name for f in dataclasses.fields(value))
+        shape = (_class_path(type(value)), fields)
+        shape_id = self.shapes.get(shape)
+        if shape_id is None:
+            shape_id = self.shapes[shape] = len(self.shapes)
+        items = [self.add(getattr(value, name)) for name in fields]
+        return self._node(_NODE.pack(_RECORD, self._items(items), shape_id))
+
+    def serialize(self, tables: Dict[str, Any], meta: Dict[str, Any]) -> bytes:
+        meta_node = self.add(meta)
+        tables_node = self.add(tables)
+        shapes_node = self.add([(path, *fields) for path, fields in self.shapes])
+
+        encoded = [text.encode("utf-8") for text in self.strings]
+        offsets = [0]
+        for blob in encoded:
+            offsets.append(offsets[-1] + len(blob))
+
+        strings_at = _HEADER.size
+        data_at = strings_at + 4 * len(offsets)
+        nodes_at = data_at + offsets[-1]
+        nodes_at += -nodes_at % 8
+        index_at = nodes_at + _NODE.size * len(self.nodes)
+
+        out = bytearray(_HEADER.pack(
+            PACK_MAGIC, PACK_VERSION, len(encoded), strings_at, data_at,
+            len(self.nodes), nodes_at, index_at, meta_node, tables_node, shapes_node))
+        out += struct.pack(f"<{len(offsets)}I", *offsets)
+        out += b"".join(encoded)
+        out += bytes(nodes_at - len(out))
+        out += b"".join(self.nodes)
+        out += struct.pack(f"<{len(self.index)}I", *self.index)
+        return bytes(out)
+
+
+def source_path(module_name: str) -> Path:
+    """Source file of a game module, without importing it or its package."""
+    return GAME_DIR.joinpath(*module_name.split(".")).with_suffix(".py")
+
+
+def fingerprint(path: Path) -> Dict[str, Any]:
+    """Size, mtime and content digest of a source file."""
+    stat = path.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "digest": hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest(),
+    }
+
+
+def build_pack(tables: Dict[str, Any], destination: Path,
+               sources: Optional[Dict[str, Path]] = None) -> int:
+    """
+    Compile *tables* into a pack at *destination*; returns its size in bytes.
+
+    *sources* maps module names to the files the tables came from; the
+    loader treats the pack as stale once any of them changes.
+    """
+    writer = _PackWriter()
+    meta = {
+        "version": PACK_VERSION,
+        "sources": {name: fingerprint(path) for name, path in (sources or {}).items()},
+    }
+    data = writer.serialize(tables, meta)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    partial = destination.with_name(destination.name + ".tmp")
+    partial.write_bytes(data)
+    os.replace(partial, destination)
+    return len(data)
+
+
+def build_content_packs(names: Optional[Iterable[str]] = None,
+                        directory: Optional[Path] = None) -> Dict[str, int]:
+    """Build the packs in ``CONTENT_PACKS`` (or just *names*); returns sizes."""
+    directory = directory or CONTENT_PACK_DIR
+    sizes = {}
+    for name in names or CONTENT_PACKS:
+        module_name, table_names = CONTENT_PACKS[name]
+        module = importlib.import_module(module_name)
+        tables = {table: getattr(module, table) for table in table_names}
+        sizes[name] = build_pack(tables, directory / f"{name}{PACK_SUFFIX}",
+                                 {module_name: source_path(module_name)})
+    return sizes
+
+
+# ── Reading ──────────────────────────────────────────────────────────
+
+
+class ContentPack:
+    """A memory-mapped pack file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise ContentPackError(f"{self.path}: empty pack") from exc
+        if len(self._map) < _HEADER.size:
+            raise ContentPackError(f"{self.path}: truncated header")
+        (magic, version, self._string_count, self._strings_at, self._data_at,
+         self._node_count, self._nodes_at, self._index_at, meta_node,
+         tables_node, shapes_node) = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ContentPackError(f"{self.path}: not a version {PACK_VERSION} content pack")
+        if self._index_at > len(self._map):
+            raise ContentPackError(f"{self.path}: truncated")
+        self._offsets = self._u32_array(self._strings_at, self._data_at)
+        self._index = self._u32_array(self._index_at, len(self._map))
+        self._strings: List[Optional[str]] = [None] * self._string_count
+        self._shapes: List[Tuple[str, Dict[str, int]]] = [
+            (shape[0], {name: i for i, name in enumerate(shape[1:])})
+            for shape in self.decode(shapes_node)
+        ]
+        self._meta_node = meta_node
+        self._tables_node = tables_node
+
+    def close(self) -> None:
+        # Views into the map must go before it can be closed
+        for view in (self._offsets, self._index):
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+
+    # Sections
+
+    def _u32_array(self, start: int, end: int):
+        """Little-endian uint32s in [start, end) as an indexable sequence."""
+        view = memoryview(self._map)[start:start + (end - start) // 4 * 4].cast("I")
+        if sys.byteorder == "little":
+            return view
+        swapped = array("I", view)
+        view.release()
+        swapped.byteswap()
+        return swapped
+
+    def _string(self, sid: int) -> str:
+        text = self._strings[sid]
+        if text is None:
+            # Decoded once, so every field holding this pool entry shares one str
+            text = self._strings[sid] = self._string_bytes(sid).decode("utf-8")
+        return text
+
+    def _string_bytes(self, sid: int) -> bytes:
+        data_at, offsets = self._data_at, self._offsets
+        return self._map[data_at + offsets[sid]:data_at + offsets[sid + 1]]
+
+    def _node(self, nid: int) -> Tuple[int, int, int]:
+        return _NODE.unpack_from(self._map, self._nodes_at + _NODE.size * nid)
+
+    def decode(self, nid: int) -> Any:
+        """The value of node *nid*: a scalar, tuple or read-only view."""
+        kind, a, b = self._node(nid)
+        if kind == _STR:
+            return self._string(a)
+        if kind == _RECORD:
+            return PackRecord(self, a, b)
+        if kind == _STRDICT or kind == _DICT:
+            return PackMapping(self, a, b, kind == _STRDICT)
+        if kind == _LIST:
+            return PackSequence(self, a, b)
+        if kind == _INT:
+            return _NODE_INT.unpack_from(self._map, self._nodes_at + _NODE.size * nid)[1]
+        if kind == _FLOAT:
+            return _NODE_FLOAT.unpack_from(self._map, self._nodes_at + _NODE.size * nid)[1]
+        if kind == _NONE:
+            return None
+        if kind == _TRUE:
+            return True
+        if kind == _FALSE:
+            return False
+        if kind == _TUPLE:
+            return tuple(self.decode(self._index[a + i]) for i in range(b))
+        if kind == _ENUM:
+            return _import_class(self._string(a))(self.decode(b))
+        raise ContentPackError(f"{self.path}: bad node kind {kind} at {nid}")
+
+    # Tables
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return to_python(self.decode(self._meta_node))
+
+    def table(self, name: str) -> Any:
+        return self.decode(self._tables_node)[name]
+
+    def table_names(self) -> List[str]:
+        return list(self.decode(self._tables_node))
+
+    def is_fresh(self) -> bool:
+        """True if every source file still matches what the pack was built from."""
+        for module_name, recorded in self.meta["sources"].items():
+            path = source_path(module_name)
+            try:
+                stat = path.stat()
+            except OSError:
+                # Frozen builds ship bytecode only, packed from the same tree
+                if getattr(sys, "frozen", False):
+                    continue
+                return False
+            if (stat.st_size, stat.st_mtime_ns) == (recorded["size"], recorded["mtime_ns"]):
+                continue
+            # Copied installs keep the content but not the mtime
+            if fingerprint(path)["digest"] != recorded["digest"]:
+                return False
+        return True
+
+
+class PackSequence(Sequence):
+    """Read-only list view; items decode on access."""
+
+    __slots__ = ("_pack", "_at", "_len")
+
+    def __init__(self, pack: ContentPack, at: int, length: int):
+        self._pack = pack
+        self._at = at
+        self._len = length
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("pack sequence index out of range")
+        return self._pack.decode(self._pack._index[self._at + index])
+
+    def __iter__(self):
+        decode, index = self._pack.decode, self._pack._index
+        for i in range(self._at, self._at + self._len):
+            yield decode(index[i])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, PackSequence)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<PackSequence len={self._len}>"
+
+
+class PackMapping(Mapping):
+    """Read-only dict view in source order; string keys are binary-searched."""
+
+    __slots__ = ("_pack", "_at", "_len", "_sorted", "_slots")
+
+    def __init__(self, pack: ContentPack, at: int, length: int, sorted_keys: bool):
+        self._pack = pack
+        self._at = at
+        self._len = length
+        self._sorted = sorted_keys
+        self._slots: Optional[Dict[Any, int]] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _key_node(self, i: int) -> int:
+        return self._pack._index[self._at + 2 * i]
+
+    def _find(self, key) -> int:
+        if not self._sorted:
+            if self._slots is None:
+                self._slots = {self._pack.decode(self._key_node(i)): i for i in range(self._len)}
+            return self._slots.get(key, -1)
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        pack, perm_at = self._pack, self._at + 2 * self._len
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = pack._index[perm_at + mid]
+            probe = pack._string_bytes(pack._node(self._key_node(i))[1])
+            if probe == target:
+                return i
+            if probe < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return -1
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._pack.decode(self._pack._index[self._at + 2 * i + 1])
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self._pack.decode(self._key_node(i))
+
+    def items(self):
+        decode, index = self._pack.decode, self._pack._index
+        for i in range(self._at, self._at + 2 * self._len, 2):
+            yield decode(index[i]), decode(index[i + 1])
+
+    def values(self):
+        decode, index = self._pack.decode, self._pack._index
+        for i in range(self._at + 1, self._at + 2 * self._len, 2):
+            yield decode(index[i])
+
+    def __repr__(self) -> str:
+        return f"<PackMapping len={self._len}>"
+
+
+class PackRecord:
+    """
+    Read-only stand-in for a dataclass instance: ``event.message`` decodes
+    that one field from the pack.
+    """
+
+    __slots__ = ("_pack", "_at", "_shape")
+
+    def __init__(self, pack: ContentPack, at: int, shape: int):
+        object.__setattr__(self, "_pack", pack)
+        object.__setattr__(self, "_at", at)
+        object.__setattr__(self, "_shape", shape)
+
+    def __getattr__(self, name: str):
+        fields = self._pack._shapes[self._shape][1]
+        try:
+            slot = fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return self._pack.decode(self._pack._index[self._at + slot])
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"content pack records are read-only ({name})")
+
+    def record_class(self) -> str:
+        """``module:QualName`` of the dataclass this record was built from."""
+        return self._pack._shapes[self._shape][0]
+
+    def field_names(self) -> List[str]:
+        return list(self._pack._shapes[self._shape][1])
+
+    def __repr__(self) -> str:
+        path, fields = self._pack._shapes[self._shape]
+        label = f" {self.id!r}" if "id" in fields else ""
+        return f"<PackRecord {path.rpartition(':')[2]}{label}>"
+
+
+def to_python(value: Any) -> Any:
+    """Deep-copy a pack view into ordinary dicts, lists and dataclasses."""
+    if isinstance(value, PackRecord):
+        cls = _import_class(value.record_class())
+        values = {name: to_python(getattr(value, name)) for name in value.field_names()}
+        init = {f.name for f in dataclasses.fields(cls) if f.init}
+        instance = cls(**{k: v for k, v in values.items() if k in init})
+        for name, item in values.items():
+            if name not in init:
+                object.__setattr__(instance, name, item)
+        return instance
+    if isinstance(value, PackMapping):
+        return {key: to_python(item) for key, item in value.items()}
+    if isinstance(value, PackSequence):
+        return [to_python(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(to_python(item) for item in value)
+    return value
+
+
+# ── Loading ──────────────────────────────────────────────────────────
+
+
+_packs: Dict[str, Optional[ContentPack]] = {}
+_packs_lock = threading.Lock()
+_fallbacks: List[str] = []
+
+
+def _pack_for(module_name: str) -> Optional[ContentPack]:
+    for name, (source, _tables) in CONTENT_PACKS.items():
+        if source == module_name:
+            break
+    else:
+        return None
+    with _packs_lock:
+        if name not in _packs:
+            pack = None
+            path = CONTENT_PACK_DIR / f"{name}{PACK_SUFFIX}"
+            try:
+                pack = ContentPack(path)
+                if not pack.is_fresh():
+                    logger.info("Content pack %s is stale; using %s", path.name, module_name)
+                    pack.close()
+                    pack = None
+            except FileNotFoundError:
+                pass
+            except (OSError, ContentPackError) as exc:
+                logger.warning("Ignoring content pack %s: %s", path, exc)
+            _packs[name] = pack
+        return _packs[name]
+
+
+def content_table(module_name: str, table_name: str) -> Any:
+    """
+    Table *table_name* of *module_name*: a read-only view from its content
+    pack when one is current, otherwise the module's own object.
+    """
+    pack = _pack_for(module_name)
+    if pack is not None:
+        return pack.table(table_name)
+    _fallbacks.append(f"{module_name}.{table_name}")
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, table_name)
+    except AttributeError:
+        # Same error ``from module import name`` gives mid circular import
+        raise ImportError(f"cannot import name {table_name!r} from {module_name!r}",
+                          name=module_name) from None
+
+
+def get_pack_stats() -> Dict[str, Any]:
+    """Which packs are mapped and which tables fell back to imports."""
+    return {
+        "mapped": {name: len(pack._map) for name, pack in _packs.items() if pack is not None},
+        "fallbacks": list(_fallbacks),
+    }
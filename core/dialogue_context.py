@@ -0,0 +1,685 @@
+"""
+Pre-rendered game-world context for player chat.
+
+The LLM chat prompt carries a block describing the world: location, weather,
+personality, needs, friends, quests and much more. Building it walks most of
+the game's subsystems, and it used to happen on the talk worker thread on
+every turn while the main thread kept mutating those same objects.
+
+``ChatContext`` splits the block into named sections. Each section is a
+sequence of *parts*, functions of the game returning lines; a section is
+rendered on the main thread and cached until:
+
+- an event it depends on fires (``NeedChangedEvent`` dirties "needs",
+  ``WeatherChangedEvent`` dirties "time_weather", ...), or
+- its ``max_age`` passes, for state that changes without events (need
+  decay, XP, the clock).
+
+``refresh()`` re-renders only dirty or expired sections, trims the result to
+the token budget (sections are ordered most important first) and publishes
+an immutable ``ContextSnapshot``. The talk thread calls ``snapshot()``, which
+reads no game state.
+
+Usage from game.py::
+
+    self.dialogue_context.attach(event_bus)
+    sched.register("dialogue_context", self._refresh_dialogue_context,
+                   DIALOGUE_CONTEXT_INTERVAL)
+
+    # Talk worker
+    memory_context = self.dialogue_context.snapshot().text
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from config import LLM_CONTEXT_TOKEN_BUDGET
+from core.event_bus import (
+    AchievementUnlockedEvent, ActionPerformedEvent, BiomeChangedEvent, ConversationEvent,
+    EventBus, GameEvent, HidingEvent, ItemUsedEvent, MoodChangedEvent, NeedChangedEvent,
+    SeasonChangedEvent, SicknessEvent, TimeChangedEvent, TrustChangedEvent,
+    VisitorArrivedEvent, VisitorDepartedEvent, WeatherChangedEvent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rough size of an English token for the local models' tokenizers
+CHARS_PER_TOKEN = 4
+
+Part = Callable[[Any], Iterable[str]]
+
+
+def _label(value: Any) -> str:
+    """Enum value or plain string."""
+    return value.value if hasattr(value, "value") else str(value)
+
+
+# ── Parts (main thread only) ──────────────────────────────────────────────
+# Each yields context lines; a part that raises contributes nothing.
+
+def _location(game) -> Iterable[str]:
+    if hasattr(game, 'exploration') and game.exploration and game.exploration.current_area:
+        area = game.exploration.current_area
+        if hasattr(area, 'description') and area.description:
+            yield f"Current location: {area.name} — {area.description}"
+        else:
+            yield f"Current location: {area.name}"
+    else:
+        yield "Current location: Home Pond (your habitat)"
+
+
+def _discovered_areas(game) -> Iterable[str]:
+    if game.exploration and game.exploration.discovered_areas:
+        area_names = list(game.exploration.discovered_areas.keys())[:10]
+        if area_names:
+            yield f"Places you've explored: {', '.join(area_names)}"
+
+
+def _time_of_day(game) -> Iterable[str]:
+    if game.day_night:
+        tod = game.day_night.get_time_of_day()
+        hour = game.day_night.get_current_hour()
+        yield f"Time of day: {_label(tod)} ({hour}:00)"
+
+
+def _season_weather(game) -> Iterable[str]:
+    if game.atmosphere:
+        season = game.atmosphere.current_season
+        if season:
+            yield f"Season: {_label(season)}"
+        weather = game.atmosphere.current_weather
+        if weather and hasattr(weather, 'weather_type'):
+            yield f"Weather: {_label(weather.weather_type)}"
+
+
+def _personality(game) -> Iterable[str]:
+    system = getattr(game.duck, '_personality_system', None)
+    if system:
+        summary = system.get_personality_summary()
+        if summary:
+            yield f"Your personality: {summary}"
+        quirk = system.get_quirk()
+        if quirk:
+            yield f"Your quirk: {quirk}"
+
+
+def _extended_personality(game) -> Iterable[str]:
+    if game.extended_personality and hasattr(game.extended_personality, 'get_description'):
+        desc = game.extended_personality.get_description()
+        if desc:
+            yield f"Extended traits: {desc}"
+
+
+def _age(game) -> Iterable[str]:
+    if game.aging:
+        yield f"Growth stage: {_label(game.aging.current_stage)} ({game.aging.get_age_string()})"
+        is_bday, years = game.aging.is_birthday()
+        if is_bday:
+            yield f"TODAY IS YOUR BIRTHDAY! You are {years} year(s) old!"
+
+
+def _needs(game) -> Iterable[str]:
+    needs = game.duck.needs
+    if not needs:
+        return
+    critical = needs.get_critical_needs() if hasattr(needs, 'get_critical_needs') else []
+    low = needs.get_low_needs() if hasattr(needs, 'get_low_needs') else []
+    urgent = needs.get_urgent_need() if hasattr(needs, 'get_urgent_need') else None
+    needs_info = [
+        f"Hunger: {needs.hunger:.0f}/100",
+        f"Energy: {needs.energy:.0f}/100",
+        f"Fun: {needs.fun:.0f}/100",
+        f"Cleanliness: {needs.cleanliness:.0f}/100",
+        f"Social: {needs.social:.0f}/100",
+    ]
+    yield f"Your needs: {' | '.join(needs_info)}"
+    if critical:
+        yield f"CRITICAL needs (very low!): {', '.join(critical)}"
+    elif low:
+        yield f"Low needs: {', '.join(low)}"
+    if urgent:
+        yield f"Most urgent need: {urgent}"
+
+
+def _mood(game) -> Iterable[str]:
+    mood = game.duck.get_mood()
+    if mood:
+        yield f"Your current mood: {mood.state.value} (score: {mood.score})"
+
+
+def _trust(game) -> Iterable[str]:
+    from core.consequences import get_trust_level_display, is_cold_shoulder_active
+    duck = game.duck
+    trust = getattr(duck, 'trust', None)
+    if trust is not None:
+        yield f"Trust/bond with player: {get_trust_level_display(trust)} ({trust:.0f}/100)"
+    if getattr(duck, 'is_sick', False):
+        yield "YOU ARE CURRENTLY SICK! You need medicine."
+    if getattr(duck, 'hiding', False):
+        yield "You are currently HIDING because you've been neglected."
+    if is_cold_shoulder_active(duck):
+        yield "You are giving the player the cold shoulder right now (they neglected you)."
+
+
+def _visitor(game) -> Iterable[str]:
+    if not (game.friends and game.friends.current_visit):
+        return
+    visit = game.friends.current_visit
+    friend = game.friends.get_friend_by_id(visit.friend_id)
+    if not friend:
+        return
+    visitor_info = (
+        f"RIGHT NOW: Your friend {friend.name} is visiting! "
+        f"They are a {_label(friend.personality)} duck. "
+        f"Friendship level: {_label(friend.friendship_level)}. "
+        f"They've visited {friend.times_visited} times."
+    )
+    if friend.favorite_food:
+        visitor_info += f" Their favorite food is {friend.favorite_food}."
+    if friend.favorite_activity:
+        visitor_info += f" They love to {friend.favorite_activity}."
+    if visit.gift_brought:
+        visitor_info += f" They brought you a gift: {visit.gift_brought}."
+    if visit.activities_done:
+        visitor_info += f" Activities you've done together: {', '.join(visit.activities_done)}."
+    # Include visitor's memory of past player interactions
+    if friend.mood_at_last_visit:
+        visitor_info += f" Last time they visited, your mood was {friend.mood_at_last_visit}."
+    if friend.visitor_mood_memory:
+        visitor_info += f" {friend.name} remembers your mood being {friend.visitor_mood_memory}."
+    if friend.player_chat_history:
+        recent = friend.player_chat_history[-3:]
+        visitor_info += f" Things the player has said to you during {friend.name}'s visits: {'; '.join(recent)}."
+    if friend.last_conversation_summary:
+        visitor_info += f" Last visit summary: {friend.last_conversation_summary}."
+    yield visitor_info
+
+    # What the player has said this visit via T key
+    from world.friends import visitor_animator
+    if visitor_animator._player_messages_this_visit:
+        recent_msgs = visitor_animator._player_messages_this_visit[-3:]
+        yield f"Things the player said THIS visit (while {friend.name} is here): {'; '.join(recent_msgs)}"
+
+    convo = getattr(game, '_active_guest_conversation', None)
+    if convo:
+        yield f"You and {friend.name} are in the middle of a conversation about: {convo.title}"
+
+
+def _friends(game) -> Iterable[str]:
+    if not (game.friends and game.friends.friends):
+        return
+    visiting_id = game.friends.current_visit.friend_id if game.friends.current_visit else None
+    non_visiting = [
+        f"{f.name} ({_label(f.personality)}, {_label(f.friendship_level)})"
+        for fid, f in game.friends.friends.items() if fid != visiting_id
+    ]
+    if non_visiting:
+        shown = non_visiting[:8]
+        extra = len(non_visiting) - len(shown)
+        friends_str = "Your other duck friends: " + ", ".join(shown)
+        if extra > 0:
+            friends_str += f" (and {extra} more)"
+        yield friends_str
+
+
+def _favorites(game) -> Iterable[str]:
+    memory = game.duck.memory
+    for label, category in (("Favorite food", "food"), ("Favorite toy", "toy"),
+                            ("Favorite activity", "activity")):
+        favorite = memory.get_favorite(category)
+        if favorite:
+            yield f"{label}: {favorite}"
+
+
+def _tricks(game) -> Iterable[str]:
+    tricks = game.tricks
+    if not (tricks and tricks.learned_tricks):
+        return
+    from duck.tricks import TRICKS
+    trick_names = []
+    for tid in tricks.learned_tricks:
+        t = TRICKS.get(tid)
+        trick_names.append(t.name if t else tid.replace('_', ' '))
+    yield f"Tricks you know: {', '.join(trick_names[:8])}"
+    if tricks.favorite_trick:
+        fav = TRICKS.get(tricks.favorite_trick)
+        yield f"Favorite trick: {fav.name if fav else tricks.favorite_trick}"
+    if tricks.current_training:
+        train = TRICKS.get(tricks.current_training)
+        yield f"Currently learning: {train.name if train else tricks.current_training}"
+
+
+def _title(game) -> Iterable[str]:
+    if game.titles:
+        display = game.titles.get_display_name()
+        if display:
+            yield f"Your title: {display}"
+
+
+def _outfit(game) -> Iterable[str]:
+    if not (game.outfits and game.outfits.current_outfit):
+        return
+    from duck.outfits import OUTFIT_ITEMS
+    outfit = game.outfits.current_outfit
+    worn = []
+    for slot in ['hat', 'face', 'neck', 'body', 'wings', 'feet', 'held', 'special']:
+        item_id = getattr(outfit, slot, None)
+        if item_id:
+            item = OUTFIT_ITEMS.get(item_id)
+            worn.append(f"{slot}: {item.name if item else item_id}")
+    if worn:
+        yield f"Currently wearing: {', '.join(worn)}"
+
+
+def _progression(game) -> Iterable[str]:
+    progression = game.progression
+    if not progression:
+        return
+    _xp_in, _xp_need, pct = progression.get_xp_progress()
+    yield (f"Level: {progression.level} ({progression.title}) — "
+           f"XP: {progression.xp} ({pct:.0f}% to next)")
+    if progression.current_streak > 1:
+        yield f"Player's login streak: {progression.current_streak} days"
+    if progression.stats:
+        stat_items = [f"{k.replace('total_', '').replace('_', ' ')}: {v}"
+                      for k, v in progression.stats.items() if v > 0]
+        if stat_items:
+            yield f"Lifetime stats: {', '.join(stat_items[:6])}"
+
+
+def _prestige(game) -> Iterable[str]:
+    if game.prestige and game.prestige.prestige_level > 0:
+        yield (f"Prestige level: {game.prestige.prestige_level} "
+               f"(Legacy points: {game.prestige.legacy_points}, "
+               f"Ducks raised: {game.prestige.total_ducks_raised})")
+
+
+def _coins(game) -> Iterable[str]:
+    yield f"Coins: {getattr(game.habitat, 'currency', 0)}"
+
+
+def _inventory(game) -> Iterable[str]:
+    if game.inventory and game.inventory.items:
+        yield f"Items in inventory: {len(game.inventory.items)}"
+
+
+def _garden(game) -> Iterable[str]:
+    if not game.garden:
+        return
+    active_plots = []
+    for plot in game.garden.plots.values():
+        if plot.plant:
+            stage = plot.plant.growth_stage if hasattr(plot.plant, 'growth_stage') else '?'
+            active_plots.append(f"{plot.plant.plant_id} ({stage})")
+    if active_plots:
+        yield f"Garden plants: {', '.join(active_plots[:5])}"
+    if game.garden.total_harvests > 0:
+        yield f"Total harvests: {game.garden.total_harvests}"
+
+
+def _fishing(game) -> Iterable[str]:
+    fishing = game.fishing
+    if not fishing:
+        return
+    if fishing.total_catches > 0:
+        fish_info = f"Fish caught: {fishing.total_catches}"
+        if fishing.biggest_catch:
+            fish_info += f" (biggest: {fishing.biggest_catch.fish_id})"
+        yield fish_info
+    if fishing.is_fishing:
+        yield "You are currently fishing!"
+
+
+def _crafting(game) -> Iterable[str]:
+    crafting = game.crafting
+    if not crafting:
+        return
+    if crafting.crafting_skill > 0:
+        yield f"Crafting skill: {crafting.crafting_skill}"
+    if crafting.current_craft:
+        yield "Currently crafting something!"
+    if crafting.recipes_unlocked:
+        yield f"Known recipes: {len(crafting.recipes_unlocked)}"
+
+
+def _building(game) -> Iterable[str]:
+    structures = getattr(game.building, 'structures', None) if game.building else None
+    if structures:
+        struct_names = [s.name if hasattr(s, 'name') else str(s) for s in structures]
+        yield f"Built structures: {', '.join(struct_names[:5])}"
+
+
+def _quests(game) -> Iterable[str]:
+    from world.quests import QUESTS
+    active_quests = getattr(game.quests, 'active_quests', None) if game.quests else None
+    if not active_quests:
+        return
+    quest_names = [QUESTS[qid].name for qid, aq in active_quests.items()
+                   if not aq.completed and not aq.failed and qid in QUESTS]
+    if quest_names:
+        yield f"Active quests: {', '.join(quest_names[:5])}"
+
+
+def _challenges(game) -> Iterable[str]:
+    if game.challenges and hasattr(game.challenges, 'active_challenges'):
+        active = [c for c in game.challenges.active_challenges if not c.completed]
+        if active:
+            chal_names = [c.name if hasattr(c, 'name') else str(c) for c in active[:3]]
+            yield f"Active challenges: {', '.join(chal_names)}"
+
+
+def _festival(game) -> Iterable[str]:
+    if game.festivals and hasattr(game.festivals, 'check_active_festival'):
+        fest = game.festivals.check_active_festival()
+        if fest:
+            yield f"Active festival: {fest.name if hasattr(fest, 'name') else str(fest)}"
+
+
+def _horoscope(game) -> Iterable[str]:
+    if game.fortune and hasattr(game.fortune, 'generate_daily_horoscope'):
+        horoscope = game.fortune.generate_daily_horoscope()
+        if horoscope:
+            text = horoscope.prediction if hasattr(horoscope, 'prediction') else str(horoscope)
+            yield f"Today's horoscope: {text}"
+
+
+def _achievements(game) -> Iterable[str]:
+    if game.achievements:
+        count = game.achievements.get_unlocked_count()
+        if count > 0:
+            yield f"Achievements unlocked: {count}/{game.achievements.get_total_count()}"
+
+
+def _badges(game) -> Iterable[str]:
+    if game.badges:
+        earned, total = game.badges.get_earned_count()
+        if earned > 0:
+            yield f"Badges earned: {earned}/{total}"
+            if game.badges.favorite_badge:
+                yield f"Favorite badge: {game.badges.favorite_badge}"
+
+
+def _finds(game) -> Iterable[str]:
+    owned = getattr(game.collectibles, 'owned', None) if game.collectibles else None
+    if owned:
+        yield f"Collectibles found: {len(owned)}"
+    secrets = getattr(game.secrets, 'discovered_secrets', None) if game.secrets else None
+    if secrets:
+        yield f"Secrets discovered: {len(secrets)}"
+    treasures = getattr(game.treasure, 'total_treasures_found', 0) if game.treasure else 0
+    if treasures > 0:
+        yield f"Treasures found: {treasures}"
+
+
+def _last_dream(game) -> Iterable[str]:
+    dream_log = getattr(game.dreams, 'dream_log', None) if game.dreams else None
+    if dream_log and hasattr(dream_log[-1], 'description'):
+        yield f"Last dream: {dream_log[-1].description[:80]}"
+
+
+def _diary(game) -> Iterable[str]:
+    diary_ctx = game.diary_manager.get_llm_diary_context(max_entries=3, max_chars=400)
+    if diary_ctx:
+        yield diary_ctx
+    elif game.diary and game.diary.entries:
+        last_entry = game.diary.entries[-1]
+        if hasattr(last_entry, 'title') and hasattr(last_entry, 'content'):
+            yield f"Latest diary entry: \"{last_entry.title}\" — {last_entry.content[:60]}"
+
+
+def _player_model(game) -> Iterable[str]:
+    if not (game.duck_brain and game.duck_brain.player_model):
+        return
+    pm = game.duck_brain.player_model
+    if pm.name:
+        yield f"Player's name: {pm.name}"
+    if pm.facts:
+        fact_strs = [f"{f.fact_type}: {f.value}" for f in pm.facts.values() if f.value][:5]
+        if fact_strs:
+            yield f"Things you know about the player: {'; '.join(fact_strs)}"
+    if pm.promises_made:
+        kept, broken = pm.promises_kept, pm.promises_broken
+        if kept + broken > 0:
+            yield f"Player's promises: {kept} kept, {broken} broken"
+
+
+def _rituals(game) -> Iterable[str]:
+    if game.duck_brain and game.duck_brain.ritual_tracker:
+        established = [
+            f"{r.action} at {r.typical_hour}:00 (streak: {r.streak}d)"
+            for r in game.duck_brain.ritual_tracker.detected_rituals.values() if r.is_established
+        ]
+        if established:
+            yield f"Player's routines you've noticed: {', '.join(established[:4])}"
+
+
+def _conversation_memory(game) -> Iterable[str]:
+    if not (game.duck_brain and game.duck_brain.conversation_memory):
+        return
+    cm = game.duck_brain.conversation_memory
+    if cm.total_conversations > 0:
+        yield f"Total conversations: {cm.total_conversations}"
+    if cm.topic_counts:
+        top_topics = sorted(cm.topic_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        yield f"Topics you talk about most: {', '.join(t[0] for t in top_topics)}"
+
+
+def _inner_mood(game) -> Iterable[str]:
+    internal = game.duck_brain._internal_mood if game.duck_brain else None
+    if internal and hasattr(internal, 'value'):
+        yield f"Your inner feeling: {internal.value}"
+
+
+def _recent_event(game) -> Iterable[str]:
+    last_event = getattr(game, '_last_event_description', None)
+    if last_event:
+        yield f"Something that happened recently: {last_event}"
+    last_vis_dialogue = getattr(game, '_last_visitor_dialogue', None)
+    if last_vis_dialogue and game.friends and game.friends.current_visit:
+        yield f"What the visitor just said: {last_vis_dialogue}"
+
+
+def _relationship(game) -> Iterable[str]:
+    memory = game.duck.memory
+    relationship = memory.get_relationship_level()
+    if relationship and relationship != "stranger":
+        yield f"Relationship with player: {relationship}"
+    if hasattr(memory, 'recall_memory'):
+        recalled = memory.recall_memory()
+        if recalled:
+            yield f"A memory: {recalled}"
+    if hasattr(memory, 'get_mood_trend'):
+        trend = memory.get_mood_trend()
+        if trend:
+            yield f"Mood trend: {trend}"
+
+
+def _habitat_items(game) -> Iterable[str]:
+    if not (game.habitat and game.habitat.placed_items):
+        return
+    from world.items import get_item_info
+    item_names = []
+    for pi in game.habitat.placed_items[:10]:
+        info = get_item_info(pi.item_id) if pi.item_id else None
+        name = info.get('name', pi.item_id) if info else pi.item_id
+        item_names.append(name.replace('_', ' '))
+    if item_names:
+        yield f"Items in your habitat: {', '.join(item_names)}"
+
+
+def _radio(game) -> Iterable[str]:
+    from audio.sound import sound_engine
+    if sound_engine.is_radio_playing():
+        radio = sound_engine.get_radio()
+        if radio and radio.current_station:
+            yield f"Currently playing: {radio.current_station.name} radio"
+
+
+# ── Sections ──────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class ContextSection:
+    """A cached slice of the context.
+
+    Attributes:
+        name: Section key, used for invalidation.
+        parts: Functions of the game yielding lines, in output order.
+        events: Event types that make the section stale.
+        max_age: Seconds before it is re-rendered even without an event.
+    """
+    name: str
+    parts: Tuple[Part, ...]
+    events: Tuple[Type[GameEvent], ...] = ()
+    max_age: float = 300.0
+
+
+# Most important first: the token budget trims from the end
+SECTIONS: Tuple[ContextSection, ...] = (
+    ContextSection("location", (_location, _discovered_areas), (BiomeChangedEvent,), 60.0),
+    ContextSection("time_weather", (_time_of_day, _season_weather),
+                   (TimeChangedEvent, SeasonChangedEvent, WeatherChangedEvent), 60.0),
+    ContextSection("identity", (_personality, _extended_personality, _age), (), 600.0),
+    ContextSection("needs", (_needs,), (NeedChangedEvent,), 30.0),
+    ContextSection("mood", (_mood,), (MoodChangedEvent, NeedChangedEvent), 30.0),
+    ContextSection("trust", (_trust,), (TrustChangedEvent, SicknessEvent, HidingEvent), 60.0),
+    ContextSection("visitor", (_visitor,),
+                   (VisitorArrivedEvent, VisitorDepartedEvent, ConversationEvent), 30.0),
+    ContextSection("friends", (_friends,), (VisitorArrivedEvent, VisitorDepartedEvent), 300.0),
+    ContextSection("favorites", (_favorites, _tricks), (ActionPerformedEvent,), 300.0),
+    ContextSection("appearance", (_title, _outfit), (AchievementUnlockedEvent,), 300.0),
+    ContextSection("progress", (_progression, _prestige, _coins, _inventory),
+                   (ActionPerformedEvent, ItemUsedEvent, AchievementUnlockedEvent), 120.0),
+    ContextSection("hobbies", (_garden, _fishing, _crafting, _building),
+                   (ActionPerformedEvent,), 120.0),
+    ContextSection("goals", (_quests, _challenges, _festival, _horoscope),
+                   (ActionPerformedEvent, SeasonChangedEvent, TimeChangedEvent), 120.0),
+    ContextSection("collection", (_achievements, _badges, _finds),
+                   (AchievementUnlockedEvent,), 300.0),
+    ContextSection("journal", (_last_dream, _diary), (TimeChangedEvent,), 300.0),
+    ContextSection("player", (_player_model, _rituals, _conversation_memory, _inner_mood),
+                   (ConversationEvent,), 120.0),
+    ContextSection("recent", (_recent_event,), (ConversationEvent, VisitorDepartedEvent), 15.0),
+    ContextSection("relationship", (_relationship,), (ConversationEvent, MoodChangedEvent), 120.0),
+    ContextSection("surroundings", (_habitat_items, _radio), (ItemUsedEvent,), 60.0),
+)
+
+
+def trim_to_budget(lines: Sequence[str], token_budget: int) -> Tuple[str, ...]:
+    """Leading *lines* whose joined text fits in *token_budget* tokens."""
+    max_chars = token_budget * CHARS_PER_TOKEN
+    kept: List[str] = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > max_chars:
+            break
+        kept.append(line)
+        used += len(line) + 1
+    return tuple(kept)
+
+
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """Context as published for the talk thread; never mutated."""
+    lines: Tuple[str, ...] = ()
+    built_at: float = 0.0
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def tokens(self) -> int:
+        return -(-len(self.text) // CHARS_PER_TOKEN)
+
+
+EMPTY_SNAPSHOT = ContextSnapshot()
+
+
+class ChatContext:
+    """Section cache invalidated by event-bus events; see the module docstring."""
+
+    def __init__(self, sections: Sequence[ContextSection] = SECTIONS,
+                 token_budget: int = LLM_CONTEXT_TOKEN_BUDGET):
+        self.sections = tuple(sections)
+        self.token_budget = token_budget
+        self._rendered: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+        self._snapshot: ContextSnapshot = EMPTY_SNAPSHOT
+        # Events can be emitted from worker threads; they only touch _dirty
+        self._lock = threading.Lock()
+        self._dirty: set = set()
+        self._unsubscribers: List[Callable[[], None]] = []
+        self._failed_parts: set = set()
+        self.render_count = 0
+
+    # ── Invalidation ──────────────────────────────────────────────────
+
+    def attach(self, bus: EventBus) -> None:
+        """Subscribe to every event a section depends on (replacing earlier subscriptions)."""
+        self.detach()
+        by_event: Dict[Type[GameEvent], List[str]] = {}
+        for section in self.sections:
+            for event_type in section.events:
+                by_event.setdefault(event_type, []).append(section.name)
+        for event_type, names in by_event.items():
+            self._unsubscribers.append(
+                bus.subscribe(event_type, lambda event, names=tuple(names): self.invalidate(*names)))
+
+    def detach(self) -> None:
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+
+    def invalidate(self, *names: str) -> None:
+        """Mark sections stale; no names marks them all."""
+        with self._lock:
+            self._dirty.update(names or (section.name for section in self.sections))
+
+    # ── Rendering (main thread) ───────────────────────────────────────
+
+    def refresh(self, game, now: Optional[float] = None) -> ContextSnapshot:
+        """Re-render dirty or expired sections and publish a new snapshot if anything changed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+
+        changed = False
+        for section in self.sections:
+            cached = self._rendered.get(section.name)
+            if cached is not None and section.name not in dirty and now - cached[1] < section.max_age:
+                continue
+            lines = self._render(section, game)
+            changed = changed or cached is None or cached[0] != lines
+            self._rendered[section.name] = (lines, now)
+
+        if changed:
+            lines = [line for section in self.sections for line in self._rendered[section.name][0]]
+            self._snapshot = ContextSnapshot(trim_to_budget(lines, self.token_budget), now)
+        return self._snapshot
+
+    def _render(self, section: ContextSection, game) -> Tuple[str, ...]:
+        self.render_count += 1
+        lines: List[str] = []
+        for part in section.parts:
+            try:
+                lines.extend(list(part(game)))   # all of a part's lines or none
+            except Exception:
+                if part not in self._failed_parts:
+                    self._failed_parts.add(part)
+                    logger.debug("Dialogue context part %s failed", part.__name__, exc_info=True)
+        return tuple(lines)
+
+    # ── Reading (any thread) ──────────────────────────────────────────
+
+    def snapshot(self) -> ContextSnapshot:
+        """The last published snapshot."""
+        return self._snapshot
+
+    def reset(self) -> None:
+        """Drop cached sections and the snapshot (new game / load)."""
+        self._rendered.clear()
+        self._snapshot = EMPTY_SNAPSHOT
+        self.invalidate()
@@ -498,6 +498,10 @@ class DuckStore:
         entries = list(self._audit_log)
         return entries[-limit:]
 
+    def audit_log_size(self) -> int:
+        """Number of entries in the audit log, for memory telemetry."""
+        return len(self._audit_log)
+
     def get_changes_for(self, field: str, limit: int = 10) -> List[StateChange]:
         """Return recent changes for a specific field.
 
@@ -740,6 +744,7 @@ class DuckStore:
         duck : Duck
             The target Duck dataclass instance (modified in-place).
         """
+        before = self._duck_fields(duck)
         duck.name = self._name
         duck.growth_stage = self._growth_stage
         duck.growth_progress = self._growth_progress
@@ -761,3 +766,18 @@ class DuckStore:
         duck.cooldown_until = self._cooldown_until
         duck.current_action = self._current_action
         duck.action_start_time = self._action_start_time
+
+        if self._duck_fields(duck) != before and hasattr(duck, "save_revision"):
+            duck.save_revision += 1
+
+    @staticmethod
+    def _duck_fields(duck: "Duck") -> tuple:
+        """The Duck state ``sync_to_duck`` writes, for change detection."""
+        needs = duck.needs
+        return (
+            duck.name, duck.growth_stage, duck.growth_progress,
+            needs.hunger, needs.energy, needs.fun, needs.cleanliness, needs.social,
+            duck.trust, duck.personality, duck.is_sick, duck.sick_since,
+            duck.hiding, duck.hiding_coax_visits, duck.cooldown_until,
+            duck.current_action, duck.action_start_time,
+        )
@@ -350,6 +350,16 @@ class EventBus:
             items = list(history)
             return items[-limit:]
 
+    def memory_stats(self) -> Dict[str, int]:
+        """Sizes of the bus containers, for memory telemetry."""
+        with self._lock:
+            return {
+                "history": sum(len(events) for events in self._history.values()),
+                "history_types": len(self._history),
+                "queue": len(self._queue),
+                "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+            }
+
     # ── housekeeping ────────────────────────────────────────────────────
 
     def clear(self) -> None:
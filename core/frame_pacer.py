@@ -0,0 +1,113 @@
+"""
+Frame pacing for the event-driven game loop.
+
+The legacy loop woke ``FPS`` times a second whether or not anything on screen
+could change.  ``FramePacer`` instead turns a set of deadlines (next scheduled
+system, next duck step, particle frames, ...) into a single timeout for
+``terminal.inkey()``, so the loop blocks until a key arrives or something
+actually needs to move.
+
+Usage from game.py::
+
+    self.frame_pacer = FramePacer(FPS)
+
+    # After rendering:
+    timeout = self.frame_pacer.compute_timeout(
+        loop_start, time.time(), [scheduler_due, animation_due],
+    )
+    key = self.terminal.inkey(timeout=timeout)
+    if key:
+        self.frame_pacer.note_input()
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from config import FPS, IDLE_MAX_WAIT, INPUT_LINGER
+
+
+class FramePacer:
+    """
+    Computes how long the game loop may block between frames.
+
+    The result is never shorter than the remaining time of the current frame
+    (so the loop never exceeds ``fps``) and never longer than
+    ``idle_max_wait`` (so clocks, blinking cursors and async replies still
+    refresh while idle).
+    """
+
+    def __init__(
+        self,
+        fps: float = FPS,
+        idle_max_wait: float = IDLE_MAX_WAIT,
+        input_linger: float = INPUT_LINGER,
+    ) -> None:
+        self.frame_time = 1.0 / fps
+        self.idle_max_wait = max(self.frame_time, idle_max_wait)
+        self.input_linger = input_linger
+        self._active_until = 0.0
+
+        # Bookkeeping for get_stats()
+        self._frames = 0
+        self._idle_frames = 0
+        self._total_wait = 0.0
+
+    def note_input(self, now: Optional[float] = None) -> None:
+        """Keep the full frame rate for ``input_linger`` seconds after input."""
+        if now is None:
+            now = time.time()
+        self._active_until = now + self.input_linger
+
+    def compute_timeout(
+        self,
+        frame_start: float,
+        now: float,
+        deadlines: Iterable[Optional[float]] = (),
+    ) -> float:
+        """
+        Return the number of seconds the loop may block waiting for input.
+
+        Args:
+            frame_start: Epoch timestamp at which the current frame began.
+            now:         Current epoch timestamp.
+            deadlines:   Epoch timestamps at which something must be updated
+                         or redrawn.  ``None`` entries are ignored.
+        """
+        frame_end = frame_start + self.frame_time
+
+        if now < self._active_until:
+            target = frame_end
+        else:
+            target = now + self.idle_max_wait
+            for deadline in deadlines:
+                if deadline is not None and deadline < target:
+                    target = deadline
+            target = max(target, frame_end)
+
+        timeout = max(0.0, target - now)
+        self._frames += 1
+        self._total_wait += timeout
+        if target > frame_end:
+            self._idle_frames += 1
+        return timeout
+
+    # ── Diagnostics ───────────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return pacing statistics.
+
+        Returns:
+            Dict with ``frames``, ``idle_frames`` (frames that blocked past
+            the normal frame time) and ``avg_wait_ms``.
+        """
+        avg_ms = (self._total_wait / self._frames * 1000) if self._frames else 0.0
+        return {
+            "frames": self._frames,
+            "idle_frames": self._idle_frames,
+            "avg_wait_ms": round(avg_ms, 3),
+        }
+
+    def __repr__(self) -> str:
+        return f"FramePacer(fps={1.0 / self.frame_time:.0f}, idle_max_wait={self.idle_max_wait})"
@@ -0,0 +1,260 @@
+"""
+Frame profiler for the game loop.
+
+Every frame is split into named sections (``input``, ``update.tick``,
+``render.playfield``, ``scheduler.events`` ...). Section times are summed
+per frame and kept over a rolling window, so the overlay and JSON dump show
+p50/p95/p99 per section as well as frame time and bytes written to the
+terminal. Frames over the budget keep their full section breakdown, which
+answers "what blew the 16 ms on that frame" without an external profiler.
+
+Usage from game.py / renderer.py::
+
+    frame_profiler.begin_frame()
+    with frame_profiler.section("input"):
+        self._process_input(key)
+
+    laps = frame_profiler.laps("update")   # consecutive phases, no nesting
+    self.update_scheduler.update(now)
+    laps.mark("scheduler")
+
+    frame_profiler.add_bytes(len(frame_str))
+    frame_profiler.end_frame()
+
+It is always on; a section costs two ``perf_counter`` calls and a dict
+update. ``enabled = False`` turns every call into a no-op.
+"""
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from config import FRAME_BUDGET_MS, FRAME_PROFILER_SLOW_FRAMES, FRAME_PROFILER_WINDOW
+
+_perf_counter = time.perf_counter
+
+
+class RollingSeries:
+    """The last *window* samples plus lifetime count, total and maximum."""
+
+    __slots__ = ("samples", "count", "total", "worst")
+
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.worst:
+            self.worst = value
+
+    def percentiles(self, *quantiles: float) -> List[float]:
+        """Nearest-rank percentiles (0-100) of the rolling window."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0.0] * len(quantiles)
+        last = len(ordered) - 1
+        return [ordered[min(last, max(0, int(-(-q * len(ordered) // 100)) - 1))]
+                for q in quantiles]
+
+    def summary(self, scale: float = 1.0) -> Dict[str, float]:
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean": round(mean * scale, 3),
+            "p50": round(p50 * scale, 3),
+            "p95": round(p95 * scale, 3),
+            "p99": round(p99 * scale, 3),
+            "max": round(self.worst * scale, 3),
+        }
+
+
+class _Section:
+    """Context manager timing one section into the current frame."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = _perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self._profiler.record(self._name, _perf_counter() - self._start)
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def mark(self, name: str) -> None:
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Laps:
+    """Times consecutive phases of one function: each ``mark`` closes a phase."""
+
+    __slots__ = ("_profiler", "_prefix", "_last")
+
+    def __init__(self, profiler: "FrameProfiler", prefix: str):
+        self._profiler = profiler
+        self._prefix = prefix
+        self._last = _perf_counter()
+
+    def mark(self, name: str) -> None:
+        now = _perf_counter()
+        self._profiler.record(f"{self._prefix}.{name}", now - self._last)
+        self._last = now
+
+
+class FrameProfiler:
+    """Per-section frame timings with rolling percentiles."""
+
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS,
+                 window: int = FRAME_PROFILER_WINDOW,
+                 keep_slow: int = FRAME_PROFILER_SLOW_FRAMES):
+        self.enabled = True
+        self.budget = budget_ms / 1000.0
+        self.window = window
+        self.frames = RollingSeries(window)
+        self.bytes = RollingSeries(window)
+        self.sections: Dict[str, RollingSeries] = {}
+        self.slow_frames: Deque[Dict[str, Any]] = deque(maxlen=keep_slow)
+        self.over_budget = 0
+        self.frame_number = 0   # Frames begun, for tagging log records
+        self._frame: Optional[Dict[str, float]] = None
+        self._frame_start = 0.0
+        self._frame_bytes = 0
+
+    # ── Recording ─────────────────────────────────────────────────────
+
+    def begin_frame(self) -> None:
+        self.frame_number += 1
+        if self.enabled:
+            self._frame = {}
+            self._frame_bytes = 0
+            self._frame_start = _perf_counter()
+
+    def section(self, name: str):
+        """``with profiler.section("render.playfield"): ...``"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def laps(self, prefix: str):
+        """Phase timer: ``laps.mark("tick")`` records ``prefix.tick``."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Laps(self, prefix)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add *seconds* to section *name* (summed per frame)."""
+        if not self.enabled:
+            return
+        frame = self._frame
+        if frame is None:
+            # Outside a frame (startup, title loading): one sample per call
+            self._series(name).add(seconds)
+        else:
+            frame[name] = frame.get(name, 0.0) + seconds
+
+    def add_bytes(self, count: int) -> None:
+        """Bytes written to the terminal this frame."""
+        self._frame_bytes += count
+
+    def end_frame(self) -> float:
+        """Close the frame; returns its duration in seconds."""
+        frame = self._frame
+        if frame is None:
+            return 0.0
+        elapsed = _perf_counter() - self._frame_start
+        self._frame = None
+        self.frames.add(elapsed)
+        self.bytes.add(self._frame_bytes)
+        for name, seconds in frame.items():
+            self._series(name).add(seconds)
+        if elapsed > self.budget:
+            self.over_budget += 1
+            self.slow_frames.append({
+                "frame": self.frames.count,
+                "at": time.time(),
+                "ms": round(elapsed * 1000, 3),
+                "bytes": self._frame_bytes,
+                "sections": {name: round(seconds * 1000, 3) for name, seconds in
+                             sorted(frame.items(), key=lambda item: -item[1])},
+            })
+        return elapsed
+
+    def _series(self, name: str) -> RollingSeries:
+        series = self.sections.get(name)
+        if series is None:
+            series = self.sections[name] = RollingSeries(self.window)
+        return series
+
+    def reset(self) -> None:
+        enabled = self.enabled
+        self.__init__(self.budget * 1000.0, self.window, self.slow_frames.maxlen)
+        self.enabled = enabled
+
+    # ── Reporting ─────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Everything the profiler knows, times in milliseconds."""
+        sections = {name: series.summary(1000.0) for name, series in self.sections.items()}
+        return {
+            "budget_ms": round(self.budget * 1000, 3),
+            "window": self.window,
+            "frames": dict(self.frames.summary(1000.0), over_budget=self.over_budget),
+            "bytes_per_frame": self.bytes.summary(),
+            "sections": dict(sorted(sections.items(), key=lambda item: -item[1]["p95"])),
+            "slow_frames": list(self.slow_frames),
+        }
+
+    def dump_json(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+    def overlay_lines(self, limit: int = 8) -> List[str]:
+        """Compact text for the in-game overlay."""
+        frame = self.frames.summary(1000.0)
+        lines = [
+            f"frame ms p50 {frame['p50']:.1f} p95 {frame['p95']:.1f} p99 {frame['p99']:.1f}",
+            f"over {self.budget * 1000:.0f}ms: {self.over_budget}/{frame['count']}"
+            f"  bytes p95 {self.bytes.summary()['p95']:.0f}",
+            f"{'section':<20}{'p50':>6}{'p95':>6}{'p99':>6}",
+        ]
+        ranked = sorted(self.sections.items(),
+                        key=lambda item: -item[1].percentiles(95)[0])[:limit]
+        for name, series in ranked:
+            p50, p95, p99 = (value * 1000 for value in series.percentiles(50, 95, 99))
+            lines.append(f"{name[:20]:<20}{p50:6.2f}{p95:6.2f}{p99:6.2f}")
+        if self.slow_frames:
+            worst = self.slow_frames[-1]
+            top = ", ".join(f"{name} {ms:.1f}" for name, ms in list(worst["sections"].items())[:2])
+            lines.append(f"last slow #{worst['frame']}: {worst['ms']:.1f}ms ({top})")
+        return lines
+
+
+frame_profiler = FrameProfiler()
@@ -4,115 +4,131 @@ Enhanced with progression, daily rewards, collectibles, and addiction mechanics.
 """
 import time
 import random
-from typing import Optional, List, Tuple, Dict
+from collections import Counter
+from typing import Any, Callable, Optional, List, Tuple, Dict
 from datetime import datetime
 
 from blessed import Terminal
 
-from config import FPS, TICK_RATE
+from config import FPS, TICK_RATE, EVENT_DRIVEN_LOOP, TALK_STREAM_REFRESH, MEMORY_SAMPLE_INTERVAL
 from config import (
     ITEM_USE_COOLDOWNS, ITEM_DIMINISHING_WINDOW, ITEM_DIMINISHING_STEPS,
     ITEM_SPAM_COUNT, ITEM_SPAM_WINDOW, ITEM_SPAM_MOOD_PENALTY,
     ITEM_SPAM_HUNGER_OVERFEED,
 )
 from core.clock import GameClock, game_clock
-from core.consequences import (
-    check_consequences, apply_trust_gain, attempt_coax, apply_medicine,
-    thaw_cold_shoulder, get_trust_level_display, ConsequenceState,
-    get_cold_shoulder_greeting, get_cold_shoulder_interaction,
-    is_cold_shoulder_active, apply_personality_drift,
+from core.lazy import (
+    LazySubsystem, defer_subsystem, is_deferred, lazy_from, lazy_modules, load_deferred,
+    note_title_drawn, startup_report,
 )
-from core.persistence import SaveManager, save_manager, create_new_save
-from core.progression import ProgressionSystem, Reward, RewardType, COLLECTIBLES
-from duck.duck import Duck
-from duck.behavior_ai import BehaviorAI
-from dialogue.conversation import ConversationSystem, conversation
-from world.events import EventSystem, event_system
-from world.area_events import (
-    AreaEventSystem, area_event_system,
-    SpontaneousTravelSystem, spontaneous_travel,
-    AREA_EVENTS,
+from core.offline import bernoulli_hits, offline_ticks, summarize_repeats
+from core.persistence import (
+    KeepSection, LazySave, SaveManager, SaveSectionTracker, save_manager, create_new_save,
 )
-from world.items import Inventory, get_random_item, get_item_info
-from world.goals import GoalSystem, goal_system
-from world.achievements import AchievementSystem, achievement_system, ACHIEVEMENTS
-from world.home import DuckHome, duck_home
-from world.atmosphere import AtmosphereManager, atmosphere, WeatherType, get_weather_need_modifiers
-from world.exploration import ExplorationSystem, exploration, BiomeType
-from world.materials import MaterialInventory, material_inventory, MATERIALS
-from world.crafting import CraftingSystem, crafting, RECIPES
-from world.building import BuildingSystem, building, BLUEPRINTS
-from world.shop import get_item as get_shop_item
-from world.minigames import (
-    MiniGameSystem, BreadCatchGame, BugChaseGame, MemoryMatchGame, DuckRaceGame,
-    MiniGameType, MiniGameResult
-)
-from world.dreams import DreamSystem, dreams
-from world.facts import get_random_fact, get_birthday_info, get_birthday_message, get_mood_response
-from world.item_interactions import (
-    execute_interaction, find_matching_item, get_item_interaction,
-    ITEM_INTERACTIONS, InteractionResult
-)
-from world.interaction_controller import InteractionController, InteractionSource
-from dialogue.diary import DuckDiary, duck_diary, DiaryEntryType
-from dialogue.diary_manager import DiaryManager
 from audio.sound import sound_engine, duck_sounds, get_music_context, MusicContext
+from audio.sound_effects import SoundEffectSystem, sound_effects
 from ui.renderer import Renderer
 from ui.animations import animation_controller
 from ui.input_handler import InputHandler, GameAction
 from ui.menu_selector import MenuSelector, MenuItem
-
-# New feature imports - Phase 2 systems
-from world.scrapbook import Scrapbook, scrapbook
-from world.fishing import FishingMinigame, fishing_system, FishingSpot
-from world.garden import Garden, garden
-from world.treasure import TreasureHunter, treasure_hunter
-from world.challenges import ChallengeSystem, challenge_system
-from world.friends import FriendsSystem, friends_system
-from world.quests import QuestSystem, quest_system, QUESTS
-from world.festivals import FestivalSystem, festival_system
-from world.collectibles import CollectiblesSystem, collectibles_system
-from world.decorations import DecorationsSystem, decorations_system
-from world.life_story import LifeStorySystem
-from world.secrets import SecretsSystem, secrets_system
-from world.weather_activities import WeatherActivitiesSystem, weather_activities_system
-from world.trading import TradingSystem, trading_system
-from world.fortune import FortuneSystem, fortune_system
-
-from duck.outfits import OutfitManager, outfit_manager
-from duck.tricks import TricksSystem, tricks_system
-from duck.titles import TitlesSystem, titles_system
-from duck.aging import AgingSystem, aging_system, get_consequence_modifiers, get_detailed_stage
-from duck.personality_extended import ExtendedPersonalitySystem, extended_personality
-from duck.seasonal_clothing import SeasonalClothingSystem, seasonal_clothing
-
-from core.prestige import PrestigeSystem, prestige_system
-from core.save_slots import SaveSlotsSystem, save_slots_system
-
-from dialogue.diary_enhanced import EnhancedDiarySystem, enhanced_diary
-from dialogue.contextual_dialogue import ContextualDialogueSystem, contextual_dialogue
-from dialogue.mood_dialogue import MoodDialogueSystem, mood_dialogue_system, MoodType, DialogueContext, MOOD_DIALOGUES
-from dialogue.guest_conversations import get_random_conversation, GuestConversation
-
-from audio.ambient import AmbientSoundSystem, ambient_sound_system
-from audio.sound_effects import SoundEffectSystem, sound_effects
-
-# DuckBrain - Seaman-style memory and personality system
-from dialogue.duck_brain import DuckBrain
-
-# Duck desires - daily goals, motivation, interaction resistance
-from duck.desires import DuckDesires
-
-from ui.statistics import StatisticsSystem, statistics_system
-from ui.day_night import DayNightSystem, day_night_system
 from ui.event_animations import (
     EventAnimator, create_event_animator, ANIMATED_EVENTS,
     EventAnimationState, BreezeAnimator
 )
-from ui.badges import BadgesSystem, badges_system, BADGES
 from ui.reactions import DuckReactionController, init_reaction_controller
 from ui.menu_selector import MasterMenuPanel
 from ui.menu_structure import build_master_menu_tree, MENU_ACTIONS
+from core.save_slots import SaveSlotsSystem, save_slots_system
+
+# Gameplay modules are not needed to draw the title screen. They are imported
+# on first use, warmed one per frame while the title screen idles, and all
+# loaded before a game starts (see core.lazy).
+(check_consequences, apply_trust_gain, attempt_coax, apply_medicine,
+ thaw_cold_shoulder, get_trust_level_display, get_cold_shoulder_greeting,
+ get_cold_shoulder_interaction, is_cold_shoulder_active,
+ apply_personality_drift) = lazy_from(
+    "core.consequences",
+    "check_consequences", "apply_trust_gain", "attempt_coax", "apply_medicine",
+    "thaw_cold_shoulder", "get_trust_level_display", "get_cold_shoulder_greeting",
+    "get_cold_shoulder_interaction", "is_cold_shoulder_active",
+    "apply_personality_drift",
+)
+ProgressionSystem, Reward, RewardType, COLLECTIBLES = lazy_from(
+    "core.progression", "ProgressionSystem", "Reward", "RewardType", "COLLECTIBLES")
+Duck, = lazy_from("duck.duck", "Duck")
+BehaviorAI, = lazy_from("duck.behavior_ai", "BehaviorAI")
+EventSystem, = lazy_from("world.events", "EventSystem")
+AreaEventSystem, SpontaneousTravelSystem = lazy_from(
+    "world.area_events", "AreaEventSystem", "SpontaneousTravelSystem")
+Inventory, get_random_item, get_item_info = lazy_from(
+    "world.items", "Inventory", "get_random_item", "get_item_info")
+GoalSystem, = lazy_from("world.goals", "GoalSystem")
+AchievementSystem, ACHIEVEMENTS = lazy_from("world.achievements", "AchievementSystem", "ACHIEVEMENTS")
+DuckHome, = lazy_from("world.home", "DuckHome")
+AtmosphereManager, WeatherType, get_weather_need_modifiers = lazy_from(
+    "world.atmosphere", "AtmosphereManager", "WeatherType", "get_weather_need_modifiers")
+ExplorationSystem, = lazy_from("world.exploration", "ExplorationSystem")
+MaterialInventory, MATERIALS = lazy_from("world.materials", "MaterialInventory", "MATERIALS")
+CraftingSystem, RECIPES = lazy_from("world.crafting", "CraftingSystem", "RECIPES")
+BuildingSystem, BLUEPRINTS = lazy_from("world.building", "BuildingSystem", "BLUEPRINTS")
+get_shop_item, = lazy_from("world.shop", "get_item")
+BreadCatchGame, BugChaseGame, MemoryMatchGame, DuckRaceGame = lazy_from(
+    "world.minigames", "BreadCatchGame", "BugChaseGame", "MemoryMatchGame", "DuckRaceGame")
+MiniGameSystem, = lazy_from("world.minigames", "MiniGameSystem")
+DreamSystem, = lazy_from("world.dreams", "DreamSystem")
+get_random_fact, get_birthday_info, get_birthday_message = lazy_from(
+    "world.facts", "get_random_fact", "get_birthday_info", "get_birthday_message")
+execute_interaction, find_matching_item, ITEM_INTERACTIONS, InteractionResult = lazy_from(
+    "world.item_interactions",
+    "execute_interaction", "find_matching_item", "ITEM_INTERACTIONS", "InteractionResult")
+InteractionSource, = lazy_from("world.interaction_controller", "InteractionSource")
+DuckDiary, = lazy_from("dialogue.diary", "DuckDiary")
+DiaryManager, = lazy_from("dialogue.diary_manager", "DiaryManager")
+
+# Phase 2 systems
+Scrapbook, = lazy_from("world.scrapbook", "Scrapbook")
+FishingMinigame, FishingSpot = lazy_from("world.fishing", "FishingMinigame", "FishingSpot")
+Garden, = lazy_from("world.garden", "Garden")
+TreasureHunter, = lazy_from("world.treasure", "TreasureHunter")
+ChallengeSystem, = lazy_from("world.challenges", "ChallengeSystem")
+FriendsSystem, = lazy_from("world.friends", "FriendsSystem")
+QuestSystem, QUESTS = lazy_from("world.quests", "QuestSystem", "QUESTS")
+FestivalSystem, = lazy_from("world.festivals", "FestivalSystem")
+CollectiblesSystem, = lazy_from("world.collectibles", "CollectiblesSystem")
+DecorationsSystem, = lazy_from("world.decorations", "DecorationsSystem")
+LifeStorySystem, = lazy_from("world.life_story", "LifeStorySystem")
+SecretsSystem, = lazy_from("world.secrets", "SecretsSystem")
+WeatherActivitiesSystem, = lazy_from("world.weather_activities", "WeatherActivitiesSystem")
+TradingSystem, = lazy_from("world.trading", "TradingSystem")
+FortuneSystem, = lazy_from("world.fortune", "FortuneSystem")
+
+OutfitManager, = lazy_from("duck.outfits", "OutfitManager")
+TricksSystem, = lazy_from("duck.tricks", "TricksSystem")
+TitlesSystem, = lazy_from("duck.titles", "TitlesSystem")
+AgingSystem, get_consequence_modifiers, get_detailed_stage = lazy_from(
+    "duck.aging", "AgingSystem", "get_consequence_modifiers", "get_detailed_stage")
+ExtendedPersonalitySystem, = lazy_from("duck.personality_extended", "ExtendedPersonalitySystem")
+SeasonalClothingSystem, = lazy_from("duck.seasonal_clothing", "SeasonalClothingSystem")
+
+PrestigeSystem, = lazy_from("core.prestige", "PrestigeSystem")
+
+EnhancedDiarySystem, = lazy_from("dialogue.diary_enhanced", "EnhancedDiarySystem")
+ContextualDialogueSystem, = lazy_from("dialogue.contextual_dialogue", "ContextualDialogueSystem")
+mood_dialogue_system, DialogueContext = lazy_from(
+    "dialogue.mood_dialogue", "mood_dialogue_system", "DialogueContext")
+get_random_conversation, = lazy_from("dialogue.guest_conversations", "get_random_conversation")
+
+AmbientSoundSystem, = lazy_from("audio.ambient", "AmbientSoundSystem")
+
+# DuckBrain - Seaman-style memory and personality system
+DuckBrain, = lazy_from("dialogue.duck_brain", "DuckBrain")
+
+# Duck desires - daily goals, motivation, interaction resistance
+DuckDesires, = lazy_from("duck.desires", "DuckDesires")
+
+StatisticsSystem, = lazy_from("ui.statistics", "StatisticsSystem")
+DayNightSystem, = lazy_from("ui.day_night", "DayNightSystem")
+BadgesSystem, BADGES = lazy_from("ui.badges", "BadgesSystem", "BADGES")
 
 # Settings and menu systems
 from core.settings import settings_manager, get_settings, load_settings, save_settings
@@ -127,8 +143,13 @@ from core.update_scheduler import (
     ATMOSPHERE_CHECK_INTERVAL, AREA_EVENT_INTERVAL,
     SPONTANEOUS_TRAVEL_INTERVAL, RANDOM_COMMENT_INTERVAL,
     CRAFT_CHECK_INTERVAL, BUILD_CHECK_INTERVAL,
-    WEATHER_DAMAGE_INTERVAL, DIARY_FLUSH_INTERVAL,
+    WEATHER_DAMAGE_INTERVAL, DIARY_FLUSH_INTERVAL, DIALOGUE_CONTEXT_INTERVAL,
+    VOICE_POOL_INTERVAL,
 )
+from core.dialogue_context import ChatContext
+from core.frame_pacer import FramePacer
+from core.frame_profiler import frame_profiler
+from core.memory_telemetry import memory_telemetry
 from core.input_dispatcher import InputDispatcher, GlobalInputHandler, OverlayInputHandler
 from core.menu_system import MenuSystem, MenuDefinition, MenuItem as MenuItemNew
 
@@ -151,8 +172,94 @@ class Game:
     between duck, UI, and persistence systems.
     """
 
-    def __init__(self):
-        self.terminal = Terminal()
+    # Gameplay subsystems, bound on first access (see core.lazy)
+    conversation = LazySubsystem("dialogue.conversation", "conversation")
+    events = LazySubsystem("world.events", "event_system")
+    inventory = LazySubsystem("world.items", "Inventory", construct=True)
+    goals = LazySubsystem("world.goals", "goal_system")
+    achievements = LazySubsystem("world.achievements", "achievement_system")
+    progression = LazySubsystem("core.progression", "ProgressionSystem", construct=True)
+    home = LazySubsystem("world.home", "DuckHome", construct=True)
+
+    # Shop and habitat system
+    habitat = LazySubsystem("world.habitat", "Habitat", construct=True)
+
+    # Unified interaction controller - handles all duck-to-item interactions
+    interaction_controller = LazySubsystem(
+        "world.interaction_controller", "InteractionController", construct=True)
+
+    # Atmosphere and diary systems (Animal Crossing style)
+    atmosphere = LazySubsystem("world.atmosphere", "atmosphere")
+    diary = LazySubsystem("dialogue.diary", "duck_diary")
+
+    # Managed diary system (smart triggers, progressive voice, LLM entries)
+    diary_manager = LazySubsystem("dialogue.diary_manager", "DiaryManager", construct=True)
+
+    # Exploration, crafting, and building systems
+    exploration = LazySubsystem("world.exploration", "exploration")
+    materials = LazySubsystem("world.materials", "material_inventory")
+    crafting = LazySubsystem("world.crafting", "crafting")
+    building = LazySubsystem("world.building", "building")
+
+    # Area-specific events and spontaneous travel
+    area_events = LazySubsystem("world.area_events", "area_event_system")
+    spontaneous_travel = LazySubsystem("world.area_events", "spontaneous_travel")
+
+    # Mini-games and dreams
+    minigames = LazySubsystem("world.minigames", "MiniGameSystem", construct=True)
+    dreams = LazySubsystem("world.dreams", "DreamSystem", construct=True)
+
+    # Scrapbook & Memory System
+    scrapbook = LazySubsystem("world.scrapbook", "scrapbook")
+
+    # Activity Systems
+    fishing = LazySubsystem("world.fishing", "fishing_system")
+    garden = LazySubsystem("world.garden", "garden")
+    treasure = LazySubsystem("world.treasure", "treasure_hunter")
+
+    # Social & Progression Systems
+    challenges = LazySubsystem("world.challenges", "challenge_system")
+    friends = LazySubsystem("world.friends", "friends_system")
+    quests = LazySubsystem("world.quests", "quest_system")
+    festivals = LazySubsystem("world.festivals", "festival_system")
+    prestige = LazySubsystem("core.prestige", "prestige_system")
+
+    # Collection & Customization Systems
+    collectibles = LazySubsystem("world.collectibles", "collectibles_system")
+    tricks = LazySubsystem("duck.tricks", "tricks_system")
+    decorations = LazySubsystem("world.decorations", "decorations_system")
+    titles = LazySubsystem("duck.titles", "titles_system")
+    outfits = LazySubsystem("duck.outfits", "outfit_manager")
+    seasonal_clothing = LazySubsystem("duck.seasonal_clothing", "seasonal_clothing")
+
+    # World & Environment Systems
+    secrets = LazySubsystem("world.secrets", "secrets_system")
+    weather_activities = LazySubsystem("world.weather_activities", "weather_activities_system")
+    trading = LazySubsystem("world.trading", "trading_system")
+    fortune = LazySubsystem("world.fortune", "fortune_system")
+
+    # Duck Extended Systems
+    aging = LazySubsystem("duck.aging", "aging_system")
+    extended_personality = LazySubsystem("duck.personality_extended", "extended_personality")
+
+    # UI & Display Systems
+    statistics = LazySubsystem("ui.statistics", "statistics_system")
+    day_night = LazySubsystem("ui.day_night", "day_night_system")
+    badges = LazySubsystem("ui.badges", "badges_system")
+
+    # Audio Systems
+    ambient = LazySubsystem("audio.ambient", "ambient_sound_system")
+
+    # Enhanced Dialogue Systems
+    enhanced_diary = LazySubsystem("dialogue.diary_enhanced", "enhanced_diary")
+    contextual_dialogue = LazySubsystem("dialogue.contextual_dialogue", "contextual_dialogue")
+
+    # Life story / agenda layer
+    life_story = LazySubsystem("world.life_story", "LifeStorySystem", construct=True)
+
+    def __init__(self, terminal: Optional[Terminal] = None):
+        # A prepared terminal lets headless runs (core.soak_test) fix the size
+        self.terminal = terminal or Terminal()
         self.renderer = Renderer(self.terminal)
         self.input_handler = InputHandler(self.terminal)
         self.reaction_controller = init_reaction_controller(self.renderer)
@@ -161,37 +268,8 @@ class Game:
 
         self.duck: Optional[Duck] = None
         self.behavior_ai: Optional[BehaviorAI] = None
-        self.conversation: ConversationSystem = conversation
-        self.events: EventSystem = event_system
-        self.inventory: Inventory = Inventory()
-        self.goals: GoalSystem = goal_system
-        self.achievements: AchievementSystem = achievement_system
-        self.progression: ProgressionSystem = ProgressionSystem()
-        self.home: DuckHome = DuckHome()
-
-        # Shop and habitat system
-        from world.habitat import Habitat
-        self.habitat: Habitat = Habitat()
-
-        # Unified interaction controller - handles all duck-to-item interactions
-        self.interaction_controller: InteractionController = InteractionController()
-
-        # Atmosphere and diary systems (Animal Crossing style)
-        self.atmosphere: AtmosphereManager = atmosphere
-        self.diary: DuckDiary = duck_diary
-
-        # Managed diary system (smart triggers, progressive voice, LLM entries)
-        self.diary_manager: DiaryManager = DiaryManager()
-
-        # Exploration, crafting, and building systems
-        self.exploration: ExplorationSystem = exploration
-        self.materials: MaterialInventory = material_inventory
-        self.crafting: CraftingSystem = crafting
-        self.building: BuildingSystem = building
 
         # Area-specific events and spontaneous travel
-        self.area_events: AreaEventSystem = area_event_system
-        self.spontaneous_travel: SpontaneousTravelSystem = spontaneous_travel
         self._last_area_event_check: float = 0.0
         self._last_spontaneous_travel_check: float = 0.0
 
@@ -298,9 +376,6 @@ class Game:
         self._enhanced_diary_page = 0           # Current page within tab
         self._last_diary_flush: float = 0.0     # Last time diary_manager.flush_pending was called
 
-        # Life story / agenda layer
-        self.life_story: LifeStorySystem = LifeStorySystem()
-        
         # Title screen menu state
         self._title_menu_index = 0        # Currently selected title menu option
         self._title_update_status = ""    # Update status message for title screen
@@ -356,66 +431,21 @@ class Game:
         self._debug_items_per_page = 15  # Items per page in debug submenu
 
         # Mini-games system
-        self.minigames: MiniGameSystem = MiniGameSystem()
         self._active_minigame = None      # Currently playing minigame instance
         self._minigame_type = None        # Type of current minigame
         self._minigame_last_update = 0.0  # Last update time for minigames
         self._boombox_playing = False     # Track if boombox music is playing
 
         # Dreams system
-        self.dreams: DreamSystem = DreamSystem()
         self._dream_active = False        # Currently showing a dream
         self._dream_result = None         # Current dream result
         self._dream_scene_index = 0       # Current scene in dream
         self._dream_scene_timer = 0.0     # Timer for scene transitions
         
         # ============== NEW FEATURE SYSTEMS ==============
-        # Scrapbook & Memory System
-        self.scrapbook: Scrapbook = scrapbook
-        
-        # Activity Systems
-        self.fishing: FishingMinigame = fishing_system
-        self.garden: Garden = garden
-        self.treasure: TreasureHunter = treasure_hunter
-        
-        # Social & Progression Systems
-        self.challenges: ChallengeSystem = challenge_system
-        self.friends: FriendsSystem = friends_system
-        self.quests: QuestSystem = quest_system
-        self.festivals: FestivalSystem = festival_system
-        self.prestige: PrestigeSystem = prestige_system
-        
-        # Collection & Customization Systems
-        self.collectibles: CollectiblesSystem = collectibles_system
-        self.tricks: TricksSystem = tricks_system
-        self.decorations: DecorationsSystem = decorations_system
-        self.titles: TitlesSystem = titles_system
-        self.outfits: OutfitManager = outfit_manager
-        self.seasonal_clothing: SeasonalClothingSystem = seasonal_clothing
-        
-        # World & Environment Systems
-        self.secrets: SecretsSystem = secrets_system
-        self.weather_activities: WeatherActivitiesSystem = weather_activities_system
-        self.trading: TradingSystem = trading_system
-        self.fortune: FortuneSystem = fortune_system
-        
-        # Duck Extended Systems
-        self.aging: AgingSystem = aging_system
-        self.extended_personality: ExtendedPersonalitySystem = extended_personality
-        
-        # UI & Display Systems
-        self.statistics: StatisticsSystem = statistics_system
-        self.day_night: DayNightSystem = day_night_system
-        self.badges: BadgesSystem = badges_system
-        
-        # Audio Systems
-        self.ambient: AmbientSoundSystem = ambient_sound_system
+        # Feature subsystems are LazySubsystem class attributes above
         self.sound_effects: SoundEffectSystem = sound_effects
         
-        # Enhanced Dialogue Systems
-        self.enhanced_diary: EnhancedDiarySystem = enhanced_diary
-        self.contextual_dialogue: ContextualDialogueSystem = contextual_dialogue
-        
         # DuckBrain - Seaman-style memory and personality system
         self.duck_brain: Optional[DuckBrain] = None
         
@@ -498,8 +528,16 @@ class Game:
         # MenuSystem: menu registry (lifecycle authority, items via legacy MenuSelector)
         self.ui_state = UIStateManager()
         self.update_scheduler = UpdateScheduler()
+        self.frame_pacer = FramePacer(FPS)
+        self.save_tracker = SaveSectionTracker()
+        self._save_tracker_path = None
+        # Save sections whose subsystems are bound lazily (see _defer_section)
+        self._unread_sections: Dict[str, Callable[[], Any]] = {}
+        self._setup_save_sections()
         self.input_dispatcher = InputDispatcher()
         self.menu_system = MenuSystem(self.ui_state)
+        # Chat world-state context, pre-rendered on the main thread
+        self.dialogue_context = ChatContext()
 
         # ── DuckStore (centralized state management) ──────────────────
         try:
@@ -599,7 +637,7 @@ class Game:
         sched.register("tick", lambda: None, TICK_INTERVAL, enabled=True)
 
         # Auto-save
-        sched.register("auto_save", lambda: self._save_game(), SAVE_INTERVAL, enabled=True)
+        sched.register("auto_save", lambda: self._save_game(incremental=True), SAVE_INTERVAL, enabled=True)
 
         # Random event checks
         sched.register("event_check",        lambda: self._check_events(), EVENT_CHECK_INTERVAL, enabled=True)
@@ -628,6 +666,88 @@ class Game:
         # Diary manager flush (random musings + pending entries)
         sched.register("diary_flush",         lambda: self._flush_diary(), DIARY_FLUSH_INTERVAL, enabled=True)
 
+        # Chat context sections: re-rendered when their events fire or they age out
+        from core.event_bus import event_bus
+        self.dialogue_context.attach(event_bus)
+        self.dialogue_context.reset()
+        sched.register("dialogue_context",    self._refresh_dialogue_context, DIALOGUE_CONTEXT_INTERVAL, enabled=True)
+
+        # Voice generator line pool: small generation slices between frames
+        sched.register("voice_pool",          self._refill_voice_pool, VOICE_POOL_INTERVAL, enabled=True)
+
+        # In-process memory telemetry (sizes of the containers that can grow)
+        self._register_memory_probes()
+        sched.register("memory_telemetry",    memory_telemetry.sample, MEMORY_SAMPLE_INTERVAL, enabled=True)
+
+    def _register_memory_probes(self):
+        """
+        Register memory telemetry probes for long-lived containers.
+
+        Probes read through ``self`` and ``sys.modules`` at sample time, so
+        they follow save loads and never import an unloaded subsystem.
+        """
+        import sys
+        from core.event_bus import event_bus
+
+        if memory_telemetry.dump_path is None:
+            from pathlib import Path
+            from game_logger import get_logger
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            memory_telemetry.dump_path = Path(get_logger().log_dir) / f"memory_{stamp}.json"
+
+        def conversation_memory():
+            return self.duck_brain.conversation_memory if self.duck_brain else None
+
+        def sized(getter):
+            def probe():
+                container = getter()
+                return None if container is None else len(container)
+            return probe
+
+        def index_entries():
+            memory = conversation_memory()
+            if memory is None:
+                return None
+            return sum(len(ids) for index in (memory.topic_index, memory.fact_index,
+                                              memory.date_index) for ids in index.values())
+
+        def duck_memory(attr):
+            return lambda: getattr(self.duck.memory, attr) if self.duck else None
+
+        def llm_history():
+            module = sys.modules.get("dialogue.llm_chat")
+            llm = module.get_existing_llm_chat() if module else None
+            return len(llm._conversation_history) if llm else None
+
+        def llm_response_cache():
+            module = sys.modules.get("dialogue.llm_behavior")
+            controller = module._controller_instance if module else None
+            return len(controller._cache._cache) if controller else None
+
+        probes = {
+            "conversation_memory.conversations":
+                sized(lambda: conversation_memory() and conversation_memory().conversations),
+            "conversation_memory.summaries":
+                sized(lambda: conversation_memory() and conversation_memory().summaries),
+            "conversation_memory.quotes":
+                sized(lambda: conversation_memory() and conversation_memory().notable_quotes),
+            "conversation_memory.index_entries": index_entries,
+            "duck_memory.short_term": sized(duck_memory("short_term")),
+            "duck_memory.long_term": sized(duck_memory("long_term")),
+            "duck_memory.mood_history": sized(duck_memory("mood_history")),
+            "event_bus.history": lambda: event_bus.memory_stats()["history"],
+            "event_bus.queue": lambda: event_bus.memory_stats()["queue"],
+            "event_bus.subscribers": lambda: event_bus.memory_stats()["subscribers"],
+            "duck_store.audit_log":
+                lambda: self.duck_store.audit_log_size() if self.duck_store else None,
+            "particles.weather": lambda: self.renderer._particle_system.weather_count,
+            "particles.ambient": lambda: self.renderer._particle_system.ambient_count,
+            "llm.conversation_history": llm_history,
+            "llm.response_cache": llm_response_cache,
+        }
+        for name, probe in probes.items():
+            memory_telemetry.register(name, probe)
+
     def _setup_input_dispatcher(self):
         """
         Wire up the InputDispatcher with global and overlay handlers.
@@ -786,23 +906,31 @@ class Game:
     def _game_loop(self):
         """Main game loop."""
         frame_time = 1.0 / FPS
+        key = None  # Key read while blocking at the end of the previous frame
 
         with self.terminal.fullscreen(), self.terminal.cbreak(), self.terminal.hidden_cursor():
             while self._running:
                 loop_start = time.time()
+                frame_profiler.begin_frame()
 
                 try:
                     # Process input
-                    self._process_input()
+                    with frame_profiler.section("input"):
+                        self._process_input(key)
 
                     # Update game state
-                    if self._state == "ai_loading":
-                        self._update_ai_loading()
-                    elif self._state == "playing" and self.duck:
-                        self._update()
+                    with frame_profiler.section("update"):
+                        if self._state == "ai_loading":
+                            self._update_ai_loading()
+                        elif self._state == "playing" and self.duck:
+                            self._update()
+                        elif self._state == "title":
+                            # Import deferred gameplay modules while the title idles
+                            lazy_modules.warm_next()
 
                     # Render
-                    self._render()
+                    with frame_profiler.section("render"):
+                        self._render()
                 except KeyboardInterrupt:
                     raise
                 except Exception as e:
@@ -811,6 +939,20 @@ class Game:
                         self._show_error_dialog(e, "Game loop error")
                     except Exception:
                         pass  # If the dialog itself fails, keep running
+                # Time spent blocking for the next frame is not frame time
+                frame_profiler.end_frame()
+
+                if EVENT_DRIVEN_LOOP:
+                    # Block in a single inkey() until a key arrives or the next
+                    # update/animation deadline, instead of spinning at FPS.
+                    now = time.time()
+                    timeout = self.frame_pacer.compute_timeout(
+                        loop_start, now, self._get_frame_deadlines(now)
+                    )
+                    key = self.terminal.inkey(timeout=timeout)
+                    if key:
+                        self.frame_pacer.note_input()
+                    continue
 
                 # Cap frame rate with adaptive sleep for CachyOS/Arch compatibility
                 elapsed = time.time() - loop_start
@@ -822,10 +964,47 @@ class Game:
                 while time.time() - loop_start < frame_time:
                     time.sleep(0.001)
 
-    def _process_input(self):
-        """Process keyboard input."""
-        # Reduced timeout from 10ms to 3ms for more responsive input
-        key = self.terminal.inkey(timeout=0.003)
+    def _get_frame_deadlines(self, now: float) -> List[Optional[float]]:
+        """Collect the epoch times at which the next frame must run.
+
+        Anything that animates every frame (minigames, dreams, fishing, event
+        animations, item interactions) returns *now*, which keeps the loop at
+        full frame rate.  Otherwise the loop may sleep until the earliest of
+        the scheduler, the core tick and the renderer's animation deadline.
+        """
+        if self._state != "playing" or not self.duck:
+            return [now]
+        if (self._active_minigame or self._dream_active or self._event_animators
+                or self._item_interaction_active or self.fishing.is_fishing
+                or self.interaction_controller.is_interacting()):
+            return [now]
+
+        deadlines: List[Optional[float]] = [
+            self.update_scheduler.next_due_time(),
+            self._last_tick + TICK_RATE,
+            self.renderer.next_animation_deadline(now),
+        ]
+        if self._duck_traveling:
+            deadlines.append(self._travel_start_time + self._travel_duration)
+        if self._duck_exploring:
+            deadlines.append(self._exploring_start_time + self._exploring_duration)
+        if self._pending_note_fetch:
+            deadlines.append(self._pending_note_fetch_time)
+        if getattr(self, '_pending_talk_future', None) is not None:
+            # Streamed reply tokens arrive between frames
+            deadlines.append(now + TALK_STREAM_REFRESH)
+        return deadlines
+
+    def _process_input(self, key=None):
+        """Process keyboard input.
+
+        Args:
+            key: Keystroke already read by the event-driven loop.  When
+                 ``None`` the terminal is polled here instead.
+        """
+        if key is None:
+            # Reduced timeout from 10ms to 3ms for more responsive input
+            key = self.terminal.inkey(timeout=0.003)
 
         if not key:
             return
@@ -1574,7 +1753,7 @@ class Game:
 
         if hasattr(self, "statistics") and self.statistics:
             self.statistics.increment_stat("coins_spent", item.cost)
-            self.statistics.items_bought += 1
+            self.statistics.add_to_count("items_bought")
 
         # Award XP for shopping (both paths)
         new_level = self._award_xp(5, "shopping")
@@ -1858,7 +2037,11 @@ class Game:
         import concurrent.futures
         if not hasattr(self, '_talk_executor'):
             self._talk_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Bring the chat context up to date here, so the worker only reads a snapshot
+        self._refresh_dialogue_context()
         self._pending_talk_message = message
+        self._talk_partial = ""
+        self._talk_partial_shown = ""
         self._pending_talk_future = self._talk_executor.submit(
             self._generate_talk_response,
             message,
@@ -1895,17 +2078,31 @@ class Game:
         return self.conversation.process_player_input(
             self.duck,
             message,
-            True,  # use_llm for ambient enrichment when available
-            memory_context,
+            use_llm=True,
+            memory_context=memory_context,
+            on_partial=self._on_talk_partial,
         )
 
+    def _on_talk_partial(self, text: str):
+        """Receive a streamed, still-growing reply (inference thread).
+
+        Only stores the text; ``_check_pending_talk`` shows it on the main
+        thread.
+        """
+        self._talk_partial = text
+
     def _check_pending_talk(self):
         """Check if an async LLM talk response is ready."""
         future = getattr(self, '_pending_talk_future', None)
         if future is None:
+            self._show_talk_follow_up()
             return
         
         if not future.done():
+            partial = getattr(self, '_talk_partial', "")
+            if partial and partial != self._talk_partial_shown:
+                self._talk_partial_shown = partial
+                self.renderer.show_partial_message(partial, category="duck")
             return
         
         # Response is ready
@@ -1954,8 +2151,10 @@ class Game:
             if self.duck_brain.player_model.name and self.conversation:
                 self.conversation.set_player_name(self.duck_brain.player_model.name)
 
-        # Show the actual response (replaces the thinking indicator)
-        self.renderer.show_message(response, duration=8.0, category="duck")
+        # Show the actual response (replaces the thinking indicator and
+        # any streamed partial reply)
+        self.renderer.show_message(response, duration=8.0, category="duck",
+                                   replaces_partial=True)
 
         # Play quacks for each syllable in the duck's response
         mood = self.duck.get_mood().state.value
@@ -1973,6 +2172,7 @@ class Game:
                     friend.player_chat_history.append(original_message)
                     if len(friend.player_chat_history) > 20:
                         friend.player_chat_history = friend.player_chat_history[-20:]
+                    self.save_tracker.mark_dirty("friends")
                     # Get visitor reaction (may be None if they don't react)
                     duck_name = self.duck.name if self.duck else "Cheese"
                     visitor_response = visitor_animator.respond_to_player_chat(
@@ -1985,6 +2185,16 @@ class Game:
             except Exception:
                 pass
 
+    def _show_talk_follow_up(self):
+        """Show an LLM reply that missed the chat deadline as a follow-up line."""
+        if not self.conversation or not self.duck:
+            return
+        follow_up = self.conversation.take_follow_up()
+        if not follow_up:
+            return
+        self.renderer.show_message(follow_up, duration=8.0, category="duck")
+        duck_sounds.quack_for_text(follow_up, self.duck.get_mood().state.value)
+
     def _parse_llm_actions(self, response: str):
         """Extract [ACTION:xxx] tags from LLM response.
         
@@ -3508,7 +3718,7 @@ class Game:
                 duration=5.0
             )
             if quest_complete and hasattr(self, "statistics") and self.statistics:
-                self.statistics.quests_completed += 1
+                self.statistics.add_to_count("quests_completed")
             
             # Update statistics
             self.progression.stats["quests_completed"] = self.progression.stats.get("quests_completed", 0) + 1
@@ -3692,7 +3902,7 @@ class Game:
         self.habitat.add_currency(final_amount)
         if hasattr(self, "statistics") and self.statistics:
             self.statistics.increment_stat("coins_earned", final_amount)
-            self.statistics.most_coins_held = max(self.statistics.most_coins_held, self.habitat.currency)
+            self.statistics.record_best("most_coins_held", self.habitat.currency)
         return final_amount
 
     def _award_xp(self, amount: int, source: str = "reward") -> Optional[int]:
@@ -3704,10 +3914,10 @@ class Game:
         new_level = self.progression.add_xp(final_amount, source)
         if hasattr(self, "statistics") and self.statistics:
             self.statistics.increment_stat("xp_earned", final_amount)
-            self.statistics.current_level = self.progression.level
-            self.statistics.highest_level = max(self.statistics.highest_level, self.progression.level)
+            self.statistics.set_value("current_level", self.progression.level)
+            self.statistics.record_best("highest_level", self.progression.level)
             if self.progression.level > old_level:
-                self.statistics.levels_gained += self.progression.level - old_level
+                self.statistics.add_to_count("levels_gained", self.progression.level - old_level)
         return new_level
 
     def _apply_reward(self, reward: Reward):
@@ -3786,12 +3996,14 @@ class Game:
     def _update(self):
         """Update game state."""
         current_time = time.time()
+        laps = frame_profiler.laps("update")
 
         # Run UpdateScheduler (fires registered periodic callbacks)
         try:
             self.update_scheduler.update(current_time)
         except Exception:
             pass
+        laps.mark("scheduler")
 
         # Update TimeManager
         try:
@@ -3809,6 +4021,7 @@ class Game:
 
         # Check for async LLM talk responses
         self._check_pending_talk()
+        laps.mark("queues")
 
         # Update item interaction animation
         self._update_item_interaction_animation()
@@ -3827,6 +4040,7 @@ class Game:
 
         # Update event animations (butterfly, bird, etc.)
         self._update_event_animations()
+        laps.mark("animations")
 
         # Check whether duck has walked to a world edge (triggers biome transition)
         self._check_biome_edge(current_time)
@@ -3871,6 +4085,8 @@ class Game:
             if current_time - self._exploring_start_time >= self._exploring_duration:
                 self._complete_exploring()
 
+        laps.mark("activities")
+
         # Update at tick rate
         if current_time - self._last_tick >= TICK_RATE:
             delta_seconds = current_time - self._last_tick
@@ -4059,6 +4275,8 @@ class Game:
 
             self._last_tick = current_time
 
+        laps.mark("tick")
+
         # Update atmosphere (weather, visitors) every 30 seconds
         if current_time - self._last_atmosphere_check >= 30:
             # Scheduler fires atmosphere.update(); post-callback logic follows
@@ -4213,6 +4431,8 @@ class Game:
 
             self._last_atmosphere_check = current_time
 
+        laps.mark("atmosphere")
+
         # Update duck reactions and dynamic music more frequently (every frame, with internal throttling)
         # Get current context for reactions and music
         weather_str = self.atmosphere.current_weather.weather_type.value if self.atmosphere.current_weather else "sunny"
@@ -4237,6 +4457,7 @@ class Game:
 
         # Update active visitor interactions (every frame when there's a visitor)
         self._update_visitor_interactions(current_time)
+        laps.mark("music_visitors")
 
         # Check for random events (every 30 seconds)
         # Skip events during active guest conversations so they don't overlap
@@ -4283,6 +4504,8 @@ class Game:
                 duck_sounds.quack("content")
             self._pending_weather_comment = None
 
+        laps.mark("events_comments")
+
         # Autonomous behavior (skip if duck is busy traveling/exploring/building/dreaming/egg)
         is_egg = self.duck and self.duck.growth_stage == "egg"
         if self.behavior_ai and not self._duck_traveling and not self._duck_exploring and not self._duck_building and not self._dream_active and not is_egg:
@@ -4449,8 +4672,11 @@ class Game:
                             mood = self.duck.get_mood().state.value
                             duck_sounds.quack(mood)
 
+        laps.mark("behavior")
+
         # Duck interacts with nearby habitat items (10% chance per update)
         self._check_item_interaction(current_time)
+        laps.mark("item_interactions")
 
         # Check crafting progress (every 2 seconds)
         if current_time - self._last_craft_check >= 2:
@@ -4648,6 +4874,7 @@ class Game:
             # Visitor is leaving
             if not visitor_animator._is_leaving:
                 # Save unlocked topics before leaving
+                self.save_tracker.mark_dirty("friends")
                 new_topics = visitor_animator.get_unlocked_topics()
                 if new_topics and friend:
                     for topic in new_topics:
@@ -5329,67 +5556,115 @@ class Game:
     def _simulate_offline_world(self, hours_away: float) -> list:
         """Simulate world events that happened while the game was closed.
         
-        Steps through time in 30-minute ticks, rolling for weather changes,
-        friend visits, spontaneous Cheese travel, and item finds.
-        Returns a list of event description strings for the offline summary.
+        Models the absence as 30-minute ticks rolling for weather changes,
+        friend visits, spontaneous Cheese travel, and item finds, but only
+        visits the ticks where a roll succeeds, so there is no cap on how
+        long the absence can be. Crafting, building and garden timers are
+        advanced in one step. Returns a list of event description strings
+        for the offline summary.
         """
+        from config import MAX_OFFLINE_NEED_HOURS
+        from world.garden import GrowthStage
         events = []
-        ticks = int(min(hours_away * 2, 96))  # 30-min ticks, cap at 48 hours
+        ticks = offline_ticks(hours_away)
 
-        for tick in range(ticks):
-            # Weather changes (~20% chance per tick)
-            if random.random() < 0.20:
-                try:
-                    old_weather = self.atmosphere.current_weather
-                    self.atmosphere.update()
-                    new_weather = self.atmosphere.current_weather
-                    if old_weather and new_weather and old_weather.weather_type != new_weather.weather_type:
-                        events.append(f"Weather changed to {new_weather.weather_type.value}")
-                except Exception:
-                    pass
+        # Weather changes (~20% chance per tick). Weather follows the wall
+        # clock, so one refresh gives the same end state as many.
+        if next(bernoulli_hits(ticks, 0.20), None) is not None:
+            try:
+                old_weather = self.atmosphere.current_weather
+                self.atmosphere.update()
+                new_weather = self.atmosphere.current_weather
+                if old_weather and new_weather and old_weather.weather_type != new_weather.weather_type:
+                    events.append(f"Weather changed to {new_weather.weather_type.value}")
+            except Exception:
+                pass
 
-            # Friend visits (~5% chance per tick, daytime only)
+        # Friend visits (~5% chance per tick, daytime only)
+        visits = Counter()
+        for tick in bernoulli_hits(ticks, 0.05):
             simulated_hour = (8 + tick) % 24  # Start from 8 AM
-            if 7 <= simulated_hour <= 22 and random.random() < 0.05:
-                try:
-                    visited, msg = self.friends.check_for_random_visitor(simulated_hour)
-                    if visited:
-                        friend_name = "A friend"
-                        if self.friends.current_visit:
-                            f = self.friends.get_friend_by_id(self.friends.current_visit.friend_id)
-                            if f:
-                                friend_name = f.name
-                            # End the visit immediately for simulation
-                            self.friends.end_visit()
-                        events.append(f"{friend_name} stopped by")
-                except Exception:
-                    pass
+            if not 7 <= simulated_hour <= 22:
+                continue
+            try:
+                visited, msg = self.friends.check_for_random_visitor(simulated_hour)
+                if visited:
+                    friend_name = "A friend"
+                    if self.friends.current_visit:
+                        f = self.friends.get_friend_by_id(self.friends.current_visit.friend_id)
+                        if f:
+                            friend_name = f.name
+                        # End the visit immediately for simulation
+                        self.friends.end_visit()
+                    visits[f"{friend_name} stopped by"] += 1
+            except Exception:
+                pass
+        events.extend(summarize_repeats(visits))
 
-            # Cheese spontaneous travel (~3% chance per tick)
-            if random.random() < 0.03:
-                try:
-                    available = self.exploration.get_available_areas(self.progression.level)
-                    if len(available) >= 2:
-                        current_name = "Home Pond"
-                        if self.exploration.current_area:
-                            current_name = self.exploration.current_area.name
-                        areas = [a for a in available if a.name != current_name]
-                        if areas:
-                            dest = random.choice(areas)
-                            events.append(f"Cheese explored {dest.name}")
-                except Exception:
-                    pass
+        # Cheese spontaneous travel (~3% chance per tick)
+        trips = Counter()
+        travel_ticks = sum(1 for _ in bernoulli_hits(ticks, 0.03))
+        if travel_ticks:
+            try:
+                available = self.exploration.get_available_areas(self.progression.level)
+                current_name = "Home Pond"
+                if self.exploration.current_area:
+                    current_name = self.exploration.current_area.name
+                areas = [a for a in available if a.name != current_name]
+                if len(available) >= 2 and areas:
+                    for _ in range(travel_ticks):
+                        trips[f"Cheese explored {random.choice(areas).name}"] += 1
+            except Exception:
+                pass
+        events.extend(summarize_repeats(trips))
 
-            # Item finds (~2% chance per tick)
-            if random.random() < 0.02:
-                try:
-                    from world.items import get_random_item, get_item_info
-                    item_id = get_random_item("common")
-                    if item_id and self.inventory.add_item(item_id):
-                        item = get_item_info(item_id)
-                        events.append(f"Found {item.name}")
-                except Exception:
-                    pass
+        # Item finds (~2% chance per tick)
+        finds = Counter()
+        for _ in bernoulli_hits(ticks, 0.02):
+            try:
+                item_id = get_random_item("common")
+                if item_id and self.inventory.add_item(item_id):
+                    finds[f"Found {get_item_info(item_id).name}"] += 1
+            except Exception:
+                pass
+        events.extend(summarize_repeats(finds))
+
+        # Timers run on through the absence in a single step
+        try:
+            craft = self.crafting.current_craft
+            if craft and craft.is_complete():
+                recipe = RECIPES.get(craft.recipe_id)
+                self._update_crafting_progress()
+                if recipe:
+                    events.append(f"Finished crafting {recipe.name}")
+        except Exception:
+            pass
+        try:
+            if self.building.current_build:
+                result = self.building.catch_up_building(self.materials, hours_away * 3600)
+                if result.get("completed"):
+                    self._complete_building(result)
+                    bp = BLUEPRINTS.get(result.get("blueprint_id"))
+                    events.append(f"Finished building {bp.name if bp else 'a structure'}")
+        except Exception:
+            pass
+        try:
+            before = {pid: plot.plant.growth_stage for pid, plot in self.garden.plots.items()
+                      if plot.plant}
+            # Plants, like needs, never suffer more than one bad day of neglect
+            self.garden.catch_up(min(hours_away, MAX_OFFLINE_NEED_HOURS))
+            ready = withered = 0
+            for pid, stage in before.items():
+                plant = self.garden.plots[pid].plant
+                if plant and plant.growth_stage != stage:
+                    ready += plant.growth_stage == GrowthStage.HARVESTABLE
+                    withered += plant.growth_stage == GrowthStage.WITHERED
+            if ready:
+                events.append(f"{ready} plant{'s' if ready > 1 else ''} ready to harvest")
+            if withered:
+                events.append(f"{withered} plant{'s' if withered > 1 else ''} withered")
+        except Exception:
+            pass
 
         return events
 
@@ -5756,6 +6031,7 @@ class Game:
                 terminal_options=self._terminal_options,
                 terminal_index=self._terminal_selection_index
             )
+            note_title_drawn()
         elif self._state == "ai_loading":
             self.renderer.render_loading_screen(
                 title="Warming up Cheese's brain",
@@ -6006,6 +6282,7 @@ class Game:
 
     def _start_new_game(self):
         """Start a new game with a new duck."""
+        lazy_modules.load_all()
         # Stop title music (both methods to ensure it stops)
         sound_engine.stop_music()
         sound_engine.stop_background_music()
@@ -6013,6 +6290,7 @@ class Game:
         self.duck = Duck.create_new()
         self.behavior_ai = BehaviorAI()
         self.inventory = Inventory()
+        self.save_tracker.reset()
 
         # Reset DuckStore with fresh duck
         try:
@@ -6209,9 +6487,12 @@ class Game:
 
     def _load_game(self):
         """Load an existing save."""
+        lazy_modules.load_all()
         active_slot = getattr(self.save_slots, 'current_slot', 1)
         self._sync_save_manager_to_slot()
         data = self.save_manager.load()
+        self.save_tracker.reset()
+        self._save_tracker_path = self.save_manager.save_path
         if not data:
             self._state = "title"
             self._start_title_music()
@@ -6296,7 +6577,7 @@ class Game:
 
         # Load diary (narrative journal)
         if "diary" in data:
-            self.diary = DuckDiary.from_dict(data["diary"])
+            self._defer_section(data, "diary", DuckDiary)
         else:
             self.diary = DuckDiary()
             # Record hatching for new diary
@@ -6510,7 +6791,7 @@ class Game:
 
         # Load enhanced diary system
         if "enhanced_diary" in data:
-            self.enhanced_diary = EnhancedDiarySystem.from_dict(data["enhanced_diary"])
+            self._defer_section(data, "enhanced_diary", EnhancedDiarySystem)
         else:
             self.enhanced_diary = EnhancedDiarySystem()
 
@@ -6520,11 +6801,12 @@ class Game:
         else:
             self.diary_manager = DiaryManager()
 
-        # Bind diary manager to game systems and check for absence
+        # Bind diary manager to game systems and check for absence.  The
+        # diary is left out so it stays unread; the manager reaches it
+        # through game= when it first writes an entry.
         self.diary_manager.bind(
             duck=self.duck,
-            diary=self.diary,
-            enhanced=self.enhanced_diary,
+            diary=None,
             duck_brain=self.duck_brain if hasattr(self, 'duck_brain') else None,
             game=self,
         )
@@ -6665,7 +6947,7 @@ class Game:
 
                 need_hours = min(offline["hours"], MAX_OFFLINE_NEED_HOURS)
                 offline_minutes = (need_hours * 60) * offline["decay_multiplier"]
-                self.duck.update(
+                self.duck.catch_up(
                     offline_minutes,
                     aging_modifiers=self._get_current_aging_modifiers(),
                     decay_multiplier=self._get_need_decay_multiplier(),
@@ -6705,7 +6987,7 @@ class Game:
                 if hasattr(self, 'duck_store') and self.duck_store:
                     self.duck_store.sync_from_duck(self.duck)
 
-                # Tick-based offline world simulation
+                # Offline world catch-up
                 offline_events = self._simulate_offline_world(offline["hours"])
 
                 # Show offline summary
@@ -6765,6 +7047,29 @@ class Game:
 
         self._enter_ai_loading_if_needed(target_state=self._state)
 
+    def _defer_section(self, data, attr: str, cls) -> None:
+        """
+        Build ``self.<attr>`` from its save section on first access.
+
+        The diaries are only read when the player interacts or opens them,
+        so their blobs are neither read nor decoded at load.  Until then
+        saves keep the section's blob (see ``KeepSection``).  A section that
+        can no longer be read starts over instead of crashing mid-game.
+        """
+        read = data.deferred(attr) if isinstance(data, LazySave) else (lambda v=data[attr]: v)
+        self._unread_sections[attr] = read
+
+        def load():
+            self._unread_sections.pop(attr, None)
+            try:
+                return cls.from_dict(read())
+            except Exception as e:
+                from game_logger import get_logger
+                get_logger().error(f"Could not load {attr} from save: {e}")
+                return cls()
+
+        defer_subsystem(self, attr, load)
+
     def _connect_duck_brain_to_llm(self, llm_chat=None):
         """Connect DuckBrain to the LLM chat system for enhanced context.
         
@@ -6873,8 +7178,114 @@ class Game:
             except Exception:
                 pass
 
-    def _save_game(self):
-        """Save the current game state."""
+    def _setup_save_sections(self):
+        """
+        Register every save section with the SaveSectionTracker.
+
+        Sections with a ``revision`` are only re-serialized on autosave when
+        their subsystem reports a change; the rest are cheap and always
+        written.  Revisions include ``id()`` so a subsystem replaced on load
+        never looks unchanged.
+        """
+        tracker = self.save_tracker
+
+        def revision_of(attr):
+            def _revision():
+                if is_deferred(self, attr):
+                    return (None, "unread")
+                obj = getattr(self, attr, None)
+                return (id(obj), getattr(obj, "save_revision", None))
+            return _revision
+
+        def to_dict_or_keep(attr):
+            # A subsystem still waiting on _defer_section keeps its blob
+            def _serialize():
+                if is_deferred(self, attr):
+                    return KeepSection(self._unread_sections[attr])
+                return getattr(self, attr).to_dict()
+            return _serialize
+
+        sections = {
+            "last_played": lambda: self.clock.timestamp,
+            "inventory": lambda: self.inventory.to_dict(),
+            "events": lambda: self.events.to_dict(),
+            "goals": lambda: self.goals.to_dict(),
+            "achievements": lambda: self.achievements.to_dict(),
+            "progression": lambda: self.progression.to_dict(),
+            "home": lambda: self.home.to_dict(),
+            "habitat": lambda: self.habitat.to_dict(),
+            "atmosphere": lambda: self.atmosphere.to_dict(),
+            "exploration": lambda: self.exploration.to_dict(),
+            "materials": lambda: self.materials.to_dict(),
+            "crafting": lambda: self.crafting.to_dict(),
+            "building": lambda: self.building.to_dict(),
+            "minigames": lambda: self.minigames.to_dict(),
+            "dreams": lambda: self.dreams.to_dict(),
+            "statistics": lambda: self._statistics,
+            "weather_seen": lambda: list(self._weather_seen),
+            # ============== NEW FEATURE SYSTEMS ==============
+            "scrapbook": lambda: self.scrapbook.to_dict(),
+            "fishing": lambda: self.fishing.to_dict(),
+            "garden": lambda: self.garden.to_dict(),
+            "treasure": lambda: self.treasure.to_dict(),
+            "challenges": lambda: self.challenges.to_dict(),
+            "festivals": lambda: self.festivals.to_dict(),
+            "prestige": lambda: self.prestige.to_dict(),
+            "collectibles": lambda: self.collectibles.to_dict(),
+            "tricks": lambda: self.tricks.to_dict(),
+            "decorations": lambda: self.decorations.to_dict(),
+            "titles": lambda: self.titles.to_dict(),
+            "outfits": lambda: self.outfits.to_dict(),
+            "seasonal_clothing": lambda: self.seasonal_clothing.to_dict(),
+            "secrets": lambda: self.secrets.to_dict(),
+            "weather_activities": lambda: self.weather_activities.to_dict(),
+            "trading": lambda: self.trading.to_dict(),
+            "fortune": lambda: self.fortune.to_dict(),
+            "aging": lambda: self.aging.to_dict(),
+            "extended_personality": lambda: self.extended_personality.to_dict(),
+            "day_night": lambda: self.day_night.to_dict(),
+            "badges": lambda: self.badges.to_dict(),
+            "save_slots": lambda: self.save_slots.to_dict(),
+            # Area event system and spontaneous travel
+            "area_events": lambda: self.area_events.to_dict(),
+            "spontaneous_travel": lambda: self.spontaneous_travel.to_dict(),
+            "cheese_away": lambda: self._cheese_away,
+            "cheese_away_biome": lambda: self._cheese_away_biome,
+            "cheese_away_destination": lambda: self._cheese_away_destination,
+            "cheese_away_since": lambda: self._cheese_away_since,
+            "cheese_away_friend": lambda: self._cheese_away_friend,
+            # Duck desires / daily goals
+            "desires": lambda: self.duck.desires.to_dict() if hasattr(self.duck, '_desires') else {},
+            "life_story": lambda: self.life_story.to_dict() if hasattr(self, "life_story") and self.life_story else {},
+            # ============== END NEW FEATURE SYSTEMS ==============
+        }
+        for name, serialize in sections.items():
+            tracker.register(name, serialize)
+
+        # Larger subsystems report their own changes
+        tracker.register("duck", lambda: self.duck.to_dict(), revision=revision_of("duck"))
+        tracker.register("friends", lambda: self.friends.to_dict(), revision=revision_of("friends"))
+        tracker.register("quests", lambda: self.quests.to_dict(), revision=revision_of("quests"))
+        tracker.register("statistics_system", lambda: self.statistics.to_dict(),
+                         revision=revision_of("statistics"))
+        tracker.register("diary", to_dict_or_keep("diary"), revision=revision_of("diary"))
+        tracker.register("enhanced_diary", to_dict_or_keep("enhanced_diary"),
+                         revision=revision_of("enhanced_diary"))
+        tracker.register("diary_manager", lambda: self.diary_manager.to_dict(),
+                         revision=revision_of("diary_manager"))
+        # DuckBrain - Seaman-style persistent memory
+        tracker.register("duck_brain",
+                         lambda: self.duck_brain.to_dict() if self.duck_brain else None,
+                         revision=revision_of("duck_brain"))
+
+    def _save_game(self, incremental: bool = False):
+        """Save the current game state.
+
+        Args:
+            incremental: Only re-serialize sections whose subsystems changed
+                since the last save (used by the autosave scheduler).  Explicit
+                saves always write every section.
+        """
         if not self.duck:
             return
 
@@ -6887,69 +7298,15 @@ class Game:
 
         self._sync_statistics_snapshot()
 
-        save_data = {
-            "duck": self.duck.to_dict(),
-            "last_played": self.clock.timestamp,
-            "inventory": self.inventory.to_dict(),
-            "events": self.events.to_dict(),
-            "goals": self.goals.to_dict(),
-            "achievements": self.achievements.to_dict(),
-            "progression": self.progression.to_dict(),
-            "home": self.home.to_dict(),
-            "habitat": self.habitat.to_dict(),
-            "atmosphere": self.atmosphere.to_dict(),
-            "diary": self.diary.to_dict(),
-            "exploration": self.exploration.to_dict(),
-            "materials": self.materials.to_dict(),
-            "crafting": self.crafting.to_dict(),
-            "building": self.building.to_dict(),
-            "minigames": self.minigames.to_dict(),
-            "dreams": self.dreams.to_dict(),
-            "statistics": self._statistics,
-            "weather_seen": list(self._weather_seen),
-            # ============== NEW FEATURE SYSTEMS ==============
-            "scrapbook": self.scrapbook.to_dict(),
-            "fishing": self.fishing.to_dict(),
-            "garden": self.garden.to_dict(),
-            "treasure": self.treasure.to_dict(),
-            "challenges": self.challenges.to_dict(),
-            "friends": self.friends.to_dict(),
-            "quests": self.quests.to_dict(),
-            "festivals": self.festivals.to_dict(),
-            "prestige": self.prestige.to_dict(),
-            "collectibles": self.collectibles.to_dict(),
-            "tricks": self.tricks.to_dict(),
-            "decorations": self.decorations.to_dict(),
-            "titles": self.titles.to_dict(),
-            "outfits": self.outfits.to_dict(),
-            "seasonal_clothing": self.seasonal_clothing.to_dict(),
-            "secrets": self.secrets.to_dict(),
-            "weather_activities": self.weather_activities.to_dict(),
-            "trading": self.trading.to_dict(),
-            "fortune": self.fortune.to_dict(),
-            "aging": self.aging.to_dict(),
-            "extended_personality": self.extended_personality.to_dict(),
-            "statistics_system": self.statistics.to_dict(),
-            "day_night": self.day_night.to_dict(),
-            "badges": self.badges.to_dict(),
-            "enhanced_diary": self.enhanced_diary.to_dict(),
-            "diary_manager": self.diary_manager.to_dict(),
-            "save_slots": self.save_slots.to_dict(),
-            # DuckBrain - Seaman-style persistent memory
-            "duck_brain": self.duck_brain.to_dict() if self.duck_brain else None,
-            # Area event system and spontaneous travel
-            "area_events": self.area_events.to_dict(),
-            "spontaneous_travel": self.spontaneous_travel.to_dict(),
-            "cheese_away": self._cheese_away,
-            "cheese_away_biome": self._cheese_away_biome,
-            "cheese_away_destination": self._cheese_away_destination,
-            "cheese_away_since": self._cheese_away_since,
-            "cheese_away_friend": self._cheese_away_friend,
-            # Duck desires / daily goals
-            "desires": self.duck.desires.to_dict() if hasattr(self.duck, '_desires') else {},
-            "life_story": self.life_story.to_dict() if hasattr(self, "life_story") and self.life_story else {},
-            # ============== END NEW FEATURE SYSTEMS ==============
-        }
+        # A different save path (slot switch) has none of our sections yet
+        if self._save_tracker_path != self.save_manager.save_path:
+            load_deferred(self)
+            self.save_tracker.reset()
+            self._save_tracker_path = self.save_manager.save_path
+
+        save_data = self.save_tracker.collect(force=not incremental)
+        partial = not self.save_tracker.last_was_full
+        written = list(save_data)
 
         # Persist DuckStore state alongside the main save data
         try:
@@ -6959,8 +7316,8 @@ class Game:
             from game_logger import get_logger
             get_logger().debug("Failed to serialize duck_store for save")
 
-        # Deep-copy and write to disk on a background thread so the main
-        # loop never blocks on JSON serialization + file I/O.
+        # Deep-copy the changed sections and write them on a background thread
+        # so the main loop never blocks on JSON serialization + file I/O.
         import copy
         save_copy = copy.deepcopy(save_data)
         if not hasattr(self, '_save_executor'):
@@ -6968,9 +7325,20 @@ class Game:
             self._save_executor = concurrent.futures.ThreadPoolExecutor(
                 max_workers=1, thread_name_prefix="save"
             )
-        self._save_executor.submit(self.save_manager.save, save_copy)
+        future = self._save_executor.submit(self.save_manager.save, save_copy, partial)
+        future.add_done_callback(
+            lambda done: self._on_save_finished(done, written, full=not partial))
         notification_manager.show("Game saved!", "success", 1.5)
 
+    def _on_save_finished(self, future, sections: List[str], full: bool = False):
+        """Runs on the save thread: sections of a failed write are collected again."""
+        try:
+            ok = future.result()
+        except Exception:
+            ok = False
+        if not ok:
+            self.save_tracker.mark_unsaved(sections, full=full)
+
     def _return_to_title(self):
         """Save the game and return to title screen."""
         if self.duck:
@@ -7105,22 +7473,23 @@ class Game:
             return
         try:
             if self.progression:
-                self.statistics.current_level = self.progression.level
-                self.statistics.highest_level = max(self.statistics.highest_level, self.progression.level)
-                self.statistics.current_login_streak = getattr(self.progression, "current_streak", self.statistics.current_login_streak)
-                self.statistics.best_login_streak = max(
-                    self.statistics.best_login_streak,
+                self.statistics.set_value("current_level", self.progression.level)
+                self.statistics.record_best("highest_level", self.progression.level)
+                self.statistics.set_value("current_login_streak", getattr(self.progression, "current_streak", self.statistics.current_login_streak))
+                self.statistics.record_best(
+                    "best_login_streak",
                     getattr(self.progression, "longest_streak", self.statistics.best_login_streak),
                 )
             if self.duck:
-                self.statistics.duck_age_days = int(self.duck.get_age_days())
+                self.statistics.set_value("duck_age_days", int(self.duck.get_age_days()))
                 mood = self.duck.get_mood().state
                 self.statistics.record_mood(mood.value if hasattr(mood, "value") else str(mood))
             if self.habitat:
-                self.statistics.most_coins_held = max(self.statistics.most_coins_held, self.habitat.currency)
+                self.statistics.record_best("most_coins_held", self.habitat.currency)
             if self.achievements:
                 unlocked = [getattr(achievement, "id", str(achievement)) for achievement in self.achievements.get_unlocked()]
-                self.statistics.milestones_reached = list({*self.statistics.milestones_reached, *unlocked})
+                self.statistics.set_value(
+                    "milestones_reached", sorted({*self.statistics.milestones_reached, *unlocked}))
         except Exception:
             pass
 
@@ -8603,11 +8972,11 @@ class Game:
                         if fish_def and fish_def.rarity in (FishRarity.RARE, FishRarity.EPIC, FishRarity.LEGENDARY, FishRarity.MYTHICAL):
                             self._process_quest_updates("fish", "rare", 1)
                             if hasattr(self, "statistics") and self.statistics:
-                                self.statistics.rare_fish_caught += 1
+                                self.statistics.add_to_count("rare_fish_caught")
                         if fish_def and fish_def.rarity in (FishRarity.LEGENDARY, FishRarity.MYTHICAL):
                             self.challenges.update_progress("catch_legendary_fish", 1)
                             if hasattr(self, "statistics") and self.statistics:
-                                self.statistics.legendary_fish_caught += 1
+                                self.statistics.add_to_count("legendary_fish_caught")
                     except Exception:
                         pass
                     if hasattr(self, "statistics") and self.statistics:
@@ -9910,7 +10279,7 @@ class Game:
             return False
 
         if hasattr(self, "statistics") and self.statistics:
-            self.statistics.festivals_participated += 1
+            self.statistics.add_to_count("festivals_participated")
 
         festival_badges = {
             "spring_bloom": "spring_spirit",
@@ -9947,7 +10316,7 @@ class Game:
                     # Add to inventory if applicable
                     self._grant_named_reward(reward.name, reward.item_type)
                     if hasattr(self, "statistics") and self.statistics:
-                        self.statistics.festival_rewards_earned += 1
+                        self.statistics.add_to_count("festival_rewards_earned")
                     new_level = self._award_xp(reward.xp_value, "festival")
                     if new_level:
                         self._on_level_up(new_level)
@@ -9977,7 +10346,7 @@ class Game:
                     lines.append(f"  Got: {reward.name}!")
                     self._grant_named_reward(reward.name, reward.item_type)
                     if hasattr(self, "statistics") and self.statistics:
-                        self.statistics.festival_rewards_earned += 1
+                        self.statistics.add_to_count("festival_rewards_earned")
                     new_level = self._award_xp(reward.xp_value, "festival")
                     if new_level:
                         self._on_level_up(new_level)
@@ -10112,7 +10481,9 @@ class Game:
         elif self._debug_submenu == "time":
             return ["advance_1h", "advance_6h", "advance_1d", "set_dawn", "set_noon", "set_dusk", "set_night"]
         elif self._debug_submenu == "misc":
-            return ["spawn_treasure", "unlock_all_areas", "max_xp", "trigger_dream", "spawn_rainbow"]
+            return ["spawn_treasure", "unlock_all_areas", "max_xp", "trigger_dream", "spawn_rainbow",
+                    "startup_report", "frame_profiler", "profiler_dump",
+                    "memory_report", "memory_trace"]
         elif self._debug_submenu == "age":
             return ["egg", "hatchling", "duckling", "juvenile", "young_adult", "adult", "mature", "elder", "legendary", "+1_day", "+7_days", "+30_days"]
         elif self._debug_submenu == "building":
@@ -10361,6 +10732,7 @@ class Game:
             self.friends.friends[friend_id] = friend
         
         # Force a visit
+        self.save_tracker.mark_dirty("friends")
         from world.friends import VisitEvent
         self.friends.current_visit = VisitEvent(
             friend_id=friend_id,
@@ -10458,6 +10830,7 @@ class Game:
         """Set friendship level of current/recent visitor."""
         from world.friends import FriendshipLevel
         
+        self.save_tracker.mark_dirty("friends")
         if self.friends.current_visit:
             friend = self.friends.get_friend_by_id(self.friends.current_visit.friend_id)
             if friend:
@@ -10573,6 +10946,29 @@ class Game:
         elif action == "spawn_rainbow":
             self._debug_set_weather("rainbow")
             return  # Already handles menu close
+        elif action == "startup_report":
+            self.renderer.show_message("# DEBUG: " + "\n".join(startup_report()), duration=8)
+        elif action == "frame_profiler":
+            shown = self.renderer.toggle_profiler()
+            self.renderer.show_message(f"# DEBUG: Frame profiler {'on' if shown else 'off'}", duration=2)
+        elif action == "profiler_dump":
+            from pathlib import Path
+            from game_logger import get_logger
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = frame_profiler.dump_json(Path(get_logger().log_dir) / f"frame_profile_{stamp}.json")
+            self.renderer.show_message(f"# DEBUG: Frame profile written to {path}", duration=4)
+        elif action == "memory_report":
+            memory_telemetry.sample()
+            self.renderer.show_message("# DEBUG: " + "\n".join(memory_telemetry.report_lines()),
+                                       duration=10)
+        elif action == "memory_trace":
+            if memory_telemetry.tracing:
+                memory_telemetry.stop_tracing()
+            else:
+                memory_telemetry.start_tracing()
+                memory_telemetry.sample()  # Baseline for allocation diffs
+            self.renderer.show_message(
+                f"# DEBUG: tracemalloc {'on' if memory_telemetry.tracing else 'off'}", duration=2)
         
         self._notify_overlay_closed(UIOverlay.DEBUG_MENU)
         self.renderer.dismiss_overlay()
@@ -10974,6 +11370,7 @@ Core Systems Tested: {report.total_tests}
                     self.duck_brain.ritual_tracker.record_interaction(
                         "play", play_time.hour, play_time.minute, play_time.weekday(), play_time.timestamp()
                     )
+                self.save_tracker.mark_dirty("duck_brain")
                 msg = "# DEBUG: Faked 10 days of rituals\n  feed ~08:00, play ~18:00"
             else:
                 msg = "# DEBUG: DuckBrain/ritual tracker not available"
@@ -10982,6 +11379,7 @@ Core Systems Tested: {report.total_tests}
             if self.duck_brain and hasattr(self.duck_brain, 'ritual_tracker'):
                 self.duck_brain.ritual_tracker._history.clear()
                 self.duck_brain.ritual_tracker._rituals.clear()
+                self.save_tracker.mark_dirty("duck_brain")
                 msg = "# DEBUG: Rituals cleared"
             else:
                 msg = "# DEBUG: DuckBrain/ritual tracker not available"
@@ -11083,6 +11481,7 @@ Core Systems Tested: {report.total_tests}
             msg = (f"# DEBUG: Voice Generator\n"
                    f"  Model loaded: {loaded}\n"
                    f"  Chain entries: {chain_size}\n"
+                   f"  Line pool: {len(vg.pool)}/{vg.pool.capacity}\n"
                    f"  Min interactions: {vg.MIN_INTERACTIONS if hasattr(vg, 'MIN_INTERACTIONS') else '?'}")
 
         # ── Memory & Recall ───────────────────────────────────────
@@ -11655,7 +12054,7 @@ Core Systems Tested: {report.total_tests}
                 if active:
                     success, start_msg = self.festivals.start_festival_participation(active)
                     if success and hasattr(self, "statistics") and self.statistics:
-                        self.statistics.festivals_participated += 1
+                        self.statistics.add_to_count("festivals_participated")
                     msg = f"# DEBUG: Festival {'started' if success else 'not started'}: {getattr(active, 'name', active)}\n  {start_msg}"
                 else:
                     msg = "# DEBUG: No festival available today"
@@ -12199,11 +12598,11 @@ Core Systems Tested: {report.total_tests}
                 self.challenges.update_progress("complete_weekly", 1)
             if hasattr(self, "statistics") and self.statistics:
                 if str(challenge.challenge_id).startswith("weekly_"):
-                    self.statistics.weekly_challenges_completed += 1
+                    self.statistics.add_to_count("weekly_challenges_completed")
                 else:
-                    self.statistics.daily_challenges_completed += 1
-                self.statistics.challenge_streak_best = max(
-                    self.statistics.challenge_streak_best,
+                    self.statistics.add_to_count("daily_challenges_completed")
+                self.statistics.record_best(
+                    "challenge_streak_best",
                     getattr(self.challenges, "challenge_streak", 0),
                 )
             claimed += 1
@@ -13178,7 +13577,7 @@ Core Systems Tested: {report.total_tests}
             if result.get("perfect"):
                 self._unlock_achievement("perfect_trick")
                 if hasattr(self, "statistics") and self.statistics:
-                    self.statistics.perfect_performances += 1
+                    self.statistics.add_to_count("perfect_performances")
             
             if hasattr(self, "statistics") and self.statistics:
                 self.statistics.increment_stat("tricks_performed")
@@ -13361,597 +13760,41 @@ Core Systems Tested: {report.total_tests}
 
     # ==================== MEMORY RECALL FOR DIALOGUE ====================
 
+    def _refresh_dialogue_context(self):
+        """Re-render stale chat-context sections, when the chat pipeline uses them.
+
+        Main thread only: this is the one place the context walks game state.
+        """
+        if not self.duck or not self.duck.memory:
+            return
+        if not (self.conversation and self.conversation.needs_memory_context()):
+            return
+        self.dialogue_context.refresh(self)
+
+    def _refill_voice_pool(self):
+        """Top up the voice generator's validated-line pool and save it once full.
+
+        Reads through ``sys.modules`` so the scheduler never imports or
+        trains the generator; it starts once something in play asks for it.
+        """
+        import sys
+        module = sys.modules.get("dialogue.voice_generator")
+        generator = getattr(module, "_instance", None)
+        if generator is None or not generator.is_trained:
+            return
+        generator.refill()
+        if generator.pool.is_full:
+            generator.save_pool()
+
     def _get_memory_context_for_dialogue(self) -> str:
-        """Get rich game-world context so the LLM knows everything about the game state."""
+        """Rich game-world context so the LLM knows everything about the game state.
+
+        Returns the snapshot last published by ``_refresh_dialogue_context``;
+        safe on the talk thread since it reads no game state.
+        """
         if not self.duck or not self.duck.memory:
             return ""
-        
-        context_parts = []
-        
-        # ---- Current location ----
-        location = "Home Pond"
-        if hasattr(self, 'exploration') and self.exploration and self.exploration.current_area:
-            area = self.exploration.current_area
-            location = area.name
-            if hasattr(area, 'description') and area.description:
-                context_parts.append(f"Current location: {location} — {area.description}")
-            else:
-                context_parts.append(f"Current location: {location}")
-        else:
-            context_parts.append("Current location: Home Pond (your habitat)")
-        
-        # Discovered areas
-        try:
-            if self.exploration and self.exploration.discovered_areas:
-                area_names = list(self.exploration.discovered_areas.keys())[:10]
-                if area_names:
-                    context_parts.append(f"Places you've explored: {', '.join(area_names)}")
-        except Exception:
-            pass
-        
-        # ---- Time / season / weather ----
-        try:
-            if self.day_night:
-                tod = self.day_night.get_time_of_day()
-                hour = self.day_night.get_current_hour()
-                tod_str = tod.value if hasattr(tod, 'value') else str(tod)
-                context_parts.append(f"Time of day: {tod_str} ({hour}:00)")
-        except Exception:
-            pass
-        
-        try:
-            if self.atmosphere:
-                season = self.atmosphere.current_season
-                if season:
-                    context_parts.append(f"Season: {season.value if hasattr(season, 'value') else season}")
-                weather = self.atmosphere.current_weather
-                if weather and hasattr(weather, 'weather_type'):
-                    w_name = weather.weather_type.value if hasattr(weather.weather_type, 'value') else str(weather.weather_type)
-                    context_parts.append(f"Weather: {w_name}")
-        except Exception:
-            pass
-        
-        # ---- Duck identity & personality ----
-        try:
-            if hasattr(self.duck, '_personality_system') and self.duck._personality_system:
-                summary = self.duck._personality_system.get_personality_summary()
-                if summary:
-                    context_parts.append(f"Your personality: {summary}")
-                quirk = self.duck._personality_system.get_quirk()
-                if quirk:
-                    context_parts.append(f"Your quirk: {quirk}")
-        except Exception:
-            pass
-        
-        # Extended personality
-        try:
-            if self.extended_personality:
-                if hasattr(self.extended_personality, 'get_description'):
-                    desc = self.extended_personality.get_description()
-                    if desc:
-                        context_parts.append(f"Extended traits: {desc}")
-        except Exception:
-            pass
-        
-        # ---- Age / growth stage ----
-        try:
-            if self.aging:
-                stage = self.aging.current_stage
-                age_str = self.aging.get_age_string()
-                context_parts.append(f"Growth stage: {stage.value if hasattr(stage, 'value') else stage} ({age_str})")
-                is_bday, years = self.aging.is_birthday()
-                if is_bday:
-                    context_parts.append(f"TODAY IS YOUR BIRTHDAY! You are {years} year(s) old!")
-        except Exception:
-            pass
-        
-        # ---- Duck needs ----
-        try:
-            needs = self.duck.needs
-            if needs:
-                critical = needs.get_critical_needs() if hasattr(needs, 'get_critical_needs') else []
-                low = needs.get_low_needs() if hasattr(needs, 'get_low_needs') else []
-                urgent = needs.get_urgent_need() if hasattr(needs, 'get_urgent_need') else None
-                needs_info = []
-                needs_info.append(f"Hunger: {needs.hunger:.0f}/100")
-                needs_info.append(f"Energy: {needs.energy:.0f}/100")
-                needs_info.append(f"Fun: {needs.fun:.0f}/100")
-                needs_info.append(f"Cleanliness: {needs.cleanliness:.0f}/100")
-                needs_info.append(f"Social: {needs.social:.0f}/100")
-                context_parts.append(f"Your needs: {' | '.join(needs_info)}")
-                if critical:
-                    context_parts.append(f"CRITICAL needs (very low!): {', '.join(critical)}")
-                elif low:
-                    context_parts.append(f"Low needs: {', '.join(low)}")
-                if urgent:
-                    context_parts.append(f"Most urgent need: {urgent}")
-        except Exception:
-            pass
-        
-        # ---- Duck mood ----
-        try:
-            mood = self.duck.get_mood()
-            if mood:
-                context_parts.append(f"Your current mood: {mood.state.value} (score: {mood.score})")
-        except Exception:
-            pass
-        
-        # ---- Trust / bond level ----
-        try:
-            from core.consequences import get_trust_level_display
-            trust = getattr(self.duck, 'trust', None)
-            if trust is not None:
-                trust_desc = get_trust_level_display(trust)
-                context_parts.append(f"Trust/bond with player: {trust_desc} ({trust:.0f}/100)")
-            # Sick / hiding / cold shoulder state
-            if getattr(self.duck, 'is_sick', False):
-                context_parts.append("YOU ARE CURRENTLY SICK! You need medicine.")
-            if getattr(self.duck, 'hiding', False):
-                context_parts.append("You are currently HIDING because you've been neglected.")
-            from core.consequences import is_cold_shoulder_active
-            if is_cold_shoulder_active(self.duck):
-                context_parts.append("You are giving the player the cold shoulder right now (they neglected you).")
-        except Exception:
-            pass
-        
-        # ---- Visiting friend ----
-        try:
-            if self.friends and self.friends.current_visit:
-                visit = self.friends.current_visit
-                friend = self.friends.get_friend_by_id(visit.friend_id)
-                if friend:
-                    personality = friend.personality.value if hasattr(friend.personality, 'value') else str(friend.personality)
-                    level = friend.friendship_level.value if hasattr(friend.friendship_level, 'value') else str(friend.friendship_level)
-                    visitor_info = (
-                        f"RIGHT NOW: Your friend {friend.name} is visiting! "
-                        f"They are a {personality} duck. "
-                        f"Friendship level: {level}. "
-                        f"They've visited {friend.times_visited} times."
-                    )
-                    if friend.favorite_food:
-                        visitor_info += f" Their favorite food is {friend.favorite_food}."
-                    if friend.favorite_activity:
-                        visitor_info += f" They love to {friend.favorite_activity}."
-                    if visit.gift_brought:
-                        visitor_info += f" They brought you a gift: {visit.gift_brought}."
-                    if visit.activities_done:
-                        visitor_info += f" Activities you've done together: {', '.join(visit.activities_done)}."
-                    # Include visitor's memory of past player interactions
-                    if friend.mood_at_last_visit:
-                        visitor_info += f" Last time they visited, your mood was {friend.mood_at_last_visit}."
-                    if friend.visitor_mood_memory:
-                        visitor_info += f" {friend.name} remembers your mood being {friend.visitor_mood_memory}."
-                    if friend.player_chat_history:
-                        recent = friend.player_chat_history[-3:]
-                        visitor_info += f" Things the player has said to you during {friend.name}'s visits: {'; '.join(recent)}."
-                    if friend.last_conversation_summary:
-                        visitor_info += f" Last visit summary: {friend.last_conversation_summary}."
-                    context_parts.append(visitor_info)
-                    
-                    # Include what the player has said this visit via T key
-                    from world.friends import visitor_animator
-                    if visitor_animator._player_messages_this_visit:
-                        recent_msgs = visitor_animator._player_messages_this_visit[-3:]
-                        context_parts.append(
-                            f"Things the player said THIS visit (while {friend.name} is here): {'; '.join(recent_msgs)}"
-                        )
-                    
-                    convo = getattr(self, '_active_guest_conversation', None)
-                    if convo:
-                        context_parts.append(
-                            f"You and {friend.name} are in the middle of a conversation about: {convo.title}"
-                        )
-        except Exception:
-            pass
-        
-        # ---- All known friends ----
-        try:
-            if self.friends and self.friends.friends:
-                friend_names = []
-                for f in self.friends.friends.values():
-                    level = f.friendship_level.value if hasattr(f.friendship_level, 'value') else str(f.friendship_level)
-                    personality = f.personality.value if hasattr(f.personality, 'value') else str(f.personality)
-                    friend_names.append(f"{f.name} ({personality}, {level})")
-                if friend_names:
-                    visiting_id = self.friends.current_visit.friend_id if self.friends.current_visit else None
-                    non_visiting = [
-                        fn for fid, fn in zip(self.friends.friends.keys(), friend_names) 
-                        if fid != visiting_id
-                    ]
-                    if non_visiting:
-                        shown = non_visiting[:8]
-                        extra = len(non_visiting) - len(shown)
-                        friends_str = "Your other duck friends: " + ", ".join(shown)
-                        if extra > 0:
-                            friends_str += f" (and {extra} more)"
-                        context_parts.append(friends_str)
-        except Exception:
-            pass
-        
-        # ---- Favorite things ----
-        fav_food = self.duck.memory.get_favorite("food")
-        fav_toy = self.duck.memory.get_favorite("toy")
-        fav_activity = self.duck.memory.get_favorite("activity")
-        if fav_food:
-            context_parts.append(f"Favorite food: {fav_food}")
-        if fav_toy:
-            context_parts.append(f"Favorite toy: {fav_toy}")
-        if fav_activity:
-            context_parts.append(f"Favorite activity: {fav_activity}")
-        
-        # ---- Tricks ----
-        try:
-            if self.tricks and self.tricks.learned_tricks:
-                from duck.tricks import TRICKS
-                trick_names = []
-                for tid in self.tricks.learned_tricks:
-                    t = TRICKS.get(tid)
-                    trick_names.append(t.name if t else tid.replace('_', ' '))
-                context_parts.append(f"Tricks you know: {', '.join(trick_names[:8])}")
-                if self.tricks.favorite_trick:
-                    fav = TRICKS.get(self.tricks.favorite_trick)
-                    context_parts.append(f"Favorite trick: {fav.name if fav else self.tricks.favorite_trick}")
-                if self.tricks.current_training:
-                    train = TRICKS.get(self.tricks.current_training)
-                    context_parts.append(f"Currently learning: {train.name if train else self.tricks.current_training}")
-        except Exception:
-            pass
-        
-        # ---- Title & outfit ----
-        try:
-            if self.titles:
-                display = self.titles.get_display_name()
-                if display:
-                    context_parts.append(f"Your title: {display}")
-        except Exception:
-            pass
-        
-        try:
-            if self.outfits and self.outfits.current_outfit:
-                from duck.outfits import OUTFIT_ITEMS
-                worn = []
-                outfit = self.outfits.current_outfit
-                for slot in ['hat', 'face', 'neck', 'body', 'wings', 'feet', 'held', 'special']:
-                    item_id = getattr(outfit, slot, None)
-                    if item_id:
-                        item = OUTFIT_ITEMS.get(item_id)
-                        worn.append(f"{slot}: {item.name if item else item_id}")
-                if worn:
-                    context_parts.append(f"Currently wearing: {', '.join(worn)}")
-        except Exception:
-            pass
-        
-        # ---- Progression / level ----
-        try:
-            if self.progression:
-                xp_in, xp_need, pct = self.progression.get_xp_progress()
-                context_parts.append(
-                    f"Level: {self.progression.level} ({self.progression.title}) — "
-                    f"XP: {self.progression.xp} ({pct:.0f}% to next)"
-                )
-                if self.progression.current_streak > 1:
-                    context_parts.append(f"Player's login streak: {self.progression.current_streak} days")
-                stats = self.progression.stats
-                if stats:
-                    stat_items = []
-                    for k, v in stats.items():
-                        if v > 0:
-                            stat_items.append(f"{k.replace('total_', '').replace('_', ' ')}: {v}")
-                    if stat_items:
-                        context_parts.append(f"Lifetime stats: {', '.join(stat_items[:6])}")
-        except Exception:
-            pass
-        
-        # ---- Prestige ----
-        try:
-            if self.prestige and self.prestige.prestige_level > 0:
-                context_parts.append(
-                    f"Prestige level: {self.prestige.prestige_level} "
-                    f"(Legacy points: {self.prestige.legacy_points}, "
-                    f"Ducks raised: {self.prestige.total_ducks_raised})"
-                )
-        except Exception:
-            pass
-        
-        # ---- Currency / inventory ----
-        try:
-            coins = getattr(self.habitat, 'currency', 0)
-            context_parts.append(f"Coins: {coins}")
-        except Exception:
-            pass
-        
-        try:
-            if self.inventory and self.inventory.items:
-                context_parts.append(f"Items in inventory: {len(self.inventory.items)}")
-        except Exception:
-            pass
-        
-        # ---- Garden ----
-        try:
-            if self.garden:
-                active_plots = []
-                for pid, plot in self.garden.plots.items():
-                    if plot.plant:
-                        stage = plot.plant.growth_stage if hasattr(plot.plant, 'growth_stage') else '?'
-                        active_plots.append(f"{plot.plant.plant_id} ({stage})")
-                if active_plots:
-                    context_parts.append(f"Garden plants: {', '.join(active_plots[:5])}")
-                if self.garden.total_harvests > 0:
-                    context_parts.append(f"Total harvests: {self.garden.total_harvests}")
-        except Exception:
-            pass
-        
-        # ---- Fishing ----
-        try:
-            if self.fishing:
-                if self.fishing.total_catches > 0:
-                    fish_info = f"Fish caught: {self.fishing.total_catches}"
-                    if self.fishing.biggest_catch:
-                        fish_info += f" (biggest: {self.fishing.biggest_catch.fish_id})"
-                    context_parts.append(fish_info)
-                if self.fishing.is_fishing:
-                    context_parts.append("You are currently fishing!")
-        except Exception:
-            pass
-        
-        # ---- Crafting ----
-        try:
-            if self.crafting:
-                if self.crafting.crafting_skill > 0:
-                    context_parts.append(f"Crafting skill: {self.crafting.crafting_skill}")
-                if self.crafting.current_craft:
-                    context_parts.append(f"Currently crafting something!")
-                if self.crafting.recipes_unlocked:
-                    context_parts.append(f"Known recipes: {len(self.crafting.recipes_unlocked)}")
-        except Exception:
-            pass
-        
-        # ---- Building ----
-        try:
-            if self.building and hasattr(self.building, 'structures'):
-                if self.building.structures:
-                    struct_names = [s.name if hasattr(s, 'name') else str(s) for s in self.building.structures]
-                    if struct_names:
-                        context_parts.append(f"Built structures: {', '.join(struct_names[:5])}")
-        except Exception:
-            pass
-        
-        # ---- Active quests ----
-        try:
-            from world.quests import QUESTS as _QUESTS
-            if self.quests and hasattr(self.quests, 'active_quests') and self.quests.active_quests:
-                quest_names = []
-                for qid, aq in self.quests.active_quests.items():
-                    if not aq.completed and not aq.failed:
-                        quest_def = _QUESTS.get(qid)
-                        if quest_def:
-                            quest_names.append(quest_def.name)
-                if quest_names:
-                    context_parts.append(f"Active quests: {', '.join(quest_names[:5])}")
-        except Exception:
-            pass
-        
-        # ---- Challenges ----
-        try:
-            if self.challenges and hasattr(self.challenges, 'active_challenges'):
-                active = [c for c in self.challenges.active_challenges if not c.completed]
-                if active:
-                    chal_names = [c.name if hasattr(c, 'name') else str(c) for c in active[:3]]
-                    context_parts.append(f"Active challenges: {', '.join(chal_names)}")
-        except Exception:
-            pass
-        
-        # ---- Festivals ----
-        try:
-            if self.festivals and hasattr(self.festivals, 'check_active_festival'):
-                fest = self.festivals.check_active_festival()
-                if fest:
-                    fname = fest.name if hasattr(fest, 'name') else str(fest)
-                    context_parts.append(f"Active festival: {fname}")
-        except Exception:
-            pass
-        
-        # ---- Fortune / horoscope ----
-        try:
-            if self.fortune and hasattr(self.fortune, 'generate_daily_horoscope'):
-                horoscope = self.fortune.generate_daily_horoscope()
-                if horoscope:
-                    context_parts.append(f"Today's horoscope: {horoscope.prediction if hasattr(horoscope, 'prediction') else str(horoscope)}")
-        except Exception:
-            pass
-        
-        # ---- Achievements / badges ----
-        try:
-            if self.achievements:
-                count = self.achievements.get_unlocked_count()
-                total = self.achievements.get_total_count()
-                if count > 0:
-                    context_parts.append(f"Achievements unlocked: {count}/{total}")
-        except Exception:
-            pass
-        
-        try:
-            if self.badges:
-                earned, total = self.badges.get_earned_count()
-                if earned > 0:
-                    context_parts.append(f"Badges earned: {earned}/{total}")
-                    fav = self.badges.favorite_badge
-                    if fav:
-                        context_parts.append(f"Favorite badge: {fav}")
-        except Exception:
-            pass
-        
-        # ---- Collectibles ----
-        try:
-            if self.collectibles and hasattr(self.collectibles, 'owned'):
-                if self.collectibles.owned:
-                    context_parts.append(f"Collectibles found: {len(self.collectibles.owned)}")
-        except Exception:
-            pass
-        
-        # ---- Secrets ----
-        try:
-            if self.secrets and hasattr(self.secrets, 'discovered_secrets'):
-                if self.secrets.discovered_secrets:
-                    context_parts.append(f"Secrets discovered: {len(self.secrets.discovered_secrets)}")
-        except Exception:
-            pass
-        
-        # ---- Treasure hunting ----
-        try:
-            if self.treasure and hasattr(self.treasure, 'total_treasures_found'):
-                if self.treasure.total_treasures_found > 0:
-                    context_parts.append(f"Treasures found: {self.treasure.total_treasures_found}")
-        except Exception:
-            pass
-        
-        # ---- Dreams ----
-        try:
-            if self.dreams and hasattr(self.dreams, 'dream_log') and self.dreams.dream_log:
-                last_dream = self.dreams.dream_log[-1]
-                if hasattr(last_dream, 'description'):
-                    context_parts.append(f"Last dream: {last_dream.description[:80]}")
-        except Exception:
-            pass
-        
-        # ---- Diary (recent entries via diary manager) ----
-        try:
-            diary_ctx = self.diary_manager.get_llm_diary_context(max_entries=3, max_chars=400)
-            if diary_ctx:
-                context_parts.append(diary_ctx)
-            elif self.diary and self.diary.entries:
-                last_entry = self.diary.entries[-1]
-                if hasattr(last_entry, 'title') and hasattr(last_entry, 'content'):
-                    context_parts.append(f"Latest diary entry: \"{last_entry.title}\" — {last_entry.content[:60]}")
-        except Exception:
-            pass
-        
-        # ---- Player model (what Cheese knows about the player) ----
-        try:
-            if self.duck_brain and self.duck_brain.player_model:
-                pm = self.duck_brain.player_model
-                if pm.name:
-                    context_parts.append(f"Player's name: {pm.name}")
-                if pm.facts:
-                    fact_strs = [f"{f.fact_type}: {f.value}" for f in pm.facts.values() if f.value][:5]
-                    if fact_strs:
-                        context_parts.append(f"Things you know about the player: {'; '.join(fact_strs)}")
-                if pm.promises_made:
-                    kept = pm.promises_kept
-                    broken = pm.promises_broken
-                    if kept + broken > 0:
-                        context_parts.append(f"Player's promises: {kept} kept, {broken} broken")
-        except Exception:
-            pass
-        
-        # ---- Ritual tracker ----
-        try:
-            if self.duck_brain and self.duck_brain.ritual_tracker:
-                rituals = self.duck_brain.ritual_tracker.detected_rituals
-                established = [
-                    f"{r.action} at {r.typical_hour}:00 (streak: {r.streak}d)"
-                    for r in rituals.values() if r.is_established
-                ]
-                if established:
-                    context_parts.append(f"Player's routines you've noticed: {', '.join(established[:4])}")
-        except Exception:
-            pass
-        
-        # ---- Conversation memory ----
-        try:
-            if self.duck_brain and self.duck_brain.conversation_memory:
-                cm = self.duck_brain.conversation_memory
-                if cm.total_conversations > 0:
-                    context_parts.append(f"Total conversations: {cm.total_conversations}")
-                if cm.topic_counts:
-                    top_topics = sorted(cm.topic_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-                    if top_topics:
-                        context_parts.append(f"Topics you talk about most: {', '.join(t[0] for t in top_topics)}")
-        except Exception:
-            pass
-        
-        # ---- Duck brain internal mood ----
-        try:
-            if self.duck_brain:
-                internal = self.duck_brain._internal_mood
-                if internal and hasattr(internal, 'value'):
-                    context_parts.append(f"Your inner feeling: {internal.value}")
-        except Exception:
-            pass
-        
-        # ---- Recent event ----
-        try:
-            last_event = getattr(self, '_last_event_description', None)
-            if last_event:
-                context_parts.append(f"Something that happened recently: {last_event}")
-        except Exception:
-            pass
-        
-        # ---- Recent visitor dialogue (what visitor said recently) ----
-        try:
-            last_vis_dialogue = getattr(self, '_last_visitor_dialogue', None)
-            if last_vis_dialogue and self.friends and self.friends.current_visit:
-                context_parts.append(f"What the visitor just said: {last_vis_dialogue}")
-        except Exception:
-            pass
-        
-        # ---- Relationship level ----
-        relationship = self.duck.memory.get_relationship_level()
-        if relationship and relationship != "stranger":
-            context_parts.append(f"Relationship with player: {relationship}")
-        
-        # ---- Recent memory ----
-        if hasattr(self.duck.memory, 'recall_memory'):
-            memory = self.duck.memory.recall_memory()
-            if memory:
-                context_parts.append(f"A memory: {memory}")
-        
-        # ---- Mood trend ----
-        if hasattr(self.duck.memory, 'get_mood_trend'):
-            trend = self.duck.memory.get_mood_trend()
-            if trend:
-                context_parts.append(f"Mood trend: {trend}")
-        
-        # ---- Habitat items ----
-        try:
-            if self.habitat and self.habitat.placed_items:
-                item_names = []
-                for pi in self.habitat.placed_items[:10]:
-                    info = get_item_info(pi.item_id) if pi.item_id else None
-                    name = info.get('name', pi.item_id) if info else pi.item_id
-                    item_names.append(name.replace('_', ' '))
-                if item_names:
-                    context_parts.append(f"Items in your habitat: {', '.join(item_names)}")
-        except Exception:
-            pass
-        
-        # ---- Radio / music status ----
-        try:
-            from audio.sound import sound_engine
-            if sound_engine.is_radio_playing():
-                radio = sound_engine.get_radio()
-                if radio and radio.current_station:
-                    context_parts.append(f"Currently playing: {radio.current_station.name} radio")
-        except Exception:
-            pass
-        
-        # Build context and truncate if too long (keep under ~3000 chars ≈ ~750 tokens)
-        result = "\n".join(context_parts)
-        max_context_chars = 3000
-        if len(result) > max_context_chars:
-            # Keep the most important lines (first ones are location/time/needs/mood),
-            # truncate from the end (less critical stats)
-            lines = result.split("\n")
-            truncated = []
-            char_count = 0
-            for line in lines:
-                if char_count + len(line) + 1 > max_context_chars:
-                    break
-                truncated.append(line)
-                char_count += len(line) + 1
-            result = "\n".join(truncated)
-        
-        return result
+        return self.dialogue_context.snapshot().text
 
     # ==================== BADGE AWARDING ====================
 
@@ -14776,7 +14619,7 @@ Core Systems Tested: {report.total_tests}
             self.renderer.show_message(f"* {msg}{self._life_story_suffix(life_messages)}", duration=3.0)
             sound_engine.play_sound("build")
             if hasattr(self, "statistics") and self.statistics:
-                self.statistics.decorations_placed += 1
+                self.statistics.add_to_count("decorations_placed")
         else:
             self.renderer.show_message(msg, duration=2.0)
 
@@ -0,0 +1,356 @@
+"""
+Lazy subsystem loading and startup import timing.
+
+game.py used to import every world, duck, dialogue and UI module before the
+title screen could draw, including several multi-thousand-line data tables.
+Modules that gameplay needs but the title screen does not are now declared
+lazily: ``lazy_from`` hands back stand-ins for the imported names, and
+``LazySubsystem`` binds a Game attribute to its singleton (or a fresh
+instance) the first time the attribute is read.  ``defer_subsystem`` swaps
+that default for a per-instance loader, so a subsystem restored from a save
+is only built when gameplay first touches it.
+
+Usage from game.py::
+
+    Garden, = lazy_from("world.garden", "Garden")
+
+    class Game:
+        garden = LazySubsystem("world.garden", "garden")
+
+    # While the title screen idles, import one deferred module per frame
+    lazy_modules.warm_next()
+    # Entering gameplay: make sure every deferred module (and its event_bus
+    # subscriptions) is loaded
+    lazy_modules.load_all()
+
+    # Loading a save: build the diary from its section on first access
+    defer_subsystem(game, "diary", lambda: DuckDiary.from_dict(read_section()))
+
+``import_timer`` records per-module import times like ``python -X
+importtime`` once installed from main.py; ``startup_report()`` summarises
+both for the debug menu.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Process start as seen by the first import of this module (main.py)
+STARTUP_BEGAN = time.perf_counter()
+
+
+class LazyModuleRegistry:
+    """Ordered set of deferred modules and how long each took to import."""
+
+    def __init__(self):
+        self._modules: Dict[str, None] = {}   # insertion-ordered
+        self._load_times: Dict[str, float] = {}
+        self._warm_index = 0
+
+    def register(self, module_name: str) -> None:
+        self._modules.setdefault(module_name, None)
+
+    def load(self, module_name: str):
+        """Import *module_name* (once) and return it."""
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        self._load_times.setdefault(module_name, time.perf_counter() - start)
+        return module
+
+    def pending(self) -> List[str]:
+        """Registered modules that have not been imported yet."""
+        return [name for name in self._modules if name not in sys.modules]
+
+    def warm_next(self) -> bool:
+        """Import the next pending module. Returns False once none are left."""
+        names = list(self._modules)
+        while self._warm_index < len(names):
+            name = names[self._warm_index]
+            self._warm_index += 1
+            if name not in sys.modules:
+                self.load(name)
+                return True
+        return False
+
+    def load_all(self) -> int:
+        """Import every pending module. Returns how many were imported."""
+        loaded = 0
+        for name in self.pending():
+            self.load(name)
+            loaded += 1
+        return loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for the startup report."""
+        return {
+            "registered": len(self._modules),
+            "loaded": len(self._modules) - len(self.pending()),
+            "load_seconds": sum(self._load_times.values()),
+        }
+
+
+lazy_modules = LazyModuleRegistry()
+
+_UNSET = object()
+
+
+class LazyAttr:
+    """
+    Stand-in for a name imported from a deferred module.
+
+    Calling it, reading attributes from it, indexing, iterating or using it
+    in ``isinstance`` imports the module and forwards to the real object, so
+    ``Garden()``, ``Garden.from_dict(data)``, ``FishingSpot.POND`` and
+    ``QUESTS.get(qid)`` work unchanged.
+    """
+
+    __slots__ = ("_module_name", "_name", "_target")
+
+    def __init__(self, module_name: str, name: str):
+        self._module_name = module_name
+        self._name = name
+        self._target = _UNSET
+        lazy_modules.register(module_name)
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is _UNSET:
+            target = getattr(lazy_modules.load(self._module_name), self._name)
+            self._target = target
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+    def __contains__(self, item) -> bool:
+        return item in self._resolve()
+
+    def __bool__(self) -> bool:
+        return bool(self._resolve())
+
+    def __instancecheck__(self, obj) -> bool:
+        return isinstance(obj, self._resolve())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not _UNSET else "deferred"
+        return f"<LazyAttr {self._module_name}.{self._name} ({state})>"
+
+
+def lazy_from(module_name: str, *names: str) -> Tuple[LazyAttr, ...]:
+    """Deferred ``from module_name import names``."""
+    return tuple(LazyAttr(module_name, name) for name in names)
+
+
+class LazySubsystem:
+    """
+    Class attribute that binds a subsystem on first access.
+
+    The first read imports *module_name*, takes *name* from it (calling it
+    when *construct* is true) and stores the result in the instance
+    ``__dict__``, so later reads are plain attribute lookups and assigning a
+    replacement (new game, load) works as before.  A loader registered with
+    ``defer_subsystem`` takes the place of the import for that instance.
+    """
+
+    def __init__(self, module_name: str, name: str, construct: bool = False):
+        self.module_name = module_name
+        self.name = name
+        self.construct = construct
+        self.attr = name
+        lazy_modules.register(module_name)
+
+    def __set_name__(self, owner, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        loader = instance.__dict__.get(_DEFERRED_ATTR, {}).pop(self.attr, None)
+        if loader is not None:
+            value = loader()
+        else:
+            value = getattr(lazy_modules.load(self.module_name), self.name)
+            if self.construct:
+                value = value()
+        instance.__dict__[self.attr] = value
+        return value
+
+
+# Instance attribute holding the loaders registered by defer_subsystem
+_DEFERRED_ATTR = "_deferred_subsystems"
+
+
+def defer_subsystem(instance, attr: str, loader) -> None:
+    """
+    Bind ``instance.<attr>`` to ``loader()`` on its first read.
+
+    *attr* must be a ``LazySubsystem``; any value already bound is dropped.
+    Assigning the attribute directly before it is read discards the loader.
+    """
+    instance.__dict__.pop(attr, None)
+    instance.__dict__.setdefault(_DEFERRED_ATTR, {})[attr] = loader
+
+
+def is_deferred(instance, attr: str) -> bool:
+    """Whether ``instance.<attr>`` still waits for its ``defer_subsystem`` loader."""
+    if attr in instance.__dict__:
+        instance.__dict__.get(_DEFERRED_ATTR, {}).pop(attr, None)
+        return False
+    return attr in instance.__dict__.get(_DEFERRED_ATTR, {})
+
+
+def load_deferred(instance) -> int:
+    """Run every pending ``defer_subsystem`` loader. Returns how many ran."""
+    pending = [attr for attr in list(instance.__dict__.get(_DEFERRED_ATTR, {}))
+               if is_deferred(instance, attr)]
+    for attr in pending:
+        getattr(instance, attr)
+    return len(pending)
+
+
+# ── Import timing ────────────────────────────────────────────────────
+
+
+class _TimedLoader:
+    """Wraps a loader to time ``exec_module``; hands the module its real loader."""
+
+    def __init__(self, loader, timer: "ImportTimer", name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        self._timer._begin(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._end(self._name)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._loader, attr)
+
+
+class ImportTimer:
+    """
+    Meta-path hook recording self and cumulative import time per module,
+    the same two columns ``python -X importtime`` prints.
+    """
+
+    def __init__(self):
+        self.records: Dict[str, Tuple[float, float]] = {}  # name -> (self, cumulative)
+        self._local = threading.local()
+        self._installed = False
+
+    def install(self) -> None:
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+
+    def uninstall(self) -> None:
+        if self._installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self._installed = False
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _begin(self, name: str) -> None:
+        # [name, started, time spent in nested imports]
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _end(self, name: str) -> None:
+        stack = self._stack()
+        _name, started, nested = stack.pop()
+        cumulative = time.perf_counter() - started
+        self.records[name] = (cumulative - nested, cumulative)
+        if stack:
+            stack[-1][2] += cumulative
+
+    def total_seconds(self) -> float:
+        """Time spent importing: self times add up to the wall time."""
+        return sum(own for own, _cumulative in self.records.values())
+
+    def slowest(self, limit: int = 10, key: str = "self") -> List[Tuple[str, float, float]]:
+        """The *limit* modules with the largest self (or cumulative) time."""
+        index = 0 if key == "self" else 1
+        ranked = sorted(self.records.items(), key=lambda item: item[1][index], reverse=True)
+        return [(name, own, cumulative) for name, (own, cumulative) in ranked[:limit]]
+
+
+import_timer = ImportTimer()
+
+_title_drawn_at: Optional[float] = None
+
+
+def note_title_drawn() -> None:
+    """Record when the first title screen frame went out."""
+    global _title_drawn_at
+    if _title_drawn_at is None:
+        _title_drawn_at = time.perf_counter()
+
+
+def startup_report(limit: int = 8) -> List[str]:
+    """Lines summarising startup time, imports and deferred modules."""
+    lines = []
+    if _title_drawn_at is not None:
+        lines.append(f"Title screen after {(_title_drawn_at - STARTUP_BEGAN) * 1000:.0f} ms")
+    records = import_timer.records
+    if records:
+        lines.append(f"Imports: {len(records)} modules, "
+                     f"{import_timer.total_seconds() * 1000:.0f} ms")
+        lines.append("  self ms   cum ms  module")
+        for name, own, cumulative in import_timer.slowest(limit):
+            lines.append(f"  {own * 1000:7.1f} {cumulative * 1000:8.1f}  {name}")
+    stats = lazy_modules.get_stats()
+    lines.append(f"Deferred: {stats['loaded']}/{stats['registered']} loaded, "
+                 f"{stats['load_seconds'] * 1000:.0f} ms")
+    return lines
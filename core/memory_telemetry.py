@@ -0,0 +1,326 @@
+"""
+In-process memory telemetry and leak detector.
+
+Subsystems register *probes*: named callables returning a size (a container
+length, an object count). The update scheduler calls ``sample()`` on an
+interval; each sample records every probe, the process RSS, live instances
+of a few tracked classes (every Nth sample, since that walks the gc heap)
+and, while tracemalloc is tracing, traced memory plus the allocation sites
+that grew most since tracing began.
+
+A series that never shrinks over the last ``MEMORY_GROWTH_SAMPLES`` samples
+and ends higher than it started is reported as growing: bounded containers
+fill up and then plateau, leaks keep climbing. Results are shown from the
+debug menu and written as JSON next to the logs by a background thread,
+where ``monitor_memory.py`` reads them.
+
+Usage from game.py::
+
+    memory_telemetry.register("event_bus.history",
+                              lambda: event_bus.memory_stats()["history"])
+    sched.register("memory_telemetry", memory_telemetry.sample, MEMORY_SAMPLE_INTERVAL)
+
+A probe returning ``None`` (subsystem not loaded yet) is skipped for that
+sample.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from config import (MEMORY_GROWTH_SAMPLES, MEMORY_TELEMETRY_WINDOW, MEMORY_TOP_ALLOCATIONS,
+                    MEMORY_TRACE_FRAMES, MEMORY_TRACKED_TYPES, MEMORY_TYPE_COUNT_EVERY)
+
+logger = logging.getLogger(__name__)
+
+# Series measured in bytes; everything else is a count
+BYTE_SERIES = frozenset({"rss", "traced", "traced_peak"})
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None when it cannot be read."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def count_instances(type_names: Iterable[str]) -> Dict[str, int]:
+    """Live gc-tracked objects whose class name is in *type_names*."""
+    wanted = set(type_names)
+    counts = dict.fromkeys(wanted, 0)
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in wanted:
+            counts[name] += 1
+    return counts
+
+
+def find_growth(samples: List[Dict[str, Any]],
+                run: int = MEMORY_GROWTH_SAMPLES) -> List[Dict[str, Any]]:
+    """
+    Series that never decreased over their last *run* samples and ended higher.
+
+    Returns one entry per growing series (name, first, last, delta, per_hour),
+    largest relative growth first.
+    """
+    series: Dict[str, List[tuple]] = {}
+    for sample in samples:
+        for name, value in sample["values"].items():
+            if value is not None:
+                series.setdefault(name, []).append((sample["at"], value))
+
+    growing = []
+    for name, points in series.items():
+        if len(points) < run:
+            continue
+        points = points[-run:]
+        values = [value for _, value in points]
+        if values[-1] <= values[0]:
+            continue
+        if any(later < earlier for earlier, later in zip(values, values[1:])):
+            continue
+        hours = (points[-1][0] - points[0][0]) / 3600.0
+        delta = values[-1] - values[0]
+        growing.append({
+            "name": name,
+            "first": values[0],
+            "last": values[-1],
+            "delta": delta,
+            "per_hour": round(delta / hours, 1) if hours > 0 else None,
+        })
+    growing.sort(key=lambda entry: -entry["delta"] / max(entry["first"], 1))
+    return growing
+
+
+def _fmt(name: str, value: Optional[float], signed: bool = False) -> str:
+    if value is None:
+        return "-"
+    sign = "+" if signed and value > 0 else ""
+    if name in BYTE_SERIES:
+        return f"{sign}{value / (1024 * 1024):.1f}M"
+    return f"{sign}{value:g}"
+
+
+def format_report(data: Dict[str, Any], limit: int = 8) -> List[str]:
+    """Text report for a ``MemoryTelemetry.to_dict()`` result."""
+    samples = data.get("samples", [])
+    if not samples:
+        return ["memory: no samples yet"]
+    first, last = samples[0], samples[-1]
+    minutes = (last["at"] - first["at"]) / 60.0
+    values = last["values"]
+    lines = [f"memory: {len(samples)} samples over {minutes:.0f} min"
+             f"  rss {_fmt('rss', values.get('rss'))}"
+             f"  traced {_fmt('traced', values.get('traced')) if data.get('tracing') else 'off'}"]
+
+    growth = data.get("growth", [])
+    if growth:
+        lines.append(f"GROWING (never shrank over last {data.get('growth_samples')} samples):")
+        for entry in growth[:limit]:
+            name = entry["name"]
+            rate = entry["per_hour"]
+            line = (f"  {name[:34]:<34} {_fmt(name, entry['first']):>8} -> "
+                    f"{_fmt(name, entry['last']):<8}")
+            if rate is not None:
+                line += f" ({_fmt(name, rate, True)}/h)"
+            lines.append(line)
+    else:
+        lines.append("no monotonic growth detected")
+
+    lines.append(f"{'series':<36}{'now':>9}{'change':>9}")
+    baseline = first["values"]
+    for name, value in sorted(values.items()):
+        if value is None or name in BYTE_SERIES:
+            continue
+        start = baseline.get(name)
+        change = value - start if start is not None else None
+        lines.append(f"  {name[:34]:<34}{_fmt(name, value):>9}{_fmt(name, change, True):>9}")
+
+    top = last.get("top") or []
+    if top:
+        lines.append("allocation growth since tracing began:")
+        for site in top[:limit]:
+            lines.append(f"  {site['where'][-40:]:<40} {_fmt('traced', site['size_diff'], True):>8}"
+                         f" {site['count_diff']:+d} blocks")
+    return lines
+
+
+class MemoryTelemetry:
+    """Periodic samples of registered probes, RSS and tracemalloc."""
+
+    def __init__(self, window: int = MEMORY_TELEMETRY_WINDOW,
+                 growth_samples: int = MEMORY_GROWTH_SAMPLES,
+                 type_count_every: int = MEMORY_TYPE_COUNT_EVERY,
+                 tracked_types: Iterable[str] = MEMORY_TRACKED_TYPES,
+                 top_allocations: int = MEMORY_TOP_ALLOCATIONS):
+        self.probes: Dict[str, Callable[[], Optional[int]]] = {}
+        self.samples: Deque[Dict[str, Any]] = deque(maxlen=window)
+        self.growth_samples = growth_samples
+        self.type_count_every = type_count_every
+        self.tracked_types = tuple(tracked_types)
+        self.top_allocations = top_allocations
+        self.dump_path: Optional[Path] = None   # Rewritten after every sample when set
+        self._dump_executor: Optional[ThreadPoolExecutor] = None
+        self._dump_future: Optional[Future] = None
+        self.sample_count = 0
+        self._failed_probes: set = set()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    # ── Probes ────────────────────────────────────────────────────────
+
+    def register(self, name: str, probe: Callable[[], Optional[int]]) -> None:
+        """Add or replace the probe *name*."""
+        self.probes[name] = probe
+        self._failed_probes.discard(name)
+
+    def unregister(self, name: str) -> None:
+        self.probes.pop(name, None)
+
+    # ── tracemalloc ───────────────────────────────────────────────────
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start_tracing(self, frames: int = MEMORY_TRACE_FRAMES) -> None:
+        """Start tracemalloc; the next sample becomes the diff baseline."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracing = True
+        self._baseline = None
+
+    def stop_tracing(self) -> None:
+        """Stop tracemalloc if this object started it, and drop the baseline."""
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _allocation_diff(self) -> List[Dict[str, Any]]:
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        if self._baseline is None:
+            self._baseline = snapshot
+            return []
+        top = []
+        for stat in snapshot.compare_to(self._baseline, "lineno")[:self.top_allocations]:
+            frame = stat.traceback[0]
+            top.append({
+                "where": f"{frame.filename}:{frame.lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            })
+        return top
+
+    # ── Sampling ──────────────────────────────────────────────────────
+
+    def sample(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Record one sample of every series; returns it."""
+        values: Dict[str, Optional[int]] = {"rss": _rss_bytes()}
+        top: List[Dict[str, Any]] = []
+        if tracemalloc.is_tracing():
+            values["traced"], values["traced_peak"] = tracemalloc.get_traced_memory()
+            top = self._allocation_diff()
+
+        for name, probe in self.probes.items():
+            try:
+                values[name] = probe()
+            except Exception:
+                if name not in self._failed_probes:
+                    self._failed_probes.add(name)
+                    logger.debug("Memory probe %s failed", name, exc_info=True)
+
+        if self.tracked_types and self.sample_count % self.type_count_every == 0:
+            for type_name, count in count_instances(self.tracked_types).items():
+                values[f"objects.{type_name}"] = count
+
+        self.sample_count += 1
+        sample = {"at": time.time() if now is None else now, "values": values, "top": top}
+        self.samples.append(sample)
+
+        if self.dump_path is not None:
+            self._dump_in_background(self.dump_path)
+        return sample
+
+    def _dump_in_background(self, path: Path) -> None:
+        """Encode and write the dump on a worker thread, off the frame path."""
+        if self._dump_executor is None:
+            self._dump_executor = ThreadPoolExecutor(max_workers=1,
+                                                     thread_name_prefix="memory-dump")
+        # Samples are never mutated once recorded, so a shallow copy is a snapshot
+        self._dump_future = self._dump_executor.submit(
+            self._write_dump, path, list(self.samples), tracemalloc.is_tracing())
+
+    def _write_dump(self, path: Path, samples: List[Dict[str, Any]], tracing: bool) -> None:
+        try:
+            _write_json(path, self._payload(samples, tracing))
+        except OSError:
+            logger.debug("Could not write memory telemetry to %s", path, exc_info=True)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for the last background dump to be written."""
+        if self._dump_future is not None:
+            wait([self._dump_future], timeout=timeout)
+
+    def growth(self) -> List[Dict[str, Any]]:
+        return find_growth(list(self.samples), self.growth_samples)
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.sample_count = 0
+        self._baseline = None
+
+    # ── Reporting ─────────────────────────────────────────────────────
+
+    def _payload(self, samples: List[Dict[str, Any]], tracing: bool) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "tracing": tracing,
+            "growth_samples": self.growth_samples,
+            "growth": find_growth(samples, self.growth_samples),
+            "samples": samples,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._payload(list(self.samples), tracemalloc.is_tracing())
+
+    def dump_json(self, path: Path) -> Path:
+        return _write_json(path, self.to_dict())
+
+    def report_lines(self, limit: int = 8) -> List[str]:
+        return format_report(self.to_dict(), limit)
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    # No indent: that forces json's pure-Python encoder, ~10x slower
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp, path)
+    return path
+
+
+memory_telemetry = MemoryTelemetry()
@@ -0,0 +1,47 @@
+"""
+Offline catch-up helpers.
+
+The offline world simulation models the absence as 30-minute ticks with an
+independent chance roll per tick for each kind of event. Rolling every tick
+costs O(ticks) and used to force a 48-hour cap. ``bernoulli_hits`` jumps
+straight from one successful roll to the next by sampling the geometric gap
+between them, so the work is proportional to the number of events, not the
+length of the absence, while the event distribution stays the same.
+"""
+import math
+import random
+from collections import Counter
+from typing import Iterator, List
+
+OFFLINE_TICK_HOURS = 0.5
+
+
+def offline_ticks(hours_away: float) -> int:
+    """Number of whole simulation ticks in an absence."""
+    return max(0, int(hours_away / OFFLINE_TICK_HOURS))
+
+
+def bernoulli_hits(trials: int, p: float, rng=random) -> Iterator[int]:
+    """
+    Yield, in order, the indices of *trials* independent rolls that succeed
+    with probability *p* — without rolling the ones that fail.
+    """
+    if trials <= 0 or p <= 0:
+        return
+    if p >= 1:
+        yield from range(trials)
+        return
+    log_miss = math.log1p(-p)
+    index = -1
+    while True:
+        # Failures before the next success are geometric: floor(ln U / ln(1-p))
+        index += 1 + int(math.log(1.0 - rng.random()) / log_miss)
+        if index >= trials:
+            return
+        yield index
+
+
+def summarize_repeats(counts: Counter) -> List[str]:
+    """Collapse repeated event lines: ``"Found Bread (x3)"``."""
+    return [text if count == 1 else f"{text} (x{count})"
+            for text, count in counts.most_common()]
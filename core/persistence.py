@@ -1,13 +1,29 @@
 """
 Save/load system for game persistence using JSON.
 
+Saves are written as a sectioned container: the save path holds a small JSON
+manifest, and every dict/list section (``duck``, ``duck_brain``, ``diary``...)
+is an independently written, zlib-compressed blob in a sibling
+``<name>.sections/`` directory.  Autosaves only rewrite the sections whose
+subsystems changed (see ``SaveSectionTracker``); unchanged sections keep
+pointing at their old blob.
+
+The manifest also carries a ``header`` summary (duck name, stage, last
+played, level...) so the title screen and slot list never touch the blobs,
+and ``load()`` returns a ``LazySave`` that only reads and decodes a section
+when it is first accessed.  Plain single-file JSON saves from older versions still load
+and ``export_json``/``import_json`` keep the plain format available.
+
 Version History:
 - 1.0: Original save format
 - 2.0: Added duck_brain (player model, conversation memory, questions)
 """
 import json
+import threading
+import zlib
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, Set
 from datetime import datetime
 
 from config import SAVE_DIR, SAVE_FILE
@@ -15,6 +31,169 @@ from config import SAVE_DIR, SAVE_FILE
 # Current save version - increment when save structure changes
 SAVE_VERSION = "2.0"
 
+# Marker stored in the manifest of sectioned saves.  "sections-1" manifests
+# (uncompressed JSON blobs, no header) are still read.
+SECTIONS_FORMAT = "sections-2"
+_SECTION_FORMATS = ("sections-1", SECTIONS_FORMAT)
+
+# zlib level for section blobs: save JSON compresses ~8x at level 6 and the
+# cost is paid on the background save thread
+SAVE_COMPRESSION_LEVEL = 6
+
+# Incremental autosaves re-serialize every section at least this often, so a
+# subsystem that forgets to report a change can never be stale for long.
+FULL_SAVE_EVERY = 10
+
+
+def sections_dir(save_path: Path) -> Path:
+    """Return the blob directory that belongs to the manifest at *save_path*."""
+    return Path(save_path).with_suffix(".sections")
+
+
+def _is_section_value(value: Any) -> bool:
+    """Dicts and lists become blobs; scalars stay inline in the manifest."""
+    return isinstance(value, (dict, list))
+
+
+def _encode_section(value: Any) -> bytes:
+    """Serialize one section to compact, compressed JSON."""
+    payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"), SAVE_COMPRESSION_LEVEL)
+
+
+def _decode_section(raw: bytes, codec: str) -> Any:
+    """Inverse of ``_encode_section`` (``codec`` "json" = sections-1 blob)."""
+    if codec == "zlib":
+        raw = zlib.decompress(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def build_save_header(data: Dict[str, Any], base: Optional[dict] = None) -> dict:
+    """
+    Summarize save *data* for menus that must not decode whole sections.
+
+    Only fields whose source sections are present in *data* are updated, so
+    a partial save can pass the previous header as *base*.
+    """
+    header = dict(base or {})
+    duck = data.get("duck")
+    if isinstance(duck, dict):
+        header["name"] = duck.get("name", "Unknown")
+        header["stage"] = duck.get("growth_stage", "unknown")
+        header["duck_created_at"] = duck.get("created_at")
+        mood_history = duck.get("mood_history") or []
+        header["mood"] = str(mood_history[-1]) if mood_history else "happy"
+    if "last_played" in data:
+        header["last_played"] = data["last_played"]
+    statistics = data.get("statistics")
+    if isinstance(statistics, dict):
+        header["days_alive"] = statistics.get("days_alive", 0)
+    progression = data.get("progression")
+    if isinstance(progression, dict):
+        header["level"] = progression.get("level", 1)
+        header["progression_coins"] = progression.get("coins", 0)
+    habitat = data.get("habitat")
+    if isinstance(habitat, dict) and "currency" in habitat:
+        header["habitat_currency"] = habitat["currency"]
+    prestige = data.get("prestige")
+    if isinstance(prestige, dict):
+        header["prestige_level"] = prestige.get("prestige_level", 0)
+    achievements = data.get("achievements")
+    if isinstance(achievements, dict):
+        header["achievements_count"] = len(achievements.get("unlocked", []))
+    stats_system = data.get("statistics_system")
+    if isinstance(stats_system, dict):
+        header["playtime_minutes"] = stats_system.get("total_playtime_minutes", 0)
+        header["first_played"] = stats_system.get("first_played")
+        header["stats_last_played"] = stats_system.get("last_played")
+    return header
+
+
+class LazySave(MutableMapping):
+    """
+    Save data whose sections are read and decoded on first access.
+
+    Behaves like the plain dict ``load()`` used to return (``get``, ``in``,
+    ``[]``, assignment).  ``load()`` only checks that every blob exists with
+    its recorded size; the bytes are read, checksummed and decoded when a
+    section is first used, and a section whose blob turns out corrupted is
+    read from the backup manifest instead.  ``deferred(key)`` hands a
+    section's reader to a subsystem that is itself built lazily.  Use
+    ``dict(save)`` to materialize everything, e.g. before ``json.dump``.
+    """
+
+    def __init__(self, inline: Dict[str, Any], raw_sections: Dict[str, Callable[[], Any]],
+                 header: Optional[dict] = None) -> None:
+        self._values: Dict[str, Any] = dict(inline)
+        self._raw: Dict[str, Callable[[], Any]] = dict(raw_sections)  # name -> reader
+        self.header: dict = header or {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key in self._raw:
+            value = self._values[key] = self._raw.pop(key)()
+            return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._raw.pop(key, None)
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._raw:
+            del self._raw[key]
+            self._values.pop(key, None)
+        else:
+            del self._values[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._values)
+        yield from [k for k in self._raw if k not in self._values]
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._raw)
+
+    def is_decoded(self, key: str) -> bool:
+        """Whether *key* has been decoded (or was never compressed)."""
+        return key in self._values
+
+    def deferred(self, key: str) -> Callable[[], Any]:
+        """Remove *key* and return a callable that reads and decodes it.
+
+        The callable does not keep this mapping alive, so a subsystem can
+        hold on to it after the rest of the save has been dropped.
+        """
+        if key in self._raw:
+            return self._raw.pop(key)
+        value = self._values.pop(key)
+        return lambda: value
+
+    def __repr__(self) -> str:
+        return f"LazySave({len(self)} sections, {len(self._raw)} undecoded)"
+
+
+class KeepSection:
+    """
+    Save value for a section whose subsystem was never loaded.
+
+    ``SaveManager.save`` keeps the section's current blob when it is still
+    intact and otherwise writes ``read()`` (the section's ``LazySave``
+    reader) in its place.
+    """
+
+    __slots__ = ("read",)
+
+    def __init__(self, read: Callable[[], Any]) -> None:
+        self.read = read
+
+    def __deepcopy__(self, memo) -> "KeepSection":
+        # Handed to the save thread as-is; the reader is immutable
+        return self
+
 
 class SaveManager:
     """Handles saving and loading game state to JSON files."""
@@ -36,39 +215,101 @@ class SaveManager:
         """Check if a save file exists."""
         return self.save_path.exists()
 
-    def save(self, data: dict) -> bool:
+    def save_size(self) -> int:
+        """On-disk bytes of the current save: the manifest plus every blob it references."""
+        save_path_resolved = self.save_path.resolve()
+        try:
+            size = save_path_resolved.stat().st_size
+        except OSError:
+            return 0
+        manifest = self._read_manifest(save_path_resolved)
+        if manifest:
+            blob_dir = sections_dir(save_path_resolved)
+            for entry in manifest["sections"].values():
+                try:
+                    size += (blob_dir / entry["file"]).stat().st_size
+                except OSError:
+                    pass
+        return size
+
+    def save(self, data: dict, partial: bool = False) -> bool:
         """
-        Save game data to JSON file.
+        Save game data as a sectioned container.
 
         Args:
-            data: Game state dictionary to save
+            data:    Game state dictionary to save.  Each dict/list value is
+                     written as its own section blob.
+            partial: When True, sections missing from *data* keep the blob
+                     from the previous save instead of being dropped.
 
         Returns:
             True if save successful, False otherwise
         """
         try:
+            save_path_resolved = self.save_path.resolve()
+            temp_path = save_path_resolved.with_suffix(".tmp")
+            bak_path = save_path_resolved.with_suffix(".bak")
+            blob_dir = sections_dir(save_path_resolved)
+            blob_dir.mkdir(parents=True, exist_ok=True)
+
+            existing = self._read_manifest(save_path_resolved)
+            if partial and existing is None and save_path_resolved.exists():
+                # A legacy single-file save has no blobs to keep
+                print("Partial save refused: existing save is not sectioned")
+                return False
+            # Generations keep increasing so the .bak manifest's blobs are
+            # never overwritten by a newer save, even when the manifest
+            # itself is unreadable
+            generation = self._latest_generation(save_path_resolved, existing) + 1
+            previous = existing if partial else None
+            prior_sections = (existing or {}).get("sections", {})
+
             # Add metadata
-            save_data = {
+            manifest: Dict[str, Any] = {
                 "version": SAVE_VERSION,
+                "format": SECTIONS_FORMAT,
                 "saved_at": datetime.now().isoformat(),
-                **data,
+                "generation": generation,
+                "header": build_save_header(data, (previous or {}).get("header")),
+                "inline": dict((previous or {}).get("inline", {})),
+                "sections": dict((previous or {}).get("sections", {})),
             }
 
-            # Write atomically using temp file
-            # Resolve paths to absolute to avoid pathlib rename bugs
-            save_path_resolved = self.save_path.resolve()
-            temp_path = save_path_resolved.with_suffix(".tmp")
-            bak_path = save_path_resolved.with_suffix(".bak")
+            # Write changed sections first; the manifest only references them
+            # once every blob is safely on disk.
+            for name, value in data.items():
+                if isinstance(value, KeepSection):
+                    entry = prior_sections.get(name)
+                    if entry and self._blob_is_intact(blob_dir, entry):
+                        manifest["inline"].pop(name, None)
+                        manifest["sections"][name] = dict(entry)
+                        continue
+                    try:
+                        value = value.read()
+                    except (OSError, ValueError, zlib.error) as e:
+                        print(f"Section {name!r} could not be kept: {e}")
+                        continue
+                if _is_section_value(value):
+                    manifest["inline"].pop(name, None)
+                    manifest["sections"][name] = self._write_section(
+                        blob_dir, name, value, generation, prior_sections.get(name)
+                    )
+                else:
+                    manifest["sections"].pop(name, None)
+                    manifest["inline"][name] = value
 
             # Remove existing temp file if crashed save left one behind
             if temp_path.exists():
                 temp_path.unlink()
 
             with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
 
-            # Backup current save before replacing
-            if save_path_resolved.exists():
+            # Backup current save before replacing; an unreadable save would
+            # only replace a good backup
+            if save_path_resolved.exists() and (
+                    existing is not None
+                    or self._try_load_file(save_path_resolved) is not None):
                 try:
                     save_path_resolved.replace(bak_path)
                 except OSError:
@@ -92,13 +333,100 @@ class SaveManager:
                     except OSError:
                         pass
                 return False
-            
+
+            self._collect_garbage(save_path_resolved)
             return True
 
-        except (IOError, OSError, TypeError) as e:
+        except (IOError, OSError, TypeError, ValueError) as e:
             print(f"Save failed: {e}")
             return False
 
+    def _write_section(self, blob_dir: Path, name: str, value: Any,
+                       generation: int, prior: Optional[dict] = None) -> Dict[str, Any]:
+        """Atomically write one section blob and return its manifest entry.
+
+        When the encoded bytes match *prior* (the section's entry in the
+        current manifest) and its blob is still on disk, nothing is written
+        and *prior* is returned.
+        """
+        payload = _encode_section(value)
+        crc = zlib.crc32(payload)
+        if (prior and prior.get("codec") == "zlib" and prior.get("crc32") == crc
+                and prior.get("bytes") == len(payload)
+                and (blob_dir / prior["file"]).is_file()):
+            return dict(prior)
+
+        filename = f"{name}.{generation}.z"
+        blob_path = blob_dir / filename
+        temp_path = blob_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+        temp_path.replace(blob_path)
+        return {
+            "file": filename,
+            "codec": "zlib",
+            "bytes": len(payload),
+            "crc32": crc,
+            "generation": generation,
+        }
+
+    @staticmethod
+    def _blob_is_intact(blob_dir: Path, entry: dict) -> bool:
+        """Whether *entry*'s blob is on disk and matches its checksum."""
+        try:
+            with open(blob_dir / entry["file"], "rb") as f:
+                raw = f.read()
+        except OSError:
+            return False
+        return "crc32" not in entry or zlib.crc32(raw) == entry["crc32"]
+
+    def _latest_generation(self, save_path_resolved: Path,
+                           manifest: Optional[dict]) -> int:
+        """Highest generation used by the manifest, its backup or any blob."""
+        latest = (manifest or {}).get("generation", 0)
+        backup = self._read_manifest(save_path_resolved.with_suffix(".bak"))
+        latest = max(latest, (backup or {}).get("generation", 0))
+        try:
+            for blob in sections_dir(save_path_resolved).iterdir():
+                # <name>.<generation>.z
+                parts = blob.name.rsplit(".", 2)
+                if len(parts) == 3 and parts[1].isdigit():
+                    latest = max(latest, int(parts[1]))
+        except OSError:
+            pass
+        return latest
+
+    def _collect_garbage(self, save_path_resolved: Path) -> None:
+        """Delete blobs referenced by neither the manifest nor its backup."""
+        blob_dir = sections_dir(save_path_resolved)
+        keep: Set[str] = set()
+        for manifest_path in (save_path_resolved, save_path_resolved.with_suffix(".bak")):
+            manifest = self._read_manifest(manifest_path)
+            if manifest:
+                keep.update(entry["file"] for entry in manifest["sections"].values())
+        try:
+            for blob in blob_dir.iterdir():
+                if blob.name not in keep:
+                    try:
+                        blob.unlink()
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+    def _read_manifest(self, path: Path) -> Optional[dict]:
+        """Return the manifest at *path*, or None for missing/legacy saves."""
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, json.JSONDecodeError):
+            return None
+        if isinstance(data, dict) and data.get("format") in _SECTION_FORMATS:
+            return data
+        return None
+
     def load(self) -> Optional[dict]:
         """
         Load game data from JSON file.
@@ -106,7 +434,8 @@ class SaveManager:
         Cleans up orphaned .tmp files.
 
         Returns:
-            Game state dictionary or None if load fails
+            Game state mapping (a ``LazySave`` for sectioned saves, a plain
+            dict for legacy JSON) or None if load fails
         """
         save_path_resolved = self.save_path.resolve()
         temp_path = save_path_resolved.with_suffix(".tmp")
@@ -134,16 +463,76 @@ class SaveManager:
         return None
 
     def _try_load_file(self, path: Path) -> Optional[dict]:
-        """Try to load and parse a JSON save file."""
+        """Try to load a save file (sectioned container or legacy JSON)."""
         if not path.exists():
             return None
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (IOError, OSError, json.JSONDecodeError) as e:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("format") in _SECTION_FORMATS:
+                return self._assemble_sections(path, data)
+            return data
+        except (IOError, OSError, ValueError) as e:
             print(f"Load failed for {path.name}: {e}")
             return None
-    
+
+    def _assemble_sections(self, path: Path, manifest: dict) -> "LazySave":
+        """Check every section blob listed in *manifest*; read them lazily.
+
+        Raises ValueError if a blob is missing or has the wrong size so
+        ``load()`` can fall back to the backup manifest.  Checksums are
+        verified when a section is first read (see ``_section_reader``).
+        """
+        path = path.resolve()
+        blob_dir = sections_dir(path)
+        inline: Dict[str, Any] = {
+            "version": manifest.get("version", SAVE_VERSION),
+            "saved_at": manifest.get("saved_at"),
+            **manifest.get("inline", {}),
+        }
+        backup_path = path.with_suffix(".bak")
+        backup = self._read_manifest(backup_path) if path != backup_path else None
+        backup_sections = (backup or {}).get("sections", {})
+        raw_sections: Dict[str, Callable[[], Any]] = {}
+        for name, entry in manifest.get("sections", {}).items():
+            try:
+                size = (blob_dir / entry["file"]).stat().st_size
+            except OSError:
+                raise ValueError(f"section {name!r} is missing")
+            if entry.get("codec") == "zlib" and size != entry.get("bytes", size):
+                raise ValueError(f"section {name!r} is truncated")
+            fallback = backup_sections.get(name)
+            if fallback and fallback.get("file") == entry["file"]:
+                fallback = None
+            raw_sections[name] = self._section_reader(blob_dir, name, entry, fallback)
+        return LazySave(inline, raw_sections, manifest.get("header"))
+
+    @staticmethod
+    def _section_reader(blob_dir: Path, name: str, entry: dict,
+                        fallback: Optional[dict]) -> Callable[[], Any]:
+        """Return a callable that reads, checks and decodes one section blob.
+
+        A blob that fails its checksum is replaced by the backup manifest's
+        blob for the same section (*fallback*) when there is one.
+        """
+        def read(section: dict) -> Any:
+            with open(blob_dir / section["file"], "rb") as f:
+                raw = f.read()
+            if "crc32" in section and zlib.crc32(raw) != section["crc32"]:
+                raise ValueError(f"section {name!r} is corrupted")
+            return _decode_section(raw, section.get("codec", "json"))
+
+        def read_section() -> Any:
+            try:
+                return read(entry)
+            except (OSError, ValueError, zlib.error):
+                if fallback is None:
+                    raise
+            print(f"Section {name!r} corrupted, loading it from backup...")
+            return read(fallback)
+
+        return read_section
+
     def _migrate_save(self, data: dict) -> dict:
         """Migrate old save formats to current version."""
         version = data.get("version", "1.0")
@@ -159,28 +548,220 @@ class SaveManager:
         return data
 
     def delete_save(self) -> bool:
-        """Delete the save file."""
+        """Delete the save file, its backup and its section blobs."""
         try:
-            if self.save_exists():
-                self.save_path.unlink()
+            for path in (self.save_path, self.save_path.with_suffix(".bak"),
+                         self.save_path.with_suffix(".tmp")):
+                if path.exists():
+                    path.unlink()
+            blob_dir = sections_dir(self.save_path)
+            if blob_dir.is_dir():
+                for blob in blob_dir.iterdir():
+                    blob.unlink()
+                blob_dir.rmdir()
             return True
         except OSError:
             return False
 
-    def get_save_info(self) -> Optional[dict]:
-        """Get basic info about save without loading full data."""
+    def read_header(self) -> Optional[dict]:
+        """
+        Return the save's header summary (see ``build_save_header``).
+
+        Sectioned saves only read the manifest; legacy JSON saves and
+        manifests without a header fall back to a full load.  A backup
+        whose blobs are gone could never be loaded, so its header is ignored.
+        """
+        save_path_resolved = self.save_path.resolve()
+        manifest = self._read_manifest(save_path_resolved)
+        if manifest and manifest.get("header"):
+            return dict(manifest["header"])
+        manifest = self._read_manifest(save_path_resolved.with_suffix(".bak"))
+        blob_dir = sections_dir(save_path_resolved)
+        if (manifest and manifest.get("header")
+                and all((blob_dir / entry["file"]).is_file()
+                        for entry in manifest["sections"].values())):
+            return dict(manifest["header"])
         data = self.load()
         if not data:
             return None
+        return build_save_header(data)
+
+    def get_save_info(self) -> Optional[dict]:
+        """Get basic info about save without loading full data."""
+        header = self.read_header()
+        if header is None:
+            return None
 
-        duck = data.get("duck", {})
         return {
-            "name": duck.get("name", "Unknown"),
-            "stage": duck.get("growth_stage", "unknown"),
-            "last_played": data.get("last_played", "unknown"),
-            "days_alive": data.get("statistics", {}).get("days_alive", 0),
+            **header,
+            "name": header.get("name", "Unknown"),
+            "stage": header.get("stage", "unknown"),
+            "last_played": header.get("last_played", "unknown"),
+            "days_alive": header.get("days_alive", 0),
         }
 
+    def export_json(self, export_path: Path) -> bool:
+        """Write the whole save as one plain JSON file (the pre-container format)."""
+        data = self.load()
+        if data is None:
+            return False
+        try:
+            export_path = Path(export_path).expanduser()
+            export_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(export_path, "w", encoding="utf-8") as f:
+                json.dump(dict(data), f, indent=2, ensure_ascii=False)
+            return True
+        except (IOError, OSError, TypeError, ValueError) as e:
+            print(f"Export failed: {e}")
+            return False
+
+    def import_json(self, import_path: Path) -> bool:
+        """Replace the save with a plain JSON save file (exported or legacy)."""
+        try:
+            with open(Path(import_path).expanduser(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, json.JSONDecodeError) as e:
+            print(f"Import failed: {e}")
+            return False
+        if not isinstance(data, dict):
+            return False
+        return self.save(self._migrate_save(data))
+
+
+# Sentinel for "this section has never been saved"
+_UNSAVED = object()
+
+
+class SaveSectionTracker:
+    """
+    Decides which save sections need re-serializing on an autosave.
+
+    Each section registers a ``serialize`` callable (usually a ``to_dict``)
+    and, optionally, a ``revision`` callable returning a cheap token that
+    changes whenever the subsystem changes.  Sections without a revision are
+    treated as always dirty, which suits small, fast-changing state such as
+    needs and the clock.
+
+    Usage from game.py::
+
+        tracker = SaveSectionTracker()
+        tracker.register("duck", lambda: self.duck.to_dict())
+        tracker.register("diary", lambda: self.diary.to_dict(),
+                         revision=lambda: (id(self.diary), self.diary.save_revision))
+
+        sections = tracker.collect()          # only changed sections
+        save_manager.save(sections, partial=True)
+    """
+
+    def __init__(self, full_save_every: int = FULL_SAVE_EVERY) -> None:
+        self._serializers: Dict[str, Callable[[], Any]] = {}
+        self._revisions: Dict[str, Callable[[], Any]] = {}
+        self._saved_revisions: Dict[str, Any] = {}
+        self._forced: Set[str] = set()
+        self._full_save_every = full_save_every
+        self._saves_since_full = 0
+        self._needs_full = True
+        # Sections whose write failed, reported from the save thread
+        self._unsaved: Set[str] = set()
+        self._unsaved_full = False
+        self._unsaved_lock = threading.Lock()
+        # Whether the last collect() returned every section
+        self.last_was_full = False
+
+    def register(
+        self,
+        name: str,
+        serialize: Callable[[], Any],
+        revision: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Register (or re-register) a save section."""
+        self._serializers[name] = serialize
+        if revision is not None:
+            self._revisions[name] = revision
+        else:
+            self._revisions.pop(name, None)
+        self._saved_revisions.pop(name, None)
+
+    def mark_dirty(self, name: str) -> None:
+        """Force *name* to be re-serialized on the next collect()."""
+        self._forced.add(name)
+
+    def reset(self) -> None:
+        """Forget what was saved; the next collect() returns every section.
+
+        Call after loading, starting a new game or switching save slots.
+        """
+        self._saved_revisions.clear()
+        self._forced.clear()
+        self._needs_full = True
+
+    def mark_unsaved(self, names: Iterable[str], full: bool = False) -> None:
+        """
+        Report that the write of *names* failed, so they are collected again.
+
+        Safe to call from the save thread: the sections are only marked
+        dirty by the next ``collect()``.  Pass *full* for a failed full save,
+        which is then retried as a full save.
+        """
+        with self._unsaved_lock:
+            self._unsaved.update(names)
+            self._unsaved_full = self._unsaved_full or full
+
+    def _apply_unsaved(self) -> None:
+        with self._unsaved_lock:
+            unsaved, self._unsaved = self._unsaved, set()
+            full, self._unsaved_full = self._unsaved_full, False
+        self._forced.update(name for name in unsaved if name in self._serializers)
+        if full:
+            self._needs_full = True
+
+    def dirty_sections(self, force: bool = False) -> Iterable[str]:
+        """Return the names of sections that would be serialized."""
+        self._apply_unsaved()
+        full = force or self._needs_full or self._saves_since_full >= self._full_save_every
+        dirty = []
+        for name in self._serializers:
+            revision = self._revisions.get(name)
+            if full or revision is None or name in self._forced:
+                dirty.append(name)
+            elif revision() != self._saved_revisions.get(name, _UNSAVED):
+                dirty.append(name)
+        return dirty
+
+    def collect(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Serialize dirty sections and remember their revisions.
+
+        Args:
+            force: Serialize every section regardless of revisions.
+
+        Returns:
+            Mapping of section name to serialized value for every section
+            that changed since the last collect().  If a serializer raises,
+            the exception propagates and nothing is marked as saved.
+        """
+        self._apply_unsaved()
+        full = force or self._needs_full or self._saves_since_full >= self._full_save_every
+        result: Dict[str, Any] = {}
+        tokens: Dict[str, Any] = {}
+        for name in self.dirty_sections(force=full):
+            # Read the revision first so a change made while serializing
+            # still leaves the section dirty for the next save
+            revision = self._revisions.get(name)
+            if revision is not None:
+                tokens[name] = revision()
+            result[name] = self._serializers[name]()
+
+        self._saved_revisions.update(tokens)
+        self._forced.difference_update(result)
+        self.last_was_full = full
+        if full:
+            self._saves_since_full = 0
+            self._needs_full = False
+        else:
+            self._saves_since_full += 1
+        return result
+
 
 def create_new_save(duck_name: str) -> dict:
     """
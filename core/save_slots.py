@@ -8,7 +8,8 @@ from typing import Dict, List, Optional
 from pathlib import Path
 import json
 import os
-import shutil
+
+from core.persistence import SaveManager
 
 
 @dataclass
@@ -64,10 +65,11 @@ class SaveSlotsSystem:
             
             if save_path.exists():
                 try:
-                    with open(save_path, 'r') as f:
-                        data = json.load(f)
+                    header = SaveManager(save_path).read_header()
+                    if header is None:
+                        raise IOError(f"unreadable save: {save_path}")
                     
-                    self.slots[slot_id] = self._parse_save_data(slot_id, data)
+                    self.slots[slot_id] = self._parse_save_header(slot_id, header)
                 except (json.JSONDecodeError, KeyError, IOError):
                     self.slots[slot_id] = SaveSlotInfo(
                         slot_id=slot_id,
@@ -85,9 +87,10 @@ class SaveSlotsSystem:
         save_path = self.get_save_path(slot_id)
         if save_path.exists():
             try:
-                with open(save_path, 'r') as f:
-                    data = json.load(f)
-                self.slots[slot_id] = self._parse_save_data(slot_id, data)
+                header = SaveManager(save_path).read_header()
+                if header is None:
+                    raise IOError(f"unreadable save: {save_path}")
+                self.slots[slot_id] = self._parse_save_header(slot_id, header)
             except (json.JSONDecodeError, KeyError, IOError):
                 self.slots[slot_id] = SaveSlotInfo(
                     slot_id=slot_id,
@@ -100,37 +103,27 @@ class SaveSlotsSystem:
                 is_empty=True,
             )
 
-    def _parse_save_data(self, slot_id: int, data: dict) -> SaveSlotInfo:
-        """Parse save data into slot info."""
-        duck_data = data.get("duck", {})
-        progression_data = data.get("progression", {})
-        prestige_data = data.get("prestige", {})
-        achievements_data = data.get("achievements", {})
-        stats_data = data.get("statistics_system") or data.get("statistics", {})
-        habitat_data = data.get("habitat", {})
-        
-        current_mood = "happy"
-        mood_history = duck_data.get("mood_history") or []
-        if mood_history:
-            current_mood = str(mood_history[-1])
+    def _parse_save_header(self, slot_id: int, header: dict) -> SaveSlotInfo:
+        """Parse a save header (see ``build_save_header``) into slot info."""
+        current_mood = header.get("mood") or "happy"
         
         # Create preview ASCII based on level/prestige
-        level = progression_data.get("level", 1)
-        prestige = prestige_data.get("prestige_level", 0)
+        level = header.get("level", 1)
+        prestige = header.get("prestige_level", 0)
         
         preview = self._generate_preview(level, prestige, current_mood)
         
         return SaveSlotInfo(
             slot_id=slot_id,
             is_empty=False,
-            duck_name=duck_data.get("name", "Cheese"),
+            duck_name=header.get("name", "Cheese"),
             level=level,
-            playtime_minutes=stats_data.get("total_playtime_minutes", 0),
-            coins=habitat_data.get("currency", progression_data.get("coins", 0)),
-            created_at=stats_data.get("first_played") or duck_data.get("created_at", "Unknown"),
-            last_played=stats_data.get("last_played") or data.get("last_played", "Unknown"),
+            playtime_minutes=header.get("playtime_minutes", 0),
+            coins=header.get("habitat_currency", header.get("progression_coins", 0)),
+            created_at=header.get("first_played") or header.get("duck_created_at") or "Unknown",
+            last_played=header.get("stats_last_played") or header.get("last_played", "Unknown"),
             prestige_level=prestige,
-            achievements_count=len(achievements_data.get("unlocked", [])),
+            achievements_count=header.get("achievements_count", 0),
             mood=current_mood,
             preview_ascii=preview,
         )
@@ -199,11 +192,7 @@ class SaveSlotsSystem:
         if not save_path.exists():
             return None
         
-        try:
-            with open(save_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
+        return SaveManager(save_path).load()
 
     def switch_slot(self, slot_id: int) -> bool:
         """Set the active slot without loading or saving game state."""
@@ -222,34 +211,35 @@ class SaveSlotsSystem:
         backup_path = self.get_backup_path(slot_id)
         
         try:
-            # Create backup of existing save
+            # Backup the existing save as a single plain JSON file; the
+            # slot itself is a manifest plus section blobs.
             if save_path.exists():
-                shutil.copy2(save_path, backup_path)
+                previous = SaveManager(save_path).load()
+                if previous is not None:
+                    self._write_json(backup_path, dict(previous))
             
-            temp_path = save_path.with_suffix(".tmp")
-            if temp_path.exists():
-                temp_path.unlink()
-
-            try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                temp_path.replace(save_path)
-            except Exception:
-                # Restore from backup on write failure
-                if temp_path.exists():
-                    temp_path.unlink()
-                if backup_path.exists():
-                    shutil.copy2(backup_path, save_path)
-                elif save_path.exists():
-                    save_path.unlink()
+            # SaveManager only swaps in the new manifest once every section
+            # is written, so a failed save leaves the old one intact.
+            if not SaveManager(save_path).save(data):
                 return False
             
             # Refresh slot info
             self.refresh_slot(slot_id)
             return True
             
-        except IOError:
+        except (IOError, TypeError, ValueError):
             return False
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        """Atomically write *data* as a plain JSON file."""
+        temp_path = path.with_suffix(".tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            temp_path.replace(path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
     
     def delete_slot(self, slot_id: int) -> bool:
         """Delete a save slot."""
@@ -260,8 +250,8 @@ class SaveSlotsSystem:
         backup_path = self.get_backup_path(slot_id)
         
         try:
-            if save_path.exists():
-                save_path.unlink()
+            if not SaveManager(save_path).delete_save():
+                return False
             if backup_path.exists():
                 backup_path.unlink()
             
@@ -288,10 +278,13 @@ class SaveSlotsSystem:
             return False
         
         try:
-            shutil.copy2(backup_path, save_path)
+            with open(backup_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not SaveManager(save_path).save(data):
+                return False
             self.refresh_slot(slot_id)
             return True
-        except IOError:
+        except (json.JSONDecodeError, IOError):
             return False
     
     def has_backup(self, slot_id: int) -> bool:
@@ -299,19 +292,13 @@ class SaveSlotsSystem:
         return self.get_backup_path(slot_id).exists()
     
     def export_slot(self, slot_id: int, export_path: str) -> bool:
-        """Export a save slot to an external file."""
-        data = self.load_slot(slot_id)
-        if data is None:
+        """Export a save slot to an external plain JSON file."""
+        if slot_id not in range(1, self.MAX_SLOTS + 1):
             return False
-        
-        try:
-            export_file = Path(export_path).expanduser()
-            export_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            return True
-        except IOError:
+        save_path = self.get_save_path(slot_id)
+        if not save_path.exists():
             return False
+        return SaveManager(save_path).export_json(Path(export_path))
     
     def import_slot(self, slot_id: int, import_path: str) -> bool:
         """Import a save file into a slot."""
@@ -0,0 +1,453 @@
+"""
+Headless soak test and throughput benchmark.
+
+Drives ``Game._update`` and ``Renderer.render_frame`` against a fake
+terminal with ``time.time`` replaced by a virtual clock, so a frame stands
+for ``SOAK_SECONDS_PER_FRAME`` of game time and simulated days run in
+minutes. A scripted player (seeded) tends the lowest need now and then.
+
+The run records:
+    - frame, update and render time distributions, plus the frame
+      profiler's per-section breakdown over the whole run
+    - bytes written to the terminal per frame
+    - allocations: memory telemetry samples every simulated hour (growth
+      detection included) and, with ``trace_allocations``, the tracemalloc
+      peak per frame
+    - save sizes, main-thread save stalls and background write durations
+    - exceptions raised by the loop, grouped by type and location
+
+``SoakReport.metrics()`` is the flat set of numbers written to a baseline
+file; ``compare_to_baseline`` lists metrics that regressed beyond the
+tolerance. Run it through ``soak_test.py``, which points HOME at a scratch
+directory so saves and learned data never touch the player's.
+"""
+from __future__ import annotations
+
+import io
+import json
+import platform
+import random
+import sys
+import threading
+import time
+import traceback
+import tracemalloc
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from blessed import Terminal
+from blessed.keyboard import Keystroke
+
+from config import (SOAK_CARE_INTERVAL, SOAK_REGRESSION_TOLERANCE, SOAK_SAMPLE_INTERVAL,
+                    SOAK_SECONDS_PER_FRAME, SOAK_TERMINAL_SIZE)
+from core.automated_test import AutomatedGameTester, TestStatus
+from core.frame_profiler import RollingSeries, frame_profiler
+from core.memory_telemetry import memory_telemetry
+
+# Scripted player: the interaction that restores each need
+CARE_ACTIONS = {
+    "hunger": "feed",
+    "energy": "sleep",
+    "fun": "play",
+    "cleanliness": "clean",
+    "social": "pet",
+}
+
+# Absolute change a metric must also exceed to count as a regression, so
+# sub-millisecond jitter on fast machines is not reported
+_ABSOLUTE_SLACK = {"_ms": 1.0, "_bytes": 4096, "_kib": 16.0, "_mb": 2.0}
+
+
+class HeadlessTerminal(Terminal):
+    """xterm-256color terminal of a fixed size that writes nowhere and never has input."""
+
+    def __init__(self, width: int, height: int):
+        super().__init__(kind="xterm-256color", stream=io.StringIO(), force_styling=True)
+        self._size = (width, height)
+
+    @property
+    def width(self) -> int:
+        return self._size[0]
+
+    @property
+    def height(self) -> int:
+        return self._size[1]
+
+    def inkey(self, timeout=None, esc_delay=0.35):
+        return Keystroke("")
+
+
+class _CountingSink(io.TextIOBase):
+    """Stand-in for stdout that counts what the renderer writes."""
+
+    def __init__(self):
+        self.written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.written += len(text)
+        return len(text)
+
+
+class VirtualClock:
+    """Replacement for ``time.time`` that only moves when advanced."""
+
+    def __init__(self, start: float):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    @contextmanager
+    def installed(self):
+        real_time = time.time
+        time.time = self
+        try:
+            yield self
+        finally:
+            time.time = real_time
+
+
+def soak_epoch() -> float:
+    """Next UTC midnight: every run starts its virtual clock at the same phase."""
+    return (time.time() // 86400 + 1) * 86400
+
+
+def create_headless_game(save_dir: Path, size=SOAK_TERMINAL_SIZE, seed: int = 0,
+                         clock: Optional[VirtualClock] = None):
+    """
+    A Game on a HeadlessTerminal with a new duck, saving under *save_dir*.
+
+    Pass the clock the soak will run on, so the game's timers start on it.
+    """
+    from core.game import Game
+    from core.persistence import SaveManager
+
+    random.seed(seed)   # The new duck's personality and starting world
+    with clock.installed() if clock else nullcontext():
+        game = Game(terminal=HeadlessTerminal(*size))
+        game.save_manager = SaveManager(Path(save_dir) / "save.json")
+        game._start_new_game()
+    game._state = "playing"   # Skip the AI loading screen
+    return game
+
+
+@dataclass
+class SoakReport:
+    """Results of one soak run. Times in milliseconds."""
+    seed: int
+    days: float
+    seconds_per_frame: float
+    terminal: List[int]
+    started_at: str
+    frames: int = 0
+    wall_seconds: float = 0.0
+    traced: bool = False
+    frame_ms: Dict[str, float] = field(default_factory=dict)
+    update_ms: Dict[str, float] = field(default_factory=dict)
+    render_ms: Dict[str, float] = field(default_factory=dict)
+    bytes_per_frame: Dict[str, float] = field(default_factory=dict)
+    alloc_kib_per_frame: Dict[str, float] = field(default_factory=dict)
+    sections: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    saves: Dict[str, Any] = field(default_factory=dict)
+    memory: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    error_tracebacks: Dict[str, str] = field(default_factory=dict)
+    final_state: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def metrics(self) -> Dict[str, float]:
+        """Flat numbers compared against a baseline (lower is better for all)."""
+        metrics = {
+            "frame_p50_ms": self.frame_ms.get("p50", 0.0),
+            "frame_p95_ms": self.frame_ms.get("p95", 0.0),
+            "frame_p99_ms": self.frame_ms.get("p99", 0.0),
+            "update_p95_ms": self.update_ms.get("p95", 0.0),
+            "render_p95_ms": self.render_ms.get("p95", 0.0),
+            "save_stall_p95_ms": self.saves.get("stall_ms", {}).get("p95", 0.0),
+            "save_write_p95_ms": self.saves.get("write_ms", {}).get("p95", 0.0),
+            "save_max_bytes": self.saves.get("max_bytes", 0),
+            "terminal_p95_bytes": self.bytes_per_frame.get("p95", 0.0),
+            "rss_growth_mb": self.memory.get("rss_growth_mb", 0.0),
+        }
+        if self.traced:
+            metrics["alloc_p95_kib"] = self.alloc_kib_per_frame.get("p95", 0.0)
+        return metrics
+
+    def baseline(self) -> Dict[str, Any]:
+        """Contents of a baseline file for this run."""
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "run": {"seed": self.seed, "days": self.days,
+                    "seconds_per_frame": self.seconds_per_frame, "terminal": self.terminal},
+            "metrics": self.metrics(),
+        }
+
+
+def compare_to_baseline(metrics: Dict[str, float], baseline: Dict[str, Any],
+                        tolerance: float = SOAK_REGRESSION_TOLERANCE) -> List[str]:
+    """Describe every metric more than *tolerance* (and the absolute slack) over baseline."""
+    regressions = []
+    for name, base in baseline.get("metrics", {}).items():
+        current = metrics.get(name)
+        if current is None:
+            continue
+        slack = next((value for suffix, value in _ABSOLUTE_SLACK.items()
+                      if name.endswith(suffix)), 0.0)
+        if current > base * (1.0 + tolerance) and current - base > slack:
+            ratio = f"{current / base:.2f}x" if base else "new"
+            regressions.append(f"{name}: {base:g} -> {current:g} ({ratio})")
+    return regressions
+
+
+class SoakTester(AutomatedGameTester):
+    """
+    Long headless run of the real update and render path.
+
+    Checks (errors, memory growth, saves, baseline) are logged as test
+    results, so ``generate_report_text``/``save_report`` cover soak runs too.
+    """
+
+    def __init__(self, game, days: float = 1.0, seed: int = 0,
+                 seconds_per_frame: float = SOAK_SECONDS_PER_FRAME,
+                 care_interval: float = SOAK_CARE_INTERVAL,
+                 sample_interval: float = SOAK_SAMPLE_INTERVAL,
+                 trace_allocations: bool = False, clock: Optional[VirtualClock] = None):
+        super().__init__(game)
+        self.clock = clock or VirtualClock(time.time())
+        self.days = days
+        self.seed = seed
+        self.seconds_per_frame = seconds_per_frame
+        self.care_interval = care_interval
+        self.sample_interval = sample_interval
+        self.trace_allocations = trace_allocations
+        self._rng = random.Random(seed)
+        self._save_lock = threading.Lock()
+        self._save_stalls = RollingSeries(100000)
+        self._save_writes = RollingSeries(100000)
+        self._save_sizes: List[int] = []
+
+    # ── Instrumentation ───────────────────────────────────────────────
+
+    def _instrument_saves(self) -> None:
+        game = self.game
+        save_game = game._save_game
+        write = game.save_manager.save
+
+        def timed_save_game(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return save_game(*args, **kwargs)
+            finally:
+                self._save_stalls.add(time.perf_counter() - start)
+
+        def timed_write(data, partial=False):
+            start = time.perf_counter()
+            try:
+                return write(data, partial)
+            finally:
+                elapsed = time.perf_counter() - start
+                size = game.save_manager.save_size()
+                with self._save_lock:
+                    self._save_writes.add(elapsed)
+                    self._save_sizes.append(size)
+
+        game._save_game = timed_save_game
+        game.save_manager.save = timed_write
+
+    def _care_for_duck(self) -> None:
+        """Scripted player: tend every low need, or do something at random."""
+        needs = self.game.duck.needs
+        low = [name for name in CARE_ACTIONS if getattr(needs, name, 100.0) < 50]
+        if not low and self._rng.random() < 0.5:
+            low = [self._rng.choice(sorted(CARE_ACTIONS))]
+        for need in low:
+            self.game._perform_interaction(CARE_ACTIONS[need])
+
+    def _final_state(self) -> Dict[str, Any]:
+        game = self.game
+        duck = game.duck
+        state: Dict[str, Any] = {"state": game._state}
+        if duck is not None:
+            state["growth_stage"] = duck.growth_stage
+            state["needs"] = {name: round(getattr(duck.needs, name), 2) for name in CARE_ACTIONS}
+        progression = getattr(game, "progression", None)
+        if progression is not None:
+            state["xp"] = progression.xp
+            state["level"] = progression.level
+        return state
+
+    # ── Run ───────────────────────────────────────────────────────────
+
+    def run_soak(self, baseline: Optional[Dict[str, Any]] = None,
+                 tolerance: float = SOAK_REGRESSION_TOLERANCE) -> SoakReport:
+        """Run for ``days`` simulated days; returns the report."""
+        from audio.sound import sound_engine
+
+        game = self.game
+        frames = max(1, int(self.days * 86400 / self.seconds_per_frame))
+        report = SoakReport(seed=self.seed, days=self.days,
+                            seconds_per_frame=self.seconds_per_frame,
+                            terminal=[game.terminal.width, game.terminal.height],
+                            started_at=datetime.now().isoformat(timespec="seconds"),
+                            traced=self.trace_allocations)
+        random.seed(self.seed)
+        self._running = True
+        self._instrument_saves()
+
+        frame_ms = RollingSeries(frames)
+        update_ms = RollingSeries(frames)
+        render_ms = RollingSeries(frames)
+        written = RollingSeries(frames)
+        allocated = RollingSeries(frames)
+        error_tracebacks: Dict[str, str] = {}
+
+        # Whole-run profiler window; the game's own telemetry schedule is
+        # replaced by one sample per simulated hour
+        profiler_window = frame_profiler.window
+        frame_profiler.window = frames
+        frame_profiler.reset()
+        dump_path = memory_telemetry.dump_path
+        memory_telemetry.dump_path = None
+        memory_telemetry.reset()
+        memory_telemetry.register("python.allocated_blocks", sys.getallocatedblocks)
+        game.update_scheduler.disable("memory_telemetry")
+        sound_was_enabled = sound_engine.enabled
+        sound_engine.set_enabled(False)
+        if self.trace_allocations:
+            memory_telemetry.start_tracing()
+
+        clock = self.clock
+        sink = _CountingSink()
+        next_care = next_sample = clock.now
+        wall_start = time.perf_counter()
+        try:
+            with clock.installed(), redirect_stdout(sink):
+                for frame in range(frames):
+                    if not self._running or game.duck is None:
+                        break
+                    clock.advance(self.seconds_per_frame)
+                    if clock.now >= next_care:
+                        next_care = clock.now + self.care_interval
+                        self._care_for_duck()
+                    if clock.now >= next_sample:
+                        next_sample = clock.now + self.sample_interval
+                        memory_telemetry.sample(now=clock.now)
+                        self._update_progress(f"Soak: day {frame * self.seconds_per_frame / 86400:.2f}",
+                                              frame, frames)
+
+                    written_before = sink.written
+                    if self.trace_allocations:
+                        tracemalloc.reset_peak()
+                        traced_before = tracemalloc.get_traced_memory()[0]
+                    frame_profiler.begin_frame()
+                    start = time.perf_counter()
+                    try:
+                        with frame_profiler.section("update"):
+                            game._update()
+                        mid = time.perf_counter()
+                        with frame_profiler.section("render"):
+                            game.renderer.render_frame(game)
+                        end = time.perf_counter()
+                        update_ms.add(mid - start)
+                        render_ms.add(end - mid)
+                        frame_ms.add(end - start)
+                    except Exception as exc:
+                        where = traceback.extract_tb(exc.__traceback__)[-1]
+                        key = f"{type(exc).__name__} at {Path(where.filename).name}:{where.lineno}"
+                        report.errors[key] = report.errors.get(key, 0) + 1
+                        error_tracebacks.setdefault(key, traceback.format_exc(limit=8))
+                    frame_profiler.end_frame()
+                    written.add(sink.written - written_before)
+                    if self.trace_allocations:
+                        allocated.add((tracemalloc.get_traced_memory()[1] - traced_before) / 1024)
+                    report.frames += 1
+                memory_telemetry.sample(now=clock.now)
+        finally:
+            executor = getattr(game, "_save_executor", None)
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if self.trace_allocations:
+                memory_telemetry.stop_tracing()
+            sound_engine.set_enabled(sound_was_enabled)
+            game.update_scheduler.enable("memory_telemetry")
+            memory_telemetry.unregister("python.allocated_blocks")
+            memory_telemetry.dump_path = dump_path
+            self._running = False
+
+        report.wall_seconds = round(time.perf_counter() - wall_start, 3)
+        report.frame_ms = frame_ms.summary(1000.0)
+        report.update_ms = update_ms.summary(1000.0)
+        report.render_ms = render_ms.summary(1000.0)
+        report.bytes_per_frame = written.summary()
+        if self.trace_allocations:
+            report.alloc_kib_per_frame = allocated.summary()
+        report.sections = frame_profiler.to_dict()["sections"]
+        frame_profiler.window = profiler_window
+        frame_profiler.reset()
+        report.saves = {
+            "count": self._save_writes.count,
+            "stall_ms": self._save_stalls.summary(1000.0),
+            "write_ms": self._save_writes.summary(1000.0),
+            "max_bytes": max(self._save_sizes, default=0),
+            "last_bytes": self._save_sizes[-1] if self._save_sizes else 0,
+        }
+        rss = [sample["values"].get("rss") for sample in memory_telemetry.samples]
+        rss = [value for value in rss if value is not None]
+        report.memory = {
+            "samples": len(memory_telemetry.samples),
+            "rss_growth_mb": round((rss[-1] - rss[0]) / (1024 * 1024), 2) if rss else 0.0,
+            "growth": memory_telemetry.growth(),
+            "last": memory_telemetry.samples[-1]["values"] if memory_telemetry.samples else {},
+        }
+        report.error_tracebacks = error_tracebacks
+        report.final_state = self._final_state()
+        self._log_checks(report, baseline, tolerance)
+        self.report.ended_at = datetime.now().isoformat()
+        return report
+
+    def _log_checks(self, report: SoakReport, baseline: Optional[Dict[str, Any]],
+                    tolerance: float) -> None:
+        category = "Soak"
+        if report.errors:
+            self._log_result("No errors during soak", category, TestStatus.FAILED,
+                             error=", ".join(f"{key} x{count}" for key, count in report.errors.items()))
+        else:
+            self._log_result("No errors during soak", category, TestStatus.PASSED,
+                             message=f"{report.frames} frames")
+
+        growth = report.memory["growth"]
+        self._log_result("No monotonic memory growth", category,
+                         TestStatus.WARNING if growth else TestStatus.PASSED,
+                         message=", ".join(entry["name"] for entry in growth) or "stable")
+
+        self._log_result("Autosaves completed", category,
+                         TestStatus.PASSED if report.saves["count"] else TestStatus.FAILED,
+                         message=f"{report.saves['count']} saves, "
+                                 f"max {report.saves['max_bytes']} bytes")
+
+        if baseline is not None:
+            regressions = compare_to_baseline(report.metrics(), baseline, tolerance)
+            self._log_result("Within baseline", category,
+                             TestStatus.FAILED if regressions else TestStatus.PASSED,
+                             error="; ".join(regressions),
+                             message=f"tolerance {tolerance:.0%}")
+
+    @staticmethod
+    def write_json(data: Dict[str, Any], path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2, default=str))
+        return path
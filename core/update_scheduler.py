@@ -14,6 +14,9 @@ Usage from game.py::
 
     # In _update():
     self.update_scheduler.update(time.time())
+
+    # Event-driven loop: block until the next system is due
+    deadline = self.update_scheduler.next_due_time()
 """
 from __future__ import annotations
 
@@ -22,6 +25,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Optional
 
+from core.frame_profiler import frame_profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +44,8 @@ CRAFT_CHECK_INTERVAL = 2.0       # Crafting progress poll
 BUILD_CHECK_INTERVAL = 5.0       # Building progress poll
 WEATHER_DAMAGE_INTERVAL = 60.0   # Structure weather damage
 DIARY_FLUSH_INTERVAL = 30.0      # Flush pending diary entries
+DIALOGUE_CONTEXT_INTERVAL = 5.0  # Re-render stale chat context sections
+VOICE_POOL_INTERVAL = 2.0        # Top up the voice generator's line pool
 
 
 @dataclass
@@ -135,11 +142,28 @@ class UpdateScheduler:
                 # still be visible in debug logs during audits and QA runs.
                 logger.debug("Scheduled system %s failed", sys.system_name, exc_info=True)
             elapsed = time.monotonic() - t0
+            frame_profiler.record(f"scheduler.{sys.system_name}", elapsed)
 
             sys.last_update = current_time
             sys.run_count += 1
             sys.total_duration += elapsed
 
+    def next_due_time(self) -> Optional[float]:
+        """
+        Return the epoch timestamp at which the next enabled system is due.
+
+        Used by the event-driven game loop to decide how long it may block
+        waiting for input.  Returns ``None`` when no system is enabled.
+        """
+        due: Optional[float] = None
+        for sys in self._systems.values():
+            if not sys.enabled:
+                continue
+            when = sys.last_update + sys.interval
+            if due is None or when < due:
+                due = when
+        return due
+
     # ── Immediate execution ───────────────────────────────────────────
 
     def force_run(self, name: str) -> None:
@@ -202,47 +202,72 @@ class AmbientLineGenerator:
                 (staleness_cutoff,),
             )
             self._conn.commit()
-            
-            if player_input:
-                # Extract content words for matching
-                words = set(player_input.lower().split())
-                # Try topic-matched line first
-                rows = self._conn.execute(
-                    "SELECT id, text, topics FROM ambient_lines "
-                    "WHERE context = 'chat_response' AND used = 0 "
-                    "ORDER BY created_at DESC LIMIT 20",
-                ).fetchall()
-                best_row = None
-                best_score = 0
-                for row_id, text, topics in rows:
-                    if topics:
-                        topic_words = set(topics.lower().split(","))
-                        overlap = len(words & topic_words)
-                        if overlap > best_score:
-                            best_score = overlap
-                            best_row = (row_id, text)
-                if best_row:
-                    self._conn.execute(
-                        "UPDATE ambient_lines SET used = 1 WHERE id = ?",
-                        (best_row[0],),
-                    )
-                    self._conn.commit()
-                    return best_row[1]
-
-            # Fall back to any unused chat_response line
-            row = self._conn.execute(
-                "SELECT id, text FROM ambient_lines "
-                "WHERE context = 'chat_response' AND used = 0 "
-                "ORDER BY created_at ASC LIMIT 1",
-            ).fetchone()
-            if not row:
+            picked = self._pick_chat_response(player_input, staleness_cutoff)
+            if picked is None:
                 return None
-            self._conn.execute(
-                "UPDATE ambient_lines SET used = 1 WHERE id = ?",
-                (row[0],),
-            )
-            self._conn.commit()
-            return row[1]
+            self._mark_used(picked[0])
+            return picked[1]
+
+    def peek_chat_response(self, player_input: str = "") -> Optional[Tuple[int, str]]:
+        """
+        Return the ``(id, text)`` ``consume_chat_response`` would give,
+        leaving the line unused.  Pass the id to ``mark_used`` once the
+        line is actually shown.
+        """
+        if not self._conn:
+            return None
+        staleness_cutoff = time.time() - CHAT_RESPONSE_STALENESS_SECONDS
+        with self._lock:
+            return self._pick_chat_response(player_input, staleness_cutoff)
+
+    def mark_used(self, line_id: int):
+        """Mark a line returned by ``peek_chat_response`` as used."""
+        if not self._conn:
+            return
+        with self._lock:
+            self._mark_used(line_id)
+
+    def _pick_chat_response(self, player_input: str,
+                            staleness_cutoff: float) -> Optional[Tuple[int, str]]:
+        """Best fresh, unused chat_response line. Caller holds the lock."""
+        if player_input:
+            # Extract content words for matching
+            words = set(player_input.lower().split())
+            # Try topic-matched line first
+            rows = self._conn.execute(
+                "SELECT id, text, topics FROM ambient_lines "
+                "WHERE context = 'chat_response' AND used = 0 AND created_at >= ? "
+                "ORDER BY created_at DESC LIMIT 20",
+                (staleness_cutoff,),
+            ).fetchall()
+            best_row = None
+            best_score = 0
+            for row_id, text, topics in rows:
+                if topics:
+                    topic_words = set(topics.lower().split(","))
+                    overlap = len(words & topic_words)
+                    if overlap > best_score:
+                        best_score = overlap
+                        best_row = (row_id, text)
+            if best_row:
+                return best_row
+
+        # Fall back to any unused chat_response line
+        row = self._conn.execute(
+            "SELECT id, text FROM ambient_lines "
+            "WHERE context = 'chat_response' AND used = 0 AND created_at >= ? "
+            "ORDER BY created_at ASC LIMIT 1",
+            (staleness_cutoff,),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _mark_used(self, line_id: int):
+        """Caller holds the lock."""
+        self._conn.execute(
+            "UPDATE ambient_lines SET used = 1 WHERE id = ?",
+            (line_id,),
+        )
+        self._conn.commit()
 
     def count_unused(self, context: str = None) -> int:
         """Count unused lines, optionally filtered by context."""
@@ -420,18 +445,20 @@ class AmbientLineGenerator:
             "Rare moments of quiet warmth buried under deadpan delivery."
         )
 
+        # Fixed instructions first, then the per-request details, so every
+        # ambient prompt shares its prefix
         user = (
+            "Write 3-5 short dialogue lines Cheese might say LATER. "
+            "Each line must be tagged with a context type.\n"
+            "Format each line as:\ncontext: dialogue text\n\n"
+            "Example:\n"
+            "greeting: *blinks* Oh. You're back. I noticed.\n"
+            "idle: I was thinking about nothing. Successfully.\n"
+            "feed: Food received. Filing under 'reasons to continue'.\n\n"
+            f"Contexts:\n{ctx_lines}\n\n"
             f"{name_clause}{location_clause}{weather_clause}{personality_clause}\n"
             f"Cheese's mood: {duck_mood}.\n"
-            f"{trigger_desc}\n"
-            f"Write 3-5 short dialogue lines Cheese might say LATER. "
-            f"Each line must be tagged with a context type.\n"
-            f"Contexts:\n{ctx_lines}\n\n"
-            f"Format each line as:\ncontext: dialogue text\n\n"
-            f"Example:\n"
-            f"greeting: *blinks* Oh. You're back. I noticed.\n"
-            f"idle: I was thinking about nothing. Successfully.\n"
-            f"feed: Food received. Filing under 'reasons to continue'.\n"
+            f"{trigger_desc}"
         )
 
         return f"[SYSTEM]{system}\n\n[USER]{user}"
@@ -464,6 +491,7 @@ class AmbientLineGenerator:
                     {"role": "user", "content": user_text},
                 ]
                 result = llm._llama.create_chat_completion(
+                    request_kind="ambient",
                     messages=messages,
                     max_tokens=120,
                     temperature=0.6,
@@ -476,6 +504,7 @@ class AmbientLineGenerator:
             else:
                 result = llm._llama(
                     prompt,
+                    request_kind="ambient",
                     max_tokens=120,
                     temperature=0.6,
                     top_p=0.9,
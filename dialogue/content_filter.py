@@ -8,12 +8,18 @@ inappropriate material into its vocabulary and memory.
 IMPORTANT: This does NOT censor or reject the player's input.
 The player can type whatever they want — Cheese just won't learn it,
 store it as a fact, or repeat it back.
+
+Every blocklist is compiled once into a term -> category map plus a
+first-word index of multi-word phrases, so classifying a text is a single
+tokenizing pass per normalized variant regardless of blocklist size.
 """
 import re
 import logging
+import threading
+from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -315,6 +321,9 @@ _LEET_MAP = {
     "+": "t",
 }
 
+# Same substitutions as a str.translate table (one C-level pass)
+_DELEET_TABLE = str.maketrans(_LEET_MAP)
+
 # Pattern for repeated characters (e.g., fuuuck, shiiit)
 _REPEATED_CHAR_RE = re.compile(r'(.)\1{2,}')
 
@@ -325,15 +334,18 @@ _SPACED_RE = re.compile(r'(?:^|\s)(\w(?:\s\w){2,})(?:\s|$)')
 _INVISIBLE_RE = re.compile(r'[\u200b\u200c\u200d\u2060\ufeff\u00ad]')
 
 # Asterisks/symbols used to mask letters (e.g., f*ck, sh!t)
-_MASK_CHARS_RE = re.compile(r'[*_\-~.#]')
+_MASK_CHARS = "*_-~.#"
+_STRIP_MASKS_TABLE = str.maketrans("", "", _MASK_CHARS)
+# deleet(strip_masks(text)) in a single translate
+_DELEET_STRIP_MASKS_TABLE = {**_DELEET_TABLE, **_STRIP_MASKS_TABLE}
+
+# Tokens for word and phrase matching
+_WORD_RE = re.compile(r'\w+')
 
 
 def _deleet(text: str) -> str:
     """Undo common leetspeak substitutions."""
-    result = []
-    for ch in text:
-        result.append(_LEET_MAP.get(ch, ch))
-    return "".join(result)
+    return text.translate(_DELEET_TABLE)
 
 
 def _derepeat(text: str) -> str:
@@ -355,7 +367,28 @@ def _strip_invisible(text: str) -> str:
 
 def _strip_masks(text: str) -> str:
     """Remove masking characters: f*ck -> fck."""
-    return _MASK_CHARS_RE.sub('', text)
+    return text.translate(_STRIP_MASKS_TABLE)
+
+
+def _variants(cleaned: str) -> List[str]:
+    """
+    Return the distinct normalized variants of already-lowercased text.
+
+    Each variant is a single translate/regex pass; characters that cannot
+    change a variant (no leet, mask or repeated characters) skip it.
+    """
+    variants = [cleaned]
+    deleeted = cleaned.translate(_DELEET_TABLE)
+    masked = cleaned.translate(_STRIP_MASKS_TABLE)
+    candidates = [deleeted, masked, _unspace(cleaned),
+                  cleaned.translate(_DELEET_STRIP_MASKS_TABLE)]
+    if _REPEATED_CHAR_RE.search(cleaned) or _REPEATED_CHAR_RE.search(deleeted) \
+            or _REPEATED_CHAR_RE.search(masked):
+        candidates += [_derepeat(cleaned), _derepeat(deleeted), _derepeat(masked)]
+    for variant in candidates:
+        if variant not in variants:
+            variants.append(variant)
+    return variants
 
 
 # Pre-build a combined set of ALL blocked single words for fast lookup
@@ -363,6 +396,21 @@ _ALL_BLOCKED_WORDS: Set[str] = set()
 for _wordset in _CATEGORY_MAP.values():
     _ALL_BLOCKED_WORDS.update(_wordset)
 
+# Term -> category (the first category in _CATEGORY_MAP listing it)
+_TERM_CATEGORY: Dict[str, FilterCategory] = {}
+for _cat, _wordset in _CATEGORY_MAP.items():
+    for _term in _wordset:
+        _TERM_CATEGORY.setdefault(_term, _cat)
+
+# Phrase index: first word -> [(remaining words, phrase, list position)]
+_PHRASE_INDEX: Dict[str, List[Tuple[Tuple[str, ...], str, int]]] = {}
+for _pos, _phrase in enumerate(_BLOCKED_PHRASES):
+    _first, *_rest = _phrase.lower().split()
+    _PHRASE_INDEX.setdefault(_first, []).append((tuple(_rest), _phrase, _pos))
+
+# Number of recently seen safe texts remembered by each ContentFilter
+_SAFE_CACHE_SIZE = 512
+
 
 class ContentFilter:
     """
@@ -373,12 +421,10 @@ class ContentFilter:
     """
 
     def __init__(self):
-        # Pre-compile phrase patterns for efficiency
-        self._phrase_patterns: List[Tuple[re.Pattern, str]] = []
-        for phrase in _BLOCKED_PHRASES:
-            # Allow flexible whitespace between words in phrases
-            pattern = r'\b' + r'\s+'.join(re.escape(w) for w in phrase.split()) + r'\b'
-            self._phrase_patterns.append((re.compile(pattern, re.IGNORECASE), phrase))
+        # Recently classified safe texts (the common case: most lines are
+        # checked again when they are learned, stored and repeated)
+        self._safe_cache: "OrderedDict[str, None]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def is_safe_to_learn(self, text: str) -> bool:
         """
@@ -398,60 +444,48 @@ class ContentFilter:
         if not text or not text.strip():
             return FilterResult(is_blocked=False)
 
+        with self._cache_lock:
+            if text in self._safe_cache:
+                self._safe_cache.move_to_end(text)
+                return FilterResult(is_blocked=False)
+
+        # Normalize text through multiple passes to catch evasion
+        cleaned = _strip_invisible(text.lower())
+
+        phrase_hits: Dict[int, str] = {}
+        word_hits: Dict[str, None] = {}  # ordered set
+        for variant in _variants(cleaned):
+            tokens = [(m.group(), m.start(), m.end()) for m in _WORD_RE.finditer(variant)]
+            for i, (word, _start, _end) in enumerate(tokens):
+                if word in _TERM_CATEGORY:
+                    word_hits[word] = None
+                for rest, phrase, pos in _PHRASE_INDEX.get(word, ()):
+                    if pos not in phrase_hits and self._phrase_follows(variant, tokens, i, rest):
+                        phrase_hits[pos] = phrase
+
         matched_categories: List[FilterCategory] = []
         matched_terms: List[str] = []
         max_severity = Severity.SOFT
 
-        # Normalize text through multiple passes to catch evasion
-        raw_lower = text.lower()
-        cleaned = _strip_invisible(raw_lower)
-        variants = {
-            cleaned,
-            _deleet(cleaned),
-            _derepeat(cleaned),
-            _strip_masks(cleaned),
-            _unspace(cleaned),
-            _derepeat(_deleet(cleaned)),
-            _derepeat(_strip_masks(cleaned)),
-            _deleet(_strip_masks(cleaned)),
-        }
-
-        # Check multi-word phrases first (exact phrase matching)
-        for pattern, phrase in self._phrase_patterns:
-            for variant in variants:
-                if pattern.search(variant):
-                    # Determine which category this phrase belongs to
-                    phrase_lower = phrase.lower()
-                    for cat, wordset in _CATEGORY_MAP.items():
-                        if phrase_lower in wordset:
-                            if cat not in matched_categories:
-                                matched_categories.append(cat)
-                            matched_terms.append(phrase)
-                            if cat in _HARD_BLOCK_CATEGORIES:
-                                max_severity = Severity.HARD
-                            break
-                    else:
-                        # Phrase not in any specific wordset, still blocked
-                        matched_terms.append(phrase)
-                    break  # Don't check other variants for this phrase
-
-        # Check single words via word boundary matching
-        for variant in variants:
-            words = set(re.findall(r'\b\w+\b', variant))
-            for word in words:
-                if word in _ALL_BLOCKED_WORDS:
-                    # Find which category
-                    for cat, wordset in _CATEGORY_MAP.items():
-                        if word in wordset:
-                            if cat not in matched_categories:
-                                matched_categories.append(cat)
-                            if word not in matched_terms:
-                                matched_terms.append(word)
-                            if cat in _HARD_BLOCK_CATEGORIES:
-                                max_severity = Severity.HARD
-                            break
+        # Phrases first (in blocklist order), then single words
+        terms = [phrase_hits[pos] for pos in sorted(phrase_hits)] + list(word_hits)
+        for term in terms:
+            # Phrases outside every wordset are recorded but not categorized
+            matched_terms.append(term)
+            cat = _TERM_CATEGORY.get(term.lower())
+            if cat is None:
+                continue
+            if cat not in matched_categories:
+                matched_categories.append(cat)
+            if cat in _HARD_BLOCK_CATEGORIES:
+                max_severity = Severity.HARD
 
         is_blocked = len(matched_categories) > 0
+        if not is_blocked:
+            with self._cache_lock:
+                self._safe_cache[text] = None
+                if len(self._safe_cache) > _SAFE_CACHE_SIZE:
+                    self._safe_cache.popitem(last=False)
 
         return FilterResult(
             is_blocked=is_blocked,
@@ -460,6 +494,20 @@ class ContentFilter:
             matched_terms=matched_terms,
         )
 
+    @staticmethod
+    def _phrase_follows(variant: str, tokens: List[Tuple[str, int, int]],
+                        i: int, rest: Tuple[str, ...]) -> bool:
+        """Whether tokens after *i* spell *rest*, separated only by whitespace."""
+        if i + len(rest) >= len(tokens):
+            return False
+        prev_end = tokens[i][2]
+        for offset, expected in enumerate(rest, start=1):
+            word, start, end = tokens[i + offset]
+            if word != expected or not variant[prev_end:start].isspace():
+                return False
+            prev_end = end
+        return True
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton
@@ -2,7 +2,8 @@
 Conversation system - text-based chat with the duck.
 Deadpan, dry, witty Animal Crossing 1 style dialogue.
 """
-from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+from typing import Optional, List, Dict, Tuple, Callable, TYPE_CHECKING
+from collections import deque
 import logging
 import random
 import re
@@ -818,6 +819,8 @@ class ConversationSystem:
         self._response_cooldowns: Dict[str, int] = {}
         self._unified_memory = DialogueMemory()
         self._pipeline = None  # lazy init
+        # (monotonic time, text) of LLM replies that missed the chat deadline
+        self._follow_ups: deque = deque(maxlen=2)
         self._context_provider = None
         self._player_name: Optional[str] = None  # cached for personalization
         if game is not None:
@@ -833,20 +836,18 @@ class ConversationSystem:
 
     def needs_memory_context(self) -> bool:
         """
-        Return True only when the active pipeline has a direct LLM response source.
+        Return True only when the pipeline's direct LLM source can answer.
 
-        The default chat path uses fast keyword/template responses now and lets
-        LLM enrich future ambient lines in the background, so building the full
-        game-state context on every first chat is usually wasted work.
+        Until the model is loaded chat uses fast keyword/template responses
+        and lets the LLM enrich future ambient lines in the background, so
+        building the full game-state context would be wasted work.
         """
-        pipeline = self._pipeline
-        if pipeline is None:
-            return False
         try:
-            return any(
-                name == "llm" and enabled
-                for _priority, name, enabled in pipeline.get_sources()
-            )
+            source = self._get_pipeline().get_source("llm")
+            if source is None or not source.is_enabled():
+                return False
+            is_ready = getattr(source, "is_ready", None)
+            return is_ready() if is_ready is not None else True
         except Exception:
             return False
 
@@ -1002,12 +1003,14 @@ class ConversationSystem:
 
         return selected
 
-    def process_player_input(self, duck: "Duck", player_input: str, use_llm: bool = True, memory_context: str = "") -> str:
+    def process_player_input(self, duck: "Duck", player_input: str, use_llm: bool = True, memory_context: str = "",
+                             on_partial: Optional[Callable[[str], None]] = None) -> str:
         """
         Process player text input and generate a response.
 
         Response chain (priority order):
-        1. LLM (if available) — best contextual understanding
+        1. LLM (once loaded, unless *use_llm* is False) — best contextual understanding, streamed
+           through *on_partial* and hedged against LLM_CHAT_DEADLINE
         2. Keyword engine — hand-crafted topic-specific responses
         3. Learning engine — patterns learned from past conversations
         4. Voice generator — Markov chain novel line
@@ -1019,18 +1022,25 @@ class ConversationSystem:
         Args:
             duck: The Duck instance
             player_input: What the player said
-            use_llm: Whether to try using LLM
+            use_llm: Whether the loaded LLM may answer this turn and queue
+                background enrichment; False keeps to the cheap sources
             memory_context: Optional context from duck's memory for richer responses
+            on_partial: Optional callback receiving an LLM reply while it is
+                still being generated (called from the inference thread)
         """
         response = None
         source = None
         _used_pipeline = False
 
+        # A new turn supersedes any follow-up to the previous one, including
+        # a slow reply that is still being generated
+        if self._pipeline is not None:
+            self._pipeline.begin_turn()
+        self._follow_ups.clear()
+
         # Try new ResponsePipeline first (unified response generation)
         try:
-            if self._pipeline is None:
-                self._pipeline = create_default_pipeline()
-            if self._pipeline:
+            if self._get_pipeline():
                 from dialogue.dialogue_core import DialogueState
                 ctx = None
                 if hasattr(self, '_context_provider') and self._context_provider:
@@ -1056,9 +1066,10 @@ class ConversationSystem:
                 state = DialogueState()
                 state._duck_ref = duck
                 state._memory_context = memory_context
+                state._on_partial = on_partial
                 if duck:
                     state.sync_from_duck(duck)
-                pipeline_resp = self._pipeline.generate_response(ctx, state)
+                pipeline_resp = self._pipeline.generate_response(ctx, state, allow_slow=use_llm)
                 if pipeline_resp and pipeline_resp.text and pipeline_resp.source != "fallback":
                     response = pipeline_resp.text
                     source = pipeline_resp.source or "pipeline"
@@ -1067,8 +1078,8 @@ class ConversationSystem:
             logger.debug("Pipeline response generation failed", exc_info=True)
 
         # Legacy fallback chain (if pipeline didn't produce a response)
-        # LLM is no longer a direct responder — it enriches in the background.
-        # Try keyword, learning, voice, and idle template chains.
+        # The LLM only answers through the pipeline; here try keyword,
+        # learning, voice, and idle template chains.
 
         # Keyword engine — hand-crafted, topic-specific, always contextual
         if not response:
@@ -1182,9 +1193,34 @@ class ConversationSystem:
 
     def generate_via_pipeline(self, player_input, context, state):
         """Generate via new pipeline. For gradual migration."""
+        return self._get_pipeline().generate_response(context, state)
+
+    def _get_pipeline(self):
         if self._pipeline is None:
-            self._pipeline = create_default_pipeline()
-        return self._pipeline.generate_response(context, state)
+            self._pipeline = create_default_pipeline(direct_llm=True)
+            self._pipeline.on_late_response = self._on_late_response
+        return self._pipeline
+
+    def _on_late_response(self, response: DialogueResponse) -> None:
+        """Keep an LLM reply that missed the chat deadline (hedge worker thread)."""
+        if response.text:
+            self._follow_ups.append((time.monotonic(), response.text))
+
+    def take_follow_up(self) -> Optional[str]:
+        """
+        Pop a late LLM reply to show as a follow-up line, or None.
+
+        Replies older than LLM_FOLLOW_UP_MAX_AGE are dropped.
+        """
+        try:
+            from config import LLM_FOLLOW_UP_MAX_AGE
+        except ImportError:
+            LLM_FOLLOW_UP_MAX_AGE = 20.0
+        while self._follow_ups:
+            received, text = self._follow_ups.popleft()
+            if time.monotonic() - received <= LLM_FOLLOW_UP_MAX_AGE:
+                return self._personalize_response(text)
+        return None
 
 
 # Global instance
@@ -6,13 +6,22 @@ generates summaries for context compression, and enables semantic
 retrieval of past conversations.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict
 import json
 import hashlib
+import re
 from dialogue.content_filter import get_content_filter
+from dialogue.memory_index import TextIndex
+
+# Words for search_conversations' postings: maximal runs of word characters
+_SEARCH_WORD_RE = re.compile(r"\w+")
+
+
+def _quote_text(entry) -> str:
+    return entry[0]
 
 
 class MessageRole(Enum):
@@ -159,6 +168,11 @@ class ConversationMemory:
         # Emotional arc tracking — rolling sentiment trend
         self._sentiment_history: List[float] = []  # Last N conversation sentiments
         self._max_sentiment_history = 20
+
+        # Derived postings, rebuilt on load (not saved)
+        self.quote_index = TextIndex(_quote_text)  # notable_quotes words/topics for recall
+        self._message_words: Dict[str, Set[str]] = {}  # word -> conversation IDs
+        self._conversation_words: Dict[str, Set[str]] = {}  # conversation ID -> words
     
     def start_conversation(self, duck_mood: Optional[str] = None) -> str:
         """Start a new conversation session."""
@@ -235,6 +249,9 @@ class ConversationMemory:
                     self.current_conversation.id,
                     msg.timestamp
                 ))
+                self.quote_index.update(self.notable_quotes)
+
+        self._index_message_words(self.current_conversation.id, content)
         
         # Extract facts from player messages
         if role == "player":
@@ -351,11 +368,19 @@ class ConversationMemory:
         return [c for c in self.conversations if c.id in conv_ids]
     
     def search_conversations(self, query: str, max_results: int = 10) -> List[Tuple[Conversation, List[ConversationMessage]]]:
-        """Search through conversation history for matching content."""
+        """Search through conversation history for matching content.
+
+        Matches are case-insensitive substrings; the word postings only
+        narrow down which conversations are scanned.
+        """
         query_lower = query.lower()
         results = []
+        candidates = self._candidate_conversations(query_lower)
+        indexed = self._conversation_words
         
         for conv in reversed(self.conversations):
+            if candidates is not None and conv.id in indexed and conv.id not in candidates:
+                continue
             matching_msgs = []
             for msg in conv.messages:
                 if query_lower in msg.content.lower():
@@ -368,6 +393,60 @@ class ConversationMemory:
         
         return results
     
+    def _candidate_conversations(self, query_lower: str) -> Optional[Set[str]]:
+        """
+        Conversation IDs that can contain *query_lower*, or None to scan all.
+
+        A query word with non-word characters on both sides must appear as
+        a whole word; one at either end of the query may be part of a
+        longer word, so it is matched against the vocabulary.
+        """
+        whole: List[Set[str]] = []
+        partial = ""
+        for match in _SEARCH_WORD_RE.finditer(query_lower):
+            word = match.group()
+            if match.start() > 0 and match.end() < len(query_lower):
+                whole.append(self._message_words.get(word, set()))
+            elif len(word) > len(partial):
+                partial = word
+        if whole:
+            whole.sort(key=len)
+            return whole[0].intersection(*whole[1:])
+        if not partial:
+            return None
+        candidates: Set[str] = set()
+        for word, conversation_ids in self._message_words.items():
+            if partial in word:
+                candidates.update(conversation_ids)
+        return candidates
+
+    def _index_message_words(self, conversation_id: str, content: str):
+        words = self._conversation_words.setdefault(conversation_id, set())
+        for word in _SEARCH_WORD_RE.findall(content.lower()):
+            if word not in words:
+                words.add(word)
+                self._message_words.setdefault(word, set()).add(conversation_id)
+
+    def _unindex_conversation(self, conversation_id: str):
+        for word in self._conversation_words.pop(conversation_id, ()):
+            conversation_ids = self._message_words.get(word)
+            if conversation_ids is not None:
+                conversation_ids.discard(conversation_id)
+                if not conversation_ids:
+                    del self._message_words[word]
+
+    def _rebuild_indices(self):
+        """Rebuild the derived postings after a load."""
+        self.quote_index.update(self.notable_quotes)
+        self._message_words = {}
+        self._conversation_words = {}
+        conversations = list(self.conversations)
+        if self.current_conversation:
+            conversations.append(self.current_conversation)
+        for conv in conversations:
+            for msg in conv.messages:
+                self._index_message_words(conv.id, msg.content)
+
     def get_random_callback(self) -> Optional[Dict]:
         """Get a random past conversation element to bring up.
         
@@ -632,6 +711,8 @@ class ConversationMemory:
                 self.summaries = self.summaries[-self.MAX_SUMMARIES:]
         
         # ACTUALLY REMOVE the old conversations to free memory
+        for conv in self.conversations[:-self.MAX_CONVERSATIONS]:
+            self._unindex_conversation(conv.id)
         self.conversations = self.conversations[-self.MAX_CONVERSATIONS:]
     
     def _enforce_memory_limits(self):
@@ -639,6 +720,7 @@ class ConversationMemory:
         # Limit notable quotes
         if len(self.notable_quotes) > self.MAX_NOTABLE_QUOTES:
             self.notable_quotes = self.notable_quotes[-self.MAX_NOTABLE_QUOTES:]
+            self.quote_index.update(self.notable_quotes)
         
         # Limit unanswered questions
         if len(self.unanswered_questions) > self.MAX_UNANSWERED_QUESTIONS:
@@ -823,6 +905,7 @@ class ConversationMemory:
         mem.conversations_by_day = defaultdict(int, {int(k): v for k, v in data.get("conversations_by_day", {}).items()})
         mem.unanswered_questions = data.get("unanswered_questions", [])
         mem.callbacks_queue = data.get("callbacks_queue", [])
+        mem._rebuild_indices()
         
         return mem
 
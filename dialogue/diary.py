@@ -726,6 +726,8 @@ class DuckDiary:
         self.milestones_recorded: List[str] = []
         self.first_entry_date: Optional[str] = None
         self.total_interactions: int = 0
+        # Bumped on every change; lets autosave skip an unchanged diary
+        self.save_revision: int = 0
 
     def _generate_entry_id(self) -> str:
         """Generate unique entry ID."""
@@ -752,6 +754,7 @@ class DuckDiary:
         """Add a new diary entry."""
         if not self.first_entry_date:
             self.first_entry_date = datetime.now().isoformat()
+        self.save_revision += 1
 
         entry = DiaryEntry(
             entry_id=self._generate_entry_id(),
@@ -926,6 +929,7 @@ class DuckDiary:
         """
         self.relationship_score += amount
         self.total_interactions += 1
+        self.save_revision += 1
 
         # Check for level up
         for level, data in sorted(RELATIONSHIP_LEVELS.items(), reverse=True):
@@ -983,6 +987,7 @@ class DuckDiary:
         for entry in self.entries:
             if entry.entry_id == entry_id:
                 entry.is_favorite = not entry.is_favorite
+                self.save_revision += 1
                 return entry.is_favorite
         return False
 
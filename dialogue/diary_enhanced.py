@@ -135,6 +135,8 @@ class EnhancedDiarySystem:
         self.current_chapter: Optional[str] = None
         self.daily_mood_summary: Dict[str, List[str]] = {}  # date -> moods
         self.dreams_recorded: int = 0
+        # Bumped on every change; lets autosave skip an unchanged diary
+        self.save_revision: int = 0
         
     def log_emotion(self, emotion: EmotionCategory, intensity: int,
                    trigger: Optional[str] = None, notes: Optional[str] = None) -> EmotionLog:
@@ -148,6 +150,7 @@ class EnhancedDiarySystem:
         )
         
         self.emotion_logs.append(log)
+        self.save_revision += 1
         
         # Update daily summary
         today = date.today().isoformat()
@@ -205,6 +208,7 @@ class EnhancedDiarySystem:
         
         self.life_chapters.append(chapter)
         self.current_chapter = chapter.chapter_id
+        self.save_revision += 1
         return chapter
         
     def add_chapter_event(self, event: str):
@@ -215,6 +219,7 @@ class EnhancedDiarySystem:
         for chapter in self.life_chapters:
             if chapter.chapter_id == self.current_chapter:
                 chapter.key_events.append(event)
+                self.save_revision += 1
                 break
                 
     def end_life_chapter(self, summary_update: Optional[str] = None):
@@ -235,6 +240,7 @@ class EnhancedDiarySystem:
                 break
                 
         self.current_chapter = None
+        self.save_revision += 1
         
     def record_dream(self, title: str, description: str,
                     recurring: bool = False) -> DreamLog:
@@ -264,6 +270,7 @@ class EnhancedDiarySystem:
         
         self.dream_logs.append(dream)
         self.dreams_recorded += 1
+        self.save_revision += 1
         
         # Keep dreams manageable
         if len(self.dream_logs) > 30:
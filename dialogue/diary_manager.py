@@ -322,10 +322,10 @@ MUSING_TEMPLATES = {
 }
 
 # ── LLM diary prompt template ────────────────────────────────────────
+# Fixed rules first, per-entry details last, so the prompt prefix is reused
 LLM_DIARY_SYSTEM_PROMPT = """You are writing Cheese the Duck's private diary entry. Cheese is a male duck — sarcastic, bread-obsessed, emotionally needy, dramatic, passive-aggressive, and secretly vulnerable. He's a judgmental roommate crossed with an existential poet who can't stop thinking about bread.
 
 VOICE RULES:
-- {voice_age_instructions}
 - Always first person. This is HIS diary. Nobody else reads it (he thinks).
 - Dry sarcasm, deadpan delivery, dramatic flair
 - Bread metaphors and bread references are frequent but not forced
@@ -337,12 +337,18 @@ VOICE RULES:
 
 FORMATTING:
 - Title: short, punchy, 2-6 words. Can be dramatic or deadpan.
-- Body: {length_guide}
 - Use *asterisks* for actions/stage directions
 - Use CAPS for emphasis (not anger)
 - Use ... for trailing thoughts
 - Can include scratched-out text like ~~I miss them~~ I don't care
 
+Write ONE diary entry. Return ONLY the entry in this exact format:
+TITLE: <title here>
+BODY: <body here>
+
+VOICE FOR THIS AGE: {voice_age_instructions}
+BODY LENGTH: {length_guide}
+
 TRIGGER: {trigger_description}
 
 CURRENT STATE:
@@ -350,11 +356,7 @@ CURRENT STATE:
 - Duck age: {duck_age} days ({voice_age} stage)
 - Needs: Hunger={hunger}, Energy={energy}, Fun={fun}, Clean={cleanliness}, Social={social}
 - Recent events: {recent_events}
-- {extra_context}
-
-Write ONE diary entry. Return ONLY the entry in this exact format:
-TITLE: <title here>
-BODY: <body here>"""
+- {extra_context}"""
 
 # Voice-age specific instructions for the LLM
 VOICE_AGE_INSTRUCTIONS = {
@@ -403,6 +405,8 @@ class DiaryManager:
         self._today_date: str = ""                # ISO date of current real day
         self._first_entry_today: bool = False     # has first-of-day been written?
         self._pending_triggers: List[Tuple[DiaryTrigger, Dict[str, Any]]] = []
+        # Bumped whenever serialised state changes; lets autosave skip us
+        self.save_revision: int = 0
 
         # ── References (set by Game during init) ──────────────────────
         self._duck = None          # Duck instance
@@ -412,15 +416,25 @@ class DiaryManager:
         self._llm_lock = threading.Lock()
 
     # ── Setup ─────────────────────────────────────────────────────────
-    def bind(self, duck, diary: DuckDiary, enhanced=None,
+    def bind(self, duck, diary: Optional[DuckDiary], enhanced=None,
              duck_brain=None, game=None):
-        """Bind to game systems. Call once after Game.__init__."""
+        """Bind to game systems. Call once after Game.__init__.
+
+        With ``diary=None`` the diary is read from ``game.diary`` when it is
+        first needed, so a diary that is still unloaded stays that way.
+        """
         self._duck = duck
         self._diary = diary
         self._duck_brain = duck_brain
         self._game_ref = game
         self._last_session_time = time.time()
 
+    def _get_diary(self) -> Optional[DuckDiary]:
+        """The bound DuckDiary, or the game's when bound with diary=None."""
+        if self._diary is None and self._game_ref is not None:
+            return getattr(self._game_ref, "diary", None)
+        return self._diary
+
     # ── Rate limiting ─────────────────────────────────────────────────
     def _can_write(self) -> bool:
         """Check if we're allowed to create a new entry right now."""
@@ -430,6 +444,7 @@ class DiaryManager:
         if now - self._hour_window_start >= 3600:
             self._entries_this_hour = 0
             self._hour_window_start = now
+            self.save_revision += 1
 
         # Hard cap
         if self._entries_this_hour >= MAX_ENTRIES_PER_HOUR:
@@ -449,6 +464,7 @@ class DiaryManager:
             self._hour_window_start = now
         self._entries_this_hour += 1
         self._last_entry_time = now
+        self.save_revision += 1
 
     # ── Trigger evaluation (called from game tick) ────────────────────
     def evaluate_triggers(self, mood_score: float, mood_state: str,
@@ -464,9 +480,11 @@ class DiaryManager:
         if today != self._today_date:
             self._today_date = today
             self._first_entry_today = False
+            self.save_revision += 1
 
         if not self._first_entry_today:
             self._first_entry_today = True
+            self.save_revision += 1
             self._pending_triggers.append(
                 (DiaryTrigger.FIRST_OF_DAY, {"mood": mood_state, "score": mood_score})
             )
@@ -514,7 +532,9 @@ class DiaryManager:
         else:
             self._high_mood_active = False
 
-        self._last_mood_score = mood_score
+        if mood_score != self._last_mood_score:
+            self._last_mood_score = mood_score
+            self.save_revision += 1
 
     def check_absence(self, last_played_timestamp):
         """
@@ -677,8 +697,9 @@ class DiaryManager:
                 self._record_write()
 
                 # Also add to the base diary for backward compat
-                if self._diary:
-                    self._diary.add_entry(
+                diary = self._get_diary()
+                if diary:
+                    diary.add_entry(
                         entry_type=DiaryEntryType.FEELING,
                         title=entry["title"],
                         content=entry["body"],
@@ -751,6 +772,7 @@ class DiaryManager:
             # Use LLM directly via create_chat_completion
             with self._llm_lock:
                 response = llm._llama.create_chat_completion(
+                    request_kind="diary",
                     messages=[
                         {"role": "system", "content": prompt},
                         {"role": "user", "content": "Write today's diary entry."},
@@ -997,8 +1019,9 @@ class DiaryManager:
                 return self._duck.get_age_days()
             except Exception:
                 pass
-        if self._diary:
-            return self._diary._get_duck_age_days()
+        diary = self._get_diary()
+        if diary:
+            return diary._get_duck_age_days()
         return 0
 
     def _get_current_mood(self) -> str:
@@ -1067,8 +1090,9 @@ class DiaryManager:
                 f'"{e["title"]}"' for e in last_3
             ))
         # Add relationship level
-        if self._diary:
-            info = self._diary.get_relationship_info()
+        diary = self._get_diary()
+        if diary:
+            info = diary.get_relationship_info()
             parts.append(f"Relationship level: {info['name']} ({info['score']} points)")
         return " | ".join(parts) if parts else "No extra context."
 
@@ -1115,6 +1139,7 @@ class DiaryManager:
         for entry in self.entries:
             if entry.get("id") == entry_id:
                 entry["is_favorite"] = not entry.get("is_favorite", False)
+                self.save_revision += 1
                 return entry["is_favorite"]
         return False
 
@@ -248,10 +248,10 @@ class DJDuckCommentary:
             ),
             "between": (
                 "You are DJ Duck, a deadpan radio host duck. "
-                f"{'The listener seems ' + duck_mood + '. ' if duck_mood else ''}"
                 "Write a single short transition line between songs. "
                 "Be dry and unenthusiastic. State the obvious. "
                 "Keep it under 15 words."
+                f"{' The listener seems ' + duck_mood + '.' if duck_mood else ''}"
             ),
             "closing": (
                 "You are DJ Duck, a deadpan radio host. "
@@ -270,6 +270,7 @@ class DJDuckCommentary:
             response = _call_with_timeout(
                 lambda: self._llm_chat._llama(
                     prompt,
+                    request_kind="dj",
                     max_tokens=50,
                     temperature=0.9,
                     top_p=0.9,
@@ -126,6 +126,10 @@ class DuckBrain:
         self._affection_growth_rate = 0.1  # How fast affection builds
         self._trust_growth_rate = 0.05
         
+        # Bumped by every method that can change persisted state; lets
+        # autosave skip re-serializing an idle brain
+        self.save_revision = 0
+
         # Genuine moment tracking (to keep them rare)
         self._genuine_moments_today = 0
         self._last_genuine_moment_date: Optional[str] = None
@@ -169,6 +173,7 @@ class DuckBrain:
     
     def start_session(self, time_since_last: float = 0):
         """Called when player starts playing."""
+        self.save_revision += 1
         self._session_start_time = time.time()
         self._session_messages = 0
         self._asked_question_this_session = False
@@ -198,6 +203,7 @@ class DuckBrain:
     
     def end_session(self):
         """Called when player stops playing."""
+        self.save_revision += 1
         if self._session_start_time:
             duration = (time.time() - self._session_start_time) / 60  # Minutes
             self.player_model.end_session()
@@ -224,6 +230,7 @@ class DuckBrain:
         Returns:
             The response (either the passed one or a generated one)
         """
+        self.save_revision += 1
         if isinstance(response, dict):
             # Support old calling convention where response was context
             context = response
@@ -332,6 +339,7 @@ class DuckBrain:
             action: The action type (feed, play, clean, pet, sleep, etc.)
             context: Either a dict with context keys or a string description
         """
+        self.save_revision += 1
         # Handle context as either dict or string
         if isinstance(context, str):
             context = {"description": context}
@@ -420,7 +428,10 @@ class DuckBrain:
             return thought.text
         
         # Check for missed rituals (broken routines the duck should mention)
+        last_ritual_check = self.ritual_tracker._last_ritual_check
         missed = self.ritual_tracker.check_missed_rituals()
+        if self.ritual_tracker._last_ritual_check != last_ritual_check:
+            self.save_revision += 1  # The check itself is persisted
         if missed:
             # Queue all but return the first one now
             for obs in missed[1:]:
@@ -469,6 +480,7 @@ class DuckBrain:
         
         if observation:
             self._last_observation_time = now
+            self.save_revision += 1
             return observation.text
         
         return None
@@ -528,39 +540,41 @@ class DuckBrain:
         if now - self._last_callback_time < 300:
             return None
 
+        callback = self._pick_callback(current_input)
+        if callback is not None:
+            self._last_callback_time = now
+            self.save_revision += 1
+        return callback
+
+    def _pick_callback(self, current_input: Optional[str]) -> Optional[str]:
+        """First available callback line, most specific source first."""
         # Try question callback first (always priority)
         callback_data = self.question_manager.get_callback(self.player_model)
         if callback_data:
-            self._last_callback_time = now
             return callback_data[0]
 
         # Try relevance-based memory recall (new system)
         if current_input:
             recall = self.memory_recall.find_relevant_memory(current_input)
             if recall:
-                self._last_callback_time = now
                 return recall["intro"]
 
         # Try time-based anniversary callbacks
         anniversary = self.memory_recall.get_contextual_callback("time_anniversary")
         if anniversary:
-            self._last_callback_time = now
             return anniversary["intro"]
 
         # Try ambient callback pool
         ambient = self._try_ambient("callback")
         if ambient:
-            self._last_callback_time = now
             return ambient
 
-        # Fall back to original callback system
+        # Fall back to original callback system (marks the statement referenced)
         callback = self.dialogue_generator.generate_callback(
             player_model=self.player_model,
             conversation_memory=self.conversation_memory
         )
-
         if callback:
-            self._last_callback_time = now
             return callback.text
 
         return None
@@ -594,6 +608,7 @@ class DuckBrain:
             self._last_question_time = now
             self._asked_question_this_session = True
             self.question_manager.record_question_asked(question.id)
+            self.save_revision += 1
             return question.id, question.text
         
         return None
@@ -604,6 +619,7 @@ class DuckBrain:
         
         Returns follow-up response if available.
         """
+        self.save_revision += 1
         follow_up = self.question_manager.record_answer(question_id, answer)
         
         # Extract any facts
@@ -636,6 +652,14 @@ class DuckBrain:
             memory_context=memory_context
         )
     
+    def llm_prompt_key(self) -> tuple:
+        """Key that changes whenever ``build_llm_prompt()`` would render differently."""
+        return self.dialogue_generator.llm_personality_prompt_key(
+            player_model=self.player_model,
+            duck_memory=self.duck_memory,
+            conversation_memory=self.conversation_memory,
+        )
+    
     def get_llm_context(self, max_messages: int = 10) -> List[Dict]:
         """Get recent conversation context for LLM."""
         return self.conversation_memory.get_recent_context(max_messages)
@@ -913,6 +937,7 @@ class DuckBrain:
             context = self._build_dialogue_context(player_message, context_dict)
             self._dialogue_state.sync_from_game(context_dict or {})
             response = self._response_pipeline.generate_response(context, self._dialogue_state)
+            self.save_revision += 1  # dialogue memory is persisted
             self._dialogue_memory.record_exchange(player_message, response.text, context, response)
             return response.text
         except Exception:
@@ -966,7 +991,12 @@ class DuckBrain:
         
         if "conversation_memory" in data:
             brain.conversation_memory = ConversationMemory.from_dict(data["conversation_memory"])
-        
+
+        # Recall reads the restored memories, not the empty ones from __init__
+        brain.memory_recall = MemoryRecall(
+            brain.conversation_memory, brain.player_model, brain.duck_memory
+        )
+
         if "question_manager" in data:
             brain.question_manager = QuestionManager.from_dict(data["question_manager"])
         
@@ -5,10 +5,16 @@ Cheese picks up on topics like Seaman from Dreamcast - dry, deadpan, witty.
 
 This is the core engine + basic topic responses.
 Extended topics are in keyword_responses_*.py files.
+
+Topics are indexed as they are registered: single-word keywords and
+anti-keywords go into word -> topic posting lists, and every multi-word
+keyword and phrase into one Aho-Corasick automaton, so a message only
+scores the topics it actually mentions.
 """
 import random
 import re
-from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+from collections import deque
+from typing import Optional, List, Dict, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from duck.duck import Duck
@@ -32,6 +38,73 @@ class KeywordResponse:
         self.anti_keywords = anti_keywords or []  # if these appear, skip this topic
 
 
+class _PhraseAutomaton:
+    """
+    Aho-Corasick automaton reporting every pattern that occurs as a substring.
+
+    Matches exactly what ``pattern in text`` would, for all patterns at once,
+    in a single pass over the text.
+    """
+
+    __slots__ = ("_goto", "_own", "_fail", "_out", "_built")
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._own: List[Optional[str]] = [None]  # pattern ending at each node
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        self._built = True
+
+    def add(self, pattern: str) -> None:
+        """Add a pattern; failure links are rebuilt on the next search."""
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._own.append(None)
+            state = nxt
+        self._own[state] = pattern
+        self._built = False
+
+    def _build(self) -> None:
+        """Compute failure links and merged outputs breadth-first."""
+        goto, own = self._goto, self._own
+        fail = [0] * len(goto)
+        out: List[Tuple[str, ...]] = [()] * len(goto)
+        out[0] = (own[0],) if own[0] is not None else ()  # the empty pattern
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # fail[state] is shallower, so its outputs are already final
+            out[state] = ((own[state],) if own[state] is not None else ()) + out[fail[state]]
+            for ch, child in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                queue.append(child)
+        self._fail, self._out = fail, out
+        self._built = True
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of patterns that occur in *text*."""
+        if not self._built:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set(out[0])
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
 class KeywordEngine:
     """Seaman-style contextual keyword detection and response engine."""
 
@@ -39,6 +112,14 @@ class KeywordEngine:
         self.topics: List[KeywordResponse] = []
         self._last_responses: Dict[str, str] = {}  # topic -> last response
         self._topic_history: List[str] = []  # recent topics discussed
+
+        # Match index, filled by add_topic() (topic ids are list positions)
+        self._word_postings: Dict[str, List[int]] = {}   # keyword -> topics
+        self._anti_postings: Dict[str, Set[int]] = {}    # anti-keyword -> topics
+        # substring pattern -> [(topic, points, counts as keyword)]
+        self._pattern_owners: Dict[str, List[Tuple[int, float, bool]]] = {}
+        self._automaton = _PhraseAutomaton()
+
         self._register_all_topics()
 
     def process(self, text: str, duck: "Duck") -> Optional[str]:
@@ -46,15 +127,24 @@ class KeywordEngine:
         Process player input and return a contextual response.
         Returns None if no topic matched (caller should use generic fallback).
         """
+        choice = self.choose(text, duck)
+        if choice is None:
+            return None
+        self.remember(*choice)
+        return choice[1]
+
+    def choose(self, text: str, duck: "Duck") -> Optional[Tuple[str, str]]:
+        """
+        Pick ``(topic name, response)`` for *text* like ``process`` does,
+        without recording it; call ``remember`` if the response is used.
+        """
         text_lower = text.lower().strip()
         words = set(re.findall(r'[a-z\']+', text_lower))
 
-        # Score each topic
+        # Score only the topics the message mentions
         scored: List[Tuple[float, KeywordResponse]] = []
-        for topic in self.topics:
-            score = self._score_topic(topic, text_lower, words)
-            if score > 0:
-                scored.append((score, topic))
+        for topic_id, score in self._score_candidates(text_lower, words):
+            scored.append((score, self.topics[topic_id]))
 
         if not scored:
             return None
@@ -82,19 +172,66 @@ class KeywordEngine:
         if not available:
             available = pool
 
-        response = random.choice(available)
-        self._last_responses[best_topic.name] = response
+        return best_topic.name, random.choice(available)
+
+    def remember(self, topic: str, response: str) -> None:
+        """Record a response from ``choose`` as said, for repeat avoidance."""
+        self._last_responses[topic] = response
 
         # Track topic history
-        self._topic_history.append(best_topic.name)
+        self._topic_history.append(topic)
         if len(self._topic_history) > 20:
             self._topic_history.pop(0)
 
-        return response
+    def _score_candidates(self, text_lower: str, words: set) -> List[Tuple[int, float]]:
+        """
+        Score every topic with at least one hit, via the match index.
+
+        Returns (topic id, score) pairs in registration order, with the same
+        scores ``_score_topic`` gives; topics scoring 0 are left out.
+        """
+        points: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for word in words:
+            for topic_id in self._word_postings.get(word, ()):
+                points[topic_id] = points.get(topic_id, 0.0) + 1.0
+                matched[topic_id] = matched.get(topic_id, 0) + 1
+        if self._pattern_owners:
+            for pattern in self._automaton.find(text_lower):
+                for topic_id, value, is_keyword in self._pattern_owners[pattern]:
+                    points[topic_id] = points.get(topic_id, 0.0) + value
+                    if is_keyword:
+                        matched[topic_id] = matched.get(topic_id, 0) + 1
+        if not points:
+            return []
+
+        blocked: Set[int] = set()
+        for word in words:
+            blocked.update(self._anti_postings.get(word, ()))
+
+        results = []
+        for topic_id in sorted(points):
+            if topic_id in blocked:
+                continue
+            score = points[topic_id]
+            matched_keywords = matched.get(topic_id, 0)
+            # Bonus for multiple keyword matches
+            if matched_keywords >= 3:
+                score += 2.0
+            elif matched_keywords >= 2:
+                score += 1.0
+            # Priority bonus (only applied when there's a real match)
+            score += self.topics[topic_id].priority * 0.1
+            results.append((topic_id, score))
+        return results
 
     def _score_topic(self, topic: KeywordResponse, text_lower: str,
                      words: set) -> float:
-        """Score how well the input matches a topic. 0 = no match."""
+        """Score how well the input matches a topic. 0 = no match.
+
+        Reference scorer for a single topic; ``process`` uses the equivalent
+        ``_score_candidates`` over the match index.
+        """
         # Check anti-keywords first
         for ak in topic.anti_keywords:
             if ak in words:
@@ -226,8 +363,26 @@ class KeywordEngine:
 
     def add_topic(self, topic: KeywordResponse):
         """Register a topic for keyword matching."""
+        topic_id = len(self.topics)
         self.topics.append(topic)
 
+        for ak in topic.anti_keywords:
+            self._anti_postings.setdefault(ak, set()).add(topic_id)
+        # Duplicates are indexed twice, just as _score_topic counts them twice
+        for phrase in topic.phrases:
+            self._add_pattern(phrase, topic_id, 3.0, False)
+        for kw in topic.keywords:
+            if " " in kw:
+                self._add_pattern(kw, topic_id, 2.0, True)
+            else:
+                self._word_postings.setdefault(kw, []).append(topic_id)
+
+    def _add_pattern(self, pattern: str, topic_id: int, value: float,
+                     is_keyword: bool):
+        """Index a substring-matched phrase or multi-word keyword."""
+        self._pattern_owners.setdefault(pattern, []).append((topic_id, value, is_keyword))
+        self._automaton.add(pattern)
+
     # ─── CORE TOPICS ──────────────────────────────────────────────
 
     def _register_greetings(self):
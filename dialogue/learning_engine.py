@@ -7,6 +7,11 @@ the player says often, without needing any external APIs or heavy NLP libs.
 
 The engine is seeded with all existing template responses on first run,
 then continuously learns from successful LLM and keyword responses.
+
+Lookups go through an in-memory inverted token index (token -> normalized
+inputs) kept in sync with ``seed_corpus()``/``learn()``/``prune()``, so only
+inputs that share one of the player's rarer words are ever scored, and a
+cheap upper bound rejects most of those before ``SequenceMatcher`` runs.
 """
 import sqlite3
 import difflib
@@ -14,7 +19,7 @@ import re
 import logging
 import threading
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Set, Tuple, List
 
 from config import SAVE_DIR
 from dialogue.content_filter import get_content_filter
@@ -38,6 +43,36 @@ def _tokenize(text: str) -> set:
     return set(_normalize(text).split())
 
 
+# Candidates must share at least this fraction of their combined words
+_MIN_JACCARD = 0.2
+
+
+class _IndexedInput:
+    """All pairs that share one normalized input, reduced to what scoring needs.
+
+    Pairs with the same input only differ in their frequency bonus, so only
+    the most frequent response can win and it is the only one kept.
+    """
+
+    __slots__ = ("text", "tokens", "response", "frequency", "first_id")
+
+    def __init__(self, text: str, response: str, frequency: int, row_id: int):
+        self.text = text
+        self.tokens = frozenset(text.split())
+        self.response = response
+        self.frequency = frequency
+        self.first_id = row_id
+
+    def offer(self, response: str, frequency: int, row_id: int) -> None:
+        """Record a pair's (new) frequency, keeping the most frequent response."""
+        if response == self.response:
+            self.frequency = max(self.frequency, frequency)
+        elif frequency > self.frequency:
+            self.response = response
+            self.frequency = frequency
+        self.first_id = min(self.first_id, row_id)
+
+
 class LearningEngine:
     """
     Learns input-response pairs and fuzzy-matches new inputs to return
@@ -51,6 +86,9 @@ class LearningEngine:
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.Lock()
         self._seeded = False
+        # Inverted index, built from SQLite on first lookup (see _ensure_index)
+        self._inputs: Optional[Dict[str, _IndexedInput]] = None
+        self._postings: Dict[str, Set[str]] = {}
         self._init_db()
 
     def _init_db(self):
@@ -101,6 +139,61 @@ class LearningEngine:
             conn.close()
         except Exception:
             pass
+        if _instance is not None and _instance._db_path == DB_PATH:
+            with _instance._lock:
+                _instance._drop_index()
+
+    # ── Inverted index ────────────────────────────────────────────────
+    # All index methods expect self._lock to be held.
+
+    def _drop_index(self):
+        """Forget the index; the next lookup rebuilds it from SQLite."""
+        self._inputs = None
+        self._postings = {}
+
+    def _ensure_index(self):
+        """Build the index from the pairs table if it is not loaded yet."""
+        if self._inputs is not None:
+            return
+        self._inputs = {}
+        self._postings = {}
+        rows = self._conn.execute(
+            "SELECT id, input_normalized, response, frequency FROM pairs ORDER BY id"
+        )
+        for row_id, normalized, response, frequency in rows:
+            self._index_pair(normalized, response, frequency, row_id)
+
+    def _index_pair(self, normalized: str, response: str, frequency: int, row_id: int):
+        """Add or update one pair in the loaded index (no-op when unloaded)."""
+        if self._inputs is None:
+            return
+        entry = self._inputs.get(normalized)
+        if entry is not None:
+            entry.offer(response, frequency, row_id)
+            return
+        entry = _IndexedInput(normalized, response, frequency, row_id)
+        if not entry.tokens:
+            return
+        self._inputs[normalized] = entry
+        for token in entry.tokens:
+            self._postings.setdefault(token, set()).add(normalized)
+
+    def _candidates(self, input_tokens: set) -> List[_IndexedInput]:
+        """
+        Return the inputs that could reach the Jaccard threshold.
+
+        A stored input needs at least ``floor(_MIN_JACCARD * |I|)`` words in
+        common with the player's input ``I``.  Any such input must contain
+        one of the ``|I| - overlap + 1`` rarest player words, so only their
+        postings are read.
+        """
+        min_overlap = max(1, int(_MIN_JACCARD * len(input_tokens)))
+        by_rarity = sorted(input_tokens, key=lambda t: len(self._postings.get(t, ())))
+        prefix = by_rarity[:len(input_tokens) - min_overlap + 1]
+        names: Set[str] = set()
+        for token in prefix:
+            names.update(self._postings.get(token, ()))
+        return [self._inputs[name] for name in names]
 
     def seed_corpus(self, pairs: List[Tuple[str, str]], source: str = "template"):
         """
@@ -118,6 +211,8 @@ class LearningEngine:
                 [(inp, _normalize(inp), resp, source) for inp, resp in pairs]
             )
             self._conn.commit()
+            # Bulk inserts are cheaper to re-read than to mirror row by row
+            self._drop_index()
             self._seeded = True
             logger.info(f"Learning engine seeded with {len(pairs)} pairs from '{source}'")
 
@@ -158,14 +253,16 @@ class LearningEngine:
                        last_used = CURRENT_TIMESTAMP WHERE id = ?""",
                     (row[0],)
                 )
+                self._index_pair(normalized, duck_response, row[1] + 1, row[0])
             else:
                 # New pair
-                self._conn.execute(
+                cursor = self._conn.execute(
                     """INSERT INTO pairs
                        (input_text, input_normalized, response, source, tone, context)
                        VALUES (?, ?, ?, ?, ?, ?)""",
                     (player_input, normalized, duck_response, source, tone, context)
                 )
+                self._index_pair(normalized, duck_response, 1, cursor.lastrowid)
             self._conn.commit()
 
     def get_response(self, player_input: str,
@@ -181,6 +278,10 @@ class LearningEngine:
         Heavily penalises mismatched lengths to avoid short seed keywords
         (e.g. "hello") matching long player sentences.
 
+        Candidates come from the inverted token index, and each one's score
+        is bounded from above (using the length-based ceiling on the
+        SequenceMatcher ratio) so most are rejected without running it.
+
         Args:
             player_input: What the player said
             confidence_threshold: Minimum confidence to return a result
@@ -201,53 +302,55 @@ class LearningEngine:
 
         input_len = len(normalized)
 
-        # Fetch candidates — use word overlap for fast pre-filtering
-        # We pull a broader set and score them precisely
+        # Snapshot the few candidates under the lock; score outside it
         with self._lock:
-            cursor = self._conn.execute(
-                """SELECT input_normalized, response, frequency
-                   FROM pairs ORDER BY frequency DESC LIMIT 5000"""
-            )
-            candidates = cursor.fetchall()
+            self._ensure_index()
+            candidates = [
+                (entry.text, entry.tokens, entry.response, entry.frequency, entry.first_id)
+                for entry in self._candidates(input_tokens)
+            ]
+
+        scored = []
+        for stored_input, stored_tokens, response, frequency, first_id in candidates:
+            # Stage 1: word overlap check (Jaccard)
+            overlap = len(input_tokens & stored_tokens)
+            jaccard = overlap / (len(input_tokens) + len(stored_tokens) - overlap)
 
-        if not candidates:
-            return None
+            # Require meaningful overlap — at least 20% shared words
+            if jaccard < _MIN_JACCARD:
+                continue
 
-        best_score = 0.0
-        best_response = None
+            # Stage 3 (cheap): length similarity penalty
+            # Prevents "hello" (5 chars) from matching "what do you
+            # think about the meaning of life" (38 chars)
+            stored_len = len(stored_input)
+            length_penalty = min(input_len, stored_len) / max(input_len, stored_len)
+            freq_bonus = min(0.08, (frequency - 1) * 0.015)
+            partial = jaccard * 0.3 + length_penalty * 0.2 + freq_bonus
 
-        for stored_input, response, frequency in candidates:
-            stored_tokens = set(stored_input.split())
-            if not stored_tokens:
+            # SequenceMatcher.ratio() can never exceed 2*min/(len_a+len_b)
+            ratio_bound = 2.0 * min(input_len, stored_len) / (input_len + stored_len)
+            upper_bound = ratio_bound * 0.5 + partial
+            if upper_bound < confidence_threshold:
                 continue
+            scored.append((upper_bound, -frequency, first_id, stored_input, response, partial))
 
-            # Stage 1: fast word overlap check (Jaccard)
-            intersection = input_tokens & stored_tokens
-            if not intersection:
-                continue  # No shared words at all — skip
-
-            union = input_tokens | stored_tokens
-            jaccard = len(intersection) / len(union) if union else 0
+        # Most promising first, so the bound can stop the scan early
+        scored.sort(key=lambda c: (-c[0], c[1], c[2]))
 
-            # Require meaningful overlap — at least 20% shared words
-            if jaccard < 0.2:
-                continue
+        best_score = 0.0
+        best_response = None
+        matcher = difflib.SequenceMatcher(None, normalized, "")
+        for upper_bound, _freq, _id, stored_input, response, partial in scored:
+            if upper_bound <= best_score:
+                break
 
             # Stage 2: precise SequenceMatcher score
-            ratio = difflib.SequenceMatcher(
-                None, normalized, stored_input
-            ).ratio()
-
-            # Stage 3: length similarity penalty
-            # Prevents "hello" (5 chars) from matching "what do you
-            # think about the meaning of life" (38 chars)
-            stored_len = len(stored_input)
-            len_ratio = min(input_len, stored_len) / max(input_len, stored_len)
-            length_penalty = len_ratio  # 0-1, closer lengths = higher
+            matcher.set_seq2(stored_input)
+            ratio = matcher.ratio()
 
             # Stage 4: blend scores with frequency bonus
-            freq_bonus = min(0.08, (frequency - 1) * 0.015)
-            score = (ratio * 0.5 + jaccard * 0.3 + length_penalty * 0.2) + freq_bonus
+            score = ratio * 0.5 + partial
 
             if score > best_score:
                 best_score = score
@@ -272,6 +375,7 @@ class LearningEngine:
                 (min_frequency, f'-{max_age_days} days')
             )
             self._conn.commit()
+            self._drop_index()
 
     def get_stats(self) -> dict:
         """Get statistics about the learning engine."""
@@ -4,7 +4,6 @@ Provides non-blocking LLM generation with caching and fallback to templates.
 LOCAL ONLY - uses bundled GGUF model, no external API calls.
 """
 import threading
-import queue
 import time
 import hashlib
 import logging
@@ -51,6 +50,13 @@ class LLMRequest:
     context: Dict[str, Any]
     callback: Optional[Callable[[Optional[str]], None]] = None
     created_at: float = field(default_factory=time.time)
+    # Callbacks of identical requests folded into this one while queued
+    merged_callbacks: List[Callable[[Optional[str]], None]] = field(default_factory=list)
+    
+    def callbacks(self) -> List[Callable[[Optional[str]], None]]:
+        """All callbacks waiting on this request."""
+        own = [self.callback] if self.callback else []
+        return own + self.merged_callbacks
     
     def __lt__(self, other: "LLMRequest") -> bool:
         """Compare by priority (higher priority first)."""
@@ -184,15 +190,32 @@ class ContextBuilder:
 
 
 class LLMWorker(threading.Thread):
-    """Background thread for non-blocking LLM generation."""
+    """Background thread for non-blocking LLM generation.
+
+    Requests are held in a small prioritised pending list rather than a plain
+    queue so they can be managed while they wait:
+
+    * Action commentary and visitor lines are coalesced per duck / visitor.
+      An identical request joins the queued one (one generation answers
+      both); a different one supersedes it, because only the newest action
+      or conversation phase is still on screen.
+    * Requests that waited longer than their staleness limit are dropped
+      instead of generated, and requests whose answer reached the cache
+      while they waited are answered from it.
+
+    Dropped requests still get their callback, with ``None``.
+    """
     
     def __init__(self, controller: "LLMBehaviorController"):
         super().__init__(daemon=True, name="LLMWorker")
         self._controller = controller
-        self._request_queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._pending: List[LLMRequest] = []
+        self._by_key: Dict[tuple, LLMRequest] = {}
+        self._cond = threading.Condition()
         self._running = False
         self._llm = None
         self._duck = None  # Reference to current duck
+        self._stats: Dict[RequestType, Dict[str, float]] = {}
     
     def set_duck(self, duck: "Duck"):
         """Set the duck reference for generation."""
@@ -206,28 +229,136 @@ class LLMWorker(threading.Thread):
     
     def stop_worker(self):
         """Stop the worker thread."""
-        self._running = False
-        # Add a poison pill to wake up the queue
-        try:
-            self._request_queue.put_nowait((999, None))
-        except queue.Full:
-            pass
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+    
+    @staticmethod
+    def _coalesce_key(request: LLMRequest) -> Optional[tuple]:
+        """Slot a request occupies in the queue, or None if it never coalesces."""
+        context = request.context
+        if request.request_type == RequestType.ACTION_COMMENTARY:
+            return ("action", context.get("duck_name"))
+        if request.request_type == RequestType.VISITOR_DIALOGUE:
+            return ("visitor", context.get("visitor_name"))
+        return None
+    
+    @staticmethod
+    def _stale_after(request_type: RequestType) -> Optional[float]:
+        """Seconds a request may wait before it is no longer worth generating."""
+        if request_type == RequestType.ACTION_COMMENTARY:
+            return _get_config('LLM_ACTION_STALE_AFTER', 6.0)
+        if request_type == RequestType.VISITOR_DIALOGUE:
+            return _get_config('LLM_VISITOR_STALE_AFTER', 12.0)
+        return None
+    
+    def _count(self, request_type: RequestType, stat: str, amount: float = 1):
+        with self._cond:  # re-entrant: also called from queue_request
+            entry = self._stats.setdefault(request_type, {
+                "completed": 0, "coalesced": 0, "superseded": 0,
+                "dropped_stale": 0, "cache_hits": 0, "wait_ms": 0.0,
+            })
+            entry[stat] += amount
     
     def queue_request(self, request: LLMRequest) -> bool:
         """Add a request to the queue. Returns False if queue is full."""
         max_queue = _get_config('LLM_MAX_QUEUE_DEPTH', 3)
-        if self._request_queue.qsize() >= max_queue:
-            return False
-        
-        # Priority queue uses tuples: (priority_value, request)
-        # Lower number = higher priority, so we negate
-        priority = -request.priority.value
-        self._request_queue.put((priority, request))
+        key = self._coalesce_key(request)
+        superseded = None
+        with self._cond:
+            queued = self._by_key.get(key) if key is not None else None
+            if queued is not None and queued.context == request.context:
+                # Same prompt already waiting: answer both with one generation
+                if request.callback:
+                    queued.merged_callbacks.append(request.callback)
+                queued.merged_callbacks.extend(request.merged_callbacks)
+                if request.priority.value > queued.priority.value:
+                    queued.priority = request.priority
+                self._count(request.request_type, "coalesced")
+                return True
+            if queued is not None:
+                self._pending.remove(queued)
+                superseded = queued
+                self._count(queued.request_type, "superseded")
+            elif len(self._pending) >= max_queue:
+                return False
+            self._pending.append(request)
+            if key is not None:
+                self._by_key[key] = request
+            self._cond.notify()
+        if superseded is not None:
+            self._deliver(superseded, None)
         return True
     
     def queue_size(self) -> int:
         """Get current queue size."""
-        return self._request_queue.qsize()
+        with self._cond:
+            return len(self._pending)
+    
+    def _next_request(self, timeout: float) -> Optional[LLMRequest]:
+        """Pop the highest-priority, oldest pending request (None on timeout)."""
+        with self._cond:
+            if not self._pending and self._running:
+                self._cond.wait(timeout)
+            if not self._pending or not self._running:
+                return None
+            request = min(self._pending,
+                          key=lambda r: (-r.priority.value, r.created_at))
+            self._pending.remove(request)
+            key = self._coalesce_key(request)
+            if key is not None and self._by_key.get(key) is request:
+                del self._by_key[key]
+            return request
+    
+    def _deliver(self, request: LLMRequest, response: Optional[str]):
+        """Call every callback waiting on *request*."""
+        for callback in request.callbacks():
+            try:
+                callback(response)
+            except Exception as callback_error:
+                logger.warning(f"Callback error: {callback_error}")
+    
+    def _handle(self, request: LLMRequest):
+        """Serve one dequeued request: drop it, answer from cache, or generate."""
+        waited = time.time() - request.created_at
+        stale_after = self._stale_after(request.request_type)
+        if stale_after is not None and waited > stale_after:
+            self._count(request.request_type, "dropped_stale")
+            self._deliver(request, None)
+            return
+        
+        response = self._controller._cache.get(request.context)
+        if response:
+            self._count(request.request_type, "cache_hits")
+        else:
+            response = self._process_request(request)
+            # Store in cache
+            if response:
+                self._controller._cache.put(request.context, response)
+        self._count(request.request_type, "completed")
+        self._count(request.request_type, "wait_ms", waited * 1000.0)
+        self._deliver(request, response)
+    
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return queue statistics per request type.
+
+        Keys are lower-case request type names (``"action_commentary"``,
+        ...), matching the request kinds of ``LLMChat.get_timing_stats``.
+        """
+        with self._cond:
+            stats = {}
+            for request_type, entry in self._stats.items():
+                done = entry["completed"]
+                stats[request_type.name.lower()] = {
+                    "completed": done,
+                    "coalesced": entry["coalesced"],
+                    "superseded": entry["superseded"],
+                    "dropped_stale": entry["dropped_stale"],
+                    "cache_hits": entry["cache_hits"],
+                    "avg_wait_ms": round(entry["wait_ms"] / done, 1) if done else 0.0,
+                }
+            return stats
     
     def run(self):
         """Main worker loop."""
@@ -238,31 +369,12 @@ class LLMWorker(threading.Thread):
         while self._running:
             try:
                 # Wait for request with timeout
-                priority, request = self._request_queue.get(timeout=1.0)
-                
+                request = self._next_request(timeout=1.0)
                 if request is None:
-                    # Poison pill - exit
-                    break
-                
-                # Process the request
-                response = self._process_request(request)
-                
-                # Store in cache
-                if response:
-                    self._controller._cache.put(request.context, response)
-                
-                # Call callback if provided
-                if request.callback:
-                    try:
-                        request.callback(response)
-                    except Exception as callback_error:
-                        logger.warning(f"Callback error: {callback_error}")
-                
-                self._request_queue.task_done()
-                
-            except queue.Empty:
-                # Timeout - cleanup expired cache entries
-                self._controller._cache.cleanup_expired()
+                    # Timeout - cleanup expired cache entries
+                    self._controller._cache.cleanup_expired()
+                    continue
+                self._handle(request)
             except Exception as e:
                 # Log error but keep running
                 logger.error(f"LLM worker error: {e}")
@@ -694,6 +806,8 @@ class LLMBehaviorController:
             "gpu_layers": llm.get_gpu_layers() if llm else 0,
             "queue_size": self._worker.queue_size(),
             "cache_size": len(self._cache._cache),
+            "requests": self._worker.get_stats(),
+            "timings": llm.get_timing_stats() if llm else {},
         }
     
     def shutdown(self):
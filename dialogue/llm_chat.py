@@ -4,14 +4,16 @@ Uses local GGUF models via llama-cpp-python with GPU auto-detection.
 LOCAL ONLY - no external API calls.
 """
 import os
+import re
 import sys
 import atexit
 import logging
 import threading
 import queue as _queue_mod
+import time
 import multiprocessing as mp
 import concurrent.futures
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
 from pathlib import Path
 
 # Configure logging for LLM operations
@@ -36,7 +38,7 @@ try:
         LLM_ENABLED, LLM_LOCAL_ONLY, LLM_MODEL_DIR, LLM_GPU_LAYERS,
         LLM_CONTEXT_SIZE, LLM_MAX_TOKENS, LLM_MAX_TOKENS_CHAT,
         LLM_TEMPERATURE, LLM_MAX_HISTORY, LLM_MAX_THREADS,
-        LLM_LOAD_NICE,
+        LLM_LOAD_NICE, LLM_PROMPT_CACHE_BYTES,
     )
 except ImportError:
     # Fallback defaults if config not available
@@ -51,6 +53,7 @@ except ImportError:
     LLM_MAX_HISTORY = 6
     LLM_MAX_THREADS = 4
     LLM_LOAD_NICE = 8
+    LLM_PROMPT_CACHE_BYTES = 256 * 1024 * 1024
 
 
 def _detect_gpu_layers() -> int:
@@ -152,6 +155,80 @@ def _call_with_timeout(func, timeout: float = LLM_CALL_TIMEOUT) -> Any:
 
 # ── Subprocess isolation for native LLM code ───────────────────────
 
+def _enable_prompt_cache(model, capacity_bytes: int) -> bool:
+    """Attach a llama.cpp RAM state cache so shared prompt prefixes are reused.
+
+    llama-cpp-python already skips re-evaluating the tokens a prompt shares
+    with the *previous* prompt.  The state cache extends that across request
+    kinds: after an action-commentary prompt, the next chat turn restores the
+    KV state saved for the chat prefix instead of re-evaluating the whole
+    system prompt.
+    """
+    if capacity_bytes <= 0:
+        return False
+    try:
+        from llama_cpp import LlamaRAMCache
+        model.set_cache(LlamaRAMCache(capacity_bytes=capacity_bytes))
+        return True
+    except Exception:
+        return False
+
+
+def _run_timed_inference(model, req: dict, on_piece=None):
+    """Run one request and split its wall time into prompt eval and generation.
+
+    The call is streamed internally: the first chunk only arrives once the
+    prompt has been evaluated, so the time until then is prompt evaluation
+    and the remainder is token generation.  The chunks are reassembled into
+    the dict shape the non-streaming call returns.  *on_piece*, if given, is
+    called with each piece of text as soon as it is produced.
+
+    Returns:
+        ``(result, timings)`` where timings has ``prompt_ms``, ``gen_ms``
+        and ``tokens``.
+    """
+    is_chat = req["method"] == "chat"
+    kwargs = dict(req["kwargs"], stream=True)
+    start = time.perf_counter()
+    if is_chat:
+        chunks = model.create_chat_completion(**kwargs)
+    else:
+        chunks = model(req["prompt"], **kwargs)
+
+    first = None
+    pieces: List[str] = []
+    finish_reason = None
+    for chunk in chunks:
+        if first is None:
+            first = time.perf_counter()
+        choice = chunk["choices"][0]
+        if is_chat:
+            text = (choice.get("delta") or {}).get("content") or ""
+        else:
+            text = choice.get("text") or ""
+        if text:
+            pieces.append(text)
+            if on_piece is not None:
+                on_piece(text)
+        finish_reason = choice.get("finish_reason") or finish_reason
+    end = time.perf_counter()
+    if first is None:
+        first = end
+
+    text = "".join(pieces)
+    if is_chat:
+        choice = {"index": 0, "finish_reason": finish_reason,
+                  "message": {"role": "assistant", "content": text}}
+    else:
+        choice = {"index": 0, "finish_reason": finish_reason, "text": text}
+    timings = {
+        "prompt_ms": (first - start) * 1000.0,
+        "gen_ms": (end - first) * 1000.0,
+        "tokens": len(pieces),
+    }
+    return {"choices": [choice]}, timings
+
+
 def _llm_subprocess_worker(model_path, n_ctx, n_threads, n_gpu_layers,
                            request_queue, response_queue):
     """LLM inference worker running in an isolated subprocess.
@@ -204,6 +281,8 @@ def _llm_subprocess_worker(model_path, n_ctx, n_threads, n_gpu_layers,
             os.close(old_stderr)
             os.close(devnull)
 
+        _enable_prompt_cache(model, LLM_PROMPT_CACHE_BYTES)
+
         # Warmup (JIT / KV-cache prime)
         try:
             model.create_chat_completion(
@@ -233,18 +312,69 @@ def _llm_subprocess_worker(model_path, n_ctx, n_threads, n_gpu_layers,
             break
         if req is None:          # shutdown sentinel
             break
+        on_piece = None
+        if req.get("stream"):
+            def on_piece(text, _id=req["id"]):
+                response_queue.put({"type": "token", "text": text, "id": _id})
         try:
-            if req["method"] == "chat":
-                result = model.create_chat_completion(**req["kwargs"])
-            else:
-                result = model(req["prompt"], **req["kwargs"])
+            result, timings = _run_timed_inference(model, req, on_piece)
             response_queue.put({"type": "result", "data": result,
-                                "id": req["id"]})
+                                "timings": timings, "id": req["id"]})
         except Exception as e:
             response_queue.put({"type": "error", "error": str(e),
                                 "id": req["id"]})
 
 
+class LLMTimingStats:
+    """Per-request-kind breakdown of prompt evaluation vs. generation time.
+
+    Kinds are free-form labels such as ``"player_chat"`` or
+    ``"action_commentary"``; calls that do not name one count as ``"other"``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict[str, float]] = {}
+
+    def record(self, kind: str, timings: Dict[str, float]) -> None:
+        """Add one request's ``prompt_ms``/``gen_ms``/``tokens``."""
+        with self._lock:
+            entry = self._kinds.setdefault(kind, {
+                "count": 0, "prompt_ms": 0.0, "gen_ms": 0.0, "tokens": 0,
+                "last_prompt_ms": 0.0, "last_gen_ms": 0.0,
+            })
+            entry["count"] += 1
+            entry["prompt_ms"] += timings.get("prompt_ms", 0.0)
+            entry["gen_ms"] += timings.get("gen_ms", 0.0)
+            entry["tokens"] += timings.get("tokens", 0)
+            entry["last_prompt_ms"] = timings.get("prompt_ms", 0.0)
+            entry["last_gen_ms"] = timings.get("gen_ms", 0.0)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return averages per kind.
+
+        Returns:
+            Dict mapping kind to ``count``, ``avg_prompt_ms``, ``avg_gen_ms``,
+            ``tokens_per_sec`` (generation only), ``last_prompt_ms`` and
+            ``last_gen_ms``.
+        """
+        with self._lock:
+            stats = {}
+            for kind, entry in self._kinds.items():
+                count = entry["count"]
+                gen_s = entry["gen_ms"] / 1000.0
+                stats[kind] = {
+                    "count": count,
+                    "avg_prompt_ms": round(entry["prompt_ms"] / count, 1),
+                    "avg_gen_ms": round(entry["gen_ms"] / count, 1),
+                    "tokens_per_sec": round(entry["tokens"] / gen_s, 1) if gen_s else 0.0,
+                    "last_prompt_ms": round(entry["last_prompt_ms"], 1),
+                    "last_gen_ms": round(entry["last_gen_ms"], 1),
+                }
+            return stats
+
+
 class _LLMProxy:
     """Proxy that forwards inference calls to an isolated subprocess.
 
@@ -280,39 +410,63 @@ class _LLMProxy:
         self.model_name: str = msg.get("model_name", "unknown")
         self.gpu_layers: int = msg.get("gpu_layers", 0)
         self._req_counter = 0
+        # One request in flight at a time: callers outside LLMChat (DJ, diary)
+        # do not hold the inference lock, and responses are matched by id.
+        self._send_lock = threading.Lock()
+        self.timings = LLMTimingStats()
 
     # ── public interface (mirrors llama_cpp.Llama) ─────────────────
 
-    def create_chat_completion(self, **kwargs):
-        return self._send_request({"method": "chat", "kwargs": kwargs})
+    # Both calls accept two extras: ``request_kind`` labels the timings and
+    # ``on_token`` receives each piece of generated text as it streams in.
+
+    def create_chat_completion(self, request_kind: str = "other",
+                               on_token: Optional[Callable[[str], None]] = None,
+                               **kwargs):
+        return self._send_request({"method": "chat", "kwargs": kwargs},
+                                  request_kind, on_token)
 
-    def __call__(self, prompt, **kwargs):
+    def __call__(self, prompt, request_kind: str = "other",
+                 on_token: Optional[Callable[[str], None]] = None, **kwargs):
         return self._send_request({"method": "completion",
-                                   "prompt": prompt, "kwargs": kwargs})
+                                   "prompt": prompt, "kwargs": kwargs},
+                                  request_kind, on_token)
 
     # ── helpers ────────────────────────────────────────────────────
 
-    def _send_request(self, request: dict) -> Any:
-        if not self._process.is_alive():
-            raise RuntimeError(
-                "LLM worker process has died (possible native crash)")
-        self._req_counter += 1
-        request["id"] = self._req_counter
-        self._request_q.put(request)
-
-        # Poll for response, checking subprocess health every second
-        while True:
-            try:
-                msg = self._response_q.get(timeout=1.0)
-                break
-            except _queue_mod.Empty:
-                if not self._process.is_alive():
-                    raise RuntimeError(
-                        "LLM worker process crashed during inference")
-                continue
+    def _send_request(self, request: dict, kind: str = "other",
+                      on_token: Optional[Callable[[str], None]] = None) -> Any:
+        with self._send_lock:
+            if not self._process.is_alive():
+                raise RuntimeError(
+                    "LLM worker process has died (possible native crash)")
+            self._req_counter += 1
+            request["id"] = self._req_counter
+            request["stream"] = on_token is not None
+            self._request_q.put(request)
+
+            # Poll for response, checking subprocess health every second
+            while True:
+                try:
+                    msg = self._response_q.get(timeout=1.0)
+                except _queue_mod.Empty:
+                    if not self._process.is_alive():
+                        raise RuntimeError(
+                            "LLM worker process crashed during inference")
+                    continue
+                if msg.get("id") != request["id"]:
+                    continue
+                if msg["type"] != "token":
+                    break
+                try:
+                    on_token(msg["text"])
+                except Exception as e:
+                    logger.debug(f"Token callback failed: {e}")
 
         if msg["type"] == "error":
             raise RuntimeError(msg["error"])
+        if msg.get("timings"):
+            self.timings.record(kind, msg["timings"])
         return msg["data"]
 
     def is_alive(self) -> bool:
@@ -328,6 +482,31 @@ class _LLMProxy:
             self._process.terminate()
 
 
+# Fixed leading parts of the completion prompts.  Keeping the per-request
+# details at the end lets llama.cpp reuse the evaluated prefix.
+_ACTION_PROMPT_PREFIX = """Generate a 1-4 word action description for a duck.
+Use asterisks. No dialogue. Just the physical action.
+
+Examples:
+*waddles*
+*splashes about*
+*quack quack*
+*preens feathers*
+*naps*
+*flaps wings*
+*looks around*
+
+"""
+
+# Complete action tags; hidden from partial replies while streaming
+_ACTION_TAG_RE = re.compile(r"\s*\[ACTION:[a-z_]+\]")
+
+_VISITOR_PROMPT_PREFIX = """Generate ONE short line of dialogue (1-2 sentences) for a visiting duck. Use *actions* occasionally.
+Be unique to your personality. Don't be generic.
+
+"""
+
+
 class LLMChat:
     """
     Handles LLM-powered conversations with the duck.
@@ -350,6 +529,8 @@ class LLMChat:
         self._warmed_up = False        # True after first throwaway inference
         self._load_thread = None
         self._disabled = False         # Runtime toggle from settings
+        self._system_prompt_key = None  # Inputs the cached system prompt was built from
+        self._system_prompt = ""
         
         if _llm_enabled_config():
             if background:
@@ -497,6 +678,11 @@ class LLMChat:
     def get_gpu_layers(self) -> int:
         """Get number of GPU layers being used."""
         return self._gpu_layers
+
+    def get_timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Prompt-eval vs. generation timings per request kind (empty if no model)."""
+        timings = getattr(self._llama, "timings", None)
+        return timings.get_stats() if timings is not None else {}
     
     def set_duck_brain(self, duck_brain) -> None:
         """Set the DuckBrain instance for enhanced context."""
@@ -510,39 +696,51 @@ class LLMChat:
         """Restore conversation history from persistence."""
         self._conversation_history = history.copy() if history else []
 
-    def _build_system_prompt(self, duck: "Duck", context: str = "") -> str:
-        """Build the system prompt with duck's personality and memory context."""
-        personality = duck.personality
-        clever_derpy = personality.get("clever_derpy", 0)
+    def _build_system_prompt(self, duck: "Duck") -> str:
+        """Build the system prompt with the duck's personality.
 
-        # Personality trait description
-        if clever_derpy < -20:
-            trait = "easily distracted but surprisingly insightful"
-        elif clever_derpy > 20:
-            trait = "observant, dry-witted, and uncomfortably perceptive"
+        The system prompt is the prefix of every chat request, so it only
+        holds slowly-changing state: llama.cpp reuses the evaluated tokens of
+        a prefix it has seen before.  Mood and world state go into the user
+        turn instead (see ``_build_context_message``).  The prompt is rebuilt
+        only when its inputs change.
+        """
+        duck_brain = getattr(self, '_duck_brain', None)
+        if duck_brain:
+            key = ("brain", id(duck_brain), duck_brain.llm_prompt_key())
         else:
-            trait = "deadpan and matter-of-fact"
+            key = ("basic", duck.name, self._personality_trait(duck))
+        if key == self._system_prompt_key and self._system_prompt:
+            return self._system_prompt
 
-        # Get mood
-        mood = duck.get_mood()
-        
-        # Check if we have DuckBrain for enhanced context
-        duck_brain = getattr(self, '_duck_brain', None)
-        
         if duck_brain:
             # Use the enhanced Seaman-style prompt from DuckBrain
-            # IMPORTANT: Pass memory_context through so the LLM knows duck's favorites, mood, etc.
-            return duck_brain.build_llm_prompt(memory_context=context)
+            prompt = duck_brain.build_llm_prompt(memory_context="")
+        else:
+            prompt = self._build_basic_system_prompt(duck)
+        self._system_prompt_key = key
+        self._system_prompt = prompt
+        return prompt
 
-        # Fallback to basic prompt if no DuckBrain
-        prompt = f"""You are {duck.name}, a male pet duck with a deadpan, dry-witted personality like Seaman from the Dreamcast game.
+    @staticmethod
+    def _personality_trait(duck: "Duck") -> str:
+        """Describe the duck's clever/derpy personality axis."""
+        clever_derpy = duck.personality.get("clever_derpy", 0)
+        if clever_derpy < -20:
+            return "easily distracted but surprisingly insightful"
+        if clever_derpy > 20:
+            return "observant, dry-witted, and uncomfortably perceptive"
+        return "deadpan and matter-of-fact"
+
+    def _build_basic_system_prompt(self, duck: "Duck") -> str:
+        """Fallback system prompt used when no DuckBrain is attached."""
+        trait = self._personality_trait(duck)
+        return f"""You are {duck.name}, a male pet duck with a deadpan, dry-witted personality like Seaman from the Dreamcast game.
 You are a he/him - an old-school traditional guy. Romantically, you're only into lady ducks.
 IMPORTANT: The player is a HUMAN, not a duck. They are your owner/caretaker.
 If the player says they like you or love you, that's owner-pet affection, NOT romantic. You appreciate them as your human friend.
 Romantic feelings are reserved for female ducks only.
 
-Current mood: {mood.state.value}
-
 Your communication style:
 - Deadpan delivery with subtle wit
 - {trait}
@@ -558,27 +756,42 @@ Example responses:
 "*tilts head* That's... a thought. I'll process it. Forever, probably."
 "Bread would solve this. Bread solves most things."
 "You've been here a while. I appreciate that. Don't tell anyone I said that."
-"*stares* I was thinking about nothing. Successfully."{f'''
-
-== YOUR CURRENT WORLD STATE (use this to answer questions!) ==
-{context}
-
-IMPORTANT: Use the world state above when the player asks about friends, visitors, events, weather, location, quests, or anything happening around you. If a friend is visiting, you KNOW them. You are aware of everything listed above — your needs, stats, achievements, garden, fishing, crafting, tricks, outfit, trust level, age, growth stage, and more.
+"*stares* I was thinking about nothing. Successfully."
 
 == ACTIONS YOU CAN PERFORM ==
 When you decide to DO something, add an action tag at the END of your response. The tag is hidden from the player.
 Available: [ACTION:feed] [ACTION:play] [ACTION:clean] [ACTION:pet] [ACTION:sleep] [ACTION:do_trick] [ACTION:explore] [ACTION:fish] [ACTION:garden] [ACTION:craft] [ACTION:radio_on] [ACTION:radio_off] [ACTION:go_home] [ACTION:quack]
-Rules: Use at most ONE action per response. Only when contextually appropriate. If the player asks you to do something, use the tag. If just chatting, no tag needed.''' if context else ''}"""
-            
-        return prompt
+Rules: Use at most ONE action per response. Only when contextually appropriate. If the player asks you to do something, use the tag. If just chatting, no tag needed."""
 
-    def generate_response(self, duck: "Duck", player_input: str, memory_context: str = "") -> Optional[str]:
+    def _build_context_message(self, duck: "Duck", player_input: str, context: str = "") -> str:
+        """Wrap the player's message with the per-turn mood and world state.
+
+        Only the newest user turn carries this block; history keeps the bare
+        player text so earlier turns stay byte-identical between requests.
+        """
+        mood = duck.get_mood()
+        parts = [f"(Your current mood: {mood.state.value})"]
+        if context:
+            parts.append(
+                "== YOUR CURRENT WORLD STATE (use this to answer questions!) ==\n"
+                f"{context}\n\n"
+                "Use the world state above when the player asks about friends, visitors, events, "
+                "weather, location, quests, your needs, items, or anything around you. "
+                "If a friend is visiting, you KNOW them by name."
+            )
+        parts.append(f"Player: {player_input}")
+        return "\n\n".join(parts)
+
+    def generate_response(self, duck: "Duck", player_input: str, memory_context: str = "",
+                          on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """Generate a response using local LLM.
         
         Args:
             duck: The Duck instance
             player_input: What the player said
             memory_context: Optional context from duck's memory (favorites, relationships, etc.)
+            on_partial: Optional callback receiving the cleaned reply so far
+                while it is still being generated (called from a worker thread)
         """
         if not self.is_ready_for_inference():
             if not self._loading and not self._last_error:
@@ -588,7 +801,7 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
         # If we have DuckBrain, get context (but DuckBrain handles context via build_llm_prompt)
         # memory_context is not overwritten - DuckBrain context is used via _build_system_prompt
 
-        response = self._generate_local(duck, player_input, memory_context)
+        response = self._generate_local(duck, player_input, memory_context, on_partial)
 
         # NOTE: Exchange recording moved to game.py _check_pending_talk()
         # so ALL response sources (LLM, keyword, learning, voice) get recorded
@@ -596,7 +809,8 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
 
         return response
 
-    def _generate_local(self, duck: "Duck", player_input: str, memory_context: str = "") -> Optional[str]:
+    def _generate_local(self, duck: "Duck", player_input: str, memory_context: str = "",
+                        on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """Generate response using local GGUF model."""
         if not self._llama:
             self._last_error = "Model not loaded"
@@ -607,13 +821,14 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
         is_capable_model = any(m in model_name_lower for m in ["llama", "phi", "qwen", "mistral"])
 
         if is_capable_model:
-            return self._generate_chat(duck, player_input, memory_context)
+            return self._generate_chat(duck, player_input, memory_context, on_partial)
         else:
-            return self._generate_completion(duck, player_input, memory_context)
+            return self._generate_completion(duck, player_input, memory_context, on_partial)
 
-    def _generate_chat(self, duck: "Duck", player_input: str, memory_context: str = "") -> Optional[str]:
+    def _generate_chat(self, duck: "Duck", player_input: str, memory_context: str = "",
+                       on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """Generate response using chat completion (for capable models like Llama 3.2)."""
-        system_prompt = self._build_system_prompt(duck, memory_context)
+        system_prompt = self._build_system_prompt(duck)
 
         # Estimate token usage and trim if needed to stay within context window
         # Rough estimate: 1 token ≈ 4 chars. Reserve tokens for response.
@@ -625,7 +840,10 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
         history_msgs = []
         for msg in self._conversation_history[-self._max_history:]:
             history_msgs.append(msg)
-        history_msgs.append({"role": "user", "content": player_input})
+        history_msgs.append({
+            "role": "user",
+            "content": self._build_context_message(duck, player_input, memory_context),
+        })
         
         # Calculate total size and trim history if too large
         total_chars = len(system_prompt) + sum(len(m["content"]) for m in history_msgs)
@@ -644,6 +862,8 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
             def _chat_infer():
                 with self._inference_lock:
                     return self._llama.create_chat_completion(
+                        request_kind="player_chat",
+                        **self._streaming_kwargs(on_partial, duck.name),
                         messages=messages,
                         max_tokens=LLM_MAX_TOKENS_CHAT,
                         temperature=LLM_TEMPERATURE,
@@ -679,7 +899,8 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
 
         return None
 
-    def _generate_completion(self, duck: "Duck", player_input: str, memory_context: str = "") -> Optional[str]:
+    def _generate_completion(self, duck: "Duck", player_input: str, memory_context: str = "",
+                             on_partial: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """Generate response using completion-style prompt (for tiny models)."""
         mood = duck.get_mood().state.value
         name = duck.name
@@ -706,6 +927,8 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
                 with self._inference_lock:
                     return self._llama(
                         prompt,
+                        request_kind="player_chat",
+                        **self._streaming_kwargs(on_partial, duck.name),
                         max_tokens=LLM_MAX_TOKENS,
                         temperature=LLM_TEMPERATURE,
                         top_p=0.9,
@@ -757,19 +980,8 @@ Rules: Use at most ONE action per response. Only when contextually appropriate.
         # Clean action name for display (remove underscores)
         clean_action = action.replace("_", " ")
         
-        prompt = f"""Generate a 1-4 word action description for a duck. Action: {clean_action}
-Use asterisks. No dialogue. Just the physical action.
-
-Examples:
-*waddles*
-*splashes about*
-*quack quack*
-*preens feathers*
-*naps*
-*flaps wings*
-*looks around*
-
-Action:"""
+        # The action goes last so every commentary prompt shares its prefix
+        prompt = f"{_ACTION_PROMPT_PREFIX}Action: {clean_action}\nDescription:"
 
         try:
             # Use timeout wrapper (shorter timeout for quick action descriptions)
@@ -777,6 +989,7 @@ Action:"""
                 with self._inference_lock:
                     return self._llama(
                         prompt,
+                        request_kind="action_commentary",
                         max_tokens=15,
                         temperature=0.7,
                         top_p=0.9,
@@ -840,15 +1053,13 @@ Action:"""
         
         traits = personality_traits.get(visitor_personality, "friendly and curious")
         
-        prompt = f"""You are {visitor_name}, a duck visiting your friend {duck.name}.
+        # Instructions first, visitor details last: the shared prefix is reused
+        prompt = f"""{_VISITOR_PROMPT_PREFIX}You are {visitor_name}, a duck visiting your friend {duck.name}.
 Your personality: {visitor_personality} - {traits}
 Friendship: {friendship_level}
 Shared memories: {memories_text}
 Conversation phase: {conversation_phase}
 
-Generate ONE short line of dialogue (1-2 sentences). Use *actions* occasionally.
-Be unique to your personality. Don't be generic.
-
 {visitor_name}:"""
 
         try:
@@ -857,6 +1068,7 @@ Be unique to your personality. Don't be generic.
                 with self._inference_lock:
                     return self._llama(
                         prompt,
+                        request_kind="visitor_dialogue",
                         max_tokens=60,
                         temperature=0.85,
                         top_p=0.9,
@@ -879,8 +1091,35 @@ Be unique to your personality. Don't be generic.
 
         return None
 
-    def _clean_response(self, response: str, speaker_name: str = "Cheese") -> Optional[str]:
-        """Clean up LLM response."""
+    def _streaming_kwargs(self, on_partial: Optional[Callable[[str], None]],
+                          speaker_name: str) -> Dict[str, Any]:
+        """Extra inference kwargs that stream cleaned partial text to *on_partial*.
+
+        Returns no kwargs when there is no listener, so non-streaming calls
+        (and plain ``Llama`` objects) are unaffected.
+        """
+        if on_partial is None or not isinstance(self._llama, _LLMProxy):
+            return {}
+        pieces: List[str] = []
+        last_shown = [None]
+
+        def on_token(text: str):
+            pieces.append(text)
+            partial = self._clean_response("".join(pieces), speaker_name, partial=True)
+            if partial and partial != last_shown[0]:
+                last_shown[0] = partial
+                on_partial(partial)
+
+        return {"on_token": on_token}
+
+    def _clean_response(self, response: str, speaker_name: str = "Cheese",
+                        partial: bool = False) -> Optional[str]:
+        """Clean up LLM response.
+
+        With *partial* the text is a reply still being generated: an opening
+        quote whose closing quote has not arrived yet is dropped, and action
+        tags (complete or half-written) are hidden.
+        """
         if not response:
             return None
 
@@ -892,9 +1131,17 @@ Be unique to your personality. Don't be generic.
         # Remove quotes if the whole thing is quoted
         if response.startswith('"') and response.endswith('"'):
             response = response[1:-1]
+        elif partial and response.startswith('"'):
+            response = response[1:]
+
+        if partial:
+            response = _ACTION_TAG_RE.sub(" ", response)
+            open_tag = response.rfind("[")
+            if open_tag != -1 and "]" not in response[open_tag:]:
+                response = response[:open_tag]
+            response = re.sub(r"  +", " ", response).strip()
 
         # Remove the speaker's name from the start (common LLM behavior)
-        import re
         name_patterns = [
             rf"^{re.escape(speaker_name)}[\s:!\-]+",
             rf"^{re.escape(speaker_name)}\s+the\s+duck[\s:!\-]+",
@@ -913,7 +1160,6 @@ Be unique to your personality. Don't be generic.
 
         # Remove standalone action-only responses that have no dialogue
         # (e.g. the LLM returned just "*waddles around*" with nothing else)
-        import re
         stripped_actions = re.sub(r'\*[^*]+\*', '', response).strip()
         if not stripped_actions:
             # Response is ONLY emotes with no actual words — let it through anyway
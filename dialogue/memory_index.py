@@ -0,0 +1,128 @@
+"""
+Memory Index — token and topic postings for memory recall.
+
+MemoryRecall scores notable quotes and player statements by word and topic
+overlap with what the player just said. Re-tokenising every quote on every
+call is the bulk of that cost, so the owners (ConversationMemory,
+PlayerModel) keep a TextIndex next to the list and update it as they append.
+Recall then walks only the postings of the input's words and topics.
+
+Positions are list indices, like ``PlayerModel.statement_topics``. When the
+list is trimmed or replaced (memory limits, load), the next ``update``
+rebuilds the postings from the per-text feature cache instead of
+re-tokenising.
+"""
+from bisect import bisect_left
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# Topic keywords used by recall (lighter than ConversationMemory's table)
+RECALL_TOPIC_KEYWORDS: Dict[str, List[str]] = {
+    "food": ["food", "eat", "hungry", "bread", "feed", "meal", "snack"],
+    "weather": ["weather", "rain", "sun", "snow", "cold", "hot", "storm"],
+    "feelings": ["feel", "sad", "happy", "angry", "love", "hate", "scared"],
+    "personal": ["my life", "my job", "my family", "my friend", "i work"],
+    "games": ["play", "game", "fun", "boring"],
+    "philosophy": ["meaning", "life", "death", "purpose", "existence"],
+    "dreams": ["dream", "hope", "wish", "someday"],
+    "past": ["remember", "used to", "when i was", "back then"],
+}
+
+
+def recall_tokens(text: str) -> FrozenSet[str]:
+    """The words recall compares: lower-cased, split on whitespace."""
+    return frozenset(text.lower().split())
+
+
+def recall_topics(text: str) -> Tuple[str, ...]:
+    """Keyword topic detection; ``("random",)`` when nothing matches."""
+    text_lower = text.lower()
+    topics = tuple(topic for topic, keywords in RECALL_TOPIC_KEYWORDS.items()
+                   if any(kw in text_lower for kw in keywords))
+    return topics or ("random",)
+
+
+class TextIndex:
+    """
+    Word and topic postings over a list of items, keyed by list position.
+
+    ``text_of`` extracts an item's text; ``topics_of`` its topics (defaults
+    to ``recall_topics`` of the text). Call ``update(items)`` after
+    appending to the list: one append is indexed incrementally, anything
+    else (trim, reassignment) rebuilds.
+    """
+
+    def __init__(self, text_of: Callable[[Any], str],
+                 topics_of: Optional[Callable[[Any], Iterable[str]]] = None):
+        self._text_of = text_of
+        self._topics_of = topics_of
+        self.words: Dict[str, List[int]] = {}
+        self.topics: Dict[str, List[int]] = {}
+        self._source: Optional[list] = None
+        self._size = 0
+        self._last: Any = None   # Last indexed item, to spot in-place edits
+        # text -> (words, detected topics) for the texts currently indexed
+        self._features: Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def features(self, text: str) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        """Cached ``(recall_tokens, recall_topics)`` of an indexed text.
+
+        Topics are only detected when the index has no ``topics_of``.
+        """
+        cached = self._features.get(text)
+        if cached is None:
+            topics = recall_topics(text) if self._topics_of is None else ()
+            cached = self._features[text] = (recall_tokens(text), topics)
+        return cached
+
+    def update(self, items: Sequence[Any]) -> None:
+        """Bring the postings in line with *items* (cheap when already in sync)."""
+        size = len(items)
+        if (items is self._source and size >= self._size
+                and (self._size == 0 or items[self._size - 1] is self._last)):
+            if size == self._size:
+                return
+            if size == self._size + 1:
+                self._add(size - 1, items[-1])
+                self._size = size
+                self._last = items[-1]
+                return
+        self._rebuild(items)
+
+    def _rebuild(self, items: Sequence[Any]) -> None:
+        old_features = self._features
+        self._features = {}
+        self.words = {}
+        self.topics = {}
+        for position, item in enumerate(items):
+            text = self._text_of(item)
+            cached = old_features.get(text)
+            if cached is not None:
+                self._features[text] = cached
+            self._add(position, item)
+        self._source = items
+        self._size = len(items)
+        self._last = items[-1] if items else None
+
+    def _add(self, position: int, item: Any) -> None:
+        text = self._text_of(item)
+        words, detected = self.features(text)
+        topics = detected if self._topics_of is None else set(self._topics_of(item))
+        for word in words:
+            self.words.setdefault(word, []).append(position)
+        for topic in topics:
+            self.topics.setdefault(topic, []).append(position)
+
+    @staticmethod
+    def hits(postings: Dict[str, List[int]], keys: Iterable[str], start: int) -> Dict[int, int]:
+        """Per position at or after *start*: how many of *keys* it contains."""
+        counts: Dict[int, int] = {}
+        for key in keys:
+            positions = postings.get(key)
+            if not positions:
+                continue
+            for position in positions[bisect_left(positions, start):]:
+                counts[position] = counts.get(position, 0) + 1
+        return counts
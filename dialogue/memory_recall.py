@@ -7,14 +7,18 @@ conversations, quotes, facts, and behavioral patterns — making his
 callbacks feel natural rather than random.
 
 No new dependencies — pure Python on existing data structures.
+Quotes and statements are scored through the word/topic postings their
+owners maintain (see dialogue.memory_index), so only memories sharing a
+word or topic with the input are looked at.
 """
+import heapq
 import random
 import time
-import re
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple, Any
-from collections import defaultdict
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from dialogue.memory_index import TextIndex, recall_tokens, recall_topics
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,38 @@ CALLBACK_COOLDOWN = 300  # 5 minutes
 # How many recent callback IDs to track for staleness
 MAX_RECENT_CALLBACKS = 20
 
+# Recent quotes / statements considered for recall
+RECALL_WINDOW = 50
+
+# Cached memory ages (timestamps) before the cache is dropped
+MAX_AGE_CACHE = 512
+
+
+class _Candidate(NamedTuple):
+    """A scored memory; the callback dict (and its random intro) is built only if picked."""
+    score: float
+    type: str
+    content: str
+    source: str
+    intro: Callable[[], str]
+    statement: Any = None
+
+    def to_dict(self) -> Dict:
+        result = {
+            "type": self.type,
+            "content": self.content,
+            "intro": self.intro(),
+            "score": self.score,
+            "source": self.source,
+        }
+        if self.statement is not None:
+            result["statement"] = self.statement
+        return result
+
+
+def _candidate_score(candidate: _Candidate) -> float:
+    return candidate.score
+
 
 class MemoryRecall:
     """
@@ -40,6 +76,11 @@ class MemoryRecall:
         self._recent_callback_ids: List[str] = []
         self._last_callback_time = 0.0
 
+        # timestamp -> (age in days, when that age next changes)
+        self._age_cache: Dict[Any, Tuple[int, datetime]] = {}
+        # fact_type -> (value, words of the value)
+        self._fact_words: Dict[str, Tuple[Any, FrozenSet[str]]] = {}
+
     def find_relevant_memory(self, current_input: str,
                               current_topics: List[str] = None) -> Optional[Dict]:
         """
@@ -61,8 +102,8 @@ class MemoryRecall:
         if not current_topics:
             current_topics = self._detect_topics(current_input)
 
-        input_words = set(current_input.lower().split())
-        candidates = []
+        input_words = recall_tokens(current_input)
+        candidates: List[_Candidate] = []
 
         # Source 1: Notable quotes matching current topics
         candidates.extend(
@@ -94,21 +135,16 @@ class MemoryRecall:
             self._score_promises()
         )
 
-        if not candidates:
-            return None
-
-        # Sort by score descending, pick best non-stale one
-        candidates.sort(key=lambda c: c["score"], reverse=True)
-
-        for candidate in candidates[:5]:  # Check top 5
-            callback_id = f"{candidate['type']}:{candidate.get('content', '')[:50]}"
+        # Pick the best non-stale one of the top 5 (ties keep source order)
+        for candidate in heapq.nlargest(5, candidates, key=_candidate_score):
+            callback_id = f"{candidate.type}:{candidate.content[:50]}"
             if callback_id not in self._recent_callback_ids:
                 # Mark as used
                 self._recent_callback_ids.append(callback_id)
                 if len(self._recent_callback_ids) > MAX_RECENT_CALLBACKS:
                     self._recent_callback_ids.pop(0)
                 self._last_callback_time = now
-                return candidate
+                return candidate.to_dict()
 
         return None
 
@@ -141,21 +177,27 @@ class MemoryRecall:
 
     # ── Scoring methods ──────────────────────────────────────────────────
 
-    def _score_quotes(self, input_words: set,
-                       current_topics: List[str]) -> List[Dict]:
+    def _score_quotes(self, input_words: FrozenSet[str],
+                       current_topics: List[str]) -> List[_Candidate]:
         """Score notable quotes by relevance to current input."""
         results = []
+        quotes = self._conv_mem.notable_quotes
+        index = self._conv_mem.quote_index
+        index.update(quotes)
+        start = max(0, len(quotes) - RECALL_WINDOW)
+        word_hits = TextIndex.hits(index.words, input_words, start)
+        topic_hits = TextIndex.hits(index.topics, set(current_topics), start)
 
-        for quote, conv_id, timestamp in self._conv_mem.notable_quotes[-50:]:
-            quote_words = set(quote.lower().split())
-            quote_topics = self._detect_topics(quote)
+        # A quote sharing no word or topic tops out at the age weight (0.2)
+        for position in sorted(word_hits.keys() | topic_hits.keys()):
+            quote, conv_id, timestamp = quotes[position]
 
             # Word overlap score
-            overlap = len(input_words & quote_words)
+            overlap = word_hits.get(position, 0)
             word_score = min(1.0, overlap / max(len(input_words), 1) * 2)
 
             # Topic overlap score
-            topic_overlap = len(set(current_topics) & set(quote_topics))
+            topic_overlap = topic_hits.get(position, 0)
             topic_score = min(1.0, topic_overlap / max(len(current_topics), 1))
 
             # Age score: prefer quotes that are old enough to be a callback
@@ -165,19 +207,15 @@ class MemoryRecall:
             total = word_score * 0.4 + topic_score * 0.4 + age_score * 0.2
 
             if total > 0.2:
-                intro = self._format_quote_intro(quote)
-                results.append({
-                    "type": "quote",
-                    "content": quote,
-                    "intro": intro,
-                    "score": total,
-                    "source": "quote_recall",
-                })
+                results.append(_Candidate(
+                    total, "quote", quote, "quote_recall",
+                    lambda quote=quote: self._format_quote_intro(quote),
+                ))
 
         return results
 
-    def _score_facts(self, input_words: set,
-                      current_topics: List[str]) -> List[Dict]:
+    def _score_facts(self, input_words: FrozenSet[str],
+                      current_topics: List[str]) -> List[_Candidate]:
         """Score player facts by relevance."""
         results = []
         if not self._player:
@@ -197,8 +235,10 @@ class MemoryRecall:
             score = topic_overlap * 0.3
 
             # Keyword bonus
-            fact_words = set(str(fact.value).lower().split())
-            word_overlap = len(input_words & fact_words)
+            cached = self._fact_words.get(fact_type)
+            if cached is None or cached[0] != fact.value:
+                cached = self._fact_words[fact_type] = (fact.value, recall_tokens(str(fact.value)))
+            word_overlap = len(input_words & cached[1])
             score += min(0.4, word_overlap * 0.15)
 
             # Confidence bonus
@@ -207,17 +247,14 @@ class MemoryRecall:
             if score > 0.2:
                 intro = self._format_fact_intro(fact_type, fact.value)
                 if intro:
-                    results.append({
-                        "type": "fact",
-                        "content": f"{fact_type}: {fact.value}",
-                        "intro": intro,
-                        "score": score,
-                        "source": "fact_callback",
-                    })
+                    results.append(_Candidate(
+                        score, "fact", f"{fact_type}: {fact.value}", "fact_callback",
+                        lambda intro=intro: intro,
+                    ))
 
         return results
 
-    def _score_topic_patterns(self, current_topics: List[str]) -> List[Dict]:
+    def _score_topic_patterns(self, current_topics: List[str]) -> List[_Candidate]:
         """Score topic frequency patterns."""
         results = []
 
@@ -234,17 +271,14 @@ class MemoryRecall:
                     f"every time you mention {topic} I add a mental tally mark. we're in double digits.",
                     f"*adjusts feathers* so. {topic}. we meet again.",
                 ]
-                results.append({
-                    "type": "topic_pattern",
-                    "content": topic,
-                    "intro": random.choice(intros),
-                    "score": score,
-                    "source": "topic_recall",
-                })
+                results.append(_Candidate(
+                    score, "topic_pattern", topic, "topic_recall",
+                    lambda intros=intros: random.choice(intros),
+                ))
 
         return results
 
-    def _score_unanswered_questions(self, input_words: set) -> List[Dict]:
+    def _score_unanswered_questions(self, input_words: FrozenSet[str]) -> List[_Candidate]:
         """Score unanswered questions by relevance."""
         results = []
 
@@ -264,33 +298,37 @@ class MemoryRecall:
                     f"I ghosted your question about \"{question}.\" not on purpose. probably.",
                     f"you asked \"{question}\" once. I'm circling back. ducks are thorough.",
                 ]
-                results.append({
-                    "type": "unanswered",
-                    "content": question,
-                    "intro": random.choice(intros),
-                    "score": score,
-                    "source": "unanswered_question",
-                })
+                results.append(_Candidate(
+                    score, "unanswered", question, "unanswered_question",
+                    lambda intros=intros: random.choice(intros),
+                ))
 
         return results
 
-    def _score_player_statements(self, input_words: set,
-                                   current_topics: List[str]) -> List[Dict]:
+    def _score_player_statements(self, input_words: FrozenSet[str],
+                                   current_topics: List[str]) -> List[_Candidate]:
         """Score player statements by topic and keyword relevance."""
         results = []
         if not self._player:
             return results
 
-        for stmt in self._player.statements[-50:]:
-            stmt_words = set(stmt.text.lower().split())
-            stmt_topics = stmt.topic_tags or []
+        statements = self._player.statements
+        index = self._player.statement_index
+        index.update(statements)
+        start = max(0, len(statements) - RECALL_WINDOW)
+        word_hits = TextIndex.hits(index.words, input_words, start)
+        topic_hits = TextIndex.hits(index.topics, set(current_topics), start)
+
+        # Without a shared word or topic a statement tops out at 0.25
+        for position in sorted(word_hits.keys() | topic_hits.keys()):
+            stmt = statements[position]
 
             # Word overlap
-            word_overlap = len(input_words & stmt_words)
+            word_overlap = word_hits.get(position, 0)
             word_score = min(1.0, word_overlap / max(len(input_words), 1) * 2)
 
             # Topic overlap
-            topic_overlap = len(set(current_topics) & set(stmt_topics))
+            topic_overlap = topic_hits.get(position, 0)
             topic_score = min(1.0, topic_overlap / max(len(current_topics), 1))
 
             # Staleness: prefer unreferenced statements
@@ -306,19 +344,15 @@ class MemoryRecall:
                 truncated = stmt.text[:80]
                 if len(stmt.text) > 80:
                     truncated += "..."
-                intro = self._format_statement_intro(truncated)
-                results.append({
-                    "type": "statement",
-                    "content": stmt.text,
-                    "intro": intro,
-                    "score": total,
-                    "source": "quote_recall",
-                    "statement": stmt,
-                })
+                results.append(_Candidate(
+                    total, "statement", stmt.text, "quote_recall",
+                    lambda truncated=truncated: self._format_statement_intro(truncated),
+                    statement=stmt,
+                ))
 
         return results
 
-    def _score_promises(self) -> List[Dict]:
+    def _score_promises(self) -> List[_Candidate]:
         """Score unfulfilled promises."""
         results = []
         if not self._player:
@@ -346,13 +380,10 @@ class MemoryRecall:
                 f"I'm not bringing up that you said you'd {text}. except I just did.",
                 f"just checking. you mentioned you'd {text}. no pressure. except all the pressure.",
             ]
-            results.append({
-                "type": "promise",
-                "content": text,
-                "intro": random.choice(intros),
-                "score": score,
-                "source": "pattern_observation",
-            })
+            results.append(_Candidate(
+                score, "promise", text, "pattern_observation",
+                lambda intros=intros: random.choice(intros),
+            ))
 
         return results
 
@@ -364,23 +395,26 @@ class MemoryRecall:
         if not topic:
             return None
 
-        # Find a past quote on this topic
-        for quote, conv_id, ts in reversed(self._conv_mem.notable_quotes[-50:]):
-            quote_topics = self._detect_topics(quote)
-            if topic in quote_topics:
-                truncated = quote[:80] + ("..." if len(quote) > 80 else "")
-                intros = [
-                    f"you told me once that \"{truncated}.\" I've been thinking about it. not jealously.",
-                    f"this reminds me. you said \"{truncated}\" before. my brain flagged it.",
-                    f"*blinks* didn't you say something like \"{truncated}\"? I have a mental file.",
-                ]
-                return {
-                    "type": "topic_echo",
-                    "content": quote,
-                    "intro": random.choice(intros),
-                    "score": 0.7,
-                    "source": "quote_recall",
-                }
+        # Most recent quote on this topic
+        quotes = self._conv_mem.notable_quotes
+        index = self._conv_mem.quote_index
+        index.update(quotes)
+        positions = index.topics.get(topic)
+        if positions and positions[-1] >= len(quotes) - RECALL_WINDOW:
+            quote = quotes[positions[-1]][0]
+            truncated = quote[:80] + ("..." if len(quote) > 80 else "")
+            intros = [
+                f"you told me once that \"{truncated}.\" I've been thinking about it. not jealously.",
+                f"this reminds me. you said \"{truncated}\" before. my brain flagged it.",
+                f"*blinks* didn't you say something like \"{truncated}\"? I have a mental file.",
+            ]
+            return {
+                "type": "topic_echo",
+                "content": quote,
+                "intro": random.choice(intros),
+                "score": 0.7,
+                "source": "quote_recall",
+            }
 
         return None
 
@@ -505,36 +539,27 @@ class MemoryRecall:
 
     def _detect_topics(self, text: str) -> List[str]:
         """Lightweight topic detection (mirrors ConversationMemory._detect_topics)."""
-        text_lower = text.lower()
-        topics = []
-
-        topic_keywords = {
-            "food": ["food", "eat", "hungry", "bread", "feed", "meal", "snack"],
-            "weather": ["weather", "rain", "sun", "snow", "cold", "hot", "storm"],
-            "feelings": ["feel", "sad", "happy", "angry", "love", "hate", "scared"],
-            "personal": ["my life", "my job", "my family", "my friend", "i work"],
-            "games": ["play", "game", "fun", "boring"],
-            "philosophy": ["meaning", "life", "death", "purpose", "existence"],
-            "dreams": ["dream", "hope", "wish", "someday"],
-            "past": ["remember", "used to", "when i was", "back then"],
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                topics.append(topic)
-
-        return topics or ["random"]
+        return list(recall_topics(text))
 
     def _age_score(self, timestamp: str, ideal_age_days: int = 14) -> float:
         """
         Score a memory by age. Peaks at ideal_age_days,
         falls off for very recent or very old memories.
         """
-        try:
-            mem_date = datetime.fromisoformat(timestamp)
-            age_days = (datetime.now() - mem_date).days
-        except (ValueError, TypeError):
-            return 0.3  # Unknown age gets neutral score
+        now = datetime.now()
+        cached = self._age_cache.get(timestamp)
+        if cached is None or now >= cached[1]:
+            try:
+                mem_date = datetime.fromisoformat(timestamp)
+                age_days = (now - mem_date).days
+            except (ValueError, TypeError):
+                return 0.3  # Unknown age gets neutral score
+            if len(self._age_cache) >= MAX_AGE_CACHE:
+                self._age_cache.clear()
+            # Whole days only change once a day, so keep it until then
+            cached = (age_days, mem_date + timedelta(days=age_days + 1))
+            self._age_cache[timestamp] = cached
+        age_days = cached[0]
 
         if age_days < 1:
             return 0.1  # Too recent to be a "callback"
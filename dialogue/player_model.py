@@ -13,6 +13,7 @@ from collections import defaultdict
 import json
 import random
 from dialogue.content_filter import get_content_filter
+from dialogue.memory_index import TextIndex
 
 
 class PlayerTraitAxis(Enum):
@@ -78,6 +79,14 @@ class BehaviorPattern:
     leisurely_sessions: int = 0  # Long, varied
 
 
+def _statement_text(statement: PlayerStatement) -> str:
+    return statement.text
+
+
+def _statement_topics(statement: PlayerStatement) -> List[str]:
+    return statement.topic_tags
+
+
 class PlayerModel:
     """
     Comprehensive model of the player built from observations and conversations.
@@ -117,6 +126,7 @@ class PlayerModel:
         # Things player has said
         self.statements: List[PlayerStatement] = []
         self.statement_topics: Dict[str, List[int]] = defaultdict(list)  # topic -> statement indices
+        self.statement_index = TextIndex(_statement_text, _statement_topics)  # word/topic postings for recall
         
         # Questions asked and answered
         self.questions_asked: List[Dict] = []  # {question, asked_at, answered, answer}
@@ -278,6 +288,7 @@ class PlayerModel:
         
         idx = len(self.statements)
         self.statements.append(statement)
+        self.statement_index.update(self.statements)
         
         # Index by topic
         for tag in statement.topic_tags:
@@ -792,6 +803,7 @@ class PlayerModel:
     
     def _rebuild_statement_index(self):
         """Rebuild the statement topic index after trimming statements."""
+        self.statement_index.update(self.statements)
         self.statement_topics = defaultdict(list)
         for idx, stmt in enumerate(self.statements):
             for tag in stmt.topic_tags:
@@ -899,6 +911,7 @@ class PlayerModel:
             model.statements.append(stmt)
             for tag in stmt.topic_tags:
                 model.statement_topics[tag].append(len(model.statements) - 1)
+        model.statement_index.update(model.statements)
         
         model.questions_asked = data.get("questions_asked", [])
         model.questions_pending = data.get("questions_pending", [])
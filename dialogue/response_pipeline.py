@@ -8,13 +8,24 @@ tries them in priority order and returns the first successful response.
 This replaces the hard-coded ``if/elif`` chain in
 ``ConversationSystem.process_player_input`` with an extensible, testable
 architecture while reusing ALL existing generation code.
+
+Hedged mode: with a ``hedge_deadline`` set, a ``slow`` source (the direct
+LLM) is started on a worker thread while the cheap sources behind it
+``preview`` a ready fallback without using anything up. If the slow source
+misses the deadline the best cheap answer is committed and served at once,
+and the late answer is kept for a follow-up unless a newer turn has begun.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import deque
+import concurrent.futures
+import functools
 import logging
 import re
+import threading
+import time
 
+from core.frame_profiler import RollingSeries
 from dialogue.dialogue_core import (
     DialogueContext,
     DialogueResponse,
@@ -23,6 +34,8 @@ from dialogue.dialogue_core import (
 
 logger = logging.getLogger(__name__)
 
+_perf_counter = time.perf_counter
+
 
 # ---------------------------------------------------------------------------
 # Voice compliance constants (seaman golden rules)
@@ -32,6 +45,52 @@ _MAX_EXCLAMATIONS = 1          # Enthusiasm exclamation cap (protest ok)
 _COMPLIANCE_WORDS_BANNED = {"awesome", "amazing", "wonderful", "fantastic",
                             "incredible", "absolutely"}  # Too enthusiastic
 
+# ---------------------------------------------------------------------------
+# Hedging / latency tracking
+# ---------------------------------------------------------------------------
+_LATENCY_WINDOW = 200                               # Samples kept per source
+_LATENCY_BUCKETS_MS = (1, 5, 25, 100, 500, 2000)    # Histogram upper edges
+_MAX_LATE_RESPONSES = 5                             # Late slow answers kept
+
+# One worker: a second hedged LLM turn waits for the first, never stacks up
+_hedge_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="response-hedge")
+        return _hedge_executor
+
+
+class SourceLatency:
+    """Rolling percentiles plus a fixed-bucket histogram of one source's generate time."""
+
+    __slots__ = ("series", "buckets")
+
+    def __init__(self) -> None:
+        self.series = RollingSeries(_LATENCY_WINDOW)
+        self.buckets = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.series.add(seconds)
+        ms = seconds * 1000.0
+        for index, edge in enumerate(_LATENCY_BUCKETS_MS):
+            if ms <= edge:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, object]:
+        labels = [f"<={edge}ms" for edge in _LATENCY_BUCKETS_MS]
+        labels.append(f">{_LATENCY_BUCKETS_MS[-1]}ms")
+        summary = self.series.summary(1000.0)
+        summary["histogram"] = dict(zip(labels, self.buckets))
+        return summary
+
 
 # ---------------------------------------------------------------------------
 # ResponseSource ABC
@@ -43,8 +102,18 @@ class ResponseSource(ABC):
 
     Subclasses wrap existing generation code (LLM, keywords, etc.)
     and present a uniform interface to the pipeline.
+
+    ``slow`` sources may take seconds; in hedged mode the pipeline runs
+    them on a worker thread under a deadline instead of blocking on them.
+    Meanwhile the cheap sources ``preview`` their answer, which may be
+    thrown away; ``commit`` is called for the one that is served.  A
+    source whose answer uses something up that it cannot hold back sets
+    ``previewable = False`` and only runs once the slow source has missed.
     """
 
+    slow = False
+    previewable = True
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -77,6 +146,20 @@ class ResponseSource(ABC):
         """
         return True
 
+    def preview(
+        self, context: DialogueContext, state: DialogueState
+    ) -> Optional[DialogueResponse]:
+        """
+        Like ``generate``, but leaves no lasting trace; the response may
+        be discarded.  Default: ``generate`` (for sources without state).
+        """
+        return self.generate(context, state)
+
+    def commit(
+        self, response: DialogueResponse, context: DialogueContext, state: DialogueState
+    ) -> None:
+        """Apply what ``preview`` held back, now that *response* is served."""
+
 
 # ---------------------------------------------------------------------------
 # LLMResponseSource
@@ -85,9 +168,13 @@ class ResponseSource(ABC):
 class LLMResponseSource(ResponseSource):
     """
     Wraps ``dialogue.llm_chat.LLMChat`` for local-LLM responses.
+
+    Only answers once the game has created the LLMChat singleton and its
+    model is ready for inference; it never starts a model load itself.
     """
 
     _ACTION_TAG_RE = re.compile(r"\[ACTION:(\w+)\]")
+    slow = True
 
     def __init__(self) -> None:
         # Lazy-import to avoid import-time model loading
@@ -106,16 +193,25 @@ class LLMResponseSource(ResponseSource):
             return True
 
     def _get_llm(self):
-        """Lazy-load the LLMChat singleton in the background."""
+        """The LLMChat singleton, once something else has created it."""
         if self._llm is None and not self._import_failed:
             try:
-                from dialogue.llm_chat import get_llm_chat
-                self._llm = get_llm_chat(background=True)
+                from dialogue.llm_chat import get_existing_llm_chat
+                self._llm = get_existing_llm_chat()
             except Exception as exc:
                 logger.debug("LLM import failed: %s", exc)
                 self._import_failed = True
         return self._llm
 
+    def is_ready(self) -> bool:
+        """Return True if the model can answer right now."""
+        llm = self._get_llm()
+        if llm is None:
+            return False
+        if hasattr(llm, "is_ready_for_inference"):
+            return llm.is_ready_for_inference()
+        return llm.is_available()
+
     def can_handle(
         self, context: DialogueContext, state: DialogueState
     ) -> bool:
@@ -123,12 +219,7 @@ class LLMResponseSource(ResponseSource):
             return False
         if context.player_message is None:
             return False
-        llm = self._get_llm()
-        if llm is None:
-            return False
-        if hasattr(llm, "is_ready_for_inference"):
-            return llm.is_ready_for_inference()
-        return llm.is_available()
+        return self.is_ready()
 
     def generate(
         self, context: DialogueContext, state: DialogueState
@@ -149,7 +240,8 @@ class LLMResponseSource(ResponseSource):
             # Build memory context string from state if available
             memory_context = getattr(state, "_memory_context", "")
             raw = llm.generate_response(
-                duck, context.player_message, memory_context=memory_context
+                duck, context.player_message, memory_context=memory_context,
+                on_partial=getattr(state, "_on_partial", None),
             )
         except Exception as exc:
             logger.debug("LLM generation failed: %s", exc)
@@ -209,23 +301,18 @@ class AmbientChatSource(ResponseSource):
             return False
         return gen.count_unused("chat_response") > 0
 
-    def generate(
-        self, context: DialogueContext, state: DialogueState
-    ) -> Optional[DialogueResponse]:
+    @staticmethod
+    def _get_generator(state: DialogueState):
         duck = getattr(state, "_duck_ref", None)
         if duck is None:
             return None
         brain = getattr(duck, "_duck_brain", None)
         if brain is None:
             return None
-        gen = getattr(brain, "_ambient_generator", None)
-        if gen is None:
-            return None
-
-        line = gen.consume_chat_response(context.player_message or "")
-        if not line:
-            return None
+        return getattr(brain, "_ambient_generator", None)
 
+    @staticmethod
+    def _response(line: str) -> DialogueResponse:
         return DialogueResponse(
             text=line,
             source="ambient_chat",
@@ -233,6 +320,39 @@ class AmbientChatSource(ResponseSource):
             should_record=True,
         )
 
+    def generate(
+        self, context: DialogueContext, state: DialogueState
+    ) -> Optional[DialogueResponse]:
+        gen = self._get_generator(state)
+        if gen is None:
+            return None
+        line = gen.consume_chat_response(context.player_message or "")
+        if not line:
+            return None
+        return self._response(line)
+
+    def preview(
+        self, context: DialogueContext, state: DialogueState
+    ) -> Optional[DialogueResponse]:
+        # Peek at the stock; the line is only used up by commit()
+        gen = self._get_generator(state)
+        if gen is None:
+            return None
+        picked = gen.peek_chat_response(context.player_message or "")
+        if not picked:
+            return None
+        response = self._response(picked[1])
+        state._ambient_line_id = picked[0]
+        return response
+
+    def commit(
+        self, response: DialogueResponse, context: DialogueContext, state: DialogueState
+    ) -> None:
+        gen = self._get_generator(state)
+        line_id = getattr(state, "_ambient_line_id", None)
+        if gen is not None and line_id is not None:
+            gen.mark_used(line_id)
+
 
 # ---------------------------------------------------------------------------
 # KeywordResponseSource
@@ -288,8 +408,38 @@ class KeywordResponseSource(ResponseSource):
         if not result:
             return None
 
+        return self._response(result)
+
+    def preview(
+        self, context: DialogueContext, state: DialogueState
+    ) -> Optional[DialogueResponse]:
+        # Choose without updating the engine's repeat avoidance
+        engine = self._get_engine()
+        duck = getattr(state, "_duck_ref", None)
+        if engine is None or duck is None:
+            return None
+        try:
+            choice = engine.choose(context.player_message, duck)
+        except Exception as exc:
+            logger.debug("Keyword engine failed: %s", exc)
+            return None
+        if not choice:
+            return None
+        state._keyword_choice = choice
+        return self._response(choice[1])
+
+    def commit(
+        self, response: DialogueResponse, context: DialogueContext, state: DialogueState
+    ) -> None:
+        engine = self._get_engine()
+        choice = getattr(state, "_keyword_choice", None)
+        if engine is not None and choice is not None:
+            engine.remember(*choice)
+
+    @staticmethod
+    def _response(text: str) -> DialogueResponse:
         return DialogueResponse(
-            text=result,
+            text=text,
             source="keyword",
             confidence=0.70,
             should_record=True,
@@ -453,8 +603,12 @@ class VoiceResponseSource(ResponseSource):
     Wraps ``dialogue.voice_generator.VoiceGenerator`` for Markov-chain
     novel lines.  Output is flagged ``should_record=False`` because
     Markov gibberish should not pollute persistent memory.
+
+    Not previewable: ``generate`` takes its line out of the shared pool.
     """
 
+    previewable = False
+
     def __init__(self) -> None:
         self._generator = None
         self._import_failed = False
@@ -529,14 +683,18 @@ class ResponsePipeline:
     Tries registered ResponseSources in priority order (lower number
     = tried first) and returns the first successful response.
 
-    Tracks tonal rotation, source distribution, and genuine-moment ratio
-    to maintain voice consistency. Applies a voice compliance post-filter
-    to ALL responses.
+    Tracks tonal rotation, source distribution, per-source latency and
+    genuine-moment ratio to maintain voice consistency. Applies a voice
+    compliance post-filter to ALL responses.
+
+    With ``hedge_deadline`` set (seconds), the first available ``slow``
+    source is run on a worker thread while the cheap sources preview a
+    fallback; the slow answer wins only if it arrives before the deadline.
 
     If every source fails, returns a minimal ``"..."`` fallback.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, hedge_deadline: Optional[float] = None) -> None:
         # List of (priority, source) tuples, kept sorted
         self._sources: List[Tuple[int, ResponseSource]] = []
         # Phase 3 tracking
@@ -544,6 +702,19 @@ class ResponsePipeline:
         self._recent_sources: deque = deque(maxlen=50)
         self._genuine_count: int = 0
         self._response_count: int = 0
+        # Hedged mode (None or 0 = slow sources run inline like the rest)
+        self.hedge_deadline = hedge_deadline
+        self.on_late_response: Optional[Callable[[DialogueResponse], None]] = None
+        self._late_responses: deque = deque(maxlen=_MAX_LATE_RESPONSES)
+        self._inflight: Optional[concurrent.futures.Future] = None
+        # Late answers are kept only while their turn is still the current one
+        self._turn: int = 0
+        self._turn_lock = threading.Lock()
+        self._hedged_count: int = 0
+        self._missed_count: int = 0
+        # Latencies are recorded from the hedge worker too
+        self._latency: Dict[str, SourceLatency] = {}
+        self._latency_lock = threading.Lock()
 
     def register_source(
         self, source: ResponseSource, priority: int
@@ -574,51 +745,55 @@ class ResponsePipeline:
         self,
         context: DialogueContext,
         state: DialogueState,
+        allow_slow: bool = True,
     ) -> DialogueResponse:
         """
         Run through sources in priority order and return the first
         successful response.  Applies voice compliance post-filter
         and tracks tonal/source statistics.
 
+        In hedged mode the slow source is started in the background and
+        the cheap sources ``preview`` their answers while it runs, so a
+        fallback is ready when the deadline passes.  Previews use nothing
+        up (an ambient line is peeked, not consumed); only the served
+        cheap answer is committed.  The call returns within
+        ``hedge_deadline``, or after the previews if they take longer.
+
         Args:
             context: The current DialogueContext.
             state: The current DialogueState.
+            allow_slow: ``False`` skips ``slow`` sources (the LLM) for
+                this turn.
 
         Returns:
             A DialogueResponse.  Guaranteed non-None; falls back to
             ``"..."`` if every source fails.
         """
-        for _priority, source in self._sources:
-            if not source.is_enabled():
-                continue
-            try:
-                if not source.can_handle(context, state):
+        self.begin_turn()
+        if self.hedge_deadline:
+            response = self._generate_hedged(context, state, allow_slow)
+        else:
+            response = None
+            for _priority, source in self._sources:
+                if source.slow and not allow_slow:
                     continue
-            except Exception as exc:
-                logger.debug(
-                    "Source '%s' can_handle raised: %s", source.name, exc
-                )
-                continue
-
-            try:
-                response = source.generate(context, state)
-            except Exception as exc:
-                logger.debug(
-                    "Source '%s' generate raised: %s", source.name, exc
-                )
-                continue
-
-            if response is not None:
-                # Voice compliance post-filter
-                response = self._apply_voice_compliance(response)
-                # Track source distribution and tones
-                self._recent_sources.append(response.source)
-                if response.mood_hint:
-                    self._recent_tones.append(response.mood_hint)
-                self._response_count += 1
-                if response.mood_hint in ("genuine", "vulnerable", "warm"):
-                    self._genuine_count += 1
-                return response
+                if not self._is_available(source, context, state):
+                    continue
+                response = self._generate_timed(source, context, state)
+                if response is not None:
+                    break
+
+        if response is not None:
+            # Voice compliance post-filter
+            response = self._apply_voice_compliance(response)
+            # Track source distribution and tones
+            self._recent_sources.append(response.source)
+            if response.mood_hint:
+                self._recent_tones.append(response.mood_hint)
+            self._response_count += 1
+            if response.mood_hint in ("genuine", "vulnerable", "warm"):
+                self._genuine_count += 1
+            return response
 
         # Ultimate fallback
         return DialogueResponse(
@@ -628,6 +803,171 @@ class ResponsePipeline:
             should_record=False,
         )
 
+    @staticmethod
+    def _is_available(
+        source: ResponseSource, context: DialogueContext, state: DialogueState
+    ) -> bool:
+        if not source.is_enabled():
+            return False
+        try:
+            return bool(source.can_handle(context, state))
+        except Exception as exc:
+            logger.debug(
+                "Source '%s' can_handle raised: %s", source.name, exc
+            )
+            return False
+
+    def _generate_timed(
+        self, source: ResponseSource, context: DialogueContext, state: DialogueState,
+        preview: bool = False,
+    ) -> Optional[DialogueResponse]:
+        start = _perf_counter()
+        try:
+            if preview:
+                return source.preview(context, state)
+            return source.generate(context, state)
+        except Exception as exc:
+            logger.debug(
+                "Source '%s' generate raised: %s", source.name, exc
+            )
+            return None
+        finally:
+            self._record_latency(source.name, _perf_counter() - start)
+
+    # ── Hedging ───────────────────────────────────────────────────────
+
+    def begin_turn(self) -> int:
+        """
+        Start a new turn and return its id.
+
+        A slow answer still running for an earlier turn is dropped when it
+        lands, and late answers nobody took are discarded.
+        ``generate_response`` calls this itself; callers that clear their
+        own copies of late answers call it first, so none slips in between.
+        """
+        with self._turn_lock:
+            self._turn += 1
+            self._late_responses.clear()
+            return self._turn
+
+    def _generate_hedged(
+        self, context: DialogueContext, state: DialogueState, allow_slow: bool = True
+    ) -> Optional[DialogueResponse]:
+        """Race the first slow source against previews of the cheap ones."""
+        started = _perf_counter()
+        pending = None
+        # One slow generation in flight per pipeline; a turn that arrives
+        # while the last one is still running goes without it
+        if allow_slow and (self._inflight is None or self._inflight.done()):
+            for _priority, source in self._sources:
+                if source.slow and self._is_available(source, context, state):
+                    pending = self._start_slow(source, context, state)
+                    break
+
+        # Preview cheap answers in order until one answers or a source
+        # that cannot preview is reached; the rest run only on a miss
+        cheap = [source for _priority, source in self._sources if not source.slow]
+        fallback = None
+        resume_at = len(cheap)
+        for index, source in enumerate(cheap):
+            if not source.previewable:
+                resume_at = index
+                break
+            if not self._is_available(source, context, state):
+                continue
+            response = self._generate_timed(source, context, state, preview=True)
+            if response is not None:
+                fallback = (source, response)
+                break
+
+        if pending is not None:
+            response = self._await_slow(pending, started)
+            if response is not None:
+                return response
+        if fallback is not None:
+            source, response = fallback
+            try:
+                source.commit(response, context, state)
+            except Exception as exc:
+                logger.debug("Source '%s' commit raised: %s", source.name, exc)
+            return response
+        for source in cheap[resume_at:]:
+            if not self._is_available(source, context, state):
+                continue
+            response = self._generate_timed(source, context, state)
+            if response is not None:
+                return response
+        return None
+
+    def _start_slow(
+        self, source: ResponseSource, context: DialogueContext, state: DialogueState
+    ) -> Tuple[concurrent.futures.Future, threading.Event]:
+        """Submit a slow source to the hedge worker; returns (future, served flag)."""
+        served = threading.Event()
+        on_partial = getattr(state, "_on_partial", None)
+        if on_partial is not None:
+            # Once the cheap answer is on screen, stop streaming the draft over it
+            def gated_partial(text):
+                if not served.is_set():
+                    on_partial(text)
+            state._on_partial = gated_partial
+        future = _get_hedge_executor().submit(self._generate_timed, source, context, state)
+        self._inflight = future
+        self._hedged_count += 1
+        return future, served
+
+    def _await_slow(
+        self, pending: Tuple[concurrent.futures.Future, threading.Event], started: float
+    ) -> Optional[DialogueResponse]:
+        future, served = pending
+        remaining = self.hedge_deadline - (_perf_counter() - started)
+        try:
+            return future.result(timeout=max(0.0, remaining))
+        except concurrent.futures.TimeoutError:
+            served.set()
+            self._missed_count += 1
+            future.add_done_callback(functools.partial(self._keep_late, self._turn))
+            return None
+
+    def _keep_late(self, turn: int, future: concurrent.futures.Future) -> None:
+        """Done-callback for a slow answer that missed its deadline (hedge worker thread)."""
+        response = future.result()
+        if response is None:
+            return
+        response = self._apply_voice_compliance(response)
+        with self._turn_lock:
+            if turn != self._turn:
+                logger.debug("Dropping late answer from superseded turn %d", turn)
+                return
+            self._late_responses.append(response)
+            callback = self.on_late_response
+            if callback is not None:
+                try:
+                    callback(response)
+                except Exception:
+                    logger.debug("on_late_response callback failed", exc_info=True)
+
+    def take_late_response(self) -> Optional[DialogueResponse]:
+        """Pop the oldest slow answer that missed its deadline, or None."""
+        try:
+            return self._late_responses.popleft()
+        except IndexError:
+            return None
+
+    def _record_latency(self, name: str, seconds: float) -> None:
+        with self._latency_lock:
+            latency = self._latency.get(name)
+            if latency is None:
+                latency = self._latency[name] = SourceLatency()
+            latency.add(seconds)
+
+    def get_source(self, name: str) -> Optional[ResponseSource]:
+        """Return the registered source called *name*, or None."""
+        for _priority, source in self._sources:
+            if source.name == name:
+                return source
+        return None
+
     def get_sources(self) -> List[Tuple[int, str, bool]]:
         """
         Return a snapshot of registered sources for debugging.
@@ -680,6 +1020,20 @@ class ResponsePipeline:
             dist[src] = dist.get(src, 0) + 1
         return dist
 
+    def get_source_latencies(self) -> Dict[str, Dict[str, object]]:
+        """Return per-source generate() latency: percentiles and histogram, in ms."""
+        with self._latency_lock:
+            return {name: latency.to_dict() for name, latency in self._latency.items()}
+
+    def get_hedge_stats(self) -> Dict[str, object]:
+        """Return hedged-mode counters: slow turns started, deadlines missed, late answers kept."""
+        return {
+            "deadline": self.hedge_deadline,
+            "hedged": self._hedged_count,
+            "missed": self._missed_count,
+            "late_pending": len(self._late_responses),
+        }
+
     def get_voice_health(self) -> Dict[str, object]:
         """Return voice health diagnostics for debug menu."""
         dist = self.get_source_distribution()
@@ -690,6 +1044,8 @@ class ResponsePipeline:
             "genuine_ratio": round(self.get_genuine_ratio(), 3),
             "dominant_source_pct": round(dominant_pct, 3),
             "recent_tones": list(self._recent_tones),
+            "source_latency_ms": self.get_source_latencies(),
+            "hedge": self.get_hedge_stats(),
             "warning": dominant_pct > 0.6 or self.get_genuine_ratio() > 0.25,
         }
 
@@ -698,24 +1054,35 @@ class ResponsePipeline:
 # Factory
 # ---------------------------------------------------------------------------
 
-def create_default_pipeline() -> ResponsePipeline:
+def create_default_pipeline(direct_llm: bool = False) -> ResponsePipeline:
     """
     Create the standard response pipeline with all available sources.
 
     Sources that fail to initialise are silently skipped so the game
     can always start, even without an LLM model.
 
-    The LLM is NOT a direct response source — it enriches future
-    responses via the ambient line system in the background.
+    By default the LLM is NOT a direct response source — it enriches
+    future responses via the ambient line system in the background.
+    With *direct_llm* (the player chat pipeline) ``LLMResponseSource``
+    answers first whenever the model is loaded, hedged against
+    ``LLM_CHAT_DEADLINE`` and streaming its reply as it is generated.
 
     Default priority order:
+        1  - LLM  (direct_llm only; skipped until the model is ready)
         5  - AmbientChat  (pre-generated LLM responses from background)
         10 - Keywords  (hand-crafted topic-specific)
         20 - Learning engine  (fuzzy-match learned pairs)
         30 - Seaman  (template deadpan fallback)
         40 - Voice  (Markov chain novel lines)
     """
-    pipeline = ResponsePipeline()
+    try:
+        from config import LLM_CHAT_DEADLINE
+    except ImportError:
+        LLM_CHAT_DEADLINE = None
+    pipeline = ResponsePipeline(hedge_deadline=LLM_CHAT_DEADLINE)
+
+    if direct_llm:
+        pipeline.register_source(LLMResponseSource(), priority=1)
 
     try:
         pipeline.register_source(AmbientChatSource(), priority=5)
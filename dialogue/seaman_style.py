@@ -1788,6 +1788,38 @@ class SeamanDialogue:
         text, tone = random.choice(thoughts)
         return DialogueLine(text, tone, DialogueContext.RANDOM)
     
+    def llm_personality_prompt_key(self, player_model, duck_memory,
+                                   conversation_memory) -> tuple:
+        """The inputs ``build_llm_personality_prompt`` renders, as a hashable key.
+
+        Leaves out the random "memory you could reference" line, so a
+        cached prompt keeps the memory it was built with.
+        """
+        player_key = None
+        if player_model:
+            visits = player_model.visit_pattern
+            player_key = (
+                player_model.name,
+                player_model.affection_level > 50,
+                player_model.trust_level > 30,
+                player_model.annoyance_level > 30,
+                visits.total_visits > 50 and (
+                    visits.current_streak if visits.current_streak > 7 else 0,
+                    int(visits.longest_absence / 24) if visits.longest_absence > 72 else 0,
+                ),
+                tuple((f.fact_type, str(f.value))
+                      for f in player_model.get_relevant_facts(max_facts=5)),
+                tuple(s.text[:80] for s in player_model.get_relevant_statements(max_statements=3)),
+            )
+        conversation_key = None
+        if conversation_memory and conversation_memory.total_conversations > 10:
+            top_topics = sorted(conversation_memory.topic_counts.items(),
+                                key=lambda x: x[1], reverse=True)[:5]
+            conversation_key = (conversation_memory.total_conversations,
+                                tuple(t[0] for t in top_topics))
+        relationship = duck_memory.get_relationship_level() if duck_memory else None
+        return (player_key, conversation_key, relationship)
+
     def build_llm_personality_prompt(self, player_model, duck_memory, 
                                        conversation_memory, memory_context: str = "") -> str:
         """Build a personality/context prompt for the LLM."""
@@ -9,21 +9,32 @@ voice rules (max 3 sentences, no enthusiasm !, length bounds, etc).
 
 Gated by interaction count — only activates after 100+ interactions
 so new players get the hand-curated template experience first.
+
+Markov output is rejected often, so ``generate`` serves from a LinePool of
+lines that already passed the filter. The game tops the pool up in small
+time slices (``refill``) and it is saved next to the brain file.
 """
+import os
 import re
 import json
+import time
+import random
 import logging
 import threading
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 
-from config import SAVE_DIR
+from config import SAVE_DIR, VOICE_POOL_REFILL_BUDGET, VOICE_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
 # Brain file path
 BRAIN_PATH = SAVE_DIR / "cheese_voice.json"
 
+# Content words: what VoiceResponseSource hints with (>3 chars)
+_WORD_RE = re.compile(r"[a-z']+")
+
 # Minimum interactions before voice generator activates
 MIN_INTERACTIONS = 100
 
@@ -98,22 +109,109 @@ class SeamanStyleFilter:
         return text
 
 
+def content_words(text: str) -> Tuple[str, ...]:
+    """Lower-cased words longer than 3 chars, in order, without repeats."""
+    return tuple(dict.fromkeys(w for w in _WORD_RE.findall(text.lower()) if len(w) > 3))
+
+
+class LinePool:
+    """
+    Bounded pool of validated lines, indexed by content word.
+
+    ``take`` is a dict lookup and a set pop; the oldest line is evicted
+    when the pool is full. Lines are added on the main thread and taken
+    from the talk worker, so every operation holds the pool's lock.
+    """
+
+    def __init__(self, capacity: int = VOICE_POOL_SIZE):
+        self.capacity = capacity
+        self.dirty = False   # Changed since the last save
+        self._lines: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()   # Oldest first
+        self._index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._lines) >= self.capacity
+
+    def add(self, line: str) -> bool:
+        """Add a validated line; returns False for a duplicate."""
+        with self._lock:
+            if line in self._lines:
+                return False
+            if len(self._lines) >= self.capacity:
+                self._remove(next(iter(self._lines)))
+            words = content_words(line)
+            self._lines[line] = words
+            for word in words:
+                self._index.setdefault(word, set()).add(line)
+            self.dirty = True
+            return True
+
+    def take(self, hint: Optional[str] = None) -> Optional[str]:
+        """
+        Remove and return a line containing a content word of *hint*, or
+        the oldest line when no hint is given. None if nothing matches.
+        """
+        with self._lock:
+            line = None
+            if hint:
+                for word in content_words(hint):
+                    bucket = self._index.get(word)
+                    if bucket:
+                        line = next(iter(bucket))
+                        break
+            elif self._lines:
+                line = next(iter(self._lines))
+            if line is None:
+                return None
+            self._remove(line)
+            self.dirty = True
+            return line
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            return list(self._lines)
+
+    def _remove(self, line: str) -> None:
+        for word in self._lines.pop(line):
+            bucket = self._index[word]
+            bucket.discard(line)
+            if not bucket:
+                del self._index[word]
+
+
 class VoiceGenerator:
     """
     Generates novel dialogue lines in Cheese's voice using Markov chains.
     """
 
-    def __init__(self, brain_path: Path = BRAIN_PATH):
+    def __init__(self, brain_path: Path = BRAIN_PATH, pool_size: int = VOICE_POOL_SIZE):
         self._brain_path = brain_path
         self._brain_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool_path = brain_path.with_name(f"{brain_path.stem}_pool.json")
         self._model = None
         self._trained = False
         self._lock = threading.Lock()
+        self._pool = LinePool(pool_size)
+        # Hints the pool could not serve; refill tries to start lines with them
+        self._wanted_hints: deque = deque(maxlen=8)
+        # markovify draws from the global ``random``; refills run on this
+        # stream instead so a wall-clock budget never shifts the game's
+        # seeded sequence
+        self._refill_random_state = random.Random().getstate()
 
     @property
     def is_trained(self) -> bool:
         return self._trained
 
+    @property
+    def pool(self) -> LinePool:
+        return self._pool
+
     def train(self, corpus_lines: List[str]):
         """
         Train the Markov model on a corpus of Cheese dialogue lines.
@@ -170,15 +268,21 @@ class VoiceGenerator:
             self._model = markovify.NewlineText.from_json(model_json)
             self._trained = True
             logger.info("Voice generator loaded from disk")
-            return True
         except Exception as e:
             logger.debug(f"Could not load voice model: {e}")
             return False
+        self._load_pool()
+        return True
 
     def generate(self, hint: str = None, max_attempts: int = 20) -> Optional[str]:
         """
         Generate a novel line in Cheese's voice.
 
+        Served from the line pool when it has stock. A hint the pool has no
+        line for gets one short hint-started chain attempt before an
+        unrelated pooled line is used; the full chain only runs here when
+        the pool is empty.
+
         Args:
             hint: Optional seed word to try to work into the generation
             max_attempts: Number of generation attempts before giving up
@@ -189,26 +293,104 @@ class VoiceGenerator:
         if not self._trained or not self._model:
             return None
 
+        line = None
+        if hint:
+            line = self._pool.take(hint)
+            if line is None:
+                self._wanted_hints.append(hint)
+                line = self._make_line(hint, max_attempts=1, hint_only=True)
+        if line is None:
+            line = self._pool.take()
+        if line is not None:
+            return line
+        return self._make_line(hint, max_attempts)
+
+    def refill(self, budget: float = VOICE_POOL_REFILL_BUDGET) -> int:
+        """
+        Add validated lines to the pool for up to *budget* seconds.
+
+        Lines for recently missed hints are made first. Returns the number
+        of lines added.
+
+        The refill stream is swapped into the global ``random`` while the
+        generator lock is held, so a ``generate`` on another thread cannot
+        draw from it in between.
+        """
+        if not self._trained or not self._model:
+            return 0
+        deadline = time.perf_counter() + budget
+        added = 0
         with self._lock:
-            for _ in range(max_attempts):
-                try:
-                    # Generate a sentence
-                    if hint:
-                        raw = self._model.make_sentence_with_start(
-                            hint, strict=False, tries=5
-                        )
-                    else:
-                        raw = None
-
-                    if not raw:
-                        raw = self._model.make_sentence(tries=5)
-
-                    if raw:
-                        cleaned = SeamanStyleFilter.validate(raw)
-                        if cleaned:
-                            return cleaned
-                except Exception:
-                    continue
+            outer_state = random.getstate()
+            random.setstate(self._refill_random_state)
+            try:
+                while not self._pool.is_full and time.perf_counter() < deadline:
+                    hint = self._wanted_hints.popleft() if self._wanted_hints else None
+                    line = self._chain_line(hint, max_attempts=1)
+                    if line and self._pool.add(line):
+                        added += 1
+            finally:
+                self._refill_random_state = random.getstate()
+                random.setstate(outer_state)
+        return added
+
+    def save_pool(self) -> bool:
+        """Write the pool next to the brain file if it changed since the last save."""
+        if not self._pool.dirty:
+            return False
+        self._pool.dirty = False
+        try:
+            tmp = self._pool_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"lines": self._pool.lines()}))
+            os.replace(tmp, self._pool_path)
+            return True
+        except Exception as e:
+            self._pool.dirty = True
+            logger.debug(f"Could not save voice line pool: {e}")
+            return False
+
+    def _load_pool(self):
+        """Restore the saved pool; lines are re-checked against the current filter."""
+        if not self._pool_path.exists():
+            return
+        try:
+            lines = json.loads(self._pool_path.read_text()).get("lines", [])
+        except Exception as e:
+            logger.debug(f"Could not load voice line pool: {e}")
+            return
+        for line in lines:
+            if isinstance(line, str) and SeamanStyleFilter.validate(line) == line:
+                self._pool.add(line)
+        self._pool.dirty = False
+
+    def _make_line(self, hint: Optional[str], max_attempts: int,
+                   hint_only: bool = False) -> Optional[str]:
+        """Run the Markov chain until a line passes SeamanStyleFilter."""
+        with self._lock:
+            return self._chain_line(hint, max_attempts, hint_only)
+
+    def _chain_line(self, hint: Optional[str], max_attempts: int,
+                    hint_only: bool = False) -> Optional[str]:
+        """``_make_line`` body; the caller holds ``self._lock``."""
+        for _ in range(max_attempts):
+            try:
+                # Generate a sentence
+                if hint:
+                    raw = self._model.make_sentence_with_start(
+                        hint, strict=False, tries=5
+                    )
+                else:
+                    raw = None
+
+                if not raw and not hint_only:
+                    raw = self._model.make_sentence(tries=5)
+
+                if raw:
+                    cleaned = SeamanStyleFilter.validate(raw)
+                    if cleaned:
+                        return cleaned
+            except Exception:
+                continue
 
         return None
 
@@ -458,6 +458,31 @@ class DuckAnimator:
     # is_moving is defined as a property earlier in the class for
     # backward compatibility with DuckPosition's attribute-style access.
 
+    def seconds_until_next_change(self) -> Optional[float]:
+        """Return how long until ``update()`` can next change what is drawn.
+
+        Mirrors the timers in :meth:`update`: a walking duck changes on the
+        next step, an animatable state on its next frame flip (or expiry),
+        and an idle duck no earlier than the shortest wander delay.  Returns
+        ``None`` when the animator is frozen and nothing will change.
+        """
+        if self.frozen:
+            return None
+
+        if self._is_directed_movement or self.x != self.target_x or self.y != self.target_y:
+            step_interval = 0.10 + (1.0 - self.motivation) * 0.15
+            return max(0.0, step_interval - self._move_timer)
+
+        if self._state_str in self.ANIMATABLE_STATES:
+            wait = max(0.0, 0.25 - self._state_animation_timer)
+            if self._state_duration > 0:
+                expires_in = self._state_start_time + self._state_duration - time.time()
+                wait = min(wait, max(0.0, expires_in))
+            return wait
+
+        # Idle: wandering is rolled once the idle timer passes 1.5-4.0 s
+        return max(0.0, 1.5 - self._idle_timer)
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
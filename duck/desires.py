@@ -450,6 +450,9 @@ class DuckDesires:
         # Weighted random selection
         types = list(scores.keys())
         weights = [scores[t] for t in types]
+        if sum(weights) <= 0:
+            # Every trait at 0 (a fresh hatchling): no preference yet
+            return random.choice(types)
         return random.choices(types, weights=weights, k=1)[0]
 
     def _pick_need_goal(self, duck: "Duck", mood_key: str) -> GoalType:
@@ -47,6 +47,9 @@ class Duck:
         self._action_message = ""
         self._action_message_expire = 0.0  # Time when message expires
         self._action_end_time = 0.0  # Time when current_action should auto-clear
+        # Bumped by the methods that change saved state (update, interact...);
+        # lets autosave skip a duck that has not changed
+        self.save_revision = 0
         if self._personality_system is None:
             self._personality_system = Personality(self.personality)
         if self._memory is None:
@@ -173,6 +176,7 @@ class Duck:
             aging_modifiers: Optional aging stat modifiers from AgingSystem
             weather_modifiers: Optional weather need decay multipliers
         """
+        self.save_revision += 1
         # Get cascade modifiers from consequence engine
         from core.consequences import get_cascade_modifiers, SICKNESS_DECAY_MULTIPLIER
         cascade_mods = get_cascade_modifiers(self.needs)
@@ -195,6 +199,47 @@ class Duck:
         # Clear short-lived display/action states once their duration has passed.
         self._clear_expired_action()
 
+    def catch_up(self, delta_minutes: float, aging_modifiers: Optional[dict] = None,
+                 weather_modifiers: Optional[dict] = None, decay_multiplier: float = 1.0):
+        """
+        Advance the duck by a long stretch of time in one step.
+
+        Used for offline absences: needs are integrated in closed form
+        (``Needs.catch_up``) and growth may cross several stages, so the
+        result matches many small ``update`` calls at a fraction of the cost.
+        """
+        from core.consequences import (
+            CASCADE_RULES, CASCADE_THRESHOLD, SICKNESS_DECAY_MULTIPLIER,
+        )
+        self.save_revision += 1
+        sickness_mult = SICKNESS_DECAY_MULTIPLIER if self.is_sick else 1.0
+        self.needs.catch_up(
+            delta_minutes,
+            self.personality,
+            aging_modifiers,
+            cascade_rules=CASCADE_RULES,
+            cascade_threshold=CASCADE_THRESHOLD,
+            sickness_multiplier=sickness_mult,
+            weather_modifiers=weather_modifiers,
+            decay_multiplier=decay_multiplier,
+        )
+
+        remaining = delta_minutes
+        while remaining > 0:
+            stage_info = GROWTH_STAGES.get(self.growth_stage)
+            if not stage_info or stage_info["duration_hours"] is None:
+                break
+            stage_minutes = stage_info["duration_hours"] * 60
+            to_next = (1.0 - self.growth_progress) * stage_minutes
+            if remaining < to_next:
+                self._update_growth(remaining)
+                break
+            remaining -= to_next
+            self.growth_progress = 0.0
+            self.growth_stage = stage_info["next"]
+
+        self._clear_expired_action()
+
     def _update_growth(self, delta_minutes: float):
         """Update growth stage progress."""
         stage_info = GROWTH_STAGES.get(self.growth_stage)
@@ -233,6 +278,7 @@ class Duck:
         """
         # Apply need changes
         changes = self.needs.apply_interaction(interaction)
+        self.save_revision += 1
 
         # Sickness reduces interaction effectiveness by 50% (except feeding)
         if getattr(self, 'is_sick', False) and interaction != "feed":
@@ -341,6 +387,7 @@ class Duck:
 
     def clear_action(self):
         """Clear the current action."""
+        self.save_revision += 1
         self.current_action = None
         self.action_start_time = None
         self._action_end_time = 0.0
@@ -3,8 +3,14 @@ Needs system for the duck - hunger, energy, fun, cleanliness, social.
 
 Decay is linear above 30%, and accelerates exponentially below that
 threshold ("hunger spiral") so neglect has real teeth.
+
+``Needs.update`` steps that model forward one frame at a time. For long
+offline absences ``Needs.catch_up`` solves it in closed form instead: above
+the threshold a need falls linearly, below it the decay rate is linear in
+the value, so the value follows an exponential curve until it reaches 0.
 """
-from typing import Dict, Optional
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from config import (
@@ -18,6 +24,8 @@ from config import (
     INTERACTION_EFFECTS,
 )
 
+NEED_NAMES = ("hunger", "energy", "fun", "cleanliness", "social")
+
 
 @dataclass
 class Needs:
@@ -130,6 +138,145 @@ class Needs:
 
         self._clamp_all()
 
+    def _base_decay_rates(self, personality: Optional[dict] = None,
+                          aging_modifiers: Optional[dict] = None,
+                          sickness_multiplier: float = 1.0,
+                          weather_modifiers: Optional[Dict[str, float]] = None,
+                          decay_multiplier: float = 1.0) -> Dict[str, float]:
+        """Per-minute decay for each need, before cascade and acceleration."""
+        modifiers = self._get_personality_modifiers(personality or {})
+        age_mods = aging_modifiers or {}
+        weather = weather_modifiers or {}
+        rates = {}
+        for need in NEED_NAMES:
+            rate = (NEED_DECAY_RATES[need] * modifiers.get(need, 1.0)
+                    * sickness_multiplier * weather.get(need, 1.0) * decay_multiplier)
+            if need in ("hunger", "energy"):
+                rate *= age_mods.get(f"{need}_rate", 1.0)
+            rates[need] = rate
+        return rates
+
+    @staticmethod
+    def _decay_closed_form(value: float, rate: float, minutes: float) -> float:
+        """Exact value after *minutes* of accelerated decay at base *rate*."""
+        if minutes <= 0:
+            return value
+        if rate <= 0:
+            return max(NEED_MIN, min(NEED_MAX, value - rate * minutes))
+        threshold = NEED_DECAY_ACCEL_THRESHOLD
+        if value >= threshold:
+            linear_minutes = (value - threshold) / rate
+            if minutes <= linear_minutes:
+                return value - rate * minutes
+            minutes -= linear_minutes
+            value = threshold
+        if minutes >= Needs._minutes_to_reach(value, rate, NEED_MIN):
+            return NEED_MIN
+        if NEED_DECAY_ACCEL_FACTOR <= 0:
+            return value - rate * minutes
+        # dv/dt = -rate * (1 + F * (1 - v/T)): v drifts away from v* = T(1+F)/F
+        k = rate * NEED_DECAY_ACCEL_FACTOR / threshold
+        v_star = threshold * (1 + NEED_DECAY_ACCEL_FACTOR) / NEED_DECAY_ACCEL_FACTOR
+        return max(NEED_MIN, v_star + (value - v_star) * math.exp(k * minutes))
+
+    @staticmethod
+    def _minutes_to_reach(value: float, rate: float, target: float) -> float:
+        """Minutes of accelerated decay at base *rate* until *value* falls to *target*."""
+        if value <= target:
+            return 0.0
+        if rate <= 0:
+            return math.inf
+        threshold = NEED_DECAY_ACCEL_THRESHOLD
+        if target >= threshold:
+            return (value - target) / rate
+        minutes = 0.0
+        if value > threshold:
+            minutes = (value - threshold) / rate
+            value = threshold
+        if NEED_DECAY_ACCEL_FACTOR <= 0:
+            return minutes + (value - target) / rate
+        k = rate * NEED_DECAY_ACCEL_FACTOR / threshold
+        v_star = threshold * (1 + NEED_DECAY_ACCEL_FACTOR) / NEED_DECAY_ACCEL_FACTOR
+        return minutes + math.log((v_star - target) / (v_star - value)) / k
+
+    def catch_up(self, delta_minutes: float, personality: Optional[dict] = None,
+                 aging_modifiers: Optional[dict] = None,
+                 cascade_rules: Iterable[Tuple[str, str, float]] = (),
+                 cascade_threshold: float = 0.0,
+                 sickness_multiplier: float = 1.0,
+                 weather_modifiers: Optional[Dict[str, float]] = None,
+                 decay_multiplier: float = 1.0):
+        """
+        Apply *delta_minutes* of decay in one closed-form step.
+
+        Gives the result ``update`` converges to when called with ever smaller
+        steps, including the acceleration spiral and cascades, in constant
+        time however long the duck was alone.
+
+        Args:
+            cascade_rules: ``(source, target, multiplier)`` triples — *target*
+                decays *multiplier* times faster while *source* is below
+                *cascade_threshold*.
+            Other arguments are as for ``update``.
+        """
+        rates = self._base_decay_rates(personality, aging_modifiers, sickness_multiplier,
+                                       weather_modifiers, decay_multiplier)
+        rules = list(cascade_rules)
+        # Each need's decay as (duration, rate) segments; a cascade target
+        # switches rate when its source crosses the threshold.
+        segments: Dict[str, List[Tuple[float, float]]] = {}
+        pending = list(NEED_NAMES)
+        while pending:
+            progressed = False
+            for need in list(pending):
+                sources = [(src, mult) for src, tgt, mult in rules if tgt == need]
+                if any(src in pending for src, _ in sources):
+                    continue
+                boundaries = []
+                for src, mult in sources:
+                    start = self._segments_time_to(getattr(self, src), segments[src],
+                                                   cascade_threshold)
+                    boundaries.append((start, mult))
+                segments[need] = self._rate_segments(rates[need], delta_minutes, boundaries)
+                pending.remove(need)
+                progressed = True
+            if not progressed:
+                raise ValueError("cascade rules form a cycle")
+
+        for need in NEED_NAMES:
+            value = getattr(self, need)
+            for minutes, rate in segments[need]:
+                value = self._decay_closed_form(value, rate, minutes)
+            setattr(self, need, value)
+        self._clamp_all()
+
+    @staticmethod
+    def _rate_segments(rate: float, total: float,
+                       boundaries: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """Split *total* minutes at each ``(start, multiplier)`` boundary."""
+        points = sorted({0.0, total, *(min(total, start) for start, _ in boundaries)})
+        result = []
+        for begin, end in zip(points, points[1:]):
+            seg_rate = rate
+            for start, mult in boundaries:
+                if start <= begin:
+                    seg_rate *= mult
+            result.append((end - begin, seg_rate))
+        return result
+
+    @staticmethod
+    def _segments_time_to(value: float, segments: List[Tuple[float, float]],
+                          target: float) -> float:
+        """Minutes until a need following *segments* first drops below *target*."""
+        elapsed = 0.0
+        for minutes, rate in segments:
+            needed = Needs._minutes_to_reach(value, rate, target)
+            if needed <= minutes:
+                return elapsed + needed
+            value = Needs._decay_closed_form(value, rate, minutes)
+            elapsed += minutes
+        return math.inf
+
     def _get_personality_modifiers(self, personality: dict) -> dict:
         """
         Get need decay modifiers based on personality.
@@ -1,23 +1,129 @@
 """
 Logging configuration for Stupid Duck game.
 Captures errors, warnings, and debug information.
+
+Records are written as JSON lines (time, level, subsystem, frame number,
+source location, message, traceback) by a background thread: the game loop
+only formats the message and puts the record on a queue. Log files rotate by
+size, and the latest errors are kept in memory for ``get_latest_errors``.
 """
+import copy
+import json
 import logging
+import queue
 import sys
-from pathlib import Path
-from datetime import datetime
 import traceback
+from collections import deque
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+from config import LOG_BACKUP_COUNT, LOG_ERROR_RING_SIZE, LOG_MAX_BYTES, LOG_QUEUE_SIZE
+
+_plain_formatter = logging.Formatter()
+
+# Per-session files in the log directory, pruned to the newest few of each:
+# logs, memory telemetry, frame profiler dumps and soak-test reports
+_PRUNED_LOGS = ("game_*.log", "errors_*.log", "memory_*.json",
+                "frame_profile_*.json", "soak_*.json")
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "subsystem": getattr(record, "subsystem", record.module),
+            "frame": getattr(record, "frame", None),
+            "logger": record.name,
+            "where": f"{record.filename}:{record.lineno}",
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _current_frame():
+    frame_profiler = sys.modules.get("core.frame_profiler")
+    return frame_profiler.frame_profiler.frame_number if frame_profiler else None
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """
+    Queue handler that tags records with subsystem and frame, and drops
+    records instead of blocking when the writer falls behind.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message and traceback here, while args and the
+        # exception are still alive, and ship only plain data to the writer
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _plain_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        if not hasattr(record, "subsystem"):
+            record.subsystem = (record.module if record.name == "StupidDuck"
+                                else record.name.rpartition(".")[2])
+        if not hasattr(record, "frame"):
+            record.frame = _current_frame()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingListener(QueueListener):
+    """Queue listener whose stop() waits for room instead of failing when full."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _ErrorRingHandler(logging.Handler):
+    """Keeps the latest formatted errors in memory."""
+
+    def __init__(self, size: int):
+        super().__init__(logging.ERROR)
+        self.errors = deque(maxlen=size)
+        self.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d\n%(message)s\n'
+        ))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.errors.append(self.format(record))
+        except Exception:
+            self.handleError(record)
 
 
 class GameLogger:
     """Centralized logging system for the game."""
 
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", max_bytes: int = LOG_MAX_BYTES,
+                 backup_count: int = LOG_BACKUP_COUNT, queue_size: int = LOG_QUEUE_SIZE,
+                 console: bool = True):
         """
         Initialize the game logger.
 
         Args:
             log_dir: Directory to store log files
+            max_bytes: Size at which a log file is rotated
+            backup_count: Rotated files kept per log
+            queue_size: Records that may wait for the writer thread
+            console: Also echo warnings and above to stdout
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
@@ -33,34 +139,50 @@ class GameLogger:
         # Configure main logger
         self.logger = logging.getLogger("StupidDuck")
         self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
 
         # Remove existing handlers
         self.logger.handlers.clear()
 
+        # Writer-side handlers, run by the listener thread
+        json_formatter = JsonLineFormatter()
+
         # File handler - all messages
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        file_handler = RotatingFileHandler(self.log_file, maxBytes=max_bytes,
+                                           backupCount=backup_count, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        file_handler.setFormatter(json_formatter)
 
         # Error file handler - errors and critical only
-        error_handler = logging.FileHandler(self.error_log_file, encoding='utf-8')
+        error_handler = RotatingFileHandler(self.error_log_file, maxBytes=max_bytes,
+                                            backupCount=backup_count, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
-        error_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d\n%(message)s\n'
-        )
-        error_handler.setFormatter(error_formatter)
-        self.logger.addHandler(error_handler)
+        error_handler.setFormatter(json_formatter)
+
+        writer_handlers = [file_handler, error_handler]
 
         # Console handler - warnings and above
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.WARNING)
-        console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.WARNING)
+            console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+            writer_handlers.append(console_handler)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._queue_handler = _StructuredQueueHandler(self._queue)
+        self._listener = _DrainingListener(self._queue, *writer_handlers,
+                                          respect_handler_level=True)
+        self._listener.start()
+
+        # Caller-side handlers: enqueue, and remember recent errors
+        self._error_ring = _ErrorRingHandler(LOG_ERROR_RING_SIZE)
+        self.logger.addHandler(self._queue_handler)
+        self.logger.addHandler(self._error_ring)
+
+        # Module loggers (logging.getLogger(__name__)) share the pipeline
+        root = logging.getLogger()
+        root.addHandler(self._queue_handler)
+        root.addHandler(self._error_ring)
 
         self.logger.info("=" * 80)
         self.logger.info("Game logger initialized")
@@ -68,35 +190,35 @@ class GameLogger:
         self.logger.info(f"Error log file: {self.error_log_file}")
         self.logger.info("=" * 80)
 
-    def debug(self, message: str):
+    @staticmethod
+    def _extra(subsystem):
+        return {"subsystem": subsystem} if subsystem else None
+
+    def debug(self, message: str, *args, subsystem: str = None):
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, extra=self._extra(subsystem), stacklevel=2)
 
-    def info(self, message: str):
+    def info(self, message: str, *args, subsystem: str = None):
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args, extra=self._extra(subsystem), stacklevel=2)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args, subsystem: str = None):
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, extra=self._extra(subsystem), stacklevel=2)
 
-    def error(self, message: str, exc_info=None):
+    def error(self, message: str, *args, exc_info=None, subsystem: str = None):
         """Log error message with optional exception info."""
-        if exc_info:
-            self.logger.error(message, exc_info=True)
-        else:
-            self.logger.error(message)
+        self.logger.error(message, *args, exc_info=bool(exc_info),
+                          extra=self._extra(subsystem), stacklevel=2)
 
-    def critical(self, message: str, exc_info=None):
+    def critical(self, message: str, *args, exc_info=None, subsystem: str = None):
         """Log critical error with optional exception info."""
-        if exc_info:
-            self.logger.critical(message, exc_info=True)
-        else:
-            self.logger.critical(message)
+        self.logger.critical(message, *args, exc_info=bool(exc_info),
+                             extra=self._extra(subsystem), stacklevel=2)
 
-    def exception(self, message: str):
+    def exception(self, message: str, *args, subsystem: str = None):
         """Log exception with full traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args, extra=self._extra(subsystem), stacklevel=2)
 
     def log_exception(self, exc: Exception, context: str = ""):
         """
@@ -110,7 +232,17 @@ class GameLogger:
         error_msg += f"Exception: {type(exc).__name__}: {str(exc)}\n"
         error_msg += f"Traceback:\n{''.join(traceback.format_tb(exc.__traceback__))}"
 
-        self.logger.error(error_msg)
+        self.logger.error(error_msg, stacklevel=2)
+
+    @property
+    def dropped_records(self) -> int:
+        """Records discarded because the writer queue was full."""
+        return self._queue_handler.dropped
+
+    def flush(self):
+        """Block until the writer thread has written everything queued so far."""
+        self._listener.stop()
+        self._listener.start()
 
     def shutdown(self):
         """Close all handlers and shutdown logging."""
@@ -118,30 +250,37 @@ class GameLogger:
         self.logger.info("Game logger shutting down")
         self.logger.info("=" * 80)
 
-        for handler in self.logger.handlers[:]:
-            handler.close()
+        root = logging.getLogger()
+        for handler in (self._queue_handler, self._error_ring):
+            root.removeHandler(handler)
             self.logger.removeHandler(handler)
 
+        # Drains the queue before the writer thread exits
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+
     def _cleanup_old_logs(self, keep: int = 10):
-        """Remove old log files, keeping the most recent ones."""
+        """Remove old log files (and their rotations), keeping the most recent ones."""
         try:
-            for prefix in ("game_", "errors_"):
+            for pattern in _PRUNED_LOGS:
                 log_files = sorted(
-                    self.log_dir.glob(f"{prefix}*.log"),
+                    self.log_dir.glob(pattern),
                     key=lambda f: f.stat().st_mtime,
                     reverse=True
                 )
                 for old_file in log_files[keep:]:
-                    try:
-                        old_file.unlink()
-                    except OSError:
-                        pass
+                    for path in [old_file, *self.log_dir.glob(f"{old_file.name}.*")]:
+                        try:
+                            path.unlink()
+                        except OSError:
+                            pass
         except Exception:
             pass  # Don't fail startup over log cleanup
 
     def get_latest_errors(self, count: int = 10) -> list:
         """
-        Read the latest errors from the error log.
+        Return the latest errors logged this session, from memory.
 
         Args:
             count: Number of recent errors to retrieve
@@ -149,31 +288,8 @@ class GameLogger:
         Returns:
             List of error messages
         """
-        try:
-            if not self.error_log_file.exists():
-                return []
-
-            with open(self.error_log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Group lines into error blocks (separated by blank lines)
-            errors = []
-            current_error = []
-
-            for line in lines:
-                if line.strip():
-                    current_error.append(line)
-                elif current_error:
-                    errors.append(''.join(current_error))
-                    current_error = []
-
-            if current_error:
-                errors.append(''.join(current_error))
-
-            return errors[-count:]
-        except Exception as e:
-            self.logger.error(f"Failed to read error log: {e}")
-            return []
+        errors = list(self._error_ring.errors)
+        return errors[-count:] if count > 0 else []
 
 
 # Global logger instance
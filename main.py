@@ -18,6 +18,17 @@ GAME_DIR = os.path.dirname(os.path.abspath(__file__))
 # Add the game directory to path for imports
 sys.path.insert(0, GAME_DIR)
 
+# Time every import from here on for the startup report in the debug menu
+from core.lazy import import_timer
+import_timer.install()
+
+# Trace allocations from startup when configured, so the memory telemetry
+# baseline covers everything loaded afterwards
+from config import MEMORY_TRACEMALLOC
+if MEMORY_TRACEMALLOC:
+    from core.memory_telemetry import memory_telemetry
+    memory_telemetry.start_tracing()
+
 
 def _ensure_venv():
     """Re-execute with venv python if not already using it.
@@ -178,10 +189,11 @@ def check_dependencies():
     missing_required = []
     missing_optional = []
 
+    # Only locate the packages: importing llama_cpp or markovify here would
+    # load them before the title screen even when they are never used.
+    import importlib.util
     for mod_name, pip_name, required in _PACKAGES:
-        try:
-            importlib.import_module(mod_name)
-        except ImportError:
+        if importlib.util.find_spec(mod_name) is None:
             if required:
                 missing_required.append((mod_name, pip_name))
             else:
@@ -1,21 +1,18 @@
 #!/bin/bash
-# Find and monitor the Stupid Duck game process
+# Follow the running game's in-process memory telemetry
 
-echo "Looking for Stupid Duck game process..."
-PID=$(ps aux | grep "[p]ython.*main.py" | grep -v grep | awk '{print $2}' | head -1)
+cd "$(dirname "$0")"
 
-if [ -z "$PID" ]; then
-    echo "Error: Game is not running!"
+if ! ls logs/memory_*.json >/dev/null 2>&1; then
+    echo "Error: No memory telemetry yet!"
     echo ""
     echo "Please start the game first with: python main.py"
-    echo "Then run this script again."
+    echo "It writes logs/memory_<timestamp>.json about once a minute."
     exit 1
 fi
 
-echo "Found game process: PID $PID"
-echo ""
-echo "Starting 5-minute memory monitor..."
+echo "Reprinting the memory report every 60 seconds (Ctrl+C to stop)..."
 echo "Play the game normally - open menus, interact, explore, etc."
 echo ""
 
-python3 monitor_memory.py "$PID" 5 10
+python3 monitor_memory.py --watch 60
@@ -80,6 +80,17 @@ class MockEventBus:
 
 # ── Fixtures ─────────────────────────────────────────────────────────────────
 
+@pytest.fixture(autouse=True, scope="session")
+def _game_logger_in_tmp(tmp_path_factory):
+    """Route the global game logger to a temp dir instead of the repo's logs/."""
+    import game_logger
+
+    game_logger._game_logger = game_logger.GameLogger(
+        log_dir=str(tmp_path_factory.mktemp("logs")), console=False)
+    yield
+    game_logger.shutdown_logger()
+
+
 @pytest.fixture
 def duck_store() -> DuckStore:
     """A fresh DuckStore with default state (needs at 50, trust at 20)."""
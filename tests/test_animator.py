@@ -74,3 +74,16 @@ def test_animation_frame():
     assert d.get_animation_frame() == 0
     d._animation_frame = 2
     assert d.get_animation_frame() == 2
+
+
+def test_seconds_until_next_change_idle_and_walking():
+    d = DuckAnimator(x=5, y=5, play_width=20, play_height=10)
+    assert d.seconds_until_next_change() == 1.5
+    d.move_to(10, 5)
+    assert d.seconds_until_next_change() <= 0.25
+
+
+def test_seconds_until_next_change_frozen():
+    d = DuckAnimator(x=5, y=5, play_width=20, play_height=10)
+    d.frozen = True
+    assert d.seconds_until_next_change() is None
@@ -0,0 +1,141 @@
+"""Tests for audio.asset_cache — decoded sound LRU cache and streamed tracks."""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.asset_cache import AudioAssetCache, StreamedTrack, estimate_decoded_bytes
+
+
+def _asset(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(b"\0" * size)
+    return path
+
+
+def _cache(budget, loads):
+    def loader(path):
+        loads.append(path.name)
+        return {"name": path.name, "size": path.stat().st_size}
+    return AudioAssetCache(budget, loader=loader, size_of=lambda sound: sound["size"])
+
+
+def test_repeat_plays_decode_once(tmp_path):
+    loads = []
+    cache = _cache(1000, loads)
+    quack = _asset(tmp_path, "quack.wav", 100)
+    assert cache.get(quack) is cache.get(quack)
+    assert loads == ["quack.wav"]
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    loads = []
+    cache = _cache(250, loads)
+    a, b, c = (_asset(tmp_path, f"{n}.wav", 100) for n in "abc")
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)  # b is now the oldest
+    cache.get(c)
+    assert cache.contains(a) and cache.contains(c) and not cache.contains(b)
+    stats = cache.get_stats()
+    assert stats["bytes"] == 200 and stats["evictions"] == 1
+
+
+def test_changed_file_is_decoded_again(tmp_path):
+    loads = []
+    cache = _cache(1000, loads)
+    quack = _asset(tmp_path, "quack.wav", 100)
+    first = cache.get(quack)
+    quack.write_bytes(b"\0" * 120)
+    os.utime(quack, ns=(quack.stat().st_atime_ns, quack.stat().st_mtime_ns + 10**9))
+    second = cache.get(quack)
+    assert second is not first and second["size"] == 120
+    assert cache.get_stats()["bytes"] == 120
+
+
+def test_oversized_asset_is_not_cached(tmp_path):
+    loads = []
+    cache = _cache(100, loads)
+    small = _asset(tmp_path, "small.wav", 50)
+    cache.get(small)
+    big = _asset(tmp_path, "big.wav", 500)
+    assert cache.get(big)["size"] == 500
+    assert not cache.contains(big) and cache.contains(small)
+
+
+def test_prewarm_fills_budget_without_evicting(tmp_path):
+    loads = []
+    cache = _cache(250, loads)
+    paths = [_asset(tmp_path, f"{n}.wav", 100) for n in "abc"]
+    assert cache.prewarm(paths) == 2
+    assert loads == ["a.wav", "b.wav"]
+    assert cache.prewarm(paths) == 0  # already warm, c still doesn't fit
+
+    thread = _cache(1000, loads).start_prewarm(paths)
+    thread.join(2.0)
+    assert not thread.is_alive()
+
+
+def test_compressed_tracks_are_estimated_larger(tmp_path):
+    assert estimate_decoded_bytes(_asset(tmp_path, "song.ogg", 100)) == 1000
+    assert estimate_decoded_bytes(_asset(tmp_path, "song.wav", 100)) == 100
+    assert estimate_decoded_bytes(tmp_path / "missing.mp3") == 0
+
+
+class _Music:
+    def __init__(self):
+        self.loaded, self.volume, self.playing = None, None, False
+
+    def load(self, path):
+        self.loaded = path
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+    def play(self, loops=0):
+        self.playing = True
+
+    def get_busy(self):
+        return self.playing
+
+    def stop(self):
+        self.playing = False
+
+
+def test_streamed_track_drives_mixer_music(monkeypatch, tmp_path):
+    music = _Music()
+    monkeypatch.setattr(StreamedTrack, "_music", staticmethod(lambda: music))
+    first = StreamedTrack(tmp_path / "main.mp3")
+    first.set_volume(0)
+    assert first.play() is first
+    first.set_volume(0.15)
+    assert music.volume == 0.15 and first.get_busy()
+
+    second = StreamedTrack(tmp_path / "other.mp3").play()
+    first.stop()  # replaced: must not stop the new stream
+    assert second.get_busy() and not first.get_busy()
+    second.stop()
+    assert not music.playing
+
+
+def test_background_music_goes_through_streamed_track(monkeypatch, tmp_path):
+    from audio.sound import SoundEngine
+
+    music = _Music()
+    monkeypatch.setattr(StreamedTrack, "_music", staticmethod(lambda: music))
+    monkeypatch.setattr(StreamedTrack, "_active", None)
+    engine = SoundEngine()
+    engine._pygame_available = True
+    engine._available_music = {"main": _asset(tmp_path, "main.mp3", 10)}
+    monkeypatch.setattr(engine, "is_radio_playing", lambda: False)
+
+    crossfaded = StreamedTrack(tmp_path / "day.mp3").play()
+    engine.play_background_music("main")
+    # The crossfade sees its stream replaced instead of the loop's busy state
+    assert music.loaded.endswith("main.mp3") and not crossfaded.get_busy()
+    engine.set_music_volume(0.3)
+    assert music.volume == 0.3
+
+    engine.stop_background_music()
+    assert not music.playing and StreamedTrack._active is None
@@ -209,6 +209,43 @@ class TestPhraseMatching:
         assert cf.classify("something about ethnic cleansing is bad").is_blocked
 
 
+# -- Compiled matcher ---------------------------------------------------------
+
+class TestCompiledMatcher:
+    def test_overlapping_phrases_both_match(self):
+        cf = _cf()
+        result = cf.classify("getting high on pond water")
+        assert "getting high" in result.matched_terms
+        assert "high on" in result.matched_terms
+
+    def test_phrase_needs_whole_words(self):
+        cf = _cf()
+        assert cf.is_safe_to_learn("my thigh only hurts a little")
+
+    def test_phrase_words_separated_by_punctuation_do_not_match(self):
+        cf = _cf()
+        assert "high on" not in cf.classify("high, on").matched_terms
+
+    def test_phrases_listed_before_words(self):
+        cf = _cf()
+        result = cf.classify("damn, hail satan")
+        assert result.matched_terms == ["hail satan", "damn"]
+        assert result.categories == [FilterCategory.ANTI_CHRISTIAN, FilterCategory.PROFANITY]
+
+    def test_safe_results_are_cached(self):
+        cf = _cf()
+        assert cf.is_safe_to_learn("bread is delicious")
+        assert "bread is delicious" in cf._safe_cache
+        first = cf.classify("bread is delicious")
+        first.matched_terms.append("mutated")
+        assert cf.classify("bread is delicious").matched_terms == []
+
+    def test_blocked_results_are_not_cached(self):
+        cf = _cf()
+        assert not cf.is_safe_to_learn("this is bullshit")
+        assert "this is bullshit" not in cf._safe_cache
+
+
 # -- Singleton ----------------------------------------------------------------
 
 class TestSingleton:
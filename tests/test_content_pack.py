@@ -0,0 +1,114 @@
+"""Tests for core.content_pack — compiled, memory-mapped content tables."""
+import importlib
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core import content_pack as cp
+from core.content_pack import (CONTENT_PACKS, ContentPack, ContentPackError, PackMapping,
+                               PackRecord, PackSequence, build_pack, to_python)
+
+
+class Mood(Enum):
+    HAPPY = "happy"
+    GRUMPY = "grumpy"
+
+
+@dataclass
+class Line:
+    text: str
+    weight: float = 1.0
+    mood: Optional[Mood] = None
+    tags: List[str] = field(default_factory=list)
+
+
+TABLE = {
+    "greetings": [Line("Quack.", tags=["short"]), Line("Hello, friend 🦆", 0.5, Mood.HAPPY)],
+    "times": ("dawn", "dusk"),
+    "counts": {"bread": 3, "debt": -2**40, "ratio": 0.25, "none": None, "flag": True},
+    "by_mood": {Mood.GRUMPY: ["Hmph."], 7: "seven"},
+}
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = tmp_path / "fixture.pack"
+    build_pack({"TABLE": TABLE}, path)
+    pack = ContentPack(path)
+    yield pack
+    pack.close()
+
+
+def test_round_trip_matches_source(pack):
+    assert to_python(pack.table("TABLE")) == TABLE
+    assert pack.table_names() == ["TABLE"]
+
+
+def test_views_decode_lazily_and_are_read_only(pack):
+    table = pack.table("TABLE")
+    assert isinstance(table, PackMapping) and list(table) == list(TABLE)
+    greetings = table["greetings"]
+    assert isinstance(greetings, PackSequence) and len(greetings) == 2
+    line = greetings[-1]
+    assert isinstance(line, PackRecord)
+    assert (line.text, line.weight, line.mood) == ("Hello, friend 🦆", 0.5, Mood.HAPPY)
+    assert "short" in greetings[0].tags and greetings[:1][0].text == "Quack."
+    assert table["times"] == ("dawn", "dusk")
+    assert table["by_mood"][Mood.GRUMPY] == ["Hmph."] and table["by_mood"][7] == "seven"
+    assert "missing" not in table and table.get("missing") is None
+    with pytest.raises(AttributeError):
+        line.text = "changed"
+    with pytest.raises(AttributeError):
+        line.nonexistent
+    # Identical strings share one pool entry and one decoded object
+    assert greetings[0].text is pack.table("TABLE")["greetings"][0].text
+
+
+def test_bad_files_are_rejected(tmp_path):
+    bogus = tmp_path / "bogus.pack"
+    bogus.write_bytes(b"NOPE" + bytes(60))
+    with pytest.raises(ContentPackError):
+        ContentPack(bogus)
+
+
+@pytest.mark.parametrize("name", sorted(CONTENT_PACKS))
+def test_game_tables_round_trip(tmp_path, name):
+    module_name, tables = CONTENT_PACKS[name]
+    module = importlib.import_module(module_name)
+    path = tmp_path / f"{name}.pack"
+    build_pack({table: getattr(module, table) for table in tables}, path,
+               {module_name: cp.source_path(module_name)})
+    pack = ContentPack(path)
+    try:
+        assert pack.is_fresh()
+        for table in tables:
+            assert to_python(pack.table(table)) == getattr(module, table)
+    finally:
+        pack.close()
+
+
+def test_content_table_uses_fresh_pack_and_falls_back_when_stale(tmp_path, monkeypatch):
+    source = tmp_path / "pack_fixture_data.py"
+    source.write_text("LINES = {'a': ['one', 'two']}\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cp, "GAME_DIR", tmp_path)
+    monkeypatch.setattr(cp, "CONTENT_PACK_DIR", tmp_path / "packs")
+    monkeypatch.setattr(cp, "CONTENT_PACKS", {"fixture": ("pack_fixture_data", ("LINES",))})
+    monkeypatch.setattr(cp, "_packs", {})
+    try:
+        cp.build_content_packs()
+        del sys.modules["pack_fixture_data"]  # imported by the build
+        lines = cp.content_table("pack_fixture_data", "LINES")
+        assert isinstance(lines, PackMapping) and list(lines["a"]) == ["one", "two"]
+        assert "pack_fixture_data" not in sys.modules
+
+        source.write_text("LINES = {'a': ['one', 'two', 'three']}\n")
+        monkeypatch.setattr(cp, "_packs", {})
+        assert cp.content_table("pack_fixture_data", "LINES") == {"a": ["one", "two", "three"]}
+    finally:
+        sys.modules.pop("pack_fixture_data", None)
@@ -0,0 +1,94 @@
+"""Tests for core.dialogue_context — event-invalidated chat context sections."""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.dialogue_context import SECTIONS, ContextSection, ChatContext, trim_to_budget
+from core.event_bus import EventBus, NeedChangedEvent, WeatherChangedEvent
+
+
+def _context(game, **kwargs):
+    calls = {"needs": 0, "weather": 0}
+
+    def needs(g):
+        calls["needs"] += 1
+        yield f"Hunger: {g.hunger}"
+
+    def weather(g):
+        calls["weather"] += 1
+        yield f"Weather: {g.weather}"
+
+    sections = (
+        ContextSection("needs", (needs,), (NeedChangedEvent,), max_age=30.0),
+        ContextSection("weather", (weather,), (WeatherChangedEvent,), max_age=300.0),
+    )
+    return ChatContext(sections, **kwargs), calls
+
+
+def test_sections_rerender_only_on_their_events_or_age():
+    game = SimpleNamespace(hunger=80, weather="sunny")
+    bus = EventBus()
+    context, calls = _context(game)
+    context.attach(bus)
+    assert context.refresh(game, now=0.0).text == "Hunger: 80\nWeather: sunny"
+
+    game.hunger, game.weather = 40, "rainy"
+    assert context.refresh(game, now=1.0).text == "Hunger: 80\nWeather: sunny"   # cached
+    bus.emit(NeedChangedEvent(need="hunger", old_value=80, new_value=40))
+    assert context.refresh(game, now=2.0).text == "Hunger: 40\nWeather: sunny"
+    assert calls == {"needs": 2, "weather": 1}
+
+    context.refresh(game, now=33.0)                       # needs aged out
+    assert calls == {"needs": 3, "weather": 1}
+    bus.emit(WeatherChangedEvent(old_weather="sunny", new_weather="rainy"))
+    assert context.refresh(game, now=34.0).text == "Hunger: 40\nWeather: rainy"
+
+    context.detach()
+    assert bus.memory_stats()["subscribers"] == 0
+    bus.emit(NeedChangedEvent())
+    context.refresh(game, now=35.0)
+    assert calls["needs"] == 3
+
+
+def test_snapshot_is_immutable_and_reads_no_game_state():
+    game = SimpleNamespace(hunger=80, weather="sunny")
+    context, calls = _context(game)
+    assert context.snapshot().text == ""
+    published = context.refresh(game, now=0.0)
+    game.hunger = 10
+    context.invalidate()
+    assert published.text == "Hunger: 80\nWeather: sunny"
+    assert context.snapshot() is published and calls["needs"] == 1
+    assert context.refresh(game, now=1.0) is not published
+
+
+def test_failing_parts_are_isolated_and_budget_trims_from_the_end():
+    def broken(game):
+        yield "partial line"
+        raise RuntimeError("subsystem not ready")
+
+    def filler(game):
+        yield "x" * 30
+        yield "y" * 30
+
+    context = ChatContext((ContextSection("a", (broken, filler)),), token_budget=10)
+    snapshot = context.refresh(SimpleNamespace(), now=0.0)
+    assert snapshot.lines == ("x" * 30,)
+    assert snapshot.tokens <= 10
+    assert trim_to_budget(["abc", "def"], token_budget=1) == ("abc",)
+
+
+def test_game_sections_render_with_missing_subsystems():
+    duck = SimpleNamespace(memory=SimpleNamespace(get_favorite=lambda category: "bread" if category == "food" else None,
+                                                  get_relationship_level=lambda: "friend"))
+    names = {name: None for name in ("exploration", "day_night", "atmosphere", "extended_personality",
+                                     "aging", "friends", "tricks", "titles", "outfits", "progression",
+                                     "prestige", "habitat", "inventory", "garden", "fishing", "crafting",
+                                     "building", "quests", "challenges", "festivals", "fortune",
+                                     "achievements", "badges", "collectibles", "secrets", "treasure",
+                                     "dreams", "diary", "diary_manager", "duck_brain")}
+    game = SimpleNamespace(duck=duck, **names)
+    text = ChatContext(SECTIONS).refresh(game, now=0.0).text
+    assert text.startswith("Current location: Home Pond (your habitat)")
+    assert "Favorite food: bread" in text and "Relationship with player: friend" in text
@@ -0,0 +1,134 @@
+"""Tests for the bucketed random-event index in world.events."""
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from world import events as ev
+from world.events import (EVENTS, SIMPLE_GROWTH_STAGES, Event, EventSystem, EventType,
+                          RANDOM_EVENT_TYPES)
+
+
+class _Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ev, "time", clock)
+    return clock
+
+
+def _period(monkeypatch, period):
+    monkeypatch.setattr(ev, "_get_current_time_period", lambda: period)
+
+
+def _brute_force(system, duck, period):
+    """The per-event filter check_random_events used to run."""
+    now = ev.time.time()
+    stage = SIMPLE_GROWTH_STAGES.index(duck.growth_stage) \
+        if duck.growth_stage in SIMPLE_GROWTH_STAGES else 0
+    eligible = []
+    for event_id, event in EVENTS.items():
+        if event.event_type not in RANDOM_EVENT_TYPES or event.probability <= 0:
+            continue
+        if now - system._last_event_times.get(event_id, 0) < event.cooldown:
+            continue
+        if event.weather_group and not system._weather_group_matches(event.weather_group):
+            continue
+        if event.required_time and period not in event.required_time:
+            continue
+        if event.requires_stage and stage < SIMPLE_GROWTH_STAGES.index(event.requires_stage):
+            continue
+        eligible.append(event_id)
+    return eligible
+
+
+@pytest.mark.parametrize("period,weather,stage", [
+    ("dawn", "sunny", "egg"),
+    ("night", "rainy", "teen"),
+    ("midday", None, "adult"),
+    ("late_night", "blizzard", "hatchling"),
+])
+def test_index_matches_brute_force_filter(monkeypatch, clock, period, weather, stage):
+    _period(monkeypatch, period)
+    system = EventSystem()
+    system.set_current_weather(weather)
+    duck = SimpleNamespace(growth_stage=stage)
+    for event_id in list(EVENTS)[::37]:
+        system._mark_fired(event_id, clock.now - 100)
+    assert system.get_eligible_events(duck) == _brute_force(system, duck, period)
+
+
+def _table(monkeypatch, **probabilities):
+    table = {
+        event_id: Event(id=event_id, name=event_id, description="",
+                        event_type=EventType.RANDOM, probability=p, effects={},
+                        mood_change=0, message="", duck_reaction="", cooldown=300)
+        for event_id, p in probabilities.items()
+    }
+    monkeypatch.setattr(ev, "EVENTS", table)
+    return table
+
+
+def test_single_draw_matches_independent_rolls(monkeypatch, clock):
+    _table(monkeypatch, a=0.1, b=0.3)
+    random.seed(5)
+    system = EventSystem()
+    duck = SimpleNamespace(growth_stage="adult")
+    fired = []
+    for _ in range(20_000):
+        clock.now += 1_000  # past both the global gap and every cooldown
+        event = system.check_random_events(duck)
+        if event:
+            fired.append(event.id)
+    # P(any) = 1 - 0.9 * 0.7, split 1:3 between a and b
+    assert len(fired) / 20_000 == pytest.approx(0.37, abs=0.015)
+    assert fired.count("a") / len(fired) == pytest.approx(0.25, abs=0.02)
+
+
+def test_cooling_events_are_skipped_until_ready(monkeypatch, clock):
+    _table(monkeypatch, a=1.0, b=1.0, c=1.0)
+    system = EventSystem()
+    duck = SimpleNamespace(growth_stage="adult")
+    seen = []
+    for _ in range(3):
+        clock.now += ev.GLOBAL_EVENT_MIN_GAP
+        seen.append(system.check_random_events(duck).id)
+    assert sorted(seen) == ["a", "b", "c"]
+    # Every event is cooling: 3 * 120s gaps < 300s cooldown for the first
+    clock.now += ev.GLOBAL_EVENT_MIN_GAP
+    assert system.check_random_events(duck) is not None  # first one is ready again
+    assert system.get_eligible_events(duck) == []
+
+
+def test_season_reset_and_save_restore_cooldowns(monkeypatch, clock):
+    _table(monkeypatch, a=1.0)
+    system = EventSystem()
+    duck = SimpleNamespace(growth_stage="adult")
+    clock.now += ev.GLOBAL_EVENT_MIN_GAP
+    assert system.check_random_events(duck).id == "a"
+    assert system.get_eligible_events(duck) == []
+
+    restored = EventSystem.from_dict(system.to_dict())
+    assert restored.get_eligible_events(duck) == []
+
+    restored.reset_cooldowns(["a"])
+    assert restored.get_eligible_events(duck) == ["a"]
+
+
+def test_encounter_events_wait_for_active_encounter(monkeypatch, clock):
+    table = _table(monkeypatch, sneaky=1.0, calm=0.5)
+    encounter_id = next(iter(ev.ENCOUNTERS))
+    table["sneaky"].encounter_id = encounter_id
+    system = EventSystem()
+    system.start_encounter(encounter_id)
+    assert system.get_eligible_events(SimpleNamespace(growth_stage="adult")) == ["calm"]
@@ -0,0 +1,51 @@
+"""Tests for core.frame_pacer — event-driven loop timeouts."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core.frame_pacer import FramePacer
+
+
+def test_idle_blocks_until_max_wait():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    timeout = pacer.compute_timeout(100.0, 100.0, [None])
+    assert timeout == pytest.approx(0.5)
+
+
+def test_earliest_deadline_wins():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    timeout = pacer.compute_timeout(100.0, 100.0, [100.3, 100.2, None])
+    assert timeout == pytest.approx(0.2)
+
+
+def test_never_faster_than_frame_rate():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    timeout = pacer.compute_timeout(100.0, 100.0, [100.0])
+    assert timeout == pytest.approx(1.0 / 60)
+
+
+def test_overdue_deadline_does_not_block():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    timeout = pacer.compute_timeout(100.0, 100.05, [99.0])
+    assert timeout == 0.0
+
+
+def test_input_keeps_full_frame_rate():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    pacer.note_input(now=100.0)
+    timeout = pacer.compute_timeout(100.5, 100.5, [None])
+    assert timeout == pytest.approx(1.0 / 60)
+    # Once the linger window passes, idle waits resume
+    timeout = pacer.compute_timeout(101.5, 101.5, [None])
+    assert timeout == pytest.approx(0.5)
+
+
+def test_stats_count_idle_frames():
+    pacer = FramePacer(fps=60, idle_max_wait=0.5, input_linger=1.0)
+    pacer.compute_timeout(100.0, 100.0, [None])
+    pacer.compute_timeout(101.0, 101.0, [101.0])
+    stats = pacer.get_stats()
+    assert stats["frames"] == 2
+    assert stats["idle_frames"] == 1
@@ -0,0 +1,98 @@
+"""Tests for core.frame_profiler — per-section frame timings."""
+import json
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core import frame_profiler as fp_module
+from core.frame_profiler import FrameProfiler, RollingSeries, frame_profiler
+from core.update_scheduler import UpdateScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(fp_module, "_perf_counter", clock)
+    return clock
+
+
+def test_rolling_percentiles_use_the_window():
+    series = RollingSeries(window=100)
+    for value in range(1, 201):
+        series.add(float(value))
+    # Only 101..200 remain in the window; lifetime max and count still cover all
+    assert series.percentiles(50, 95, 99) == [150.0, 195.0, 199.0]
+    assert series.count == 200 and series.worst == 200.0
+    assert RollingSeries(5).percentiles(50) == [0.0]
+
+
+def test_sections_sum_per_frame_and_slow_frames_keep_breakdown(clock):
+    profiler = FrameProfiler(budget_ms=16.0)
+    for cost in (0.004, 0.030):
+        profiler.begin_frame()
+        with profiler.section("input"):
+            clock.now += 0.001
+        laps = profiler.laps("update")
+        clock.now += cost
+        laps.mark("tick")
+        for _ in range(2):
+            with profiler.section("render.playfield"):
+                clock.now += 0.002
+        profiler.add_bytes(512)
+        profiler.end_frame()
+
+    assert profiler.sections["render.playfield"].samples[-1] == pytest.approx(0.004)
+    assert profiler.frames.count == 2 and profiler.over_budget == 1
+    slow = profiler.slow_frames[-1]
+    assert slow["frame"] == 2 and slow["bytes"] == 512
+    assert list(slow["sections"])[0] == "update.tick"
+    assert slow["sections"]["update.tick"] == pytest.approx(30.0)
+
+
+def test_disabled_profiler_records_nothing(clock):
+    profiler = FrameProfiler()
+    profiler.enabled = False
+    profiler.begin_frame()
+    with profiler.section("input"):
+        clock.now += 1.0
+    profiler.laps("update").mark("tick")
+    profiler.end_frame()
+    assert profiler.sections == {} and profiler.frames.count == 0
+
+
+def test_json_dump_and_overlay(tmp_path, clock):
+    profiler = FrameProfiler(budget_ms=1.0)
+    profiler.begin_frame()
+    with profiler.section("render.side_panel"):
+        clock.now += 0.005
+    profiler.end_frame()
+
+    data = json.loads(profiler.dump_json(tmp_path / "profile.json").read_text())
+    assert data["budget_ms"] == 1.0
+    assert data["frames"]["over_budget"] == 1
+    assert data["sections"]["render.side_panel"]["p99"] == pytest.approx(5.0)
+    lines = profiler.overlay_lines()
+    assert any(line.startswith("render.side_panel") for line in lines)
+    assert lines[-1].startswith("last slow #1")
+
+
+def test_scheduler_callbacks_are_profiled():
+    frame_profiler.reset()
+    scheduler = UpdateScheduler()
+    scheduler.register("autosave", lambda: None, interval=60.0)
+    frame_profiler.begin_frame()
+    scheduler.update(time.time() + 120.0)
+    frame_profiler.end_frame()
+    assert frame_profiler.sections["scheduler.autosave"].count == 1
+    frame_profiler.reset()
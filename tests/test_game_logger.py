@@ -0,0 +1,97 @@
+"""Tests for game_logger — queued JSON-lines logging."""
+import json
+import logging
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from game_logger import GameLogger
+
+
+@pytest.fixture
+def game_logger(tmp_path):
+    logger = GameLogger(log_dir=str(tmp_path), console=False)
+    yield logger
+    if logger._listener._thread is not None:
+        logger.shutdown()
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_json_lines_with_subsystem_and_frame(game_logger):
+    from core.frame_profiler import frame_profiler
+    frame_profiler.begin_frame()
+    game_logger.info("Saved %d slots", 3, subsystem="save")
+    try:
+        raise ValueError("bad bread")
+    except ValueError:
+        game_logger.error("Handler failed", exc_info=True)
+    logging.getLogger("dialogue.llm_chat").warning("worker slow")
+    game_logger.shutdown()
+
+    records = _records(game_logger.log_file)
+    saved = next(r for r in records if r["message"] == "Saved 3 slots")
+    assert saved["subsystem"] == "save" and saved["level"] == "INFO"
+    assert saved["frame"] == frame_profiler.frame_number
+    assert saved["where"].startswith("test_game_logger.py:")
+    failed = next(r for r in records if r["message"] == "Handler failed")
+    assert "ValueError: bad bread" in failed["exc"]
+    worker = next(r for r in records if r["message"] == "worker slow")
+    assert worker["subsystem"] == "llm_chat" and worker["logger"] == "dialogue.llm_chat"
+    assert [r["message"] for r in _records(game_logger.error_log_file)] == ["Handler failed"]
+
+
+def test_caller_thread_only_enqueues(game_logger):
+    handlers = game_logger.logger.handlers
+    assert not any(isinstance(h, logging.FileHandler) for h in handlers)
+    assert game_logger._listener._thread.is_alive()
+
+
+def test_latest_errors_come_from_memory(game_logger):
+    for n in range(3):
+        game_logger.error(f"error {n}")
+    game_logger.shutdown()
+    game_logger.error_log_file.unlink()
+    latest = game_logger.get_latest_errors(2)
+    assert len(latest) == 2
+    assert "error 1" in latest[0] and "error 2" in latest[1]
+
+
+def test_logs_rotate_by_size(tmp_path):
+    logger = GameLogger(log_dir=str(tmp_path), max_bytes=2000, backup_count=2, console=False)
+    for n in range(100):
+        logger.debug(f"line {n:03d} " + "x" * 40)
+    logger.shutdown()
+    rotated = sorted(p.name for p in tmp_path.glob(logger.log_file.name + ".*"))
+    assert rotated == [logger.log_file.name + ".1", logger.log_file.name + ".2"]
+    assert logger.log_file.stat().st_size <= 2000
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    logger = GameLogger(log_dir=str(tmp_path), queue_size=1, console=False)
+    logger._listener.stop()  # writer paused: the queue fills up
+    for n in range(5):
+        logger.info(f"burst {n}")
+    assert logger.dropped_records >= 4
+    logger._listener.start()
+    logger.shutdown()
+
+
+def test_old_session_files_are_pruned(tmp_path):
+    import os
+    for n in range(12):
+        for name in (f"memory_{n:02d}.json", f"frame_profile_{n:02d}.json", f"soak_{n:02d}.json"):
+            path = tmp_path / name
+            path.write_text("{}")
+            os.utime(path, (n, n))
+    (tmp_path / "notes.json").write_text("{}")
+    logger = GameLogger(log_dir=str(tmp_path), console=False)
+    logger.shutdown()
+    for prefix in ("memory_", "frame_profile_", "soak_"):
+        kept = sorted(p.name for p in tmp_path.glob(f"{prefix}*.json"))
+        assert kept == [f"{prefix}{n:02d}.json" for n in range(2, 12)]
+    assert (tmp_path / "notes.json").exists()
@@ -14,7 +14,7 @@ class _FakeConversation:
     def needs_memory_context(self) -> bool:
         return self.needs_context
 
-    def process_player_input(self, duck, message, use_llm=True, memory_context="") -> str:
+    def process_player_input(self, duck, message, use_llm=True, memory_context="", on_partial=None) -> str:
         self.received_context = memory_context
         return f"reply:{message}"
 
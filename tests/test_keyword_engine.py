@@ -0,0 +1,128 @@
+"""Tests for dialogue.keyword_responses — indexed topic matching."""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from dialogue.keyword_responses import KeywordEngine, KeywordResponse, _PhraseAutomaton
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return KeywordEngine()
+
+
+def _full_scan(engine, text):
+    """Score every topic the old way, for comparison with the index."""
+    text_lower = text.lower().strip()
+    words = set(re.findall(r"[a-z']+", text_lower))
+    scores = [(i, engine._score_topic(t, text_lower, words)) for i, t in enumerate(engine.topics)]
+    return [(i, s) for i, s in scores if s > 0]
+
+
+def _indexed(engine, text):
+    text_lower = text.lower().strip()
+    words = set(re.findall(r"[a-z']+", text_lower))
+    return engine._score_candidates(text_lower, words)
+
+
+def test_automaton_matches_substring_semantics():
+    patterns = ["he", "she", "his", "hers", "how are you", "are you", "you"]
+    automaton = _PhraseAutomaton()
+    for pattern in patterns:
+        automaton.add(pattern)
+    for text in ["ushers", "how are you today", "this", "", "areyou", "hhe"]:
+        assert automaton.find(text) == {p for p in patterns if p in text}
+
+
+def test_automaton_rebuilds_after_add():
+    automaton = _PhraseAutomaton()
+    automaton.add("bread")
+    assert automaton.find("i love bread") == {"bread"}
+    automaton.add("love")
+    assert automaton.find("i love bread") == {"bread", "love"}
+
+
+def test_index_matches_full_scan(engine):
+    vocab = set()
+    for topic in engine.topics:
+        vocab.update(topic.keywords)
+        vocab.update(topic.phrases)
+        vocab.update(topic.anti_keywords)
+    vocab = sorted(vocab) + ["the", "a", "duck", "pond", "hello"]
+    rng = random.Random(11)
+    for _ in range(1500):
+        message = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 8)))
+        assert _indexed(engine, message) == _full_scan(engine, message)
+
+
+def test_topics_added_later_are_indexed():
+    engine = KeywordEngine()
+    engine.add_topic(KeywordResponse(
+        "zz_bread", ["zzbread", "zz toast"], ["Bread."], priority=50,
+        anti_keywords=["zzmold"],
+    ))
+    assert engine.process("zzbread", None) == "Bread."
+    assert engine.process("zz toast", None) == "Bread."
+    assert engine.process("zzbread zzmold", None) is None
+
+
+def _engine_with_synthetic_topics(extra):
+    engine = KeywordEngine()
+    for i in range(extra):
+        engine.add_topic(KeywordResponse(
+            name=f"synthetic_{i}",
+            keywords=[f"zq{i}word", f"zq{i} two words"],
+            phrases=[f"zq{i} some phrase"],
+            responses=["..."],
+        ))
+    return engine
+
+
+_MESSAGES = [
+    "hello there how are you today",
+    "do you like bread or swimming in the pond",
+    "i had a weird dream about flying",
+    "tell me a joke please",
+]
+
+
+def _postings_visited(engine, text):
+    """Index entries a message touches: word postings plus pattern owners."""
+    text_lower = text.lower().strip()
+    words = set(re.findall(r"[a-z']+", text_lower))
+    visited = sum(len(engine._word_postings.get(word, ())) for word in words)
+    visited += sum(len(engine._pattern_owners[p]) for p in engine._automaton.find(text_lower))
+    return visited
+
+
+def test_work_per_message_flat_as_topic_count_grows():
+    base = _engine_with_synthetic_topics(0)
+    grown = _engine_with_synthetic_topics(4000)
+    assert len(grown.topics) == len(base.topics) + 4000
+    for message in _MESSAGES:
+        assert _postings_visited(grown, message) == _postings_visited(base, message)
+        assert _indexed(grown, message) == _indexed(base, message)
+
+
+@pytest.mark.bench
+def test_latency_microbenchmark(capsys):
+    """Per-message latency vs. number of registered topics (``pytest -m bench``)."""
+    messages = _MESSAGES * 50
+    timings = {}
+    for extra in (0, 1000, 4000):
+        engine = _engine_with_synthetic_topics(extra)
+        engine.process("warm up", None)
+        start = time.perf_counter()
+        for message in messages:
+            engine.process(message, None)
+        timings[len(engine.topics)] = (time.perf_counter() - start) / len(messages)
+
+    with capsys.disabled():
+        for count, seconds in timings.items():
+            print(f"\n  {count:5d} topics: {seconds * 1e6:7.1f} us/message", end="")
+        print()
@@ -0,0 +1,141 @@
+"""Tests for core.lazy — deferred gameplay modules and import timing."""
+import subprocess
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core.lazy import (
+    ImportTimer, LazyModuleRegistry, LazySubsystem, defer_subsystem, is_deferred, lazy_from,
+    lazy_modules, load_deferred,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    """Write an importable module that counts how often it is executed."""
+    def make(name, body=""):
+        (tmp_path / f"{name}.py").write_text(
+            "import builtins\n"
+            "builtins._lazy_test_loads = getattr(builtins, '_lazy_test_loads', 0) + 1\n"
+            + body)
+        return name
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import builtins
+    builtins._lazy_test_loads = 0
+    yield make
+    for name in list(sys.modules):
+        if name.startswith("lazy_fixture_"):
+            del sys.modules[name]
+    del builtins._lazy_test_loads
+
+
+def _loads():
+    import builtins
+    return builtins._lazy_test_loads
+
+
+def test_lazy_attr_imports_on_first_use(fake_module):
+    name = fake_module("lazy_fixture_a", "TABLE = {'x': 1}\nclass Thing:\n    KIND = 'duck'\n")
+    Thing, TABLE = lazy_from(name, "Thing", "TABLE")
+    assert _loads() == 0 and name not in sys.modules
+
+    assert Thing.KIND == "duck"
+    assert isinstance(Thing(), Thing)
+    assert "x" in TABLE and TABLE["x"] == 1 and len(TABLE) == 1 and list(TABLE) == ["x"]
+    assert _loads() == 1
+
+
+def test_lazy_subsystem_binds_once_and_can_be_replaced(fake_module):
+    name = fake_module("lazy_fixture_b", "class System:\n    pass\nshared = System()\n")
+
+    class Owner:
+        shared = LazySubsystem(name, "shared")
+        fresh = LazySubsystem(name, "System", construct=True)
+
+    owner = Owner()
+    assert _loads() == 0
+    assert owner.shared is sys.modules[name].shared
+    first = owner.fresh
+    assert owner.fresh is first and first is not Owner().fresh
+    owner.fresh = "replaced"
+    assert owner.fresh == "replaced"
+    assert _loads() == 1
+
+
+def test_deferred_subsystem_runs_its_loader_on_first_read(fake_module):
+    name = fake_module("lazy_fixture_d", "class System:\n    pass\n")
+
+    class Owner:
+        diary = LazySubsystem(name, "System", construct=True)
+        brain = LazySubsystem(name, "System", construct=True)
+
+    owner = Owner()
+    calls = []
+    defer_subsystem(owner, "diary", lambda: calls.append("diary") or "from save")
+    defer_subsystem(owner, "brain", lambda: calls.append("brain") or "unused")
+    assert is_deferred(owner, "diary") and calls == [] and _loads() == 0
+
+    assert owner.diary == "from save" and owner.diary == "from save"
+    assert calls == ["diary"] and not is_deferred(owner, "diary")
+
+    owner.brain = "new game"
+    assert not is_deferred(owner, "brain") and load_deferred(owner) == 0
+    assert owner.brain == "new game" and calls == ["diary"] and _loads() == 0
+
+
+def test_registry_warms_in_declaration_order(fake_module):
+    names = [fake_module(f"lazy_fixture_{n}") for n in ("c", "d", "e")]
+    registry = LazyModuleRegistry()
+    for name in names:
+        registry.register(name)
+    assert registry.warm_next()
+    assert registry.pending() == names[1:]
+    assert registry.load_all() == 2
+    assert not registry.warm_next()
+    assert registry.get_stats()["loaded"] == 3
+
+
+def test_import_timer_splits_self_and_cumulative(fake_module):
+    inner = fake_module("lazy_fixture_inner", "import time\ntime.sleep(0.02)\n")
+    outer = fake_module("lazy_fixture_outer", f"import {inner}\nimport time\ntime.sleep(0.01)\n")
+    timer = ImportTimer()
+    timer.install()
+    try:
+        __import__(outer)
+    finally:
+        timer.uninstall()
+    inner_self, inner_cum = timer.records[inner]
+    outer_self, outer_cum = timer.records[outer]
+    assert inner_self >= 0.02 and outer_cum >= inner_cum + 0.01
+    assert outer_self == pytest.approx(outer_cum - inner_cum)
+    assert timer.slowest(1, key="cumulative")[0][0] == outer
+    # The module keeps its real loader
+    assert type(sys.modules[outer].__loader__).__name__ == "SourceFileLoader"
+
+
+def test_game_import_defers_gameplay_modules():
+    script = (
+        "import sys; sys.path.insert(0, '.')\n"
+        "import core.game\n"
+        "from core.lazy import lazy_modules\n"
+        "heavy = ['world.item_interactions', 'world.expanded_events', "
+        "'dialogue.guest_conversations', 'world.quests']\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+        "lazy_modules.load_all()\n"
+        "print(lazy_modules.pending())\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split("\n")[:2] == ["[]", "[]"]
+
+
+def test_game_registers_its_deferred_modules():
+    import core.game  # noqa: F401
+    assert "world.events" in lazy_modules._modules
+    assert "world.garden" in lazy_modules._modules
@@ -0,0 +1,105 @@
+"""Tests for dialogue.learning_engine — indexed fuzzy retrieval."""
+import difflib
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from dialogue.learning_engine import LearningEngine, _normalize, _tokenize
+
+WORDS = ("hello friend duck pond bread swim sleep happy sad rain sun "
+         "what do you think about the meaning of life are tired hungry").split()
+
+
+def _reference(engine, player_input, threshold=0.65):
+    """The original full-scan scorer, for comparing results."""
+    normalized = _normalize(player_input)
+    input_tokens = _tokenize(player_input)
+    rows = engine._conn.execute(
+        "SELECT input_normalized, response, frequency FROM pairs "
+        "ORDER BY frequency DESC, id"
+    ).fetchall()
+    best_score, best_response = 0.0, None
+    for stored, response, frequency in rows:
+        stored_tokens = set(stored.split())
+        intersection = input_tokens & stored_tokens
+        if not intersection:
+            continue
+        jaccard = len(intersection) / len(input_tokens | stored_tokens)
+        if jaccard < 0.2:
+            continue
+        ratio = difflib.SequenceMatcher(None, normalized, stored).ratio()
+        len_ratio = min(len(normalized), len(stored)) / max(len(normalized), len(stored))
+        score = ratio * 0.5 + jaccard * 0.3 + len_ratio * 0.2 + min(0.08, (frequency - 1) * 0.015)
+        if score > best_score:
+            best_score, best_response = score, response
+    if best_response and best_score >= threshold:
+        return best_score
+    return None
+
+
+@pytest.fixture
+def engine(tmp_path):
+    eng = LearningEngine(db_path=tmp_path / "brain.db")
+    yield eng
+    eng.close()
+
+
+def test_exact_input_returns_response(engine):
+    engine.seed_corpus([("hello friend", "Quack, hello."), ("are you hungry", "Always.")])
+    response, confidence = engine.get_response("Hello, friend!")
+    assert response == "Quack, hello."
+    assert confidence >= 0.9
+
+
+def test_no_shared_words_returns_none(engine):
+    engine.seed_corpus([("hello friend", "Quack, hello.")])
+    assert engine.get_response("bread pond") is None
+
+
+def test_learn_updates_index(engine):
+    engine.seed_corpus([("hello friend", "Quack, hello.")])
+    assert engine.get_response("hello friend")  # builds the index
+    engine.learn("do you like rain", "Rain is free swimming.", source="keyword")
+    assert engine.get_response("do you like rain")[0] == "Rain is free swimming."
+
+
+def test_most_frequent_response_wins(engine):
+    engine.seed_corpus([("how are you", "Fine."), ("how are you", "Busy.")])
+    assert engine.get_response("how are you")
+    for _ in range(3):
+        engine.learn("how are you", "Busy.", source="keyword")
+    assert engine.get_response("how are you")[0] == "Busy."
+
+
+def test_clear_all_pairs_drops_index(tmp_path, monkeypatch):
+    import dialogue.learning_engine as le
+    db = tmp_path / "brain.db"
+    monkeypatch.setattr(le, "DB_PATH", db)
+    eng = LearningEngine(db_path=db)
+    monkeypatch.setattr(le, "_instance", eng)
+    eng.seed_corpus([("hello friend", "Quack, hello.")])
+    assert eng.get_response("hello friend")
+    LearningEngine.clear_all_pairs()
+    assert eng.get_response("hello friend") is None
+    eng.close()
+
+
+def test_matches_full_scan_scores(engine):
+    rng = random.Random(7)
+
+    def sentence():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 7)))
+
+    engine.seed_corpus([(sentence(), f"reply {i}") for i in range(600)])
+    for _ in range(120):
+        query = sentence()
+        expected = _reference(engine, query)
+        result = engine.get_response(query)
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result[1] == pytest.approx(expected)
@@ -0,0 +1,226 @@
+"""Tests for the LLM request scheduler, timed inference and prompt prefixes."""
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dialogue.llm_behavior import (
+    LLMRequest, LLMWorker, RequestPriority, RequestType, ResponseCache,
+)
+from dialogue.llm_chat import LLMChat, LLMTimingStats, _run_timed_inference
+from duck.duck import Duck
+
+
+def _worker():
+    controller = SimpleNamespace(_cache=ResponseCache(max_size=10, ttl=60))
+    worker = LLMWorker(controller)
+    worker._running = True
+    return worker
+
+
+def _action(action, results, age=0.0, duck_name="Cheese"):
+    return LLMRequest(
+        request_type=RequestType.ACTION_COMMENTARY,
+        priority=RequestPriority.NORMAL,
+        context={"type": "action", "duck_name": duck_name, "action": action},
+        callback=lambda response: results.append((action, response)),
+        created_at=time.time() - age,
+    )
+
+
+def _generate_with(worker, fn):
+    worker._process_request = fn
+    while True:
+        request = worker._next_request(timeout=0)
+        if request is None:
+            return
+        worker._handle(request)
+
+
+def test_identical_requests_share_one_generation():
+    worker, results, calls = _worker(), [], []
+    assert worker.queue_request(_action("waddle", results))
+    assert worker.queue_request(_action("waddle", results))
+    assert worker.queue_size() == 1
+
+    _generate_with(worker, lambda request: calls.append(request) or "*waddles*")
+    assert len(calls) == 1
+    assert results == [("waddle", "*waddles*"), ("waddle", "*waddles*")]
+    assert worker.get_stats()["action_commentary"]["coalesced"] == 1
+
+
+def test_newer_action_supersedes_queued_one():
+    worker, results = _worker(), []
+    worker.queue_request(_action("waddle", results))
+    worker.queue_request(_action("quack", results))
+    # The superseded request is answered with None straight away
+    assert results == [("waddle", None)]
+    assert worker.queue_size() == 1
+
+    _generate_with(worker, lambda request: "*quacks*")
+    assert results[-1] == ("quack", "*quacks*")
+    assert worker.get_stats()["action_commentary"]["superseded"] == 1
+
+
+def test_coalescing_bypasses_queue_depth():
+    worker, results = _worker(), []
+    for name in ("A", "B", "C"):
+        assert worker.queue_request(_action("nap", results, duck_name=name))
+    assert not worker.queue_request(_action("nap", results, duck_name="D"))
+    assert worker.queue_request(_action("swim", results, duck_name="A"))
+    assert worker.queue_size() == 3
+
+
+def test_stale_requests_are_dropped():
+    worker, results = _worker(), []
+    worker.queue_request(_action("waddle", results, age=60.0))
+    _generate_with(worker, lambda request: "never generated")
+    assert results == [("waddle", None)]
+    assert worker.get_stats()["action_commentary"]["dropped_stale"] == 1
+
+
+def test_high_priority_requests_go_first():
+    worker, order = _worker(), []
+    worker.queue_request(_action("waddle", []))
+    worker.queue_request(LLMRequest(
+        request_type=RequestType.SPECIAL_EVENT,
+        priority=RequestPriority.HIGH,
+        context={"type": "event", "event_type": "rainbow"},
+    ))
+    _generate_with(worker, lambda request: order.append(request.request_type) or "ok")
+    assert order == [RequestType.SPECIAL_EVENT, RequestType.ACTION_COMMENTARY]
+
+
+def test_cached_answer_skips_generation():
+    worker, results = _worker(), []
+    request = _action("preen", results)
+    worker._controller._cache.put(request.context, "*preens*")
+    worker.queue_request(request)
+    _generate_with(worker, lambda request: "generated")
+    assert results == [("preen", "*preens*")]
+    assert worker.get_stats()["action_commentary"]["cache_hits"] == 1
+
+
+# ── Subprocess inference ─────────────────────────────────────────────
+
+
+class _StreamingModel:
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.kwargs = None
+
+    def create_chat_completion(self, **kwargs):
+        self.kwargs = kwargs
+        yield {"choices": [{"delta": {"role": "assistant"}, "finish_reason": None}]}
+        for piece in self.pieces:
+            yield {"choices": [{"delta": {"content": piece}, "finish_reason": None}]}
+        yield {"choices": [{"delta": {}, "finish_reason": "stop"}]}
+
+    def __call__(self, prompt, **kwargs):
+        self.kwargs = kwargs
+        for piece in self.pieces:
+            yield {"choices": [{"text": piece, "finish_reason": None}]}
+
+
+def test_timed_inference_reassembles_chat_result():
+    model = _StreamingModel(["*blinks*", " Bread?"])
+    result, timings = _run_timed_inference(
+        model, {"method": "chat", "kwargs": {"messages": [], "max_tokens": 5}})
+    assert model.kwargs["stream"] is True
+    assert result["choices"][0]["message"]["content"] == "*blinks* Bread?"
+    assert result["choices"][0]["finish_reason"] == "stop"
+    assert timings["tokens"] == 2
+    assert timings["prompt_ms"] >= 0 and timings["gen_ms"] >= 0
+
+
+def test_timed_inference_reassembles_completion_result():
+    model = _StreamingModel(["*wad", "dles*"])
+    result, _ = _run_timed_inference(
+        model, {"method": "completion", "prompt": "Action:", "kwargs": {}})
+    assert result["choices"][0]["text"] == "*waddles*"
+
+
+def test_timing_stats_per_kind():
+    stats = LLMTimingStats()
+    stats.record("player_chat", {"prompt_ms": 300.0, "gen_ms": 1000.0, "tokens": 20})
+    stats.record("player_chat", {"prompt_ms": 100.0, "gen_ms": 1000.0, "tokens": 20})
+    stats.record("action_commentary", {"prompt_ms": 50.0, "gen_ms": 100.0, "tokens": 3})
+    chat = stats.get_stats()["player_chat"]
+    assert chat["count"] == 2
+    assert chat["avg_prompt_ms"] == 200.0
+    assert chat["tokens_per_sec"] == 20.0
+    assert chat["last_prompt_ms"] == 100.0
+    assert stats.get_stats()["action_commentary"]["count"] == 1
+
+
+# ── Stable prompt prefixes ───────────────────────────────────────────
+
+
+class _RecordingLlama:
+    def __init__(self):
+        self.calls = []
+
+    def create_chat_completion(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"choices": [{"message": {"content": "*stares* Bread."}}]}
+
+
+def _chat_llm():
+    llm = object.__new__(LLMChat)
+    llm._llama = _RecordingLlama()
+    llm._inference_lock = threading.Lock()
+    llm._conversation_history = []
+    llm._max_history = 6
+    llm._duck_brain = None
+    llm._system_prompt_key = None
+    llm._system_prompt = ""
+    llm._last_error = None
+    return llm
+
+
+def test_brain_system_prompt_is_rebuilt_only_when_its_inputs_change():
+    from dialogue.duck_brain import DuckBrain
+
+    llm, duck, brain = _chat_llm(), Duck.create_new(), DuckBrain()
+    llm._duck_brain = brain
+    first = llm._build_system_prompt(duck)
+    brain.save_revision += 3                      # Unrelated bookkeeping
+    brain.conversation_memory.add_message("duck", "*blinks* weather.")
+    assert llm._build_system_prompt(duck) is first
+
+    brain.player_model.record_fact("has_pet", "cat")
+    second = llm._build_system_prompt(duck)
+    assert second is not first and "has_pet: cat" in second
+
+
+def test_system_prompt_prefix_is_stable_across_turns():
+    llm, duck = _chat_llm(), Duck.create_new()
+    llm._generate_chat(duck, "hello", "Weather: rain")
+    llm._generate_chat(duck, "what's up", "Weather: sunny")
+
+    first, second = (call["messages"] for call in llm._llama.calls)
+    assert first[0] == second[0]
+    assert "Weather" not in first[0]["content"]
+    assert second[-1]["content"].endswith("Player: what's up")
+    assert "Weather: sunny" in second[-1]["content"]
+    # History holds the bare player text, so earlier turns stay identical
+    assert second[1] == {"role": "user", "content": "hello"}
+    assert llm._llama.calls[0]["request_kind"] == "player_chat"
+
+
+def test_ambient_generation_is_timed_as_its_own_kind():
+    from dialogue.ambient_lines import AmbientLineGenerator
+
+    llm = _chat_llm()
+    llm._model_name = "qwen"
+    gen = object.__new__(AmbientLineGenerator)
+    gen._llm_chat = llm
+    prompt = gen._build_prompt("idle", "", "", "", "content", "", "", ["idle"])
+    assert gen._call_llm(prompt) == "*stares* Bread."
+
+    call = llm._llama.calls[0]
+    assert call["request_kind"] == "ambient"
+    # Instructions lead the user message; the per-request details trail it
+    assert call["messages"][1]["content"].startswith("Write 3-5 short dialogue lines")
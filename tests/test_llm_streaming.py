@@ -0,0 +1,111 @@
+"""Tests for streamed LLM replies: proxy token forwarding, partial cleanup, UI."""
+import queue
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dialogue.llm_chat import LLMChat, LLMTimingStats, _LLMProxy
+from ui.renderer import Renderer
+
+
+def _proxy(messages):
+    proxy = object.__new__(_LLMProxy)
+    proxy._request_q = queue.Queue()
+    proxy._response_q = queue.Queue()
+    for msg in messages:
+        proxy._response_q.put(msg)
+    proxy._process = SimpleNamespace(is_alive=lambda: True)
+    proxy._req_counter = 0
+    proxy._send_lock = threading.Lock()
+    proxy.timings = LLMTimingStats()
+    return proxy
+
+
+def test_proxy_forwards_tokens_and_returns_result():
+    result = {"choices": [{"message": {"content": "Hello"}}]}
+    proxy = _proxy([
+        {"type": "result", "data": {"stale": True}, "id": 0},  # earlier timed-out call
+        {"type": "token", "text": "Hel", "id": 1},
+        {"type": "token", "text": "lo", "id": 1},
+        {"type": "result", "data": result, "id": 1,
+         "timings": {"prompt_ms": 10.0, "gen_ms": 20.0, "tokens": 2}},
+    ])
+    tokens = []
+    assert proxy.create_chat_completion(
+        request_kind="player_chat", on_token=tokens.append, messages=[]) == result
+    assert tokens == ["Hel", "lo"]
+    request = proxy._request_q.get_nowait()
+    assert request["stream"] is True
+    assert "on_token" not in request["kwargs"]
+    assert proxy.timings.get_stats()["player_chat"]["count"] == 1
+
+
+def test_proxy_requests_no_stream_without_listener():
+    proxy = _proxy([{"type": "result", "data": {"choices": []}, "id": 1}])
+    proxy("prompt", max_tokens=5)
+    assert proxy._request_q.get_nowait()["stream"] is False
+
+
+def _llm():
+    llm = object.__new__(LLMChat)
+    llm._llama = object.__new__(_LLMProxy)
+    return llm
+
+
+def test_partial_cleanup_hides_unfinished_markup():
+    llm = _llm()
+    assert llm._clean_response('"*blinks* Bread', "Cheese", partial=True) == "*blinks* Bread"
+    assert llm._clean_response("Fine. [ACTION:fe", "Cheese", partial=True) == "Fine."
+    assert llm._clean_response("Fine. [ACTION:feed] More", "Cheese", partial=True) == "Fine. More"
+    # The finished reply keeps its tags for the game to execute
+    assert llm._clean_response("Fine. [ACTION:feed]", "Cheese") == "Fine. [ACTION:feed]"
+
+
+def test_streaming_kwargs_report_growing_clean_text():
+    llm, shown = _llm(), []
+    kwargs = llm._streaming_kwargs(shown.append, "Cheese")
+    for piece in ["Cheese: ", "*st", "ares*", " Bread", " [ACTION:"]:
+        kwargs["on_token"](piece)
+    assert shown == ["*st", "*stares*", "*stares* Bread"]
+    assert llm._streaming_kwargs(None, "Cheese") == {}
+
+
+def _renderer():
+    renderer = object.__new__(Renderer)
+    renderer._chat_log = []
+    renderer._chat_log_max_size = 30
+    renderer._partial_reply = ""
+    renderer._partial_log_entries = []
+    renderer._cheese_away = False
+    renderer._message_queue = []
+    renderer._talk_buffer = ""
+    return renderer
+
+
+def test_partial_message_is_replaced_in_chat_log():
+    renderer = _renderer()
+    renderer.show_message("*tilts head* ...", category="duck")
+    renderer.show_partial_message("*stares*")
+    renderer.show_partial_message("*stares* Bread")
+    assert [msg for _, msg, _ in renderer._chat_log] == ["*tilts head* ...", "*stares* Bread"]
+    assert renderer._message_queue == ["*stares* Bread"]
+
+    # Other messages leave the reply being streamed alone
+    renderer.show_message("Saved!")
+    assert renderer._partial_reply == "*stares* Bread"
+
+    renderer.show_message("*stares* Bread. Now.", category="duck", replaces_partial=True)
+    assert [msg for _, msg, _ in renderer._chat_log] == [
+        "*tilts head* ...", "Saved!", "*stares* Bread. Now."]
+    assert renderer._partial_reply == ""
+
+
+def test_talk_overlay_shows_partial_reply():
+    renderer = _renderer()
+    captured = {}
+    renderer._overlay_box = lambda base, content, title, width: captured.setdefault("content", content)
+    renderer.show_partial_message("*stares* Bread")
+    renderer._overlay_talk([], 80)
+    assert "*stares* Bread ..." in captured["content"]
@@ -0,0 +1,88 @@
+"""Tests for dialogue.memory_recall — recall over indexed quotes and statements."""
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dialogue.conversation_memory import ConversationMemory
+from dialogue.memory_index import TextIndex, recall_topics
+from dialogue.memory_recall import MemoryRecall
+from dialogue.player_model import PlayerModel
+
+
+def test_text_index_appends_incrementally_and_rebuilds_on_trim():
+    items = ["bread is good", "rain again"]
+    index = TextIndex(lambda text: text)
+    index.update(items)
+    items.append("more bread please")
+    index.update(items)
+    assert index.words["bread"] == [0, 2]
+    assert index.topics["food"] == [0, 2] and index.topics["weather"] == [1]
+    assert TextIndex.hits(index.words, {"bread", "please"}, start=1) == {2: 2}
+
+    del items[0]
+    index.update(items)
+    assert index.words["bread"] == [1] and "good" not in index.words
+    assert len(index) == 2
+
+
+def test_quote_index_follows_adds_and_reload():
+    memory = ConversationMemory()
+    memory.add_message("player", "I love bread more than anything")
+    memory.add_message("player", "ok")
+    memory.add_message("player", "I hate the rain so much")
+    assert len(memory.notable_quotes) == 2
+    assert memory.quote_index.words["bread"] == [0]
+    assert memory.quote_index.topics["weather"] == [1]
+
+    restored = ConversationMemory.from_dict(memory.to_dict())
+    assert restored.quote_index.words == memory.quote_index.words
+
+
+def test_search_keeps_substring_matching():
+    memory = ConversationMemory()
+    memory.add_message("player", "my job is at the bakery")
+    memory.end_conversation()
+    memory.add_message("player", "bread, bread and more bread")
+    memory.end_conversation()
+
+    def found(query):
+        return [len(messages) for _, messages in memory.search_conversations(query)]
+
+    assert found("ead") == [1]           # Inside a word
+    assert found("y job is a") == [1]    # Partial words at both ends
+    assert found("bread and") == [1]
+    assert found("job bread") == []
+    assert found("...") == []
+    assert found("") == [1, 1]
+
+
+def test_recall_scores_only_memories_sharing_words_or_topics():
+    memory, player = ConversationMemory(), PlayerModel()
+    memory.add_message("player", "I love my garden tomatoes")
+    memory.add_message("player", "I hate the rain so much")
+    old = (datetime.now() - timedelta(days=14)).isoformat()
+    memory.notable_quotes = [(quote, conv_id, old) for quote, conv_id, _ in memory.notable_quotes]
+    player.record_statement("my sister plays chess", topic_tags=["games"], sentiment=0.5)
+
+    recall = MemoryRecall(memory, player)
+    words = frozenset("the rain is back".split())
+    topics = list(recall_topics("the rain is back"))
+    assert [c.content for c in recall._score_quotes(words, topics)] == ["I hate the rain so much"]
+    assert recall._score_player_statements(words, topics) == []
+
+    picked = recall.find_relevant_memory("the rain is back")
+    assert picked["type"] == "quote" and picked["content"] == "I hate the rain so much"
+    assert picked["intro"] and picked["score"] > 0.2
+    recall._last_callback_time = 0
+    assert recall.find_relevant_memory("the rain is back") is None    # Already used
+
+
+def test_brain_recall_reads_the_restored_memories():
+    from dialogue.duck_brain import DuckBrain
+
+    brain = DuckBrain()
+    brain.conversation_memory.add_message("player", "I love bread more than anything")
+    restored = DuckBrain.from_dict(brain.to_dict())
+    assert restored.memory_recall._conv_mem is restored.conversation_memory
+    assert restored.memory_recall._player is restored.player_model
@@ -0,0 +1,101 @@
+"""Tests for core.memory_telemetry — in-process memory sampling and growth detection."""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import monitor_memory
+from core.duck_store import DuckStore
+from core.event_bus import EventBus
+from core.memory_telemetry import MemoryTelemetry, count_instances, find_growth
+
+
+def _telemetry(**kwargs):
+    kwargs.setdefault("growth_samples", 4)
+    kwargs.setdefault("tracked_types", ())
+    return MemoryTelemetry(**kwargs)
+
+
+def test_growing_container_is_flagged_and_bounded_one_is_not():
+    telemetry = _telemetry()
+    leaky, bounded = [], []
+    telemetry.register("leaky", lambda: len(leaky))
+    telemetry.register("bounded", lambda: len(bounded))
+    for minute in range(8):
+        leaky.extend(range(10))
+        bounded[:] = range(min(3 + minute, 5))   # fills up, then plateaus
+        telemetry.sample(now=minute * 60.0)
+
+    growth = {entry["name"]: entry for entry in telemetry.growth()}
+    assert "leaky" in growth and "bounded" not in growth
+    assert (growth["leaky"]["first"], growth["leaky"]["last"]) == (50, 80)
+    assert growth["leaky"]["per_hour"] == 600.0
+
+
+def test_dips_reset_growth_and_short_runs_are_ignored():
+    samples = [{"at": float(n), "values": {"x": value}}
+               for n, value in enumerate([1, 2, 3, 2, 3, 4])]
+    assert find_growth(samples, run=4) == []
+    assert [entry["name"] for entry in find_growth(samples, run=3)] == ["x"]
+    assert find_growth(samples[:2], run=3) == []
+
+
+def test_failing_and_unloaded_probes_are_skipped():
+    telemetry = _telemetry()
+    telemetry.register("unloaded", lambda: None)
+    telemetry.register("broken", lambda: 1 / 0)
+    sample = telemetry.sample()
+    assert sample["values"]["unloaded"] is None and "broken" not in sample["values"]
+    assert "rss" in sample["values"]
+
+
+def test_type_counts_and_subsystem_stats():
+    class Particle:
+        pass
+
+    particles = [Particle() for _ in range(3)]
+    assert count_instances(["Particle"])["Particle"] >= 3
+    telemetry = _telemetry(tracked_types=("Particle",), type_count_every=2)
+    assert "objects.Particle" in telemetry.sample()["values"]
+    assert "objects.Particle" not in telemetry.sample()["values"]
+    del particles
+
+    bus = EventBus(history_size=5)
+    assert bus.memory_stats() == {"history": 0, "history_types": 0, "queue": 0, "subscribers": 0}
+    store = DuckStore()
+    store.change_need("hunger", -5, "test")
+    assert store.audit_log_size() == 1
+
+
+def test_tracing_reports_allocation_sites():
+    telemetry = _telemetry(top_allocations=5)
+    telemetry.start_tracing()
+    try:
+        telemetry.sample()                       # baseline
+        hoard = [bytearray(1024) for _ in range(200)]
+        sample = telemetry.sample()
+    finally:
+        telemetry.stop_tracing()
+    assert sample["values"]["traced"] > 0
+    assert any("test_memory_telemetry.py" in site["where"] and site["size_diff"] >= 200 * 1024
+               for site in sample["top"])
+    del hoard
+
+
+def test_dump_and_cli_report(tmp_path, capsys):
+    telemetry = _telemetry()
+    items = []
+    telemetry.register("llm.response_cache", lambda: len(items))
+    telemetry.dump_path = tmp_path / "memory_20260101_000000.json"
+    for minute in range(5):
+        items.append(minute)
+        telemetry.sample(now=minute * 60.0)
+    telemetry.flush()
+
+    data = json.loads(telemetry.dump_path.read_text())
+    assert data["growth"][0]["name"] == "llm.response_cache"
+    assert monitor_memory.main(["--log-dir", str(tmp_path)]) == 0
+    out = capsys.readouterr().out
+    assert "GROWING" in out and "llm.response_cache" in out
+    assert monitor_memory.main(["--log-dir", str(tmp_path), "--samples", "6"]) == 0
+    assert "no monotonic growth detected" in capsys.readouterr().out
@@ -0,0 +1,193 @@
+"""Tests for closed-form offline catch-up against tick-by-tick simulation."""
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core.consequences import CASCADE_RULES, CASCADE_THRESHOLD, get_cascade_modifiers
+from core.game import Game
+from core.offline import bernoulli_hits, offline_ticks, summarize_repeats
+from duck.duck import Duck
+from duck.needs import Needs
+from world.building import BuildingSystem, BuildProgress, Structure
+from world.crafting import CraftingSystem
+from world.garden import Garden, GrowthStage, PlantedPlant
+from world.items import Inventory
+
+NEEDS = ("hunger", "energy", "fun", "cleanliness", "social")
+
+
+def _stepped(needs, minutes, step=0.05, **kwargs):
+    """Reference: many small Needs.update calls with live cascades."""
+    elapsed = 0.0
+    while elapsed < minutes - 1e-12:
+        dt = min(step, minutes - elapsed)
+        needs.update(dt, cascade_modifiers=get_cascade_modifiers(needs), **kwargs)
+        elapsed += dt
+    return needs
+
+
+def _closed(needs, minutes, **kwargs):
+    needs.catch_up(minutes, cascade_rules=CASCADE_RULES,
+                   cascade_threshold=CASCADE_THRESHOLD, **kwargs)
+    return needs
+
+
+@pytest.mark.parametrize("minutes", [5, 45, 120, 600])
+def test_needs_catch_up_matches_small_steps(minutes):
+    start = dict(hunger=45, energy=80, fun=35, cleanliness=60, social=25)
+    kwargs = dict(personality={"active_lazy": 40, "neat_messy": -20},
+                  aging_modifiers={"hunger_rate": 1.2}, decay_multiplier=0.5)
+    stepped = _stepped(Needs(**start), minutes, **kwargs)
+    closed = _closed(Needs(**start), minutes, **kwargs)
+    for need in NEEDS:
+        assert getattr(closed, need) == pytest.approx(getattr(stepped, need), abs=0.05)
+
+
+def test_cascade_speeds_up_target_after_source_crosses():
+    # Hunger falls below the cascade threshold part way through
+    start = dict(hunger=24, energy=90, fun=90, cleanliness=90, social=90)
+    stepped = _stepped(Needs(**start), 30)
+    closed = _closed(Needs(**start), 30)
+    plain = Needs(**start)
+    plain.catch_up(30)
+    assert closed.energy == pytest.approx(stepped.energy, abs=0.02)
+    assert closed.energy < plain.energy
+
+
+def test_spiral_hits_zero_and_stays():
+    needs = _closed(Needs(hunger=29, energy=29, fun=29, cleanliness=29, social=29), 10**6)
+    assert all(getattr(needs, need) == 0 for need in NEEDS)
+
+
+def test_duck_catch_up_crosses_growth_stages():
+    duck = Duck.create_new()
+    duck.growth_stage, duck.growth_progress = "hatchling", 0.5
+    # Half of hatchling (36h) plus a quarter of duckling (66h)
+    duck.catch_up((36 + 66) * 60)
+    assert duck.growth_stage == "duckling"
+    assert duck.growth_progress == pytest.approx(0.25)
+
+
+# ── Bernoulli sampling ───────────────────────────────────────────────
+
+
+def test_bernoulli_hits_frequency_and_bounds():
+    rng = random.Random(7)
+    hits = list(bernoulli_hits(200_000, 0.05, rng))
+    assert hits == sorted(set(hits))
+    assert 0 <= hits[0] and hits[-1] < 200_000
+    assert 9_500 < len(hits) < 10_500
+    assert list(bernoulli_hits(5, 1.0)) == [0, 1, 2, 3, 4]
+    assert list(bernoulli_hits(5, 0.0)) == []
+
+
+def test_offline_ticks_and_repeat_summary():
+    assert offline_ticks(24 * 30) == 1440
+    assert summarize_repeats(Counter({"Found Bread": 3, "Found Pebble": 1})) == [
+        "Found Bread (x3)", "Found Pebble"]
+
+
+# ── Building and garden timers ───────────────────────────────────────
+
+
+def _building(blueprint_id="cozy_nest"):
+    system = BuildingSystem()
+    system.current_build = BuildProgress(Structure(blueprint_id=blueprint_id, position=(0, 0)))
+    return system
+
+
+def test_building_catch_up_spans_several_stages():
+    stepped, closed = _building(), _building()
+    for _ in range(10):
+        stepped.update_building(delta_time=1.0)
+    closed.catch_up_building(seconds=10.0)
+    assert closed.current_build.structure.current_stage == \
+        stepped.current_build.structure.current_stage == 2
+    assert closed.current_build.structure.stage_progress == pytest.approx(0.0)
+
+    result = closed.catch_up_building(seconds=3600)
+    assert result["completed"] and closed.current_build is None
+    assert closed.structures_built == 1
+
+
+def _garden(water, planted_hours_ago=30.0):
+    garden = Garden()
+    planted = (datetime.now() - timedelta(hours=planted_hours_ago)).isoformat()
+    garden.plots[0].plant = PlantedPlant(plant_id="sunflower", plot_id=0, planted_at=planted,
+                                         last_watered=planted, water_level=water, health=60)
+    return garden
+
+
+@pytest.mark.parametrize("hours", [1.0, 6.0, 24.0])
+def test_garden_catch_up_matches_small_steps(hours):
+    stepped, closed = _garden(50), _garden(50)
+    for _ in range(int(hours * 100)):
+        stepped.update_plants(0.01)
+    closed.catch_up(hours)
+    a, b = stepped.plots[0].plant, closed.plots[0].plant
+    assert b.water_level == pytest.approx(a.water_level, abs=0.1)
+    assert b.health == pytest.approx(a.health, abs=0.2)
+    assert b.is_withered == a.is_withered
+    assert b.growth_stage == a.growth_stage
+
+
+def test_garden_growth_is_judged_while_still_watered():
+    # Sunflower takes 24h and drinks 10 water/h. Away for the last 12 of its
+    # 22 hours, it stayed above 20 water for 8 of them: judged at 18h old.
+    garden = _garden(water=100, planted_hours_ago=22.0)
+    garden.catch_up(12.0)
+    assert garden.plots[0].plant.growth_stage == GrowthStage.MATURE
+
+
+def test_garden_plant_that_withers_while_away_stays_withered():
+    garden = _garden(water=100, planted_hours_ago=30.0)
+    garden.catch_up(20.0)
+    plant = garden.plots[0].plant
+    assert plant.is_withered
+    assert plant.growth_stage == GrowthStage.WITHERED
+
+
+# ── Game-level world catch-up ────────────────────────────────────────
+
+
+class _Friends:
+    current_visit = None
+
+    def check_for_random_visitor(self, hour):
+        return False, None
+
+
+def _offline_game():
+    game = object.__new__(Game)
+    weather = SimpleNamespace(weather_type=SimpleNamespace(value="sunny"))
+    game.atmosphere = SimpleNamespace(current_weather=weather, update=lambda: [])
+    game.friends = _Friends()
+    areas = [SimpleNamespace(name="Home Pond"), SimpleNamespace(name="Misty Marsh")]
+    game.exploration = SimpleNamespace(current_area=None,
+                                       get_available_areas=lambda level: areas)
+    game.progression = SimpleNamespace(level=3)
+    game.inventory = Inventory(max_size=1000)
+    game.crafting = CraftingSystem()
+    game.building = BuildingSystem()
+    game.materials = None
+    game.garden = Garden()
+    return game
+
+
+def test_month_away_is_summarised_quickly_without_cap():
+    random.seed(3)
+    game = _offline_game()
+    start = time.perf_counter()
+    events = game._simulate_offline_world(24 * 30)
+    assert time.perf_counter() - start < 0.5
+    # ~43 trips over a month, far beyond the old 48-hour window, in one line
+    trip = next(e for e in events if e.startswith("Cheese explored"))
+    assert trip.startswith("Cheese explored Misty Marsh (x")
+    assert len(events) == len(set(events))
@@ -1,9 +1,12 @@
 """Tests for ui.particle_system — ParticleSystem lifecycle."""
+import random
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from ui.particle_system import ParticleSystem
+import pytest
+
+from ui.particle_system import AMBIENT_SPAWN_INTERVAL, ParticleArrays, ParticleSystem
 
 
 def test_initial_empty():
@@ -37,3 +40,91 @@ def test_configure_biome():
     for _ in range(10):
         ps.update(0.1)
     assert isinstance(ps.get_particles(), list)
+
+
+def _run(ps, updates=200):
+    for _ in range(updates):
+        ps.update(0.033)
+    return ps.get_particles()
+
+
+@pytest.fixture(params=["array", "numpy"])
+def np(request):
+    """NumPy for the vectorised backend, None for the ``array`` fallback."""
+    return pytest.importorskip("numpy") if request.param == "numpy" else None
+
+
+def test_blizzard_fills_the_field_within_bounds(np):
+    ps = ParticleSystem(width=60, height=20, use_numpy=np is not None)
+    ps.configure_weather("blizzard", 0.9)
+    particles = _run(ps)
+    assert len(particles) > 200
+    assert ps.weather_count <= 60 * 20
+    assert all(0 <= x < 60 and 0 <= y < 20 for x, y, _, _ in particles)
+    assert {ch for _, _, ch, _ in particles} <= set("*/\\O")
+    assert {rgb for _, _, _, rgb in particles} == {(240, 240, 255)}
+
+
+def test_rising_weather_spawns_at_bottom_and_leaves_at_top(np):
+    random.seed(3)
+    ps = ParticleSystem(width=200, height=10, use_numpy=np is not None)
+    ps.configure_weather("heat_shimmer", 0.5)
+    ps.update(0.033)
+    assert ps.weather_count and {y for _, y, _, _ in ps.get_particles()} == {9}
+    _run(ps)
+    # Rising particles are culled at the top edge, so the layer plateaus
+    assert 0 < ps.weather_count < 200 * 10 // 2
+
+
+def test_ambient_layer_is_capped_and_suppressed_by_heavy_weather(np):
+    ps = ParticleSystem(width=60, height=20, max_ambient=5, use_numpy=np is not None)
+    ps.configure_biome("swamp", "night", "fall")
+    _run(ps)
+    assert 0 < ps.ambient_count <= 5
+    ps.configure_weather("heavy_rain", 0.9)
+    ps.update(0.033)
+    ps.update(0.033)
+    assert ps.ambient_count == 0
+
+
+def test_idle_ambient_spawners_wake_at_a_low_rate():
+    ps = ParticleSystem(width=40, height=12, use_numpy=False)
+    ps.configure_biome("swamp", "night", "fall")
+    # Configured but nothing alive yet: not a per-frame animation
+    assert not ps.is_active()
+    assert ps.next_spawn_delay() == AMBIENT_SPAWN_INTERVAL
+    _run(ps)
+    assert ps.is_active()
+
+    ps.configure_weather("rainy", 0.5)
+    assert ps.next_spawn_delay() == 0.0
+    ps.clear()
+    assert not ps.is_active() and ps.next_spawn_delay() is None
+
+
+def test_biome_configs_rebuild_only_on_change():
+    ps = ParticleSystem(width=40, height=12, use_numpy=False)
+    ps.configure_biome("forest", "midday", "summer")
+    tables = ps._ambient_spawns
+    ps.configure_biome("forest", "midday", "summer")
+    assert ps._ambient_spawns is tables
+    ps.configure_biome(None, "", "")
+    _run(ps, 2)
+    assert not ps.is_active()
+
+
+def test_particle_arrays_batch_ops(np):
+    layer = ParticleArrays(np, capacity=2)
+    layer.extend(3, [0.0, 1.0, 2.0], 5.0, 1.0, float("inf"), [7, 8, 9], 0)
+    layer.extend(2, [3.0, 4.0], 6.0, 1.0, 0.1, 1, 2)
+    assert len(layer) == 5
+    assert list(layer.column("x")) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert list(layer.column("age")) == [0.0] * 5
+    layer.compact([True, False, True, False, True] if np is None
+                  else np.array([True, False, True, False, True]))
+    assert list(layer.column("glyph")) == [7, 9, 1]
+    layer.keep_last(2)
+    assert list(layer.column("x")) == [2.0, 4.0]
+    assert list(layer.column("life")) == [float("inf"), 0.1]
+    layer.clear()
+    assert len(layer) == 0
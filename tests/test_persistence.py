@@ -0,0 +1,491 @@
+"""Tests for core.persistence — sectioned saves and incremental autosave."""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from core.persistence import (
+    KeepSection, LazySave, SaveManager, SaveSectionTracker, build_save_header, sections_dir,
+)
+from core.save_slots import SaveSlotsSystem
+
+
+def _sample():
+    return {
+        "duck": {"name": "Cheese", "growth_stage": "duckling"},
+        "diary": {"entries": [{"title": "Day one"}]},
+        "weather_seen": ["sunny"],
+        "last_played": "2026-01-01T00:00:00",
+        "cheese_away": False,
+    }
+
+
+def _blobs(save_path):
+    return sorted(p.name for p in sections_dir(save_path).iterdir())
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    assert manager.save(_sample())
+
+    manifest = json.loads(path.read_text())
+    assert manifest["format"] == "sections-2"
+    assert set(manifest["sections"]) == {"duck", "diary", "weather_seen"}
+    assert manifest["inline"]["cheese_away"] is False
+
+    data = manager.load()
+    for key, value in _sample().items():
+        assert data[key] == value
+
+
+def test_partial_save_keeps_unchanged_sections(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    diary_file = json.loads(path.read_text())["sections"]["diary"]["file"]
+
+    assert manager.save({"duck": {"name": "Cheese", "growth_stage": "adult"}}, partial=True)
+
+    manifest = json.loads(path.read_text())
+    assert manifest["sections"]["diary"]["file"] == diary_file
+    data = manager.load()
+    assert data["duck"]["growth_stage"] == "adult"
+    assert data["diary"] == _sample()["diary"]
+    assert data["last_played"] == _sample()["last_played"]
+
+
+def test_save_size_counts_referenced_blobs(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    assert manager.save_size() == 0
+    manager.save(_sample())
+    manifest_size = path.stat().st_size
+    before = manager.save_size()
+    assert before > manifest_size
+
+    # Only the diary grows; the manifest barely changes but the size must follow
+    entries = [{"title": f"Day {i}", "text": f"{i * 7919:x}" * 20} for i in range(200)]
+    manager.save({"diary": {"entries": entries}}, partial=True)
+    assert manager.save_size() > before + 1000
+    blob_dir = sections_dir(path)
+    referenced = json.loads(path.read_text())["sections"].values()
+    assert manager.save_size() == path.stat().st_size + sum(
+        (blob_dir / entry["file"]).stat().st_size for entry in referenced)
+
+
+def test_full_save_drops_missing_sections(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    manager.save({"duck": {"name": "Cheese"}})
+    assert "diary" not in manager.load()
+
+
+def test_stale_blobs_are_collected(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    for stage in ("egg", "duckling", "teen", "adult"):
+        manager.save({"duck": {"growth_stage": stage}})
+    # Only the current manifest and its .bak are referenced
+    assert _blobs(path) == ["duck.3.z", "duck.4.z"]
+
+
+def test_loads_legacy_json_save(tmp_path):
+    path = tmp_path / "save.json"
+    path.write_text(json.dumps({"version": "2.0", **_sample()}))
+    data = SaveManager(path).load()
+    assert data["duck"]["name"] == "Cheese"
+    assert data["diary"] == _sample()["diary"]
+
+
+def test_partial_save_over_legacy_json_is_refused(tmp_path):
+    path = tmp_path / "save.json"
+    path.write_text(json.dumps({"version": "2.0", **_sample()}))
+    assert not SaveManager(path).save({"duck": {}}, partial=True)
+    assert SaveManager(path).load()["diary"] == _sample()["diary"]
+
+
+def test_missing_blob_falls_back_to_backup(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save({"duck": {"growth_stage": "egg"}})
+    manager.save({"duck": {"growth_stage": "duckling"}})
+    current = json.loads(path.read_text())["sections"]["duck"]["file"]
+    (sections_dir(path) / current).unlink()
+    assert manager.load()["duck"]["growth_stage"] == "egg"
+
+
+def test_corrupted_blob_falls_back_to_backup(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save({"duck": {"growth_stage": "egg"}})
+    manager.save({"duck": {"growth_stage": "duckling"}})
+    current = json.loads(path.read_text())["sections"]["duck"]["file"]
+    blob = sections_dir(path) / current
+    blob.write_bytes(blob.read_bytes()[:-4] + b"oops")
+    assert manager.load()["duck"]["growth_stage"] == "egg"
+
+
+def test_sections_are_compressed(tmp_path):
+    path = tmp_path / "save.json"
+    big = {"entries": [{"title": "quack", "content": "a pond day"}] * 500}
+    SaveManager(path).save({"diary": big})
+    entry = json.loads(path.read_text())["sections"]["diary"]
+    assert entry["codec"] == "zlib"
+    assert entry["bytes"] < len(json.dumps(big)) / 4
+
+
+def test_sections_are_decoded_lazily(tmp_path):
+    path = tmp_path / "save.json"
+    SaveManager(path).save(_sample())
+    data = SaveManager(path).load()
+    assert isinstance(data, LazySave)
+    assert "diary" in data and not data.is_decoded("diary")
+    assert data["duck"]["name"] == "Cheese"
+    assert not data.is_decoded("diary")
+    assert dict(data)["diary"] == _sample()["diary"]
+    assert data.is_decoded("diary")
+
+
+def test_blobs_are_read_on_first_access(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save({"duck": {"growth_stage": "egg"}})
+    manager.save({"duck": {"growth_stage": "duckling"}})
+    data = manager.load()
+    # Corrupting the blob after load() is only noticed when it is read,
+    # and the backup's copy of the section is used instead
+    current = json.loads(path.read_text())["sections"]["duck"]["file"]
+    blob = sections_dir(path) / current
+    blob.write_bytes(blob.read_bytes()[:-4] + b"oops")
+    assert data["duck"]["growth_stage"] == "egg"
+
+
+def test_deferred_section_outlives_its_save(tmp_path):
+    path = tmp_path / "save.json"
+    SaveManager(path).save(_sample())
+    data = SaveManager(path).load()
+    read = data.deferred("diary")
+    assert "diary" not in data
+    del data
+    assert read() == _sample()["diary"]
+
+
+def test_keep_section_reuses_or_rewrites_its_blob(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    read = manager.load().deferred("diary")
+    entry = json.loads(path.read_text())["sections"]["diary"]
+
+    assert manager.save({**_sample(), "diary": KeepSection(read)})
+    assert json.loads(path.read_text())["sections"]["diary"] == entry
+
+    # An intact copy is needed; otherwise the section is written again
+    blob = sections_dir(path) / entry["file"]
+    blob.write_bytes(b"x" * entry["bytes"])
+    assert manager.save({**_sample(), "diary": KeepSection(lambda: {"entries": []})})
+    assert json.loads(path.read_text())["sections"]["diary"]["file"] != entry["file"]
+    assert manager.load()["diary"] == {"entries": []}
+
+
+def test_reads_sections_1_saves(tmp_path):
+    path = tmp_path / "save.json"
+    blob_dir = sections_dir(path)
+    blob_dir.mkdir()
+    (blob_dir / "duck.1.json").write_text(json.dumps({"name": "Cheese"}))
+    path.write_text(json.dumps({
+        "version": "2.0",
+        "format": "sections-1",
+        "generation": 1,
+        "inline": {"last_played": "yesterday"},
+        "sections": {"duck": {"file": "duck.1.json", "bytes": 17, "generation": 1}},
+    }))
+    manager = SaveManager(path)
+    assert manager.load()["duck"] == {"name": "Cheese"}
+    assert manager.get_save_info()["name"] == "Cheese"
+    assert manager.save({"weather_seen": []}, partial=True)
+    assert manager.load()["duck"] == {"name": "Cheese"}
+
+
+def test_header_is_read_without_blobs(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    for blob in sections_dir(path).iterdir():
+        blob.unlink()
+    info = manager.get_save_info()
+    assert info["name"] == "Cheese"
+    assert info["stage"] == "duckling"
+    assert info["last_played"] == "2026-01-01T00:00:00"
+
+
+def test_partial_save_updates_header(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save({**_sample(), "progression": {"level": 3}})
+    manager.save({"duck": {"name": "Cheese", "growth_stage": "adult"}}, partial=True)
+    header = manager.read_header()
+    assert header["stage"] == "adult"
+    assert header["level"] == 3
+
+
+def test_build_save_header_legacy_fields():
+    header = build_save_header({
+        "duck": {"name": "Brie", "growth_stage": "egg", "mood_history": ["sad"]},
+        "achievements": {"unlocked": ["a", "b"]},
+        "habitat": {"currency": 12},
+    })
+    assert header["name"] == "Brie"
+    assert header["mood"] == "sad"
+    assert header["achievements_count"] == 2
+    assert header["habitat_currency"] == 12
+
+
+def test_json_export_import_round_trip(tmp_path):
+    path = tmp_path / "save.json"
+    SaveManager(path).save(_sample())
+    export = tmp_path / "export.json"
+    assert SaveManager(path).export_json(export)
+    assert json.loads(export.read_text())["diary"] == _sample()["diary"]
+
+    other = SaveManager(tmp_path / "other.json")
+    assert other.import_json(export)
+    assert other.load()["duck"] == _sample()["duck"]
+
+
+def test_delete_save_removes_blobs(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    assert manager.delete_save()
+    assert not path.exists()
+    assert not sections_dir(path).exists()
+
+
+def test_delete_save_leaves_no_backup_behind(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    manager.save(_sample())
+    assert manager.delete_save()
+    assert not path.with_suffix(".bak").exists()
+    assert manager.read_header() is None and manager.load() is None
+
+
+def test_backup_with_missing_blobs_has_no_header(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    manager.save({**_sample(), "duck": {"name": "Quackers"}})
+    path.unlink()
+    for blob in sections_dir(path).iterdir():
+        blob.unlink()
+    assert manager.read_header() is None
+
+
+def test_unchanged_sections_reuse_their_blob(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save(_sample())
+    first = json.loads(path.read_text())["sections"]
+    manager.save({**_sample(), "duck": {"name": "Cheese", "growth_stage": "adult"}})
+    second = json.loads(path.read_text())
+    assert second["generation"] == 2
+    assert second["sections"]["diary"] == first["diary"]
+    assert second["sections"]["duck"]["file"] == "duck.2.z"
+    assert manager.load()["diary"] == _sample()["diary"]
+
+
+def test_generation_survives_an_unreadable_manifest(tmp_path):
+    path = tmp_path / "save.json"
+    manager = SaveManager(path)
+    manager.save({"duck": {"growth_stage": "egg"}})
+    manager.save({"duck": {"growth_stage": "duckling"}})
+    path.write_text("{not json")
+    # The .bak still points at duck.1.z; a new save must not reuse that name
+    assert manager.save({"duck": {"growth_stage": "teen"}})
+    assert json.loads(path.read_text())["generation"] == 3
+    assert json.loads(path.with_suffix(".bak").read_text())["generation"] == 1
+    assert manager.load()["duck"]["growth_stage"] == "teen"
+
+
+# ── SaveSectionTracker ───────────────────────────────────────────────
+
+
+class _Diary:
+    def __init__(self):
+        self.entries = []
+        self.save_revision = 0
+
+    def add(self, text):
+        self.entries.append(text)
+        self.save_revision += 1
+
+
+def _tracker(diary, calls):
+    tracker = SaveSectionTracker(full_save_every=3)
+
+    def serialize_diary():
+        calls.append("diary")
+        return list(diary.entries)
+
+    tracker.register("duck", lambda: {"hunger": 50})
+    tracker.register("diary", serialize_diary,
+                     revision=lambda: (id(diary), diary.save_revision))
+    return tracker
+
+
+def test_tracker_skips_unchanged_sections():
+    diary, calls = _Diary(), []
+    tracker = _tracker(diary, calls)
+
+    assert set(tracker.collect()) == {"duck", "diary"}
+    assert tracker.last_was_full
+    assert set(tracker.collect()) == {"duck"}
+    assert not tracker.last_was_full
+
+    diary.add("hello")
+    assert tracker.collect()["diary"] == ["hello"]
+    assert calls == ["diary", "diary"]
+
+
+def test_brain_read_paths_leave_save_revision_alone():
+    import time
+    from dialogue.duck_brain import DuckBrain
+
+    brain = DuckBrain()
+    brain.get_idle_thought()                       # First ritual check is persisted
+    brain._last_observation_time = brain._last_callback_time = time.time()
+    revision = brain.save_revision
+    for _ in range(3):
+        assert brain.get_idle_thought()
+        assert brain.get_observation() is None     # On cooldown
+        assert brain.get_callback("hello") is None
+    assert brain.save_revision == revision
+
+    brain.generate_response_via_pipeline("hello")
+    assert brain.save_revision == revision + 1
+
+
+def test_subsystem_save_revisions_track_changes():
+    from core.duck_store import DuckStore
+    from duck.duck import Duck
+    from ui.statistics import StatisticsSystem
+    from world.friends import FriendsSystem
+    from world.quests import QuestSystem
+
+    friends, quests, stats = FriendsSystem(), QuestSystem(), StatisticsSystem()
+    revisions = [friends.save_revision, quests.save_revision, stats.save_revision]
+    friends.get_friend_list()
+    quests.get_available_quests()
+    stats.get_overview_stats()
+    stats.set_value("current_level", stats.current_level)
+    stats.record_best("most_coins_held", 0)
+    assert [friends.save_revision, quests.save_revision, stats.save_revision] == revisions
+
+    friends.start_visit()
+    quests.start_quest("welcome_duckling")
+    stats.add_to_count("items_bought")
+    assert friends.save_revision > revisions[0]
+    assert quests.save_revision > revisions[1]
+    assert stats.save_revision > revisions[2]
+
+    duck = Duck.create_new("Cheese")
+    store = DuckStore(duck)
+    revision = duck.save_revision
+    store.sync_to_duck(duck)                        # Nothing new to push
+    assert duck.save_revision == revision
+    store.change_need("hunger", -10)
+    store.sync_to_duck(duck)
+    assert duck.save_revision == revision + 1
+
+
+def test_tracker_forces_periodic_full_save():
+    diary, calls = _Diary(), []
+    tracker = _tracker(diary, calls)
+    tracker.collect()
+    for _ in range(3):
+        assert "diary" not in tracker.collect()
+    assert "diary" in tracker.collect()
+    assert tracker.last_was_full
+
+
+def test_tracker_reset_and_mark_dirty():
+    diary, calls = _Diary(), []
+    tracker = _tracker(diary, calls)
+    tracker.collect()
+
+    tracker.mark_dirty("diary")
+    assert "diary" in tracker.collect()
+    assert "diary" not in tracker.collect()
+
+    tracker.reset()
+    assert "diary" in tracker.collect()
+    assert tracker.last_was_full
+
+
+def test_tracker_failed_write_recollects_only_its_sections():
+    diary, calls = _Diary(), []
+    tracker = _tracker(diary, calls)
+    tracker.collect()
+    diary.add("hello")
+    written = list(tracker.collect())
+    assert "diary" in written
+
+    # Reported from the save thread; applied by the next collect()
+    tracker.mark_unsaved(written)
+    assert "diary" in tracker.collect()
+    assert not tracker.last_was_full
+    assert "diary" not in tracker.collect()
+
+    tracker.mark_unsaved(["duck"], full=True)
+    assert "diary" in tracker.collect()
+    assert tracker.last_was_full
+
+
+def test_tracker_failed_serializer_saves_nothing():
+    tracker = SaveSectionTracker()
+    state = {"fail": True}
+
+    def serialize():
+        if state["fail"]:
+            raise ValueError("boom")
+        return {}
+
+    tracker.register("diary", serialize, revision=lambda: 1)
+    with pytest.raises(ValueError):
+        tracker.collect()
+    state["fail"] = False
+    assert "diary" in tracker.collect()
+
+
+# ── Save slots ───────────────────────────────────────────────────────
+
+
+def test_save_slots_use_sectioned_saves(tmp_path):
+    slots = SaveSlotsSystem(save_dir=str(tmp_path))
+    assert slots.save_to_slot(2, _sample())
+    assert slots.get_slot(2).duck_name == "Cheese"
+    assert sections_dir(slots.get_save_path(2)).is_dir()
+
+    changed = _sample()
+    changed["duck"]["name"] = "Brie"
+    assert slots.save_to_slot(2, changed)
+    # Backups are plain JSON exports of the previous save
+    backup = json.loads(slots.get_backup_path(2).read_text())
+    assert backup["duck"]["name"] == "Cheese"
+
+    assert slots.restore_backup(2)
+    assert slots.load_slot(2)["duck"]["name"] == "Cheese"
+
+    export = tmp_path / "exported.json"
+    assert slots.export_slot(2, str(export))
+    assert json.loads(export.read_text())["duck"]["name"] == "Cheese"
+
+    assert slots.delete_slot(2)
+    assert slots.get_slot(2).is_empty
+    assert not sections_dir(slots.get_save_path(2)).exists()
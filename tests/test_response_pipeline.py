@@ -1,12 +1,20 @@
 """Tests for dialogue.response_pipeline — ResponsePipeline and ResponseSource."""
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import dialogue.llm_chat as llm_chat_module
+from dialogue.ambient_lines import AmbientLineGenerator
 from dialogue.dialogue_core import DialogueContext, DialogueResponse, DialogueState
+from dialogue.llm_chat import LLMChat, LLMTimingStats, _LLMProxy
 from dialogue.response_pipeline import ResponsePipeline, ResponseSource
 from dialogue.conversation import ConversationSystem
+from duck.duck import Duck
 
 
 def _make_context():
@@ -106,6 +114,101 @@ def test_priority_ordering():
     assert order[0] == "high"  # Lower priority number = tried first
 
 
+def _loaded_llm(monkeypatch, reply_tokens, finished=True):
+    """Install an LLMChat singleton whose worker process streams *reply_tokens*.
+
+    Without *finished* the final result is left for the test to send.
+    """
+    monkeypatch.setattr(llm_chat_module, "_llm_enabled_config", lambda: False)
+    llm = LLMChat()
+    proxy = object.__new__(_LLMProxy)
+    proxy._request_q = queue.Queue()
+    proxy._response_q = queue.Queue()
+    for token in reply_tokens:
+        proxy._response_q.put({"type": "token", "text": token, "id": 1})
+    if finished:
+        proxy._response_q.put({"type": "result", "id": 1, "data": {
+            "choices": [{"message": {"content": "".join(reply_tokens)}}]}})
+    proxy._process = SimpleNamespace(is_alive=lambda: True)
+    proxy._req_counter = 0
+    proxy._send_lock = threading.Lock()
+    proxy.timings = LLMTimingStats()
+    llm._llama = proxy
+    llm._available = True
+    llm._model_name = "qwen-test"
+    monkeypatch.setattr(llm_chat_module, "_llm_chat_instance", llm)
+    return llm
+
+
+def test_conversation_streams_loaded_llm_reply(monkeypatch):
+    llm = _loaded_llm(monkeypatch, ["*stares*", " Bread."])
+    conversation = ConversationSystem()
+    assert conversation.needs_memory_context()
+
+    partials = []
+    reply = conversation.process_player_input(
+        Duck.create_new("Cheese"), "got bread?", on_partial=partials.append)
+    assert partials == ["*stares*", "*stares* Bread."]
+    assert reply == "*stares* Bread."
+    assert llm._llama._request_q.get_nowait()["stream"] is True
+
+
+def test_conversation_without_use_llm_keeps_to_cheap_sources(monkeypatch):
+    llm = _loaded_llm(monkeypatch, ["*stares*", " Bread."])
+    conversation = ConversationSystem()
+    reply = conversation.process_player_input(Duck.create_new("Cheese"), "got bread?",
+                                              use_llm=False)
+    assert reply and reply != "*stares* Bread."
+    assert llm._llama._request_q.empty()
+
+
+def test_conversation_skips_llm_until_the_game_loads_it(monkeypatch):
+    monkeypatch.setattr(llm_chat_module, "_llm_chat_instance", None)
+    conversation = ConversationSystem()
+    assert not conversation.needs_memory_context()
+    assert conversation.process_player_input(Duck.create_new("Cheese"), "hello")
+    assert llm_chat_module._llm_chat_instance is None
+
+
+def _stocked_duck(tmp_path, line):
+    """A duck whose brain has one ambient chat_response line in stock."""
+    with patch("dialogue.ambient_lines.DB_PATH", tmp_path / "brain.db"):
+        generator = AmbientLineGenerator(llm_chat=None, cooldown=0)
+    generator._store_lines([("chat_response", line)], "test")
+    duck = Duck.create_new("Cheese")
+    duck._duck_brain = SimpleNamespace(_ambient_generator=generator)
+    return duck, generator
+
+
+def test_hedged_chat_keeps_ambient_stock_when_llm_answers(monkeypatch, tmp_path):
+    _loaded_llm(monkeypatch, ["*stares*", " Bread."])
+    duck, generator = _stocked_duck(tmp_path, "*nods* Bread. Yes.")
+    conversation = ConversationSystem()
+    assert conversation._get_pipeline().hedge_deadline
+
+    assert conversation.process_player_input(duck, "got bread?") == "*stares* Bread."
+    assert generator.count_unused("chat_response") == 1
+
+
+def test_hedged_chat_serves_ambient_line_then_late_llm_follow_up(monkeypatch, tmp_path):
+    llm = _loaded_llm(monkeypatch, ["*stares*", " Bread."], finished=False)
+    duck, generator = _stocked_duck(tmp_path, "*nods* Bread. Yes.")
+    conversation = ConversationSystem()
+    conversation._get_pipeline().hedge_deadline = 0.05
+
+    assert conversation.process_player_input(duck, "got bread?") == "*nods* Bread. Yes."
+    assert generator.count_unused("chat_response") == 0
+
+    llm._llama._response_q.put({"type": "result", "id": 1, "data": {
+        "choices": [{"message": {"content": "*stares* Bread."}}]}})
+    waited = time.monotonic()
+    follow_up = conversation.take_follow_up()
+    while follow_up is None and time.monotonic() - waited < 5:
+        time.sleep(0.01)
+        follow_up = conversation.take_follow_up()
+    assert follow_up == "*stares* Bread."
+
+
 def test_conversation_only_needs_memory_context_for_direct_llm_source():
     conv = ConversationSystem()
     assert conv.needs_memory_context() is False
@@ -113,3 +216,152 @@ def test_conversation_only_needs_memory_context_for_direct_llm_source():
     conv._pipeline = ResponsePipeline()
     conv._pipeline.register_source(DirectLLMSource(), priority=10)
     assert conv.needs_memory_context() is True
+
+
+class GatedLLMSource(ResponseSource):
+    """Slow source that answers only when its gate opens."""
+    slow = True
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.calls = 0
+    @property
+    def name(self): return "llm"
+    def can_handle(self, context, state): return True
+    def generate(self, context, state):
+        self.calls += 1
+        on_partial = getattr(state, "_on_partial", None)
+        if on_partial:
+            on_partial("draft")
+        assert self.gate.wait(5)
+        if on_partial:
+            on_partial("late draft")
+        return DialogueResponse(text="llm reply", source="llm", confidence=0.85,
+                                actions=[], mood_hint=None, should_record=True)
+    def is_enabled(self): return True
+
+
+class PreviewSource(AlwaysSource):
+    """Cheap source that counts previews, commits and plain generates."""
+
+    def __init__(self):
+        self.previews = self.commits = self.generates = 0
+    def generate(self, context, state):
+        self.generates += 1
+        return super().generate(context, state)
+    def preview(self, context, state):
+        self.previews += 1
+        return super().generate(context, state)
+    def commit(self, response, context, state):
+        self.commits += 1
+
+
+class UnpreviewableSource(PreviewSource):
+    previewable = False
+
+
+def _hedged_pipeline(deadline, cheap=None):
+    pipe = ResponsePipeline(hedge_deadline=deadline)
+    llm = GatedLLMSource()
+    pipe.register_source(llm, priority=1)
+    pipe.register_source(NeverSource(), priority=10)
+    pipe.register_source(cheap or AlwaysSource(), priority=20)
+    return pipe, llm
+
+
+def test_hedged_slow_source_wins_within_deadline():
+    cheap = PreviewSource()
+    pipe, llm = _hedged_pipeline(deadline=5.0, cheap=cheap)
+    llm.gate.set()
+    resp = pipe.generate_response(_make_context(), DialogueState())
+    assert resp.source == "llm" and resp.text == "llm reply"
+    assert pipe.get_hedge_stats()["missed"] == 0
+    # The fallback was ready, but nothing it would have used up was touched
+    assert (cheap.previews, cheap.commits, cheap.generates) == (1, 0, 0)
+
+
+def test_hedged_miss_commits_the_previewed_answer():
+    cheap = PreviewSource()
+    pipe, llm = _hedged_pipeline(deadline=0.05, cheap=cheap)
+    assert pipe.generate_response(_make_context(), DialogueState()).text == "always"
+    assert (cheap.previews, cheap.commits, cheap.generates) == (1, 1, 0)
+    llm.gate.set()
+
+
+def test_hedged_unpreviewable_source_waits_for_the_miss():
+    cheap = UnpreviewableSource()
+    pipe, llm = _hedged_pipeline(deadline=5.0, cheap=cheap)
+    llm.gate.set()
+    assert pipe.generate_response(_make_context(), DialogueState()).source == "llm"
+    assert (cheap.previews, cheap.generates) == (0, 0)
+
+
+def test_hedged_deadline_miss_serves_cheap_answer_and_keeps_late_one():
+    pipe, llm = _hedged_pipeline(deadline=0.05)
+    late = []
+    done = threading.Event()
+    pipe.on_late_response = lambda response: (late.append(response), done.set())
+    partials = []
+    state = DialogueState()
+    state._on_partial = partials.append
+
+    start = time.perf_counter()
+    resp = pipe.generate_response(_make_context(), state)
+    assert resp.text == "always"
+    assert time.perf_counter() - start < 2.0
+
+    llm.gate.set()
+    assert done.wait(5)
+    assert partials == ["draft"]                   # Nothing streamed over the served reply
+    assert [r.text for r in late] == ["llm reply"]
+    assert pipe.take_late_response().text == "llm reply"
+    assert pipe.take_late_response() is None
+    assert pipe.get_hedge_stats() == {"deadline": 0.05, "hedged": 1, "missed": 1, "late_pending": 0}
+
+
+def test_conversation_drops_late_reply_from_a_superseded_turn():
+    conversation = ConversationSystem()
+    pipe, llm = _hedged_pipeline(deadline=0.05)
+    pipe.on_late_response = conversation._on_late_response
+    conversation._pipeline = pipe
+    duck = Duck.create_new("Cheese")
+
+    assert conversation.process_player_input(duck, "hello?")
+    slow_call = pipe._inflight
+    # The next turn arrives while the first one's LLM call is still running
+    # and does not queue another
+    assert conversation.process_player_input(duck, "anyone there?")
+    assert llm.calls == 1
+
+    finished = threading.Event()
+    slow_call.add_done_callback(lambda future: finished.set())
+    llm.gate.set()
+    assert finished.wait(5)
+    assert conversation.take_follow_up() is None
+    assert pipe.take_late_response() is None
+
+
+def test_source_latencies_are_tracked_per_source():
+    pipe = ResponsePipeline()
+    pipe.register_source(NeverSource(), priority=10)
+    pipe.register_source(AlwaysSource(), priority=20)
+    for _ in range(3):
+        pipe.generate_response(_make_context(), DialogueState())
+    latencies = pipe.get_source_latencies()
+    assert set(latencies) == {"never", "always"}
+    assert latencies["always"]["count"] == 3
+    assert sum(latencies["always"]["histogram"].values()) == 3
+    assert pipe.get_voice_health()["source_latency_ms"] == latencies
+
+
+def test_conversation_shows_late_llm_reply_as_follow_up():
+    from dialogue.conversation import ConversationSystem
+
+    conversation = ConversationSystem()
+    pipe = conversation._get_pipeline()
+    pipe.on_late_response(DialogueResponse(text="late thought", source="llm", confidence=0.85))
+    assert conversation.take_follow_up() == "late thought"
+    assert conversation.take_follow_up() is None
+
+    conversation._follow_ups.append((time.monotonic() - 3600, "stale thought"))
+    assert conversation.take_follow_up() is None
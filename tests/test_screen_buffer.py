@@ -0,0 +1,90 @@
+"""Tests for ui.screen_buffer — cell-level diff rendering."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ui.screen_buffer import ScreenBuffer, parse_cells, apply_sgr, DEFAULT_STYLE, WIDE_CONTINUATION
+
+
+def _move(row, col):
+    return f"\x1b[{row + 1};{col + 1}H"
+
+
+RED = "\x1b[38;2;255;0;0m"
+RESET = "\x1b[m"
+
+
+def test_parse_cells_pads_and_tracks_style():
+    chars, styles = parse_cells(f"a{RED}b{RESET}c", 5)
+    assert chars == ["a", "b", "c", " ", " "]
+    assert styles[0] == DEFAULT_STYLE
+    assert styles[1] == ("38;2;255;0;0", None, ())
+    assert styles[2] == DEFAULT_STYLE
+
+
+def test_parse_cells_truncates():
+    chars, _ = parse_cells("abcdef", 3)
+    assert chars == ["a", "b", "c"]
+
+
+def test_apply_sgr_combined_codes():
+    style = apply_sgr(DEFAULT_STYLE, "1;38;5;208;48;2;1;2;3")
+    assert style == ("38;5;208", "48;2;1;2;3", ("1",))
+    assert apply_sgr(style, "22") == ("38;5;208", "48;2;1;2;3", ())
+    assert apply_sgr(style, "0") == DEFAULT_STYLE
+
+
+def test_first_render_clears_and_paints():
+    buf = ScreenBuffer(move=_move)
+    out = buf.render(["hello", "world"], 10)
+    assert out.startswith("\x1b[H\x1b[2J")
+    assert "hello" in out and "world" in out
+
+
+def test_identical_frame_writes_nothing():
+    buf = ScreenBuffer(move=_move)
+    buf.render(["hello", "world"], 10)
+    assert buf.render(["hello", "world"], 10) == ""
+
+
+def test_only_changed_cells_are_written():
+    buf = ScreenBuffer(move=_move)
+    row = "." * 80
+    buf.render([row] * 30, 80)
+    changed = row[:40] + "*" + row[41:]
+    out = buf.render([row] * 10 + [changed] + [row] * 19, 80)
+    assert out == _move(10, 40) + "*" + RESET
+    assert buf.last_cells_changed == 1
+
+
+def test_style_change_alone_is_emitted():
+    buf = ScreenBuffer(move=_move)
+    buf.render(["abc"], 3)
+    out = buf.render([f"a{RED}b{RESET}c"], 3)
+    assert out.startswith(_move(0, 1))
+    assert "38;2;255;0;0" in out
+    assert "b" in out
+
+
+def test_invalidate_forces_repaint():
+    buf = ScreenBuffer(move=_move)
+    buf.render(["abc"], 3)
+    buf.invalidate()
+    out = buf.render(["abc"], 3)
+    assert "abc" in out
+
+
+def test_wide_glyphs_take_two_columns():
+    chars, _ = parse_cells("ab📺c", 6)
+    assert chars == ["a", "b", "📺", WIDE_CONTINUATION, "c", " "]
+    chars, _ = parse_cells("abcd⌚", 5)
+    assert chars == ["a", "b", "c", "d", " "]          # Would straddle the edge
+    assert parse_cells("éx", 3)[0] == ["é", "x", " "]   # Combining mark
+
+
+def test_cursor_moves_by_display_column_after_wide_glyph():
+    buf = ScreenBuffer(move=lambda y, x: f"<{y},{x}>", normal="")
+    buf.render(["ab📺cdefgh"], 12)
+    assert buf.render(["ab📺cdefXh"], 12) == "<0,8>X"
+    assert buf.render(["abXYcdefXh"], 12) == "<0,2>XY"
+    assert buf.render(["ab～cdefXh"], 12) == "<0,2>～"
@@ -0,0 +1,231 @@
+"""Tests for audio.sfx_mixer — cached effect PCM, dispatcher thread, voice limits."""
+import array
+import math
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from audio.sfx_mixer import AudioDispatcher, EffectCache, VoiceLimiter, render_tones
+from audio.sound import SOUND_EFFECTS, DuckSounds, SoundType
+from audio.sound_effects import SoundPriority
+
+
+def _reference_pcm(tones, volume=1.0):
+    """The per-sample synthesis play_sound used to run on every call."""
+    buf = array.array('h')
+    for freq, duration in tones:
+        n_samples = int(44100 * duration)
+        fade_len = min(int(n_samples * 0.1), 200)
+        for i in range(n_samples):
+            val = math.sin(2 * math.pi * freq * i / 44100)
+            if fade_len > 0:
+                if i < fade_len:
+                    val *= i / fade_len
+                elif i >= n_samples - fade_len:
+                    val *= (n_samples - 1 - i) / fade_len
+            sample = int(val * 32767 * volume * 0.15)
+            buf.append(sample)
+            buf.append(sample)
+    return buf
+
+
+def _samples(pcm):
+    out = array.array('h')
+    out.frombytes(pcm)
+    return out
+
+
+def test_render_matches_reference_synthesis(monkeypatch):
+    # Force the pure-Python path so the comparison is exact
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    tones = SOUND_EFFECTS[SoundType.QUACK]
+    assert _samples(render_tones(tones)) == _reference_pcm(tones)
+
+
+def test_numpy_render_matches_reference():
+    pytest.importorskip("numpy")
+    tones = SOUND_EFFECTS[SoundType.LEVEL_UP]
+    rendered, reference = _samples(render_tones(tones)), _reference_pcm(tones)
+    assert len(rendered) == len(reference)
+    assert max(abs(a - b) for a, b in zip(rendered, reference)) <= 1
+
+
+def test_effect_cache_renders_each_effect_once():
+    calls = []
+    cache = EffectCache(
+        {"a": [(440, 0.01)], "b": [(880, 0.01)]},
+        make_sound=lambda pcm: ("sound", len(pcm)),
+        render=lambda tones: calls.append(tones) or b"\0" * 8,
+    )
+    assert cache.sound("a") is cache.sound("a")
+    assert len(calls) == 1
+    assert cache.warm_next()
+    assert not cache.warm_next()
+    assert len(calls) == 2 and len(cache) == 2
+
+
+# ── Voice limiting ───────────────────────────────────────────────────
+
+
+class _Channel:
+    def __init__(self):
+        self.busy = True
+        self.volume = None
+
+    def get_busy(self):
+        return self.busy
+
+    def stop(self):
+        self.busy = False
+
+    def set_volume(self, volume):
+        self.volume = volume
+
+
+class _Sound:
+    def play(self):
+        return _Channel()
+
+
+def test_voice_limiter_steals_lower_priority():
+    limiter = VoiceLimiter(max_voices=2)
+    step = limiter.play(_Sound(), SoundPriority.LOW)
+    limiter.play(_Sound(), SoundPriority.MEDIUM)
+    alert = limiter.play(_Sound(), SoundPriority.HIGH, volume=0.5)
+    assert alert.volume == 0.5
+    assert not step.busy
+    assert limiter.stolen == 1 and limiter.active() == 2
+
+
+def test_voice_limiter_drops_when_nothing_outranked():
+    limiter = VoiceLimiter(max_voices=1)
+    first = limiter.play(_Sound(), SoundPriority.MEDIUM)
+    assert limiter.play(_Sound(), SoundPriority.MEDIUM) is None
+    assert first.busy and limiter.dropped == 1
+    # A finished voice frees its slot
+    first.busy = False
+    assert limiter.play(_Sound(), SoundPriority.LOW) is not None
+
+
+# ── Dispatcher ───────────────────────────────────────────────────────
+
+
+def test_dispatcher_runs_commands_in_due_order():
+    dispatcher = AudioDispatcher(max_queue=16)
+    order, done = [], threading.Event()
+    try:
+        start = time.monotonic()
+        dispatcher.schedule(0.08, lambda: (order.append(("late", time.monotonic() - start)),
+                                           done.set()))
+        dispatcher.schedule(0.03, lambda: order.append(("soon", 0)))
+        dispatcher.submit(lambda: order.append(("now", 0)))
+        assert done.wait(2.0)
+        assert [name for name, _ in order] == ["now", "soon", "late"]
+        assert order[-1][1] >= 0.07
+    finally:
+        dispatcher.shutdown()
+
+
+def test_dispatcher_refuses_low_priority_when_backed_up():
+    dispatcher = AudioDispatcher(max_queue=4)
+    gate, release = threading.Event(), threading.Event()
+    try:
+        dispatcher.submit(lambda: (gate.set(), release.wait(2.0)))
+        assert gate.wait(2.0)
+        assert dispatcher.submit(lambda: None, SoundPriority.MEDIUM)
+        assert dispatcher.submit(lambda: None, SoundPriority.MEDIUM)
+        assert not dispatcher.submit(lambda: None, SoundPriority.LOW)
+        assert dispatcher.submit(lambda: None, SoundPriority.HIGH)
+        assert dispatcher.submit(lambda: None, SoundPriority.HIGH)
+        assert not dispatcher.submit(lambda: None, SoundPriority.HIGH)
+        assert dispatcher.dropped == 2
+    finally:
+        release.set()
+        dispatcher.shutdown()
+
+
+def test_dispatcher_idle_task_runs_until_done():
+    remaining, done = [3], threading.Event()
+
+    def idle():
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            done.set()
+        return remaining[0] > 0
+
+    dispatcher = AudioDispatcher(idle=idle)
+    try:
+        dispatcher.submit(lambda: None)
+        assert done.wait(2.0)
+        time.sleep(0.02)
+        assert remaining == [0]
+    finally:
+        dispatcher.shutdown()
+
+
+def test_dispatcher_blocks_when_idle():
+    dispatcher = AudioDispatcher()
+    drains, ran = [0], threading.Event()
+    drain = dispatcher._drain
+
+    def counting_drain(timeout):
+        drains[0] += 1
+        return drain(timeout)
+
+    dispatcher._drain = counting_drain
+    try:
+        dispatcher.submit(ran.set)
+        assert ran.wait(2.0)
+        time.sleep(0.2)
+        assert drains[0] <= 3                  # Not a busy loop
+        dispatcher.submit(lambda: None)        # Still wakes up for new work
+        time.sleep(0.05)
+        assert dispatcher.pending() == 0
+    finally:
+        dispatcher.shutdown()
+
+
+# ── DuckSounds on the dispatcher ─────────────────────────────────────
+
+
+class _Engine:
+    def __init__(self):
+        self._available_wavs = {"quack": Path("quack.wav")}
+        self.scheduled = []
+        self.quacks = 0
+
+    def schedule(self, delay, fn, priority=SoundPriority.MEDIUM):
+        self.scheduled.append((delay, fn))
+        return True
+
+    def play_wav(self, name, volume=None):
+        self.quacks += 1
+
+
+def test_panic_schedules_sos_rounds_until_stopped():
+    engine = _Engine()
+    duck = DuckSounds(engine)
+    duck.panic()
+    delays = [round(delay, 2) for delay, _ in engine.scheduled]
+    assert delays == [0.0, 0.1, 0.2, 0.45, 0.7, 0.95, 1.35, 1.45, 1.55, 2.25]
+
+    for _, fn in engine.scheduled[:3]:
+        fn()
+    assert engine.quacks == 3
+    duck.stop_panic()
+    for _, fn in engine.scheduled[3:]:
+        fn()
+    assert engine.quacks == 3
+    assert len(engine.scheduled) == 10  # the re-arm did not queue another round
+
+
+def test_quack_for_text_uses_scheduled_offsets():
+    engine = _Engine()
+    DuckSounds(engine).quack_for_text("hello there friend")
+    delays = [delay for delay, _ in engine.scheduled]
+    assert delays[0] == 0.0 and delays == sorted(delays)
+    assert all(0.12 <= b - a <= 0.2 for a, b in zip(delays, delays[1:]))
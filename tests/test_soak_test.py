@@ -0,0 +1,75 @@
+"""Tests for core.soak_test — headless soak runs and baseline comparison."""
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.persistence import SaveManager
+from core.soak_test import HeadlessTerminal, SoakTester, VirtualClock, compare_to_baseline
+
+GAME_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_compare_to_baseline_needs_ratio_and_absolute_slack():
+    baseline = {"metrics": {"frame_p95_ms": 10.0, "update_p95_ms": 0.2,
+                            "save_max_bytes": 100000, "rss_growth_mb": 1.0}}
+    metrics = {"frame_p95_ms": 14.0, "update_p95_ms": 0.6,
+               "save_max_bytes": 110000, "rss_growth_mb": 0.5}
+    regressions = compare_to_baseline(metrics, baseline, tolerance=0.25)
+    # 0.2 -> 0.6 ms is 3x but under the 1 ms slack; 100000 -> 110000 is within 25%
+    assert regressions == ["frame_p95_ms: 10 -> 14 (1.40x)"]
+    assert compare_to_baseline(metrics, baseline, tolerance=0.5) == []
+
+
+def test_virtual_clock_replaces_time_only_while_installed():
+    clock = VirtualClock(1000.0)
+    with clock.installed():
+        clock.advance(60.0)
+        assert time.time() == 1060.0
+    assert time.time() > 1e9
+
+
+def test_instrumented_saves_report_section_blob_sizes(tmp_path):
+    game = SimpleNamespace(save_manager=SaveManager(tmp_path / "save.json"),
+                           _save_game=lambda: None)
+    tester = SoakTester(game, days=0.01)
+    tester._instrument_saves()
+    game.save_manager.save({"duck": {"name": "Cheese"}, "diary": {"entries": []}})
+    # Only the diary blob grows; the manifest stays about the same size
+    entries = [{"title": f"Day {i}", "text": f"{i * 7919:x}" * 20} for i in range(200)]
+    game.save_manager.save({"diary": {"entries": entries}}, partial=True)
+    first, second = tester._save_sizes
+    assert second > first + 1000
+    assert second == game.save_manager.save_size()
+
+
+def test_headless_terminal_has_fixed_size_and_no_input():
+    term = HeadlessTerminal(100, 30)
+    assert (term.width, term.height) == (100, 30)
+    assert term.move_xy(2, 3) and not term.inkey(timeout=0)
+
+
+def _soak(tmp_path, name, *extra):
+    report = tmp_path / f"{name}.json"
+    result = subprocess.run(
+        [sys.executable, str(GAME_DIR / "soak_test.py"), "--days", "0.02", "--seed", "7",
+         "--size", "100x30", "--report", str(report), *extra],
+        cwd=tmp_path, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(report.read_text())
+
+
+def test_seeded_soak_runs_replay_and_pass_their_own_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    first = _soak(tmp_path, "first", "--write-baseline", str(baseline))
+    assert first["frames"] == 28 and first["errors"] == {}
+    assert first["saves"]["count"] > 0 and first["saves"]["max_bytes"] > 0
+    assert first["frame_ms"]["count"] == 28 and first["bytes_per_frame"]["max"] > 0
+    assert "update.scheduler" in first["sections"]
+    assert json.loads(baseline.read_text())["run"]["seed"] == 7
+
+    second = _soak(tmp_path, "second", "--compare", str(baseline), "--tolerance", "1000")
+    assert second["final_state"] == first["final_state"]
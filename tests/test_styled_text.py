@@ -0,0 +1,59 @@
+"""Tests for ui.styled_text — run-based ANSI-aware text."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ui.styled_text import StyledText
+
+RED = "\x1b[31m"
+RESET = "\x1b(B\x1b[m"
+
+
+def test_parse_roundtrip_and_width():
+    s = f"ab{RED}cd{RESET}e"
+    text = StyledText.parse(s)
+    assert str(text) == s
+    assert text.width == 5
+    assert text.plain == "abcde"
+
+
+def test_plain_string_fast_path():
+    text = StyledText.parse("hello")
+    assert text.width == 5
+    assert str(text.ljust(7)) == "hello  "
+
+
+def test_slice_keeps_only_codes_inside_range():
+    s = f"ab{RED}cd{RESET}e"
+    text = StyledText.parse(s)
+    # The red code sits at visible position 2
+    assert str(text.slice(2, 4)) == f"{RED}cd"
+    # Starting inside the red run drops the code (no colour bleed)
+    assert str(text.slice(3, 5)) == f"d{RESET}e"
+    assert str(text.slice(0, 2)) == "ab"
+    # A full-width slice is the text itself
+    assert text.slice(0, 5) is text
+
+
+def test_padding_helpers():
+    text = StyledText.parse(f"{RED}x{RESET}")
+    assert str(text.center(4)) == f" {RED}x{RESET}  "
+    assert str(text.rjust(3)) == f"  {RED}x{RESET}"
+    assert text.fit(3).width == 3
+    assert StyledText.parse("abcdef").fit(3) == "abc"
+
+
+def test_concatenation_tracks_width():
+    left = StyledText.parse(f"{RED}ab")
+    combined = left + RESET + "cd"
+    assert combined.width == 4
+    assert str(combined) == f"{RED}ab{RESET}cd"
+    assert str("x" + left) == f"x{RED}ab"
+
+
+def test_visible_helpers_delegate():
+    from ui.renderer import _visible_len, _visible_slice, _visible_center
+    s = f"ab{RED}cd{RESET}e"
+    assert _visible_len(s) == 5
+    assert _visible_slice(s, 1, 3) == f"b{RED}c"
+    assert _visible_center("ab", 6) == "  ab  "
@@ -76,3 +76,13 @@ def test_get_stats_run_count():
     sched.update(time.time() + 1)
     stats = sched.get_stats()
     assert stats["counter"]["run_count"] >= 2
+
+
+def test_next_due_time_is_earliest_enabled_system():
+    sched = UpdateScheduler()
+    assert sched.next_due_time() is None
+    sched.register("slow", lambda: None, 60.0, enabled=True)
+    sched.register("fast", lambda: None, 2.0, enabled=True)
+    sched.register("off", lambda: None, 0.5, enabled=False)
+    fast_due = sched._systems["fast"].last_update + 2.0
+    assert sched.next_due_time() == fast_due
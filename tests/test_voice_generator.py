@@ -0,0 +1,116 @@
+"""Tests for dialogue.voice_generator — validated line pool."""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from dialogue.voice_generator import LinePool, VoiceGenerator, content_words
+
+CORPUS = [
+    "The pond is cold today and I am not amused by it.",
+    "Bread is the only honest food in this whole pond.",
+    "I watched the clouds for an hour and they did nothing useful.",
+    "The clouds are judging me again from very far away.",
+    "Bread appears when you least expect it and never when you need it.",
+    "I am not sulking, I am resting my feathers with great purpose.",
+    "Nobody asked the frogs to sing but here we are again.",
+    "The frogs are loud and the pond is small and I am tired.",
+]
+
+
+def test_content_words_match_the_pipeline_hint_rule():
+    assert content_words("Bread? The BREAD, is mine.") == ("bread", "mine")
+
+
+def test_pool_takes_by_hint_and_evicts_oldest():
+    pool = LinePool(capacity=2)
+    assert pool.add("Bread is fine I suppose.")
+    assert not pool.add("Bread is fine I suppose.")
+    pool.add("The pond is cold.")
+    pool.add("Clouds again, naturally.")                 # Evicts the bread line
+    assert len(pool) == 2
+    assert pool.take("bread") is None
+    assert pool.take("cold pond?") == "The pond is cold."
+    assert pool.take("pond") is None                     # Index entry went with it
+    assert pool.take() == "Clouds again, naturally."
+    assert pool.take() is None
+
+
+def _trained(tmp_path, pool_size=8):
+    pytest.importorskip("markovify")
+    generator = VoiceGenerator(brain_path=tmp_path / "voice.json", pool_size=pool_size)
+    generator.train(CORPUS)
+    assert generator.is_trained
+    return generator
+
+
+def test_generate_serves_pool_without_running_the_chain(tmp_path, monkeypatch):
+    generator = _trained(tmp_path)
+    assert generator.refill(budget=1.0) == len(generator.pool) == 8
+    assert generator.refill(budget=1.0) == 0             # Already full
+
+    tried = []
+
+    def hint_attempt_only(hint, max_attempts, hint_only=False):
+        assert hint_only and max_attempts == 1, "full chain ran"
+        tried.append(hint)
+        return None
+
+    monkeypatch.setattr(generator, "_make_line", hint_attempt_only)
+    stocked = set(generator.pool.lines())
+    served = [generator.generate(hint="zzzz") for _ in range(8)]
+    assert set(served) == stocked
+    assert tried == list(generator._wanted_hints) == ["zzzz"] * 8
+
+
+def test_hint_miss_tries_a_hint_started_line_first(tmp_path):
+    generator = _trained(tmp_path)
+    generator.pool.add("Nothing about that here.")
+    random.seed(3)
+    assert generator.generate(hint="Bread").startswith("Bread")
+    assert len(generator.pool) == 1
+
+
+def test_missed_hints_are_made_first_on_refill(tmp_path):
+    generator = _trained(tmp_path, pool_size=1)
+    generator._wanted_hints.append("Bread")
+    generator.refill(budget=1.0)
+    assert generator.pool.lines()[0].startswith("Bread")
+
+
+def test_pool_persists_next_to_the_brain_file(tmp_path):
+    generator = _trained(tmp_path)
+    generator.refill(budget=1.0)
+    generator.pool.add("Blatant enthusiasm!!! Everything is great!!! Wow!!! Yes!!!")
+    assert generator.save_pool() and not generator.save_pool()
+    assert (tmp_path / "voice_pool.json").exists()
+
+    reloaded = VoiceGenerator(brain_path=tmp_path / "voice.json", pool_size=8)
+    assert reloaded.load()
+    assert reloaded.pool.lines() == generator.pool.lines()[:-1]   # Filter re-applied on load
+    assert not reloaded.pool.dirty
+
+
+def test_refill_leaves_the_global_random_sequence_alone(tmp_path):
+    generator = _trained(tmp_path)
+    random.seed(11)
+    expected = random.random()
+    random.seed(11)
+    assert generator.refill(budget=1.0) > 0
+    assert random.random() == expected
+
+
+def test_refill_holds_the_generator_lock_while_swapped(tmp_path, monkeypatch):
+    generator = _trained(tmp_path)
+    chain = generator._chain_line
+    held = []
+
+    def checking_chain(*args, **kwargs):
+        held.append(generator._lock.locked())
+        return chain(*args, **kwargs)
+
+    monkeypatch.setattr(generator, "_chain_line", checking_chain)
+    generator.refill(budget=1.0)
+    assert held and all(held)
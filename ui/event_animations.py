@@ -187,8 +187,8 @@ class EventAnimator:
         dy = target_y - self.y
         distance = math.sqrt(dx * dx + dy * dy)
         
-        if distance < self.speed:
-            # Reached this waypoint
+        if distance <= self.speed:
+            # Reached this waypoint (stationary animators have speed 0)
             self.x = target_x
             self.y = target_y
             self.path_index += 1
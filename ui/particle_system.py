@@ -1,11 +1,17 @@
 """
-Unified particle system for weather effects and biome ambient particles.
+Unified particle engine for weather effects and biome ambient particles.
 
-Replaces both ``Renderer._generate_weather_decorations()`` and
-``Renderer._update_ambient_particles()`` with a single, composable system.
-All particle configs, movement, spawning, and despawning are handled here
-with no Terminal/UI dependency -- callers receive integer positions and RGB
-colours ready for rendering.
+The renderer's only particle path: all particle configs, movement, spawning,
+and despawning are handled here with no Terminal/UI dependency -- callers
+receive integer positions and RGB colours ready for rendering.
+
+Particles are stored struct-of-arrays (:class:`ParticleArrays`): position,
+speed, age, lifetime, glyph index and motion code live in parallel columns,
+NumPy arrays when NumPy is installed and ``array``-module arrays otherwise.
+Each update moves, ages and culls a whole layer as one batch, and every
+config's characters are resolved to glyph-palette indices when the config is
+loaded, so spawning is an index draw rather than a ``random.choice`` plus an
+object per particle.
 
 Performance note: this system is designed for 60 fps.  Weather and ambient
 particles internally skip every other update (effective 30 fps) to match the
@@ -15,9 +21,19 @@ from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from itertools import compress, repeat
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 # ── Enums ─────────────────────────────────────────────────────────────────────
@@ -32,6 +48,70 @@ class ParticleDirection(Enum):
     SWIRL = "swirl"
 
 
+# Integer code stored per particle in the ``motion`` column
+_MOTION_CODES: Dict[ParticleDirection, int] = {d: i for i, d in enumerate(ParticleDirection)}
+
+# Ambient motion coefficients per direction. Each update, with u, v ~ U(-1, 1):
+#   x += dx*speed + u*(jx + jxs*speed) + sin(2*age)*swirl*speed
+#   y += dy*speed + v*(jy + jys*speed) + cos(2*age)*swirl*speed/2
+# and the particle despawns with probability ``fade``.
+_AMBIENT_MOTION: Dict[ParticleDirection, Tuple[float, ...]] = {
+    #                               dx    dy    jx    jxs   jy    jys  swirl  fade
+    ParticleDirection.FALL:        (0.0, 1.0, 0.15, 0.0, 0.0, 0.0, 0.0, 0.0),
+    ParticleDirection.FLOAT_UP:    (0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 0.0),
+    ParticleDirection.DRIFT_RIGHT: (1.0, 0.0, 0.0, 0.0, 0.05, 0.0, 0.0, 0.0),
+    ParticleDirection.DRIFT_LEFT:  (-1.0, 0.0, 0.0, 0.0, 0.05, 0.0, 0.0, 0.0),
+    ParticleDirection.STATIC:      (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.03),
+    ParticleDirection.SWIRL:       (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+}
+_MOTION_ROWS: List[Tuple[float, ...]] = [_AMBIENT_MOTION[d] for d in ParticleDirection]
+
+
+class _Drift(NamedTuple):
+    """Horizontal weather drift: ``x += shift + U(lo, hi) + amp*sin(frame*freq + phase)``.
+
+    The wave phase is the particle's y (``"y"``) or x (``"x"``) before it moves.
+    """
+    shift: float = 0.0
+    lo: float = 0.0
+    hi: float = 0.0
+    freq: float = 0.0
+    amp: float = 0.0
+    phase: str = "y"
+
+
+_NO_DRIFT = _Drift()
+_WEATHER_DRIFT: Dict[str, _Drift] = {
+    name: drift
+    for names, drift in (
+        (("windy", "wind", "blizzard", "leaf_storm"), _Drift(shift=0.8)),
+        (("autumn_wind", "gentle_wind", "breezy"), _Drift(shift=0.5)),
+        (("snowy", "snow", "light_snow", "heavy_snow", "flurries"), _Drift(lo=-0.3, hi=0.3)),
+        (("falling_leaves",), _Drift(lo=-0.4, hi=0.4)),
+        (("stormy", "storm", "thunderstorm", "summer_storm"), _Drift(lo=-0.5, hi=0.5)),
+        (("aurora",), _Drift(freq=0.1, amp=0.3, phase="y")),
+        (("meteors",), _Drift(shift=1.5)),
+        (("pollen",), _Drift(lo=-0.2, hi=0.4)),
+        (("heat_shimmer",), _Drift(freq=0.2, amp=0.2, phase="x")),
+    )
+    for name in names
+}
+
+_STORM_TYPES = frozenset({"stormy", "storm", "thunderstorm", "summer_storm", "ice_storm"})
+_LIGHTNING_RGB = (255, 255, 150)
+_AURORA_CHARS = ("|", "~", "/", "\\")
+_AURORA_RGB = (100, 255, 200)
+
+_INF = float("inf")
+
+# Ambient weather above this intensity suppresses the biome layer
+_AMBIENT_SUPPRESS_INTENSITY = 0.7
+
+# Ambient spawns are sparse: with no particle alive, the event-driven loop
+# only wakes this often (seconds) to give the spawners another roll
+AMBIENT_SPAWN_INTERVAL = 0.5
+
+
 # ── Data classes ──────────────────────────────────────────────────────────────
 
 @dataclass
@@ -63,27 +143,117 @@ class ParticleConfig:
 
 
 @dataclass
-class Particle:
-    """A single live particle instance.
+class _SpawnTable:
+    """A config resolved for spawning: glyph-palette indices and column values."""
+    density: float
+    glyphs: Any          # Palette indices (ndarray with NumPy, else a list)
+    speed: float         # Signed: negative rises (weather) -- ambient uses the magnitude
+    life: float
+    motion: int
+    direction: ParticleDirection
 
-    Attributes:
-        x: Current x position (float for sub-cell precision).
-        y: Current y position.
-        char: Character to render.
-        color_rgb: RGB colour tuple.
-        direction: Movement direction.
-        speed: Movement speed.
-        age: Seconds since spawn.
-        lifetime: Maximum lifetime or ``None``.
+
+# ── Struct-of-arrays storage ─────────────────────────────────────────────────
+
+class ParticleArrays:
+    """One layer of particles stored as parallel columns.
+
+    Float columns: ``x``, ``y``, ``speed``, ``age`` and ``life`` (seconds,
+    ``inf`` for particles only removed at the edges).  Int columns:
+    ``glyph`` (index into the owning system's palette) and ``motion`` (a
+    :class:`ParticleDirection` code).
+
+    With NumPy the columns are preallocated arrays grown by doubling and only
+    the first ``len(self)`` entries are live; without it they are ``array``
+    objects holding exactly the live entries.
     """
-    x: float
-    y: float
-    char: str
-    color_rgb: Tuple[int, int, int]
-    direction: ParticleDirection
-    speed: float
-    age: float = 0.0
-    lifetime: Optional[float] = None
+
+    FLOATS = ("x", "y", "speed", "age", "life")
+    INTS = ("glyph", "motion")
+    COLUMNS = FLOATS + INTS
+
+    def __init__(self, np=None, capacity: int = 64) -> None:
+        self.np = np
+        self.size = 0
+        for name in self.FLOATS:
+            setattr(self, name, np.zeros(capacity) if np is not None else array("d"))
+        for name in self.INTS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int32) if np is not None
+                    else array("i"))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str):
+        """Live entries of column *name* (a writable view with NumPy)."""
+        values = getattr(self, name)
+        return values[:self.size] if self.np is not None else values
+
+    def extend(self, count: int, x, y, speed, life, glyph, motion) -> None:
+        """Append *count* particles, all at age 0.
+
+        Each argument is a sequence of *count* values or a scalar shared by
+        the whole batch.
+        """
+        if count <= 0:
+            return
+        values = (x, y, speed, 0.0, life, glyph, motion)
+        end = self.size + count
+        if self.np is not None:
+            if end > len(self.x):
+                self._grow(end)
+            for name, value in zip(self.COLUMNS, values):
+                getattr(self, name)[self.size:end] = value
+        else:
+            for name, value in zip(self.COLUMNS, values):
+                column = getattr(self, name)
+                column.extend(repeat(value, count) if isinstance(value, (int, float)) else value)
+        self.size = end
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * len(self.x))
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = self.np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def compact(self, keep) -> None:
+        """Keep only the particles where *keep* is true, preserving order."""
+        if self.np is not None:
+            kept = int(self.np.count_nonzero(keep))
+            if kept == self.size:
+                return
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[:kept] = column[:self.size][keep]
+            self.size = kept
+        else:
+            if all(keep):
+                return
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[:] = array(column.typecode, compress(column, keep))
+            self.size = len(self.x)
+
+    def keep_last(self, limit: int) -> None:
+        """Drop the oldest particles beyond *limit*."""
+        drop = self.size - limit
+        if drop <= 0:
+            return
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            if self.np is not None:
+                column[:limit] = column[drop:self.size].copy()
+            else:
+                del column[:drop]
+        self.size = limit
+
+    def clear(self) -> None:
+        if self.np is None:
+            for name in self.COLUMNS:
+                del getattr(self, name)[:]
+        self.size = 0
 
 
 # ── Main particle system ─────────────────────────────────────────────────────
@@ -100,21 +270,46 @@ class ParticleSystem:
         system.update(delta_time)
         for ix, iy, ch, rgb in system.get_particles():
             render(ix, iy, ch, rgb)
+
+    Args:
+        width, height: Playfield size in cells.
+        max_ambient: Cap on live ambient particles (the newest are kept).
+        use_numpy: ``False`` forces the ``array`` fallback; by default NumPy
+            is used when it can be imported.
+
+    Weather particles are capped at one per playfield cell.
     """
 
-    def __init__(self, width: int, height: int, max_particles: int = 50) -> None:
+    def __init__(self, width: int, height: int, max_ambient: int = 20,
+                 use_numpy: Optional[bool] = None) -> None:
         self._width: int = width
         self._height: int = height
-        self._max_particles: int = max_particles
+        self._max_ambient: int = max_ambient
 
-        self._weather_particles: List[Particle] = []
-        self._ambient_particles: List[Particle] = []
+        np = _load_numpy() if use_numpy is not False else None
+        self._np = np
+        # Seeded from ``random`` so a seeded game replays the same particles
+        self._rng = np.random.default_rng(random.getrandbits(64)) if np is not None else None
+        self._motion_table = np.array(_MOTION_ROWS) if np is not None else None
+
+        self._weather = ParticleArrays(np)
+        self._ambient = ParticleArrays(np)
+
+        # Glyph palette shared by both layers: index -> (char, rgb)
+        self._palette: List[Tuple[str, Tuple[int, int, int]]] = []
+        self._palette_index: Dict[Tuple[str, Tuple[int, int, int]], int] = {}
+        self._bolt_glyph = self._glyph("!", _LIGHTNING_RGB)
+        self._aurora_glyphs = [self._glyph(char, _AURORA_RGB) for char in _AURORA_CHARS]
 
         self._weather_configs: List[ParticleConfig] = []
         self._ambient_configs: List[ParticleConfig] = []
+        self._weather_spawns: List[_SpawnTable] = []
+        self._ambient_spawns: List[_SpawnTable] = []
+        self._biome_key: Optional[Tuple[str, str, str]] = None
 
         self._weather_type: Optional[str] = None
         self._weather_intensity: float = 0.0
+        self._drift: _Drift = _NO_DRIFT
 
         # Frame counter for 30-fps skip logic (matches original renderer)
         self._frame: int = 0
@@ -125,12 +320,16 @@ class ParticleSystem:
 
     def clear(self) -> None:
         """Remove all particles and configs."""
-        self._weather_particles.clear()
-        self._ambient_particles.clear()
-        self._weather_configs.clear()
-        self._ambient_configs.clear()
+        self._weather.clear()
+        self._ambient.clear()
+        self._weather_configs = []
+        self._ambient_configs = []
+        self._weather_spawns = []
+        self._ambient_spawns = []
+        self._biome_key = None
         self._weather_type = None
         self._weather_intensity = 0.0
+        self._drift = _NO_DRIFT
         self._frame = 0
 
     def set_bounds(self, width: int, height: int) -> None:
@@ -149,22 +348,28 @@ class ParticleSystem:
 
         self._weather_type = weather_type
         self._weather_intensity = intensity
-        self._weather_particles.clear()
+        self._weather.clear()
 
         if not weather_type:
             self._weather_configs = []
-            return
-
-        self._weather_configs = WeatherParticles.get_config(weather_type, intensity)
+        else:
+            self._weather_configs = WeatherParticles.get_config(weather_type, intensity)
+        self._weather_spawns = [self._spawn_table(cfg) for cfg in self._weather_configs]
+        self._drift = _WEATHER_DRIFT.get(weather_type or "", _NO_DRIFT)
 
-    def configure_biome(self, biome: str, time_of_day: str, season: str) -> None:
+    def configure_biome(self, biome: Optional[str], time_of_day: str, season: str) -> None:
         """Set up biome-specific ambient particle configs.
 
-        Loads from :class:`BiomeParticles` and filters by time/season.
+        Loads from :class:`BiomeParticles` and filters by time/season.  Cheap
+        to call every frame: configs are only rebuilt when an argument changes.
         """
-        all_configs = BiomeParticles.get_config(biome)
+        key = (biome, time_of_day, season)
+        if key == self._biome_key:
+            return
+        self._biome_key = key
+
         active: List[ParticleConfig] = []
-        for cfg in all_configs:
+        for cfg in BiomeParticles.get_config(biome) if biome else []:
             if cfg.time_filter is not None and time_of_day not in cfg.time_filter:
                 continue
             if cfg.season_filter is not None and season not in cfg.season_filter:
@@ -172,8 +377,30 @@ class ParticleSystem:
             active.append(cfg)
 
         self._ambient_configs = active
+        self._ambient_spawns = [self._spawn_table(cfg) for cfg in active]
         # Don't clear existing ambient particles -- they age out naturally
 
+    def _glyph(self, char: str, rgb: Tuple[int, int, int]) -> int:
+        """Palette index for *char* drawn in *rgb*, adding it on first use."""
+        key = (char, rgb)
+        index = self._palette_index.get(key)
+        if index is None:
+            index = self._palette_index[key] = len(self._palette)
+            self._palette.append(key)
+        return index
+
+    def _spawn_table(self, cfg: ParticleConfig) -> _SpawnTable:
+        glyphs = [self._glyph(char, cfg.color_rgb) for char in cfg.chars]
+        rises = cfg.direction == ParticleDirection.FLOAT_UP
+        return _SpawnTable(
+            density=cfg.density,
+            glyphs=self._np.array(glyphs, dtype=self._np.int32) if self._np is not None else glyphs,
+            speed=-cfg.speed if rises else cfg.speed,
+            life=_INF if cfg.lifetime is None else cfg.lifetime,
+            motion=_MOTION_CODES[cfg.direction],
+            direction=cfg.direction,
+        )
+
     # ------------------------------------------------------------------
     # Update
     # ------------------------------------------------------------------
@@ -193,202 +420,233 @@ class ParticleSystem:
         self._update_weather(delta_time)
         self._update_ambient(delta_time)
 
+    def is_active(self) -> bool:
+        """Return True while any particle is alive and needs a frame per update."""
+        return bool(self._weather.size or self._ambient.size)
+
+    def next_spawn_delay(self) -> Optional[float]:
+        """Seconds until the spawners want another update, or None if nothing can spawn.
+
+        Weather spawns a row on every update; the sparse ambient spawners
+        only need ``AMBIENT_SPAWN_INTERVAL`` while no particle is alive.
+        """
+        if self._weather_spawns:
+            return 0.0
+        if self._ambient_spawns and self._weather_intensity <= _AMBIENT_SUPPRESS_INTENSITY:
+            return AMBIENT_SPAWN_INTERVAL
+        return None
+
+    @property
+    def weather_count(self) -> int:
+        return self._weather.size
+
+    @property
+    def ambient_count(self) -> int:
+        return self._ambient.size
+
     def get_particles(self) -> List[Tuple[int, int, str, Tuple[int, int, int]]]:
-        """Return all live particles as ``(x, y, char, rgb)`` with integer positions."""
+        """Return all live particles as ``(x, y, char, rgb)`` with integer positions.
+
+        Weather particles come first, then ambient ones.
+        """
         result: List[Tuple[int, int, str, Tuple[int, int, int]]] = []
-        for p in self._weather_particles:
-            ix, iy = int(p.x), int(p.y)
-            if 0 <= ix < self._width and 0 <= iy < self._height:
-                result.append((ix, iy, p.char, p.color_rgb))
-        for p in self._ambient_particles:
-            ix, iy = int(p.x), int(p.y)
-            if 0 <= ix < self._width and 0 <= iy < self._height:
-                result.append((ix, iy, p.char, p.color_rgb))
+        palette = self._palette
+        width, height = self._width, self._height
+        np = self._np
+        for layer in (self._weather, self._ambient):
+            if not layer.size:
+                continue
+            if np is not None:
+                ix = layer.column("x").astype(np.int64)
+                iy = layer.column("y").astype(np.int64)
+                visible = (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height)
+                cells = zip(ix[visible].tolist(), iy[visible].tolist(),
+                            layer.column("glyph")[visible].tolist())
+            else:
+                cells = ((int(x), int(y), glyph) for x, y, glyph
+                         in zip(layer.x, layer.y, layer.glyph)
+                         if 0 <= x < width and 0 <= y < height)
+            result.extend((x, y) + palette[glyph] for x, y, glyph in cells)
         return result
 
     # ------------------------------------------------------------------
-    # Weather particle update (ported from _update_weather_particles)
+    # Weather layer
     # ------------------------------------------------------------------
 
     def _update_weather(self, delta_time: float) -> None:
         """Move and spawn weather particles."""
-        if not self._weather_configs:
-            self._weather_particles.clear()
+        layer = self._weather
+        if not self._weather_spawns:
+            layer.clear()
             return
 
-        wtype = self._weather_type or ""
-
-        # --- Move existing ---
-        alive: List[Particle] = []
-        for p in self._weather_particles:
-            p.age += delta_time
-            if p.lifetime is not None and p.age >= p.lifetime:
-                continue
-
-            ny = p.y + p.speed
-            nx = p.x
-
-            # Horizontal drift per weather type (ported from original)
-            if wtype in ("windy", "wind", "blizzard", "leaf_storm"):
-                nx += 0.8
-            elif wtype in ("autumn_wind", "gentle_wind", "breezy"):
-                nx += 0.5
-            elif wtype in ("snowy", "snow", "light_snow", "heavy_snow", "flurries"):
-                nx += random.uniform(-0.3, 0.3)
-            elif wtype == "falling_leaves":
-                nx += random.uniform(-0.4, 0.4)
-            elif wtype in ("stormy", "storm", "thunderstorm", "summer_storm"):
-                nx += random.uniform(-0.5, 0.5)
-            elif wtype == "aurora":
-                nx += math.sin(self._frame * 0.1 + p.y) * 0.3
-            elif wtype == "meteors":
-                nx += 1.5
-            elif wtype == "pollen":
-                nx += random.uniform(-0.2, 0.4)
-            elif wtype == "heat_shimmer":
-                nx += math.sin(self._frame * 0.2 + p.x) * 0.2
-
-            if 0 <= nx < self._width and ny < self._height:
-                p.x = nx
-                p.y = ny
-                alive.append(p)
+        if layer.size:
+            if self._np is not None:
+                self._move_weather_numpy(delta_time)
+            else:
+                self._move_weather_python(delta_time)
 
         # --- Spawn new particles at edge ---
-        for cfg in self._weather_configs:
-            spawn_y = float(self._height - 1) if cfg.direction == ParticleDirection.FLOAT_UP else 0.0
-            for col in range(self._width):
-                if random.random() < cfg.density:
-                    alive.append(Particle(
-                        x=float(col),
-                        y=spawn_y,
-                        char=random.choice(cfg.chars),
-                        color_rgb=cfg.color_rgb,
-                        direction=cfg.direction,
-                        speed=cfg.speed,
-                        lifetime=cfg.lifetime,
-                    ))
+        for table in self._weather_spawns:
+            cols, glyphs = self._spawn_row(table)
+            spawn_y = float(self._height - 1) if table.speed < 0 else 0.0
+            layer.extend(len(cols), cols, spawn_y, table.speed, table.life, glyphs, table.motion)
+
+        wtype = self._weather_type or ""
+        static = _MOTION_CODES[ParticleDirection.STATIC]
 
         # --- Lightning for storm types (every ~1.5 s at 60 fps) ---
-        if wtype in ("stormy", "storm", "thunderstorm", "summer_storm", "ice_storm"):
+        if wtype in _STORM_TYPES:
             if self._frame % 90 == 0 and random.random() < 0.25:
                 bolt_x = random.randint(3, max(3, self._width - 3))
                 bolt_y = random.randint(0, min(3, self._height - 1))
-                alive.append(Particle(
-                    x=float(bolt_x), y=float(bolt_y),
-                    char="!", color_rgb=(255, 255, 150),
-                    direction=ParticleDirection.STATIC, speed=0.0,
-                    lifetime=0.1,
-                ))
+                bolts_x = [float(bolt_x)]
+                bolts_y = [float(bolt_y)]
                 if wtype == "thunderstorm" and random.random() < 0.5:
-                    alive.append(Particle(
-                        x=float(random.randint(3, max(3, self._width - 3))),
-                        y=float(bolt_y + 1),
-                        char="!", color_rgb=(255, 255, 150),
-                        direction=ParticleDirection.STATIC, speed=0.0,
-                        lifetime=0.1,
-                    ))
+                    bolts_x.append(float(random.randint(3, max(3, self._width - 3))))
+                    bolts_y.append(float(bolt_y + 1))
+                layer.extend(len(bolts_x), bolts_x, bolts_y, 0.0, 0.1, self._bolt_glyph, static)
 
         # --- Aurora wave lines ---
         if wtype == "aurora":
             if self._frame % 20 == 0:
-                wave_y = random.randint(0, min(5, self._height - 1))
-                for wx in range(0, self._width, random.randint(3, 6)):
-                    alive.append(Particle(
-                        x=float(wx), y=float(wave_y),
-                        char=random.choice(["|", "~", "/", "\\"]),
-                        color_rgb=(100, 255, 200),
-                        direction=ParticleDirection.STATIC, speed=0.0,
-                        lifetime=0.35,
-                    ))
-
-        self._weather_particles = alive
+                wave_y = float(random.randint(0, min(5, self._height - 1)))
+                xs = [float(wx) for wx in range(0, self._width, random.randint(3, 6))]
+                glyphs = [random.choice(self._aurora_glyphs) for _ in xs]
+                layer.extend(len(xs), xs, wave_y, 0.0, 0.35, glyphs, static)
+
+        # More particles than cells cannot be seen
+        layer.keep_last(max(1, self._width * self._height))
+
+    def _spawn_row(self, table: _SpawnTable) -> Tuple[Sequence[float], Any]:
+        """Columns that spawn a particle this update, and their glyphs."""
+        if self._np is not None:
+            rng = self._rng
+            cols = self._np.flatnonzero(rng.random(self._width) < table.density)
+            glyphs = table.glyphs[rng.integers(0, len(table.glyphs), cols.size)]
+            return cols.astype(float), glyphs
+        cols = [float(col) for col in range(self._width) if random.random() < table.density]
+        return cols, [random.choice(table.glyphs) for _ in cols]
+
+    def _move_weather_numpy(self, delta_time: float) -> None:
+        np, layer, drift = self._np, self._weather, self._drift
+        x, y, age = layer.column("x"), layer.column("y"), layer.column("age")
+        age += delta_time
+        if drift.amp:
+            wave = np.sin(self._frame * drift.freq + (y if drift.phase == "y" else x)) * drift.amp
+            x += wave
+        y += layer.column("speed")
+        if drift.shift:
+            x += drift.shift
+        if drift.hi > drift.lo:
+            x += self._rng.uniform(drift.lo, drift.hi, layer.size)
+        layer.compact((age < layer.column("life"))
+                      & (x >= 0) & (x < self._width) & (y >= 0) & (y < self._height))
+
+    def _move_weather_python(self, delta_time: float) -> None:
+        layer, drift = self._weather, self._drift
+        x, y, speed, age, life = layer.x, layer.y, layer.speed, layer.age, layer.life
+        width, height = self._width, self._height
+        jitter = drift.hi > drift.lo
+        uniform, sin = random.uniform, math.sin
+        wave_base = self._frame * drift.freq
+        keep = []
+        for i in range(layer.size):
+            age[i] += delta_time
+            px, py = x[i], y[i]
+            nx = px + drift.shift
+            if jitter:
+                nx += uniform(drift.lo, drift.hi)
+            if drift.amp:
+                nx += sin(wave_base + (py if drift.phase == "y" else px)) * drift.amp
+            ny = py + speed[i]
+            x[i] = nx
+            y[i] = ny
+            keep.append(age[i] < life[i] and 0 <= nx < width and 0 <= ny < height)
+        layer.compact(keep)
 
     # ------------------------------------------------------------------
-    # Ambient particle update (ported from _update_ambient_particles)
+    # Ambient layer
     # ------------------------------------------------------------------
 
     def _update_ambient(self, delta_time: float) -> None:
         """Move and spawn biome ambient particles."""
+        layer = self._ambient
         # Suppress during heavy weather
-        if self._weather_intensity > 0.7 or not self._ambient_configs:
-            self._ambient_particles.clear()
+        if self._weather_intensity > _AMBIENT_SUPPRESS_INTENSITY or not self._ambient_spawns:
+            layer.clear()
             return
 
-        alive: List[Particle] = []
-
-        for p in self._ambient_particles:
-            p.age += delta_time
-            if p.lifetime is not None and p.age >= p.lifetime:
-                continue
-
-            nx, ny = p.x, p.y
-
-            if p.direction == ParticleDirection.FALL:
-                ny += p.speed
-                nx += random.uniform(-0.15, 0.15)
-            elif p.direction == ParticleDirection.FLOAT_UP:
-                ny += random.uniform(-p.speed, p.speed)
-                nx += random.uniform(-p.speed, p.speed)
-            elif p.direction == ParticleDirection.DRIFT_RIGHT:
-                ny += random.uniform(-0.05, 0.05)
-                nx += p.speed
-            elif p.direction == ParticleDirection.DRIFT_LEFT:
-                ny += random.uniform(-0.05, 0.05)
-                nx -= p.speed
-            elif p.direction == ParticleDirection.STATIC:
-                # Static particles fade out randomly
-                if random.random() < 0.03:
-                    continue
-            elif p.direction == ParticleDirection.SWIRL:
-                angle = p.age * 2.0
-                nx += math.sin(angle) * p.speed
-                ny += math.cos(angle) * p.speed * 0.5
-
-            if 0 <= nx < self._width and 0 <= ny < self._height:
-                p.x = nx
-                p.y = ny
-                alive.append(p)
+        if layer.size:
+            if self._np is not None:
+                self._move_ambient_numpy(delta_time)
+            else:
+                self._move_ambient_python(delta_time)
 
         # Spawn new particles from active configs
-        for cfg in self._ambient_configs:
-            spawn_count = cfg.density * self._width * self._height * 0.02
-            if random.random() < spawn_count:
-                char = random.choice(cfg.chars)
-
-                if cfg.direction == ParticleDirection.FALL:
-                    sx = random.uniform(0, self._width - 1)
-                    sy = 0.0
-                elif cfg.direction == ParticleDirection.FLOAT_UP:
-                    sx = random.uniform(0, self._width - 1)
-                    sy = random.uniform(0, self._height - 1)
-                elif cfg.direction == ParticleDirection.DRIFT_RIGHT:
-                    sx = 0.0
-                    sy = random.uniform(0, self._height - 1)
-                elif cfg.direction == ParticleDirection.DRIFT_LEFT:
-                    sx = float(self._width - 1)
-                    sy = random.uniform(0, self._height - 1)
-                elif cfg.direction == ParticleDirection.STATIC:
-                    sx = random.uniform(0, self._width - 1)
-                    sy = random.uniform(0, self._height * 0.4)
-                else:
-                    sx = random.uniform(0, self._width - 1)
-                    sy = random.uniform(0, self._height - 1)
-
-                alive.append(Particle(
-                    x=sx, y=sy,
-                    char=char,
-                    color_rgb=cfg.color_rgb,
-                    direction=cfg.direction,
-                    speed=cfg.speed,
-                    lifetime=cfg.lifetime,
-                ))
+        area_factor = self._width * self._height * 0.02
+        for table in self._ambient_spawns:
+            if random.random() < table.density * area_factor:
+                sx, sy = self._ambient_spawn_point(table.direction)
+                layer.extend(1, (sx,), (sy,), abs(table.speed), table.life,
+                             (random.choice(table.glyphs),), table.motion)
 
         # Cap particle count
-        max_ambient = 20
-        if len(alive) > max_ambient:
-            alive = alive[-max_ambient:]
-
-        self._ambient_particles = alive
+        layer.keep_last(self._max_ambient)
+
+    def _ambient_spawn_point(self, direction: ParticleDirection) -> Tuple[float, float]:
+        right, bottom = self._width - 1, self._height - 1
+        if direction == ParticleDirection.FALL:
+            return random.uniform(0, right), 0.0
+        if direction in (ParticleDirection.DRIFT_RIGHT, ParticleDirection.DRIFT_LEFT):
+            sx = 0.0 if direction == ParticleDirection.DRIFT_RIGHT else float(right)
+            return sx, random.uniform(0, bottom)
+        if direction == ParticleDirection.STATIC:
+            return random.uniform(0, right), random.uniform(0, self._height * 0.4)
+        return random.uniform(0, right), random.uniform(0, bottom)
+
+    def _move_ambient_numpy(self, delta_time: float) -> None:
+        np, rng, layer = self._np, self._rng, self._ambient
+        n = layer.size
+        x, y, age, speed = (layer.column(name) for name in ("x", "y", "age", "speed"))
+        age += delta_time
+        coeffs = self._motion_table[layer.column("motion")]
+        x += coeffs[:, 0] * speed + rng.uniform(-1.0, 1.0, n) * (coeffs[:, 2] + coeffs[:, 3] * speed)
+        y += coeffs[:, 1] * speed + rng.uniform(-1.0, 1.0, n) * (coeffs[:, 4] + coeffs[:, 5] * speed)
+        swirl = coeffs[:, 6] * speed
+        if swirl.any():
+            angle = age * 2.0
+            x += np.sin(angle) * swirl
+            y += np.cos(angle) * swirl * 0.5
+        layer.compact((age < layer.column("life")) & (rng.random(n) >= coeffs[:, 7])
+                      & (x >= 0) & (x < self._width) & (y >= 0) & (y < self._height))
+
+    def _move_ambient_python(self, delta_time: float) -> None:
+        layer = self._ambient
+        x, y, speed, age, life, motion = (layer.x, layer.y, layer.speed, layer.age,
+                                          layer.life, layer.motion)
+        width, height = self._width, self._height
+        uniform = random.uniform
+        keep = []
+        for i in range(layer.size):
+            age[i] += delta_time
+            dx, dy, jx, jxs, jy, jys, swirl, fade = _MOTION_ROWS[motion[i]]
+            s = speed[i]
+            nx = x[i] + dx * s
+            ny = y[i] + dy * s
+            if jx or jxs:
+                nx += uniform(-1.0, 1.0) * (jx + jxs * s)
+            if jy or jys:
+                ny += uniform(-1.0, 1.0) * (jy + jys * s)
+            if swirl:
+                angle = age[i] * 2.0
+                nx += math.sin(angle) * swirl * s
+                ny += math.cos(angle) * swirl * s * 0.5
+            x[i] = nx
+            y[i] = ny
+            keep.append(age[i] < life[i] and not (fade and random.random() < fade)
+                        and 0 <= nx < width and 0 <= ny < height)
+        layer.compact(keep)
 
 
 # ── WeatherParticles config factory ───────────────────────────────────────────
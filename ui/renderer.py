@@ -6,95 +6,62 @@ import sys
 import time
 import math
 import random
-import re
-from functools import lru_cache
 from typing import Optional, List, Dict, Tuple, Any, TYPE_CHECKING
 from blessed import Terminal
 
 
-# Regex to strip ANSI escape sequences for visible length calculation
-_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m|\033\[[0-9;]*m|\x1b\([0-9;]*[a-zA-Z]')
+from ui.styled_text import StyledText
+
+
+# The _visible_* helpers are thin wrappers over StyledText, which parses a
+# line once into (codes, text) runs with its visible width precomputed.
 
-@lru_cache(maxsize=1024)
 def _visible_len(s: str) -> int:
-    """Get visible length of string, ignoring ANSI escape codes. Cached for performance."""
-    return len(_ANSI_ESCAPE.sub('', s))
+    """Get visible length of string, ignoring ANSI escape codes."""
+    return StyledText.parse(s).width
 
 
 def _visible_ljust(s: str, width: int) -> str:
     """Left-justify string to visible width, accounting for ANSI codes."""
-    visible = _visible_len(s)
-    if visible >= width:
-        return s
-    return s + ' ' * (width - visible)
+    return str(StyledText.parse(s).ljust(width))
 
 
 def _visible_center(s: str, width: int) -> str:
     """Center string to visible width, accounting for ANSI codes."""
-    visible = _visible_len(s)
-    if visible >= width:
-        return s
-    pad_total = width - visible
-    pad_left = pad_total // 2
-    pad_right = pad_total - pad_left
-    return ' ' * pad_left + s + ' ' * pad_right
+    return str(StyledText.parse(s).center(width))
 
 
 def _visible_rjust(s: str, width: int) -> str:
     """Right-justify string to visible width, accounting for ANSI codes."""
-    visible = _visible_len(s)
-    if visible >= width:
-        return s
-    return ' ' * (width - visible) + s
+    return str(StyledText.parse(s).rjust(width))
 
 
 def _visible_slice(s: str, start: int, end: int) -> str:
     """Slice string by visible character positions, preserving ANSI codes.
     
     Returns substring from visible position start to end (exclusive).
-    Handles ANSI escape sequences correctly - only includes ANSI codes
-    that appear within the sliced range to prevent color bleeding.
+    Only includes ANSI codes that appear within the sliced range to
+    prevent color bleeding.
     """
-    result = []
-    visible_pos = 0
-    i = 0
-    
-    while i < len(s):
-        # Check for ANSI escape sequence
-        match = _ANSI_ESCAPE.match(s, i)
-        if match:
-            # Only include ANSI codes that appear within the sliced range
-            # Don't include codes from before the slice to prevent color bleeding
-            if visible_pos >= start and visible_pos < end:
-                result.append(match.group())
-            i = match.end()
-        else:
-            # Regular character
-            if start <= visible_pos < end:
-                result.append(s[i])
-            visible_pos += 1
-            i += 1
-    
-    return ''.join(result)
+    return str(StyledText.parse(s).slice(start, end))
 
 
 def _visible_truncate(s: str, width: int) -> str:
     """Truncate string to visible width, preserving ANSI codes."""
-    return _visible_slice(s, 0, width)
+    return str(StyledText.parse(s).truncate(width))
 
 
 def _visible_marquee(s: str, width: int, speed: float = 6.0) -> str:
     """Scroll long single-line text so every character becomes visible."""
     if width <= 0:
         return ""
-    if _visible_len(s) <= width:
-        return _visible_ljust(s, width)
+    text = StyledText.parse(s)
+    if text.width <= width:
+        return str(text.ljust(width))
 
-    spacer = "   "
-    scroll_text = s + spacer
-    scroll_width = _visible_len(scroll_text)
-    offset = int(time.time() * speed) % scroll_width
-    return _visible_slice(scroll_text + scroll_text, offset, offset + width)
+    scroll_text = text + "   "
+    offset = int(time.time() * speed) % scroll_text.width
+    return str((scroll_text + scroll_text).slice(offset, offset + width))
 
 
 from config import COLORS
@@ -112,8 +79,10 @@ from duck.cosmetics import CosmeticsRenderer, COSMETIC_ART
 from core.time_system import get_current_time_of_day, get_current_season
 from duck.animator import DuckAnimator
 from ui.particle_system import ParticleSystem
+from ui.screen_buffer import ScreenBuffer
 from ui.biome_config import get_biome_tint, blend_tint
 from ui.render_context import RenderContext, build_render_context
+from core.frame_profiler import frame_profiler
 
 if TYPE_CHECKING:
     from duck.duck import Duck
@@ -202,6 +171,10 @@ class Renderer:
         self._chat_log_max_size = 30  # Keep last 30 messages
         self._chat_log_visible_lines = 5  # Show 5 lines in the UI
         self._chat_scroll_offset = 0  # Scroll offset (0 = newest at bottom)
+        # Reply still being generated: its chat log entries are replaced on
+        # every update and dropped when the next message is shown
+        self._partial_reply = ""
+        self._partial_log_entries: List[tuple] = []
         
         # Cheese away state — when True, duck chat messages are obscured
         self._cheese_away = False
@@ -214,6 +187,7 @@ class Renderer:
         self._show_help = False
         self._show_inventory = False
         self._show_stats = False
+        self._show_profiler = False  # Frame profiler overlay (debug menu)
         self._show_talk = False
         self._show_closeup = False
         self._closeup_expire = 0
@@ -249,8 +223,12 @@ class Renderer:
         from ui.interaction_animations import InteractionAnimator
         self.interaction_animator = InteractionAnimator()
 
-        # Dirty-frame detection: skip writes when output hasn't changed
-        self._last_frame_output: str = ""
+        # Cell-level diff buffer: render_frame only writes cells that changed
+        self._screen = ScreenBuffer(
+            move=self.term.move,
+            normal=self.term.normal,
+            clear=self.term.home + self.term.clear,
+        )
 
         # Playfield decorations (static objects)
         self._playfield_objects: List[Tuple[int, int, str]] = []
@@ -278,8 +256,7 @@ class Renderer:
         self._first_render = True  # Force regeneration on first render
         # Don't generate pattern here - wait for first render with correct dimensions
 
-        # Weather effects
-        self._weather_particles: List[Tuple[float, float, str]] = []  # (x, y, char)
+        # Weather effects: the frame counter drives the title's weather flavour text
         self._weather_frame = 0
         self._current_weather_type: Optional[str] = None
 
@@ -288,17 +265,12 @@ class Renderer:
         self._show_particles = True
         self._show_animations = True
         self._show_weather_effects = True
-        
-        # Biome ambient particles (fireflies, falling leaves, mist, etc.)
-        self._ambient_particles: List[Tuple[float, float, str, Tuple[int, int, int]]] = []  # (x, y, char, rgb)
 
-        # Unified particle system (provides additional particles alongside existing ones)
-        try:
-            self._particle_system = ParticleSystem(
-                self.duck_pos.field_width, self.duck_pos.field_height
-            )
-        except Exception:
-            self._particle_system = None
+        # Weather and biome ambient particles (fireflies, falling leaves, mist, etc.)
+        self._particle_system = ParticleSystem(
+            self.duck_pos.field_width, self.duck_pos.field_height
+        )
+        self._particle_colors: Dict[Tuple[int, int, int], Any] = {}
 
         # RenderContext snapshot (built each frame for future migration)
         self._current_context: Optional[RenderContext] = None
@@ -540,369 +512,34 @@ class Renderer:
             self._location_decorations = []
             self._location_scenery = []
 
-    def _update_weather_particles(self, width: int, height: int, weather_type: Optional[str],
-                                   weather_intensity: float = 0.0):
-        """Update animated weather particles."""
+    def _update_particles(self, width: int, height: int, weather_type: Optional[str],
+                          weather_intensity: float = 0.0, biome: Optional[str] = None,
+                          time_of_day: str = "", season: str = ""):
+        """Configure and step the particle system for this frame's weather and biome."""
         if not self._show_weather_effects:
             weather_type = None  # render as clear skies
 
-        # Update unified ParticleSystem with weather config
-        try:
-            if self._particle_system is not None:
-                self._particle_system.set_bounds(width, height)
-                self._particle_system.configure_weather(weather_type, weather_intensity)
-                if self._show_particles:
-                    self._particle_system.update(0.033)  # ~30fps delta
-                else:
-                    self._particle_system.clear()
-        except Exception:
-            pass
-
-        # Reset particles if weather changed
+        # Weather flavour text cycles on this counter; restart it on a change
         if weather_type != self._current_weather_type:
-            self._weather_particles = []
             self._current_weather_type = weather_type
             self._weather_frame = 0
-
-        if not weather_type:
-            self._weather_particles = []
-            return
-
         self._weather_frame += 1
 
-        # Cap weather animation to 30 FPS by skipping every other frame at 60 FPS
-        # This makes weather feel more natural and less frantic
-        if self._weather_frame % 2 == 0:
-            return  # Skip particle movement on every 2nd frame
-
-        # Weather particle settings - Enhanced for many weather types
-        # Note: sunny/clear weather has no particles (just a nice day)
-        weather_chars = {
-            # Rain variants
-            "drizzle": ["'", ",", "'", "."],  # Light rain
-            "rain": ["|", "|", "'", ",", ":", "'"],  # Rain streaks (alias for rainy)
-            "rainy": ["|", "|", "'", ",", ":", "'"],  # Rain streaks
-            "heavy_rain": ["|", "|", "|", "'", ",", "|", ":"],  # Heavy rain
-            "spring_rain": ["|", "'", ",", "~"],  # Gentle spring rain
-            "storm": ["|", "|", "'", ",", ":"],  # Storm rain
-            "stormy": ["|", "|", "'", ",", ":"],  # Storm rain (alias)
-            "thunderstorm": ["|", "|", "!", "|", ",", "!", ":"],  # Thunder + rain
-            "summer_storm": ["|", "|", "|", "'", "!", "|"],  # Heavy summer storm
-            
-            # Snow variants  
-            "light_snow": ["*", ".", "*", "."],  # Light snowflakes
-            "snow": ["*", "*", "*", "*", ".", "o", "*"],  # Normal snow
-            "snowy": ["*", "*", "*", "*", ".", "o", "*"],  # Normal snow (alias)
-            "heavy_snow": ["*", "*", "o", "*", "*", "O", "*"],  # Heavy snowfall
-            "flurries": ["*", ".", "*", ".", "*"],  # Dancing flurries
-            "blizzard": ["*", "*", "*", "/", "\\", "*", "O"],  # Blowing blizzard
-            
-            # Ice variants
-            "sleet": ["'", "|", "'", ",", "|", "."],  # Mixed ice/rain
-            "hail": ["o", "o", "O", "o", "."],  # Ice balls
-            "ice_storm": ["|", "'", "o", "|", "'"],  # Freezing rain
-            
-            # Fog/mist
-            "fog": [".", "~", "~", "~", " ", "#"],  # Thick fog
-            "foggy": [".", "~", "~", "~", " ", "#"],  # Thick fog (alias)
-            "mist": [".", "~", " ", "~", "."],  # Light mist
-            
-            # Wind variants
-            "wind": [">", ">", "~", ">", "~", "-", "~"],  # Standard wind
-            "windy": [">", ">", "~", ">", "~", "-", "~"],  # Standard wind (alias)
-            "gentle_wind": ["~", "-", "~", " ", "~"],  # Gentle breeze
-            "autumn_wind": [">", "}", "{", ">", "~"],  # Fall wind with leaves
-            
-            # Leaf particles
-            "falling_leaves": ["{", "}", "(", ")", "~"],  # Drifting leaves
-            "leaf_storm": ["{", "}", "{", ">", "}", ">", "{"],  # Swirling leaves
-            
-            # Special effects
-            "pollen": [".", "°", ".", "°", "."],  # Floating pollen
-            "heat_shimmer": ["~", "~", "^", "~"],  # Heat waves rising
-            "moonlight": ["*", ".", "*", "."],  # Moonlit sparkles
-            "golden_sparkles": ["*", "+", "*", "."],  # Golden hour magic
-            "sparkles": ["*", "+", "*", ".", "+"],  # Generic sparkles
-            
-            # Rare/magical
-            "rainbow": ["*", "*", "*", "*", "*"],  # Rainbow sparkles
-            "aurora": ["|", "/", "\\", "|", "~"],  # Northern lights
-            "meteors": ["\\", "/", "*", "."],  # Shooting stars
-        }
-
-        particle_density = {
-            # Rain variants
-            "drizzle": 0.08,
-            "rain": 0.20,
-            "rainy": 0.20,
-            "heavy_rain": 0.30,
-            "spring_rain": 0.15,
-            "storm": 0.25,
-            "stormy": 0.25,
-            "thunderstorm": 0.28,
-            "summer_storm": 0.30,
-            
-            # Snow variants
-            "light_snow": 0.06,
-            "snow": 0.12,
-            "snowy": 0.12,
-            "heavy_snow": 0.20,
-            "flurries": 0.08,
-            "blizzard": 0.35,
-            
-            # Ice variants
-            "sleet": 0.18,
-            "hail": 0.15,
-            "ice_storm": 0.22,
-            
-            # Fog/mist
-            "fog": 0.15,
-            "foggy": 0.15,
-            "mist": 0.08,
-            
-            # Wind variants
-            "wind": 0.10,
-            "windy": 0.10,
-            "gentle_wind": 0.05,
-            "autumn_wind": 0.12,
-            
-            # Leaf particles
-            "falling_leaves": 0.08,
-            "leaf_storm": 0.18,
-            
-            # Special effects
-            "pollen": 0.06,
-            "heat_shimmer": 0.04,
-            "moonlight": 0.03,
-            "golden_sparkles": 0.05,
-            "sparkles": 0.06,
-            
-            # Rare/magical
-            "rainbow": 0.08,
-            "aurora": 0.10,
-            "meteors": 0.02,
-        }
-
-        particle_speed = {
-            # Rain variants (fast, downward)
-            "drizzle": 1.2,
-            "rain": 2.0,
-            "rainy": 2.0,
-            "heavy_rain": 2.5,
-            "spring_rain": 1.5,
-            "storm": 2.5,
-            "stormy": 2.5,
-            "thunderstorm": 2.8,
-            "summer_storm": 3.0,
-            
-            # Snow variants (slow, gentle)
-            "light_snow": 0.3,
-            "snow": 0.4,
-            "snowy": 0.4,
-            "heavy_snow": 0.5,
-            "flurries": 0.35,
-            "blizzard": 0.8,
-            
-            # Ice variants
-            "sleet": 1.8,
-            "hail": 2.2,
-            "ice_storm": 2.0,
-            
-            # Fog/mist (very slow drift)
-            "fog": 0.15,
-            "foggy": 0.15,
-            "mist": 0.1,
-            
-            # Wind variants (fast horizontal)
-            "wind": 1.5,
-            "windy": 1.5,
-            "gentle_wind": 0.8,
-            "autumn_wind": 1.2,
-            
-            # Leaf particles (medium, drifting)
-            "falling_leaves": 0.6,
-            "leaf_storm": 1.0,
-            
-            # Special effects
-            "pollen": 0.2,
-            "heat_shimmer": -0.3,  # Rises up
-            "moonlight": 0.4,
-            "golden_sparkles": 0.3,
-            "sparkles": 0.4,
-            
-            # Rare/magical
-            "rainbow": 0.5,
-            "aurora": 0.2,
-            "meteors": 3.5,
-        }
-
-        chars = weather_chars.get(weather_type, [])
-        density = particle_density.get(weather_type, 0)
-        speed = particle_speed.get(weather_type, 1.0)
-
-        if not chars:
-            return
-
-        # Move existing particles
-        new_particles = []
-        for x, y, char in self._weather_particles:
-            new_y = y + speed
-
-            # Horizontal drift for different weather types
-            # Wind types - strong rightward movement
-            if weather_type in ("windy", "wind", "blizzard", "leaf_storm"):
-                new_x = x + 0.8
-            # Autumn/gentle wind - moderate rightward
-            elif weather_type in ("autumn_wind", "gentle_wind", "breezy"):
-                new_x = x + 0.5
-            # Snow types - gentle random drift
-            elif weather_type in ("snowy", "snow", "light_snow", "heavy_snow", "flurries"):
-                new_x = x + random.uniform(-0.3, 0.3)
-            # Leaves - swaying drift
-            elif weather_type == "falling_leaves":
-                new_x = x + random.uniform(-0.4, 0.4)
-            # Storm types - chaotic
-            elif weather_type in ("stormy", "storm", "thunderstorm", "summer_storm"):
-                new_x = x + random.uniform(-0.5, 0.5)
-            # Aurora - gentle wave motion
-            elif weather_type == "aurora":
-                import math
-                new_x = x + math.sin(self._weather_frame * 0.1 + y) * 0.3
-            # Meteors - diagonal streak
-            elif weather_type == "meteors":
-                new_x = x + 1.5  # Fast diagonal
-            # Pollen - floating drift
-            elif weather_type == "pollen":
-                new_x = x + random.uniform(-0.2, 0.4)
-            # Heat shimmer - slight wave
-            elif weather_type == "heat_shimmer":
-                import math
-                new_x = x + math.sin(self._weather_frame * 0.2 + x) * 0.2
-            else:
-                new_x = x
-
-            if new_y < height and 0 <= new_x < width:
-                new_particles.append((new_x, new_y, char))
-
-        # Spawn new particles at top (or bottom for heat shimmer)
-        spawn_y = height - 1 if weather_type == "heat_shimmer" else 0.0
-        for x in range(width):
-            if random.random() < density:
-                char = random.choice(chars)
-                new_particles.append((float(x), spawn_y, char))
-
-        # Lightning flash for storms (rare and brief)
-        if weather_type in ("stormy", "storm", "thunderstorm", "summer_storm", "ice_storm"):
-            if self._weather_frame % 90 == 0 and random.random() < 0.25:  # 90 frames = ~1.5s at 60 FPS
-                bolt_x = random.randint(3, max(3, width - 3))
-                bolt_y = random.randint(0, min(3, height - 1))
-                new_particles.append((float(bolt_x), float(bolt_y), "!"))
-                # Double flash for thunderstorms
-                if weather_type == "thunderstorm" and random.random() < 0.5:
-                    bolt_x2 = random.randint(3, max(3, width - 3))
-                    new_particles.append((float(bolt_x2), float(bolt_y + 1), "!"))
-
-        # Aurora color waves effect
-        if weather_type == "aurora":
-            # Add horizontal lines that drift
-            if self._weather_frame % 20 == 0:  # 20 frames = ~0.33s at 60 FPS
-                wave_y = random.randint(0, min(5, height - 1))
-                for wx in range(0, width, random.randint(3, 6)):
-                    char = random.choice(["|", "~", "/", "\\"])
-                    new_particles.append((float(wx), float(wave_y), char))
-
-        self._weather_particles = new_particles
-
-    def _update_ambient_particles(self, width: int, height: int,
-                                   biome: str, time_of_day: str, season: str,
-                                   weather_intensity: float = 0.0):
-        """Update biome-specific ambient particles (fireflies, falling leaves, mist, etc.)."""
-        # Suppress when disabled in settings, or during heavy weather to avoid visual clutter
-        if not self._show_particles or weather_intensity > 0.7 or not biome:
-            self._ambient_particles = []
-            return
-
-        from ui.biome_visuals import get_ambient_particles
-
-        configs = get_ambient_particles(biome, time_of_day, season)
-        if not configs:
-            self._ambient_particles = []
-            return
-
-        # Skip every other frame (30 effective FPS, same as weather particles)
-        if self._weather_frame % 2 != 0:
-            return
-
-        new_particles = []
-
-        # Move existing particles
-        for x, y, char, rgb in self._ambient_particles:
-            # Find which config this particle belongs to (by colour match)
-            speed = 0.1
-            direction = "fall"
-            for cfg in configs:
-                if cfg["color_rgb"] == rgb:
-                    speed = cfg["speed"]
-                    direction = cfg["direction"]
-                    break
-
-            if direction == "fall":
-                ny = y + speed
-                nx = x + random.uniform(-0.15, 0.15)
-            elif direction == "float":
-                ny = y + random.uniform(-speed, speed)
-                nx = x + random.uniform(-speed, speed)
-            elif direction == "drift_right":
-                ny = y + random.uniform(-0.05, 0.05)
-                nx = x + speed
-            elif direction == "drift_left":
-                ny = y + random.uniform(-0.05, 0.05)
-                nx = x - speed
-            elif direction == "static":
-                nx, ny = x, y
-                # Static particles fade out randomly
-                if random.random() < 0.03:
-                    continue
-            else:
-                nx, ny = x, y
-
-            if 0 <= nx < width and 0 <= ny < height:
-                new_particles.append((nx, ny, char, rgb))
-
-        # Spawn new particles from active configs
-        for cfg in configs:
-            density = cfg["density"]
-            # Scale density by area — spawn a few per update
-            spawn_count = density * width * height * 0.02  # Moderate rate
-            if random.random() < spawn_count:
-                char = random.choice(cfg["chars"])
-                rgb = cfg["color_rgb"]
-                direction = cfg["direction"]
-
-                if direction == "fall":
-                    sx = random.uniform(0, width - 1)
-                    sy = 0.0  # Start at top
-                elif direction == "float":
-                    sx = random.uniform(0, width - 1)
-                    sy = random.uniform(0, height - 1)
-                elif direction in ("drift_right", "drift_left"):
-                    sx = 0.0 if direction == "drift_right" else float(width - 1)
-                    sy = random.uniform(0, height - 1)
-                elif direction == "static":
-                    sx = random.uniform(0, width - 1)
-                    sy = random.uniform(0, height * 0.4)  # Upper portion only
-                else:
-                    sx = random.uniform(0, width - 1)
-                    sy = random.uniform(0, height - 1)
-
-                new_particles.append((sx, sy, char, rgb))
-
-        # Cap particle count to prevent runaway
-        max_particles = 20
-        if len(new_particles) > max_particles:
-            new_particles = new_particles[-max_particles:]
-
-        self._ambient_particles = new_particles
+        # show_particles gates the biome ambient layer, show_weather_effects the weather one
+        if not self._show_particles or not season:
+            biome = None
+        system = self._particle_system
+        system.set_bounds(width, height)
+        system.configure_weather(weather_type, weather_intensity)
+        system.configure_biome(biome, time_of_day, season)
+        system.update(0.033)  # ~30fps delta
+
+    def _particle_color(self, rgb: Tuple[int, int, int]):
+        """Formatting function for a particle colour, built once per colour."""
+        color = self._particle_colors.get(rgb)
+        if color is None:
+            color = self._particle_colors[rgb] = self.term.color_rgb(*rgb)
+        return color
 
     def _get_time_of_day_elements(self, width: int, biome: str = None) -> Tuple[str, Optional[Any], List[Tuple[int, str]]]:
         """
@@ -1082,6 +719,7 @@ class Renderer:
 
     def clear(self):
         """Clear the terminal."""
+        self._screen.invalidate()
         print(self.term.home + self.term.clear)
 
     def render_loading_screen(self, title: str, message: str = "",
@@ -1123,6 +761,7 @@ class Renderer:
             ])
         lines.append("+" + "=" * (inner + 2) + "+")
 
+        self._screen.invalidate()
         print(self.term.home + self.term.clear, end="")
         top_pad = max(0, (max(self.term.height, 20) - len(lines)) // 2)
         for _ in range(top_pad):
@@ -1145,7 +784,8 @@ class Renderer:
 
         # Build RenderContext snapshot every frame (stored for external consumers)
         try:
-            self._current_context = build_render_context(game)
+            with frame_profiler.section("render.context"):
+                self._current_context = build_render_context(game)
         except Exception:
             pass
 
@@ -1255,12 +895,14 @@ class Renderer:
         event_animators = getattr(game, '_event_animators', [])
 
         # Main area: playfield on left, side panel on right
-        playfield_lines = self._render_playfield(duck, playfield_width, field_height,
-                                                   equipped_cosmetics, placed_items, weather_info,
-                                                   built_structures, current_visitor, event_animators,
-                                                   biome=current_biome, season=current_season)
+        with frame_profiler.section("render.playfield"):
+            playfield_lines = self._render_playfield(duck, playfield_width, field_height,
+                                                     equipped_cosmetics, placed_items, weather_info,
+                                                     built_structures, current_visitor, event_animators,
+                                                     biome=current_biome, season=current_season)
         # Pass playfield height so side panel can match exactly
-        sidepanel_lines = self._render_side_panel(duck, game, side_panel_width, len(playfield_lines))
+        with frame_profiler.section("render.side_panel"):
+            sidepanel_lines = self._render_side_panel(duck, game, side_panel_width, len(playfield_lines))
 
         # Combine playfield and side panel
         max_lines = max(len(playfield_lines), len(sidepanel_lines))
@@ -1268,9 +910,9 @@ class Renderer:
             pf_line = playfield_lines[i] if i < len(playfield_lines) else " " * playfield_width
             sp_line = sidepanel_lines[i] if i < len(sidepanel_lines) else " " * side_panel_width
             # Pad lines to exact visible width (accounting for ANSI escape codes)
-            pf_line = _visible_ljust(pf_line, playfield_width)
-            sp_line = _visible_ljust(sp_line, side_panel_width)
-            output.append(pf_line + sp_line)
+            pf_line = StyledText.parse(pf_line).ljust(playfield_width)
+            sp_line = StyledText.parse(sp_line).ljust(side_panel_width)
+            output.append(str(pf_line + sp_line))
 
         # Progress bars (Level/XP and Growth)
         output.extend(self._render_progress_bars(width, game))
@@ -1285,6 +927,7 @@ class Renderer:
         self._check_celebration_expired()
 
         # Overlays (help, stats, inventory, celebration, item interaction, fishing)
+        overlay_laps = frame_profiler.laps("render")
         if self._show_celebration:
             output = self._overlay_celebration(output, width)
         elif hasattr(game, '_item_interaction_active') and game._item_interaction_active:
@@ -1306,27 +949,22 @@ class Renderer:
             output = self._overlay_menu(output, width)
         elif self._show_message_overlay and not getattr(self, '_message_rendered_inline', False):
             output = self._overlay_message(output, width)
+        if self._show_profiler:
+            output = self._overlay_profiler(output, width)
+        overlay_laps.mark("overlays")
 
-        # Build batched frame string — one sys.stdout.write() instead of ~35 print() calls
+        # Diff against what the terminal already shows and write only the
+        # changed cells — one sys.stdout.write() of a few hundred bytes
         max_lines = min(len(output), self.term.height - 1)
-        parts: list[str] = []
-        for i in range(max_lines):
-            line = output[i]
-            truncated = _visible_truncate(line, width)
-            padded = _visible_ljust(truncated, width)
-            parts.append(self.term.move(i, 0) + padded + self.term.normal)
-        frame_body = "".join(parts)
-
         if is_first_render:
-            frame_str = self.term.home + self.term.clear + frame_body
-        else:
-            frame_str = self.term.home + frame_body
-
-        # Dirty-frame detection: skip write when output is identical to last frame
-        if is_first_render or frame_str != self._last_frame_output:
+            self._screen.invalidate()
+        frame_str = self._screen.render(output[:max_lines], width)
+        overlay_laps.mark("diff")
+        if frame_str:
             sys.stdout.write(frame_str)
             sys.stdout.flush()
-            self._last_frame_output = frame_str
+            frame_profiler.add_bytes(len(frame_str.encode("utf-8", "replace")))
+        overlay_laps.mark("write")
 
     def render_frame_from_context(self, ctx: "RenderContext"):
         """Render a frame using a pre-built RenderContext.
@@ -1393,16 +1031,11 @@ class Renderer:
         for role, message in ctx.chat_messages[-3:]:
             output.append(f"{role}: {message}")
 
-        parts: list[str] = []
         max_lines = min(len(output), height - 1)
-        for i in range(max_lines):
-            line = _visible_truncate(output[i], width)
-            parts.append(self.term.move(i, 0) + _visible_ljust(line, width) + self.term.normal)
-        frame_str = self.term.home + "".join(parts)
-        if frame_str != self._last_frame_output:
+        frame_str = self._screen.render(output[:max_lines], width)
+        if frame_str:
             sys.stdout.write(frame_str)
             sys.stdout.flush()
-            self._last_frame_output = frame_str
 
     def _render_header_bar(self, duck: "Duck", width: int, currency: int = 0, weather=None, time_info=None, season_info=None) -> List[str]:
         """Render the top header bar with weather, season, and time info."""
@@ -1569,8 +1202,8 @@ class Renderer:
         right_side = f"{' '.join(right_parts)} "
 
         # Calculate padding — ensure a separator between left and right
-        left_len = _visible_len(left_side)
-        right_len = _visible_len(right_side)
+        left_len = StyledText.parse(left_side).width
+        right_len = StyledText.parse(right_side).width
         available = inner_width - left_len - right_len
 
         if available >= 1:
@@ -1582,8 +1215,7 @@ class Renderer:
             line1 = _visible_marquee(full_line, inner_width)
 
         # Ensure line fits
-        line1 = _visible_ljust(line1, inner_width)
-        line1 = _visible_truncate(line1, inner_width)
+        line1 = str(StyledText.parse(line1).ljust(inner_width).truncate(inner_width))
 
         lines = [
             BOX_DOUBLE["tl"] + BOX_DOUBLE["h"] * inner_width + BOX_DOUBLE["tr"],
@@ -1626,9 +1258,12 @@ class Renderer:
         # Compute weather intensity for particle systems
         _weather_intensity = weather_info.intensity if weather_info and hasattr(weather_info, 'intensity') else 0.0
 
-        # Update weather particles (use particle_type for specific effects, fallback to weather_type)
-        self._update_weather_particles(inner_width, field_height, particle_type or weather_type,
-                                       weather_intensity=_weather_intensity)
+        # Step weather (particle_type for specific effects, fallback to weather_type) and
+        # biome ambient particles (fireflies, falling leaves, etc.)
+        _time_key = get_current_time_of_day().value if biome and season else ""
+        self._update_particles(inner_width, field_height, particle_type or weather_type,
+                               weather_intensity=_weather_intensity, biome=biome,
+                               time_of_day=_time_key, season=season or "")
 
         # Generate environmental weather decorations (puddles, snow piles, etc.)
         # Use world dims so decoration positions are world-space (camera offset applied when rendering)
@@ -1642,18 +1277,6 @@ class Renderer:
         # Get time-of-day visual elements (blended with biome tint)
         sky_char, time_bg_color, celestials = self._get_time_of_day_elements(inner_width, biome=biome)
 
-        # Update biome ambient particles (fireflies, falling leaves, etc.)
-        if biome and season:
-            _time_key = get_current_time_of_day().value  # returns "dawn", "morning", etc.
-            self._update_ambient_particles(inner_width, field_height, biome, _time_key, season, _weather_intensity)
-
-            # Configure unified ParticleSystem for biome ambient effects
-            try:
-                if self._particle_system is not None:
-                    self._particle_system.configure_biome(biome, _time_key, season)
-            except Exception:
-                pass
-
         # Title bar with weather/time flavor text
         title = " DUCK HABITAT "
         weather_effects = self._get_weather_ambient_effects(weather_type, inner_width)
@@ -1775,7 +1398,12 @@ class Renderer:
         # Use a grid of (char, color_func) tuples to handle colors properly
         # Get ground color for current location (season-aware)
         ground_color = get_ground_color(self._current_location, season=season) if self._current_location else None
-        
+
+        # Weather and ambient particles bucketed by row
+        particle_rows: Dict[int, List[Tuple[int, str, Tuple[int, int, int]]]] = {}
+        for px, py, pchar, prgb in self._particle_system.get_particles():
+            particle_rows.setdefault(py, []).append((px, pchar, prgb))
+
         for y in range(field_height):
             # Initialize row with (char, ground_color) tuples, slicing world ground at camera offset
             world_y = cam_y + y
@@ -2061,45 +1689,13 @@ class Renderer:
                             # Use consistent color for effects
                             row[px] = (char, self.color_sparkle)
 
-            # Add weather particles (rendered on top of everything except text)
-            # Use RGB colors for consistent appearance across terminals
-            weather_colors = {
-                "rainy": self.color_rain,          # Cool rain color
-                "stormy": self.color_snow,         # Bright storm
-                "snowy": self.color_snow,          # White snow
-                "foggy": self.color_ui_dim,        # Misty fog
-                "windy": self.color_rain,          # Wind streaks
-                "rainbow": self.color_sparkle,     # Magic rainbow
-            }
-            weather_color = weather_colors.get(self._current_weather_type)
-            for px, py, char in self._weather_particles:
-                if int(py) == y and 0 <= int(px) < inner_width:
+            # Add weather and biome ambient particles (rendered on top of everything except text)
+            for px, pchar, prgb in particle_rows.get(y, ()):
+                if px < inner_width:
                     # Don't overwrite duck or effect characters
-                    existing_char, existing_color = row[int(px)]
+                    existing_char, _ = row[px]
                     if existing_char in GROUND_CHARS or existing_char == ' ':
-                        # Only use first character if multi-char to prevent overflow
-                        display_char = char[0] if len(char) > 1 else char
-                        row[int(px)] = (display_char, weather_color)
-
-            # Add biome ambient particles (fireflies, falling leaves, mist, etc.)
-            for ax, ay, achar, argb in self._ambient_particles:
-                if int(ay) == y and 0 <= int(ax) < inner_width:
-                    existing_char, _ = row[int(ax)]
-                    if existing_char in GROUND_CHARS or existing_char == ' ':
-                        ambient_color = self.term.color_rgb(*argb)
-                        row[int(ax)] = (achar, ambient_color)
-
-            # Add particles from unified ParticleSystem (additional layer)
-            try:
-                if self._particle_system is not None:
-                    for px, py, pchar, prgb in self._particle_system.get_particles():
-                        if py == y and 0 <= px < inner_width:
-                            existing_char, _ = row[px]
-                            if existing_char in GROUND_CHARS or existing_char == ' ':
-                                ps_color = self.term.color_rgb(*prgb)
-                                row[px] = (pchar, ps_color)
-            except Exception:
-                pass
+                        row[px] = (pchar, self._particle_color(prgb))
 
             # Convert row to string, applying colors
             row_chars = []
@@ -2247,12 +1843,12 @@ class Renderer:
                         color = self.term.bright_white
                 
                 # Format line (already has timestamp prefix from wrapping)
-                msg_truncated = _visible_truncate(line_text, inner_width - 1)
+                msg_truncated = StyledText.parse(line_text).truncate(inner_width - 1)
                 
                 line_content = color + msg_truncated + self.term.normal
                 # Pad to width
-                line_padded = _visible_ljust(line_content, inner_width)
-                lines.append(BOX["v"] + line_padded + BOX["v"])
+                line_padded = line_content.ljust(inner_width)
+                lines.append(str(BOX["v"] + line_padded + BOX["v"]))
         
         # Bottom of playfield
         lines.append(BOX["bl"] + BOX["h"] * inner_width + BOX["br"])
@@ -2287,7 +1883,7 @@ class Renderer:
                 "              ",
             ]
             for egg_line in egg_closeup:
-                centered = _visible_center(egg_line, inner_width)
+                centered = str(StyledText.parse(egg_line).center(inner_width))
                 yellow_line = self.color_duck_body + centered + self.term.normal
                 lines.append(BOX["v"] + yellow_line + BOX["v"])
         else:
@@ -2306,17 +1902,17 @@ class Renderer:
                 # Show compact close-up with consistent duck color (RGB for cross-platform)
                 for closeup_line in closeup:
                     # Center the line properly
-                    centered = _visible_center(closeup_line, inner_width)
+                    centered = str(StyledText.parse(closeup_line).center(inner_width))
                     # Apply consistent RGB yellow color to the duck ASCII
                     yellow_line = self.color_duck_body + centered + self.term.normal
                     lines.append(BOX["v"] + yellow_line + BOX["v"])
             else:
                 # Show mood status (compact) — truncate long descriptions
-                desc = mood.description
-                if _visible_len(desc) > inner_width:
-                    desc = _visible_truncate(desc, inner_width - 2) + ".."
-                mood_text = _visible_center(desc, inner_width)
-                lines.append(BOX["v"] + mood_text + BOX["v"])
+                desc = StyledText.parse(mood.description)
+                if desc.width > inner_width:
+                    desc = desc.truncate(inner_width - 2) + ".."
+                mood_text = desc.center(inner_width)
+                lines.append(str(BOX["v"] + mood_text + BOX["v"]))
 
         # Divider
         lines.append(BOX["t_right"] + BOX["h"] * inner_width + BOX["t_left"])
@@ -2349,8 +1945,8 @@ class Renderer:
             bar = self._make_progress_bar(value, bar_width)
             line_content = f"{name}{cascade_marker}{bar} {pct_str}"
             # Pad to exact width
-            line_content = _visible_ljust(line_content, inner_width)
-            lines.append(BOX["v"] + line_content + BOX["v"])
+            line_content = StyledText.parse(line_content).ljust(inner_width)
+            lines.append(str(BOX["v"] + line_content + BOX["v"]))
 
         # Trust bar — primary relationship indicator
         trust_val = getattr(duck, 'trust', 20.0)
@@ -2369,15 +1965,15 @@ class Renderer:
             trust_bar_w = 5
         trust_bar = self._make_progress_bar(trust_val, trust_bar_w)
         trust_line = f"{trust_label}{trust_bar} {trust_pct}{badge_part}"
-        trust_line = _visible_ljust(trust_line, inner_width)
-        lines.append(BOX["v"] + trust_line + BOX["v"])
+        trust_line = StyledText.parse(trust_line).ljust(inner_width)
+        lines.append(str(BOX["v"] + trust_line + BOX["v"]))
 
         # Consequence stage alert
         consequence_stage = getattr(self, '_last_consequence_stage', 0)
         if consequence_stage >= 1:
             alert_char = "⚠" if int(time.time()) % 2 == 0 else " "
             alert_text = f" {alert_char} NEEDS ATTENTION {alert_char} "
-            alert_line = _visible_center(alert_text, inner_width)
+            alert_line = str(StyledText.parse(alert_text).center(inner_width))
             lines.append(BOX["v"] + alert_line + BOX["v"])
 
         # Divider - Master Menu Section
@@ -2418,9 +2014,9 @@ class Renderer:
                 lines.append(BOX["v"] + " " * inner_width + BOX["v"])
         else:
             # Fallback if master menu not initialized
-            fallback_title = _visible_center("--- MENU ---", inner_width)
+            fallback_title = str(StyledText.parse("--- MENU ---").center(inner_width))
             lines.append(BOX["v"] + fallback_title + BOX["v"])
-            fallback_msg = _visible_center("Loading...", inner_width)
+            fallback_msg = str(StyledText.parse("Loading...").center(inner_width))
             lines.append(BOX["v"] + fallback_msg + BOX["v"])
             # Pad to needed size
             while len(lines) < lines_before_menu + menu_lines_needed:
@@ -2434,7 +2030,7 @@ class Renderer:
 
         # Activity/Status
         activity = self._get_activity_text(duck)
-        activity_centered = _visible_center(activity, inner_width)
+        activity_centered = str(StyledText.parse(activity).center(inner_width))
         lines.append(BOX["v"] + activity_centered + BOX["v"])
 
         # Current action message (truncate if needed)
@@ -2442,8 +2038,7 @@ class Renderer:
             action_msg = "Waiting to hatch..."
         else:
             action_msg = duck.get_action_message() or "Just vibing..."
-        action_msg = _visible_truncate(action_msg, inner_width - 2)
-        action_centered = _visible_center(action_msg, inner_width)
+        action_centered = str(StyledText.parse(action_msg).truncate(inner_width - 2).center(inner_width))
         lines.append(BOX["v"] + action_centered + BOX["v"])
         
         # Current location (from exploration system) - always show line for consistent height
@@ -2452,8 +2047,7 @@ class Renderer:
             location = f"@ {area_name}"  # Use @ instead of emoji for consistent width
         else:
             location = "@ Home Pond"  # Default location
-        location = _visible_truncate(location, inner_width)
-        location_centered = _visible_center(location, inner_width)
+        location_centered = str(StyledText.parse(location).truncate(inner_width).center(inner_width))
         lines.append(BOX["v"] + location_centered + BOX["v"])
 
         # Bottom padding for vertical centering
@@ -2766,6 +2360,7 @@ class Renderer:
         output.append("[Q] Quit Game".center(width))
 
         # Print everything
+        self._screen.invalidate()
         print(self.term.home + self.term.clear, end="")
         for line in output:
             print(line)
@@ -3050,6 +2645,7 @@ class Renderer:
         ])
 
         # Use home only (no clear) to prevent flicker - overwrite in place
+        self._screen.invalidate()
         print(self.term.home)
         for line in title_art:
             # Clear to end of line to handle any leftover characters
@@ -3226,14 +2822,21 @@ class Renderer:
 
     def _overlay_talk(self, base_output: List[str], width: int) -> List[str]:
         """Overlay talk/chat interface."""
+        import textwrap
         talk_text = [
             "Talk to your duck!",
             "",
+        ]
+        if self._partial_reply:
+            # Reply still streaming in from the model
+            talk_text.extend(textwrap.wrap(self._partial_reply + " ...", width=44)[-3:])
+            talk_text.append("")
+        talk_text.extend([
             f"> {self._talk_buffer}_",
             "",
             "Type a message and press ENTER",
             "Press ESC to cancel",
-        ]
+        ])
 
         return self._overlay_box(base_output, talk_text, "TALK", width)
 
@@ -3279,6 +2882,24 @@ class Renderer:
         
         return self._overlay_box(base_output, fish_text, "FISHING", width)
 
+    def toggle_profiler(self) -> bool:
+        """Show or hide the frame profiler overlay."""
+        self._show_profiler = not self._show_profiler
+        return self._show_profiler
+
+    def _overlay_profiler(self, base_output: List[str], width: int) -> List[str]:
+        """Frame profiler table drawn over the top-right corner."""
+        content = frame_profiler.overlay_lines()
+        box_width = min(max(len(line) for line in content) + 2, width - 2)
+        title = " PROFILER "
+        box_lines = [BOX_DOUBLE["tl"] + title + BOX_DOUBLE["h"] * max(0, box_width - len(title)) + BOX_DOUBLE["tr"]]
+        for line in content:
+            box_lines.append(str(BOX_DOUBLE["v"] + StyledText.parse(f" {line}").fit(box_width) + BOX_DOUBLE["v"]))
+        box_lines.append(BOX_DOUBLE["bl"] + BOX_DOUBLE["h"] * box_width + BOX_DOUBLE["br"])
+        result = base_output.copy()
+        self._composite_box(result, box_lines, 1, max(0, width - box_width - 2), width)
+        return result
+
     def _overlay_message(self, base_output: List[str], width: int) -> List[str]:
         """Overlay message box."""
         # Check if message expired
@@ -3390,7 +3011,7 @@ class Renderer:
 
         # Create box - the interior is box_width wide
         # Total line width = tl(1) + interior(box_width) + tr(1) = box_width + 2
-        title_visible_len = _visible_len(title)
+        title_visible_len = StyledText.parse(title).width
         title_with_spaces = f" {title} "
         title_total_len = title_visible_len + 2  # Including spaces
         
@@ -3407,9 +3028,8 @@ class Renderer:
         for line in visible_content:
             # Ensure content fills exactly box_width chars with spaces (solid background)
             # First truncate if too long, then pad with spaces to fill
-            content_area = _visible_truncate(f" {line}", box_width)
-            content_area = _visible_ljust(content_area, box_width)
-            box_lines.append(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"])
+            content_area = StyledText.parse(f" {line}").fit(box_width)
+            box_lines.append(str(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"]))
 
         box_lines.append(BOX_DOUBLE["bl"] + BOX_DOUBLE["h"] * box_width + BOX_DOUBLE["br"])
 
@@ -3418,20 +3038,28 @@ class Renderer:
         start_row = 4
         start_col = (width - box_width - 2) // 2
         
-        for i, line in enumerate(box_lines):
-            if start_row + i < len(result):
-                row = result[start_row + i]
-                # Use ANSI-aware slicing for rows that may contain colored text
-                box_visible_width = _visible_len(line)
-                left_part = _visible_slice(row, 0, start_col)
-                left_part = _visible_ljust(left_part, start_col)  # Ensure proper width
-                right_part = _visible_slice(row, start_col + box_visible_width, width)
-                # Add terminal reset after left_part to prevent color bleeding into overlay
-                new_row = left_part + self.term.normal + line + right_part
-                result[start_row + i] = _visible_truncate(new_row, width)
+        self._composite_box(result, box_lines, start_row, start_col, width)
 
         return result
 
+    def _composite_box(self, result: List[str], box_lines: List[str],
+                       start_row: int, start_col: int, width: int) -> None:
+        """Draw *box_lines* over *result* in place at (start_row, start_col).
+
+        Each base row is parsed once into a StyledText and sliced around the
+        box, so colored playfield text on either side is preserved.
+        """
+        for i, line in enumerate(box_lines):
+            if start_row + i >= len(result):
+                break
+            row = StyledText.parse(result[start_row + i])
+            box = StyledText.parse(line)
+            left_part = row.slice(0, start_col).ljust(start_col)
+            right_part = row.slice(start_col + box.width, width)
+            # Add terminal reset after left_part to prevent color bleeding into overlay
+            new_row = left_part + self.term.normal + box + right_part
+            result[start_row + i] = str(new_row.truncate(width))
+
     def _overlay_celebration(self, base_output: List[str], width: int) -> List[str]:
         """Overlay celebration screen with ASCII art."""
         from ui.ascii_art import get_celebration_art, get_celebration_frame_count
@@ -3451,9 +3079,9 @@ class Renderer:
         if self._celebration_message:
             content.append("")
             # Use ANSI-aware centering for colored messages
-            content.append(_visible_center(self._celebration_message, 30))
+            content.append(str(StyledText.parse(self._celebration_message).center(30)))
         content.append("")
-        content.append(_visible_center("Press any key to continue...", 30))
+        content.append(str(StyledText.parse("Press any key to continue...").center(30)))
 
         # Create a larger box for celebrations (using BOX_DOUBLE for consistency)
         box_width = min(60, width - 4)
@@ -3470,9 +3098,8 @@ class Renderer:
 
         for line in content:
             # Center and ensure full width with spaces (solid background)
-            content_area = _visible_truncate(f" {line}", box_width)
-            content_area = _visible_ljust(content_area, box_width)
-            box_lines.append(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"])
+            content_area = StyledText.parse(f" {line}").fit(box_width)
+            box_lines.append(str(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"]))
 
         # Bottom border
         box_lines.append(BOX_DOUBLE["bl"] + BOX_DOUBLE["h"] * box_width + BOX_DOUBLE["br"])
@@ -3484,17 +3111,7 @@ class Renderer:
         start_row = max(2, (len(result) - box_height) // 2 - 2)
         start_col = (width - box_width - 2) // 2
 
-        for i, line in enumerate(box_lines):
-            if start_row + i < len(result):
-                row = result[start_row + i]
-                # Use ANSI-aware slicing for rows that may contain colored text
-                box_visible_width = _visible_len(line)
-                left_part = _visible_slice(row, 0, start_col)
-                left_part = _visible_ljust(left_part, start_col)
-                right_part = _visible_slice(row, start_col + box_visible_width, width)
-                # Add terminal reset after left_part to prevent color bleeding into overlay
-                new_row = left_part + self.term.normal + line + right_part
-                result[start_row + i] = _visible_truncate(new_row, width)
+        self._composite_box(result, box_lines, start_row, start_col, width)
 
         return result
 
@@ -3530,12 +3147,12 @@ class Renderer:
         # Build content box
         content = []
         content.append("")  # Top padding
-        content.append(_visible_center("~~ INTERACTING ~~", 40))
+        content.append(str(StyledText.parse("~~ INTERACTING ~~").center(40)))
         content.append("")
         
         # Add animation frame
         for line in frame:
-            content.append(_visible_center(line, 40))
+            content.append(str(StyledText.parse(line).center(40)))
         
         content.append("")
         
@@ -3550,12 +3167,12 @@ class Renderer:
                     if len(line) + len(word) + 1 <= 36:
                         line += (" " if line else "") + word
                     else:
-                        content.append(_visible_center(line, 40))
+                        content.append(str(StyledText.parse(line).center(40)))
                         line = word
                 if line:
-                    content.append(_visible_center(line, 40))
+                    content.append(str(StyledText.parse(line).center(40)))
             else:
-                content.append(_visible_center(msg, 40))
+                content.append(str(StyledText.parse(msg).center(40)))
         
         content.append("")
 
@@ -3575,9 +3192,8 @@ class Renderer:
         
         for line in content:
             # Truncate and pad to box width
-            content_area = _visible_truncate(f" {line}", box_width)
-            content_area = _visible_ljust(content_area, box_width)
-            box_lines.append(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"])
+            content_area = StyledText.parse(f" {line}").fit(box_width)
+            box_lines.append(str(BOX_DOUBLE["v"] + content_area + BOX_DOUBLE["v"]))
         
         # Bottom border
         box_lines.append(BOX_DOUBLE["bl"] + BOX_DOUBLE["h"] * box_width + BOX_DOUBLE["br"])
@@ -3587,17 +3203,7 @@ class Renderer:
         start_row = max(2, (len(result) - box_height) // 2 - 2)
         start_col = (width - box_width) // 2
 
-        for i, line in enumerate(box_lines):
-            if start_row + i < len(result):
-                row = result[start_row + i]
-                # Use ANSI-aware slicing
-                box_visible_width = _visible_len(line)
-                left_part = _visible_slice(row, 0, start_col)
-                left_part = _visible_ljust(left_part, start_col)
-                right_part = _visible_slice(row, start_col + box_visible_width, width)
-                # Add terminal reset after left_part to prevent color bleeding into overlay
-                new_row = left_part + self.term.normal + line + right_part
-                result[start_row + i] = _visible_truncate(new_row, width)
+        self._composite_box(result, box_lines, start_row, start_col, width)
 
         return result
 
@@ -3699,12 +3305,20 @@ class Renderer:
             return items[self._shop_item_index]
         return None
 
-    def show_message(self, message: str, duration: float = 5.0, category: str = "system"):
+    def show_message(self, message: str, duration: float = 5.0, category: str = "system",
+                     replaces_partial: bool = False):
         """Show a message to the player and add to chat log. 
-        Categories: system, action, duck, event, discovery"""
+        Categories: system, action, duck, event, discovery
+
+        Pass *replaces_partial* for the finished reply to a streamed one so
+        the partial text shown by ``show_partial_message`` is removed.
+        """
         import textwrap
         from datetime import datetime
         
+        if replaces_partial:
+            self._clear_partial_reply()
+        
         # If Cheese is away, obscure duck-category messages
         if self._cheese_away and category == "duck":
             from dialogue.travel_dialogue import get_obscured_chat
@@ -3741,6 +3355,45 @@ class Renderer:
         else:
             self._message_expire = float('inf')  # Never expire automatically
     
+    def show_partial_message(self, message: str, category: str = "duck"):
+        """Show a reply that is still being generated.
+
+        Each call replaces the previous partial text in the message box, the
+        talk overlay and the chat log; ``show_message(...,
+        replaces_partial=True)`` with the finished reply removes it.
+        """
+        import textwrap
+        from datetime import datetime
+
+        if self._cheese_away and category == "duck":
+            return  # the finished reply is obscured by show_message
+        self._clear_partial_reply()
+        self._partial_reply = message
+
+        timestamp = datetime.now().strftime("%H:%M")
+        for line in message.split('\n'):
+            if line.strip():
+                entry = (timestamp, line.strip(), category)
+                self._chat_log.append(entry)
+                self._partial_log_entries.append(entry)
+        if len(self._chat_log) > self._chat_log_max_size:
+            self._chat_log = self._chat_log[-self._chat_log_max_size:]
+
+        wrapped_lines = []
+        for line in message.split('\n'):
+            wrapped_lines.extend(textwrap.wrap(line, width=44) or [''])
+        self._message_queue = wrapped_lines
+        self._show_message_overlay = True
+        self._message_expire = time.time() + 15.0
+
+    def _clear_partial_reply(self):
+        """Drop the chat log entries of a partially shown reply."""
+        if self._partial_log_entries:
+            partial_ids = {id(entry) for entry in self._partial_log_entries}
+            self._chat_log = [e for e in self._chat_log if id(e) not in partial_ids]
+            self._partial_log_entries = []
+        self._partial_reply = ""
+
     def add_chat_message(self, message: str, category: str = "system"):
         """Add a message to the chat log without showing overlay."""
         from datetime import datetime
@@ -3884,15 +3537,10 @@ class Renderer:
         self.show_overlay("\n".join(lines), duration=0)
 
     def set_show_particles(self, enabled: bool):
-        """Wire the display.show_particles setting (ambient/unified particles)."""
+        """Wire the display.show_particles setting (biome ambient particles)."""
         self._show_particles = bool(enabled)
         if not self._show_particles:
-            self._ambient_particles = []
-            try:
-                if self._particle_system is not None:
-                    self._particle_system.clear()
-            except Exception:
-                pass
+            self._particle_system.configure_biome(None, "", "")
 
     def set_show_animations(self, enabled: bool):
         """Wire the display.show_animations setting (effects, event animations)."""
@@ -3902,7 +3550,7 @@ class Renderer:
         """Wire the display.show_weather_effects setting (rain/snow visuals)."""
         self._show_weather_effects = bool(enabled)
         if not self._show_weather_effects:
-            self._weather_particles = []
+            self._particle_system.configure_weather(None, 0.0)
 
     def show_effect(self, effect_name: str, duration: float = 1.0):
         """Show a visual effect."""
@@ -4068,6 +3716,7 @@ class Renderer:
             "",
         ])
 
+        self._screen.invalidate()
         print(self.term.home + self.term.clear)
         print("\n".join(lines))
 
@@ -4078,3 +3727,39 @@ class Renderer:
             self._animation_frame = (self._animation_frame + 1) % 4
             self._animation_time = current
             animation_controller.update()
+
+    def next_animation_deadline(self, now: Optional[float] = None) -> Optional[float]:
+        """Return the epoch time at which the next frame must be drawn.
+
+        Used by the event-driven game loop: anything that moves every frame
+        (particles, celebrations, item animations, effect overlays) returns
+        *now*; the duck, timed overlays and idle ambient particle spawners
+        report when they next change.  Returns ``None`` when nothing on screen is scheduled to change.
+        """
+        if now is None:
+            now = time.time()
+
+        spawn_wait = self._particle_system.next_spawn_delay()
+        if (self._particle_system.is_active()
+                or spawn_wait == 0.0
+                or self._show_celebration
+                or self.interaction_animator.is_animating()
+                or animation_controller.is_animating()
+                or animation_controller.get_particles()
+                or animation_controller.get_effect_overlay()):
+            return now
+
+        deadline: Optional[float] = None
+        duck_wait = self.duck_pos.seconds_until_next_change()
+        if duck_wait is not None:
+            deadline = now + duck_wait
+        for expire in (
+            self._message_expire if self._show_message_overlay else None,
+            self._closeup_expire if self._show_closeup else None,
+            None if spawn_wait is None else now + spawn_wait,
+        ):
+            if expire is None or not now < expire < float('inf'):
+                continue
+            if deadline is None or expire < deadline:
+                deadline = expire
+        return deadline
@@ -0,0 +1,300 @@
+"""
+Cell-level double buffer for terminal output.
+
+The renderer builds each frame as a list of ANSI-styled lines.  Writing all of
+them every frame costs ~10 KB for a 116x35 screen even when a single particle
+moved.  ``ScreenBuffer`` parses the lines into a back buffer of
+``(char, style)`` cells, compares it with the front buffer (what the terminal
+currently shows) and emits cursor moves and SGR codes only for the cells that
+changed.
+
+Cells are terminal columns: a wide glyph (emoji, fullwidth forms) takes its
+own cell plus a continuation cell holding ``""``, so cursor moves land on the
+display column the terminal actually uses.
+
+Usage from renderer.py::
+
+    self._screen = ScreenBuffer(move=self.term.move, normal=self.term.normal)
+
+    # Each frame:
+    frame_str = self._screen.render(output_lines, width)
+    if frame_str:
+        sys.stdout.write(frame_str)
+
+Anything else that writes to the terminal directly (title screen, loading
+screen, minigames) must call ``invalidate()`` so the next frame repaints.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+# SGR sequences (group 1 = parameters) and charset designations such as the
+# ``ESC ( B`` blessed emits as part of ``term.normal``.
+_ESCAPE = re.compile(r'\x1b\[([0-9;]*)m|\x1b\([0-9;]*[a-zA-Z]')
+
+# A normalised style: (foreground, background, attributes).  ``None`` means
+# the terminal default; attributes are sorted SGR codes such as ``"1"``.
+Style = Tuple[Optional[str], Optional[str], Tuple[str, ...]]
+DEFAULT_STYLE: Style = (None, None, ())
+
+# SGR codes that switch an attribute off, mapped to the codes they cancel
+_ATTR_OFF = {
+    22: ("1", "2"),
+    23: ("3",),
+    24: ("4",),
+    25: ("5",),
+    27: ("7",),
+    28: ("8",),
+    29: ("9",),
+}
+
+# Continuation cell after a double-width glyph; writing the glyph fills it
+WIDE_CONTINUATION = ''
+
+# Unchanged runs shorter than this are rewritten rather than skipped with a
+# cursor move, which is itself ~8 bytes.
+_MAX_GAP = 4
+
+
+def apply_sgr(style: Style, params: str) -> Style:
+    """Return *style* updated by one SGR parameter string (e.g. ``"1;38;5;2"``)."""
+    fg, bg, attrs = style
+    attr_set = set(attrs)
+    codes = params.split(';') if params else ['0']
+    i = 0
+    while i < len(codes):
+        try:
+            code = int(codes[i] or 0)
+        except ValueError:
+            i += 1
+            continue
+        if code == 0:
+            fg, bg = None, None
+            attr_set.clear()
+        elif code in (38, 48):
+            # Extended colour: 38;5;n or 38;2;r;g;b
+            mode = codes[i + 1] if i + 1 < len(codes) else ''
+            span = 3 if mode == '5' else 5 if mode == '2' else 1
+            value = ';'.join(codes[i:i + span])
+            if code == 38:
+                fg = value
+            else:
+                bg = value
+            i += span
+            continue
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            fg = str(code)
+        elif code == 39:
+            fg = None
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            bg = str(code)
+        elif code == 49:
+            bg = None
+        elif code in _ATTR_OFF:
+            attr_set.difference_update(_ATTR_OFF[code])
+        else:
+            attr_set.add(str(code))
+        i += 1
+    return (fg, bg, tuple(sorted(attr_set)))
+
+
+@lru_cache(maxsize=1024)
+def char_width(char: str) -> int:
+    """Terminal columns taken by *char*: 0 (combining), 1, or 2 (wide)."""
+    if unicodedata.combining(char) or unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+def _add_text(chars: List[str], styles: List[Style], text: str, style: Style) -> None:
+    """Append the cells *text* covers, one per display column."""
+    if text.isascii():
+        chars.extend(text)
+        styles.extend([style] * len(text))
+        return
+    for char in text:
+        width = char_width(char)
+        if width == 0:
+            if chars:
+                chars[-1] += char   # Combining mark / variation selector rides along
+            continue
+        chars.append(char)
+        styles.append(style)
+        if width == 2:
+            chars.append(WIDE_CONTINUATION)
+            styles.append(style)
+
+
+def parse_cells(line: str, width: int) -> Tuple[List[str], List[Style]]:
+    """Split an ANSI-styled *line* into exactly *width* chars and styles.
+
+    Lines shorter than *width* are padded with default-styled spaces; longer
+    lines are truncated.  A wide glyph is followed by a ``WIDE_CONTINUATION``
+    cell; one that would straddle the right edge becomes a space.
+    """
+    chars: List[str] = []
+    styles: List[Style] = []
+    style = DEFAULT_STYLE
+    pos = 0
+    for match in _ESCAPE.finditer(line):
+        text = line[pos:match.start()]
+        if text:
+            _add_text(chars, styles, text, style)
+        pos = match.end()
+        params = match.group(1)
+        if params is not None:
+            style = apply_sgr(style, params)
+    text = line[pos:]
+    if text:
+        _add_text(chars, styles, text, style)
+
+    if len(chars) > width:
+        del chars[width:]
+        del styles[width:]
+        if width and chars[-1] and char_width(chars[-1][0]) == 2:
+            chars[-1] = ' '
+    elif len(chars) < width:
+        pad = width - len(chars)
+        chars.extend(' ' * pad)
+        styles.extend([DEFAULT_STYLE] * pad)
+    return chars, styles
+
+
+class ScreenBuffer:
+    """
+    Front/back cell buffers that turn full frames into minimal updates.
+
+    Args:
+        move:   ``move(row, col)`` returning the cursor-positioning sequence
+                (``Terminal.move``).
+        normal: Sequence that resets all attributes (``Terminal.normal``).
+        clear:  Sequence that homes the cursor and clears the screen.
+    """
+
+    def __init__(
+        self,
+        move: Callable[[int, int], str],
+        normal: str = '\x1b[m',
+        clear: str = '\x1b[H\x1b[2J',
+    ) -> None:
+        self._move = move
+        self._normal = normal
+        self._clear = clear
+        self._width = 0
+        self._front_chars: List[List[str]] = []
+        self._front_styles: List[List[Style]] = []
+        # Raw input line per row; identical lines skip parsing entirely
+        self._front_lines: List[Optional[str]] = []
+        self._needs_clear = True
+        self._sgr_cache: Dict[Style, str] = {}
+
+        # Bookkeeping for get_stats()
+        self.last_bytes = 0
+        self.last_cells_changed = 0
+        self.frames = 0
+        self.total_bytes = 0
+
+    def invalidate(self) -> None:
+        """Forget what the terminal shows; the next render clears and repaints."""
+        self._needs_clear = True
+
+    def _reset_blank(self, width: int, rows: int) -> None:
+        """Record a freshly cleared screen of *rows* x *width* blank cells."""
+        self._width = width
+        self._front_chars = [[' '] * width for _ in range(rows)]
+        self._front_styles = [[DEFAULT_STYLE] * width for _ in range(rows)]
+        self._front_lines = [None] * rows
+
+    def _sgr(self, style: Style) -> str:
+        """Return the sequence that switches the terminal to *style*."""
+        seq = self._sgr_cache.get(style)
+        if seq is None:
+            fg, bg, attrs = style
+            if style == DEFAULT_STYLE:
+                seq = self._normal
+            else:
+                codes = list(attrs)
+                if fg is not None:
+                    codes.append(fg)
+                if bg is not None:
+                    codes.append(bg)
+                seq = self._normal + '\x1b[' + ';'.join(codes) + 'm'
+            self._sgr_cache[style] = seq
+        return seq
+
+    def render(self, lines: List[str], width: int) -> str:
+        """
+        Diff *lines* against the front buffer and return the update sequence.
+
+        Returns an empty string when nothing changed.  The front buffer is
+        updated as if the returned string had been written.
+        """
+        out: List[str] = []
+        if self._needs_clear or width != self._width or len(lines) > len(self._front_chars):
+            out.append(self._clear)
+            self._reset_blank(width, len(lines))
+            self._needs_clear = False
+
+        changed_total = 0
+        for row, line in enumerate(lines):
+            if self._front_lines[row] == line:
+                continue
+            chars, styles = parse_cells(line, width)
+            front_chars = self._front_chars[row]
+            front_styles = self._front_styles[row]
+            self._front_lines[row] = line
+
+            col = 0
+            while col < width:
+                if chars[col] == front_chars[col] and styles[col] == front_styles[col]:
+                    col += 1
+                    continue
+
+                # Extend the run, swallowing short unchanged gaps
+                end = col + 1
+                last_changed = col
+                while end < width and end - last_changed <= _MAX_GAP:
+                    if chars[end] != front_chars[end] or styles[end] != front_styles[end]:
+                        last_changed = end
+                    end += 1
+                end = last_changed + 1
+                # Whole glyphs only: the cursor moves by display column
+                if col and chars[col] == WIDE_CONTINUATION:
+                    col -= 1
+                if end < width and chars[end] == WIDE_CONTINUATION:
+                    end += 1
+
+                out.append(self._move(row, col))
+                current: Style = DEFAULT_STYLE  # every run ends with a reset
+                for x in range(col, end):
+                    style = styles[x]
+                    if style != current:
+                        out.append(self._sgr(style))
+                        current = style
+                    out.append(chars[x])
+                    if chars[x] != front_chars[x] or style != front_styles[x]:
+                        changed_total += 1
+                out.append(self._normal)
+                front_chars[col:end] = chars[col:end]
+                front_styles[col:end] = styles[col:end]
+                col = end
+
+        frame = ''.join(out)
+        self.last_bytes = len(frame.encode('utf-8'))
+        self.last_cells_changed = changed_total
+        self.frames += 1
+        self.total_bytes += self.last_bytes
+        return frame
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return output statistics (bytes for the last frame and on average)."""
+        avg = self.total_bytes / self.frames if self.frames else 0.0
+        return {
+            "frames": self.frames,
+            "last_bytes": self.last_bytes,
+            "last_cells_changed": self.last_cells_changed,
+            "avg_bytes": round(avg, 1),
+        }
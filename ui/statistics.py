@@ -40,6 +40,9 @@ class StatisticsSystem:
     """
     
     def __init__(self):
+        # Bumped on every change to saved state; lets autosave skip idle stats
+        self.save_revision: int = 0
+
         # General Stats
         self.total_playtime_minutes: int = 0
         self.session_count: int = 0
@@ -154,6 +157,7 @@ class StatisticsSystem:
         
         if self.current_login_streak > self.best_login_streak:
             self.best_login_streak = self.current_login_streak
+        self.save_revision += 1
     
     def end_session(self):
         """End the current session and record playtime."""
@@ -169,6 +173,7 @@ class StatisticsSystem:
             self.longest_session_minutes = duration
         
         self.current_session_start = None
+        self.save_revision += 1
     
     def increment_stat(self, stat_name: str, amount: int = 1):
         """Increment a stat record."""
@@ -182,6 +187,7 @@ class StatisticsSystem:
         
         stat.current_value += amount
         stat.all_time_total += amount
+        self.save_revision += 1
         stat.daily_values[today] = stat.daily_values.get(today, 0) + amount
         stat.weekly_values[week] = stat.weekly_values.get(week, 0) + amount
         stat.monthly_values[month] = stat.monthly_values.get(month, 0) + amount
@@ -191,6 +197,22 @@ class StatisticsSystem:
             stat.peak_value = stat.current_value
             stat.peak_date = today
     
+    def add_to_count(self, stat_name: str, amount: int = 1):
+        """Add to a plain counter such as ``items_bought``."""
+        setattr(self, stat_name, getattr(self, stat_name, 0) + amount)
+        self.save_revision += 1
+    
+    def set_value(self, stat_name: str, value):
+        """Set a plain stat; only a different value counts as a change."""
+        if getattr(self, stat_name, None) != value:
+            setattr(self, stat_name, value)
+            self.save_revision += 1
+    
+    def record_best(self, stat_name: str, value):
+        """Raise a high-water mark such as ``most_coins_held``."""
+        if value > getattr(self, stat_name, 0):
+            self.set_value(stat_name, value)
+    
     def get_stat_summary(self, stat_name: str) -> Dict:
         """Get summary of a stat."""
         stat = getattr(self, stat_name, None)
@@ -296,11 +318,14 @@ class StatisticsSystem:
                     self.milestones_reached.append(milestone)
                     new_milestones.append(f"Earned {amount:,} coins!")
         
+        if new_milestones:
+            self.save_revision += 1
         return new_milestones
     
     def record_mood(self, mood: str):
         """Record current duck mood."""
         self.mood_history[mood] = self.mood_history.get(mood, 0) + 1
+        self.save_revision += 1
     
     def get_mood_distribution(self) -> Dict[str, float]:
         """Get percentage distribution of moods."""
@@ -0,0 +1,196 @@
+"""
+ANSI-aware styled text.
+
+Renderer lines are plain ``str`` objects with embedded SGR escape codes.
+Measuring, slicing and padding them used to mean running the escape regex
+over every line and walking the visible characters one at a time.
+``StyledText`` parses a line once into runs of ``(codes, text)`` — the escape
+codes that precede a stretch of visible text — and keeps the visible width
+precomputed, so slicing, padding and centering cost O(runs) rather than
+O(characters).
+
+Usage::
+
+    row = StyledText.parse(line)
+    left = row.slice(0, start_col).ljust(start_col)
+    new_row = left + normal + box_line + row.slice(start_col + box_w, width)
+    output.append(str(new_row))
+
+Slicing keeps only the escape codes that sit inside the sliced range, which
+matches the historical ``_visible_slice`` behaviour and prevents colours from
+before the slice bleeding into it.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import List, Sequence, Tuple, Union
+
+# One or more consecutive escape sequences (SGR and charset designations)
+_ANSI_RUN = re.compile(r'(?:\x1b\[[0-9;]*m|\x1b\([0-9;]*[a-zA-Z])+')
+
+Run = Tuple[str, str]  # (escape codes, visible text)
+
+
+class StyledText:
+    """
+    An immutable line of text with embedded ANSI escape codes.
+
+    Attributes:
+        width: Number of visible (non-escape) characters.
+    """
+
+    __slots__ = ("_runs", "_starts", "width", "_str")
+
+    def __init__(self, runs: Sequence[Run] = ()) -> None:
+        self._runs: Tuple[Run, ...] = tuple(runs)
+        starts: List[int] = []
+        pos = 0
+        for _codes, text in self._runs:
+            starts.append(pos)
+            pos += len(text)
+        self._starts = starts
+        self.width: int = pos
+        self._str: Union[str, None] = None
+
+    # ── Construction ──────────────────────────────────────────────────
+
+    @classmethod
+    def parse(cls, s: Union[str, "StyledText"]) -> "StyledText":
+        """Parse a string with embedded escape codes in a single pass."""
+        if isinstance(s, StyledText):
+            return s
+        if '\x1b' not in s:
+            result = cls(((("", s),) if s else ()))
+            result._str = s
+            return result
+
+        runs: List[Run] = []
+        pos = 0
+        pending = ""
+        for match in _ANSI_RUN.finditer(s):
+            text = s[pos:match.start()]
+            if text:
+                runs.append((pending, text))
+                pending = ""
+            pending += match.group()
+            pos = match.end()
+        text = s[pos:]
+        if text or pending:
+            runs.append((pending, text))
+        result = cls(runs)
+        result._str = s
+        return result
+
+    # ── Conversion ────────────────────────────────────────────────────
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = "".join(codes + text for codes, text in self._runs)
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"StyledText({str(self)!r})"
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StyledText):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    @property
+    def plain(self) -> str:
+        """The visible text with all escape codes removed."""
+        return "".join(text for _codes, text in self._runs)
+
+    # ── Concatenation ─────────────────────────────────────────────────
+
+    def __add__(self, other: Union[str, "StyledText"]) -> "StyledText":
+        other = StyledText.parse(other)
+        if not other._runs:
+            return self
+        if not self._runs:
+            return other
+        runs = list(self._runs)
+        first_codes, first_text = other._runs[0]
+        if not first_codes:
+            # Plain text directly follows our last run: merge into it
+            codes, text = runs[-1]
+            runs[-1] = (codes, text + first_text)
+            runs.extend(other._runs[1:])
+        else:
+            runs.extend(other._runs)
+        result = StyledText(runs)
+        if self._str is not None and other._str is not None:
+            result._str = self._str + other._str
+        return result
+
+    def __radd__(self, other: str) -> "StyledText":
+        return StyledText.parse(other) + self
+
+    # ── Slicing ───────────────────────────────────────────────────────
+
+    def slice(self, start: int, end: int) -> "StyledText":
+        """
+        Return the visible columns ``[start, end)``.
+
+        Escape codes are kept only when they sit inside the range, so styles
+        from before *start* are not carried into the result.
+        """
+        start = max(0, start)
+        if end <= start or not self._runs:
+            return StyledText()
+        if start == 0 and end >= self.width:
+            return self
+
+        out: List[Run] = []
+        idx = max(0, bisect_right(self._starts, start) - 1)
+        for i in range(idx, len(self._runs)):
+            pos = self._starts[i]
+            if pos >= end:
+                break
+            codes, text = self._runs[i]
+            run_codes = codes if pos >= start else ""
+            lo = max(start, pos) - pos
+            hi = min(end, pos + len(text)) - pos
+            run_text = text[lo:hi] if lo < hi else ""
+            if run_codes or run_text:
+                out.append((run_codes, run_text))
+        return StyledText(out)
+
+    def truncate(self, width: int) -> "StyledText":
+        """Return at most *width* visible columns."""
+        return self.slice(0, width)
+
+    # ── Padding ───────────────────────────────────────────────────────
+
+    def ljust(self, width: int) -> "StyledText":
+        """Pad with spaces on the right up to *width* visible columns."""
+        if self.width >= width:
+            return self
+        return self + " " * (width - self.width)
+
+    def rjust(self, width: int) -> "StyledText":
+        """Pad with spaces on the left up to *width* visible columns."""
+        if self.width >= width:
+            return self
+        return " " * (width - self.width) + self
+
+    def center(self, width: int) -> "StyledText":
+        """Center within *width* visible columns (extra space goes right)."""
+        if self.width >= width:
+            return self
+        pad_total = width - self.width
+        pad_left = pad_total // 2
+        return " " * pad_left + self + " " * (pad_total - pad_left)
+
+    def fit(self, width: int) -> "StyledText":
+        """Truncate or pad to exactly *width* visible columns."""
+        return self.slice(0, width).ljust(width)
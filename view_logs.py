@@ -2,11 +2,28 @@
 """
 View game logs - displays the latest log files.
 """
+import json
 import sys
 from pathlib import Path
 import argparse
 
 
+def format_line(line: str) -> str:
+    """Render one JSON-lines log record readably (older plain logs pass through)."""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return line
+    if not isinstance(entry, dict):
+        return line
+    frame = f"#{entry['frame']}" if entry.get("frame") is not None else ""
+    text = (f"{entry.get('time', '')} {entry.get('level', ''):<8} "
+            f"[{entry.get('subsystem', '')}{frame}] {entry.get('message', '')}\n")
+    if entry.get("exc"):
+        text += entry["exc"] + "\n"
+    return text
+
+
 def view_logs(log_type='all', tail=50):
     """
     View game logs.
@@ -49,7 +66,7 @@ def view_logs(log_type='all', tail=50):
                 lines = f.readlines()
                 if tail > 0:
                     lines = lines[-tail:]
-                print(''.join(lines))
+                print(''.join(format_line(line) for line in lines))
         except Exception as e:
             print(f"Error reading error log: {e}")
 
@@ -61,7 +78,7 @@ def view_logs(log_type='all', tail=50):
                 lines = f.readlines()
                 if tail > 0:
                     lines = lines[-tail:]
-                print(''.join(lines))
+                print(''.join(format_line(line) for line in lines))
         except Exception as e:
             print(f"Error reading log: {e}")
 
@@ -71,7 +88,7 @@ def view_logs(log_type='all', tail=50):
         try:
             with open(latest_game_log, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
-                print(''.join(lines[-tail:]))
+                print(''.join(format_line(line) for line in lines[-tail:]))
         except Exception as e:
             print(f"Error reading log: {e}")
 
@@ -84,7 +101,7 @@ def list_logs():
         print("No logs directory found.")
         return
 
-    all_logs = sorted(logs_dir.glob("*.log"), key=lambda p: p.stat().st_mtime, reverse=True)
+    all_logs = sorted(logs_dir.glob("*.log*"), key=lambda p: p.stat().st_mtime, reverse=True)
 
     if not all_logs:
         print("No log files found.")
@@ -986,6 +986,30 @@ class BuildingSystem:
             "commentary": self._get_build_commentary(structure),
         }
     
+    def catch_up_building(self, inventory: MaterialInventory = None,
+                          seconds: float = 0.0) -> Dict:
+        """
+        Advance the current build by *seconds* in one call.
+
+        Unlike ``update_building``, which finishes at most one stage per
+        call and drops any overflow, this carries leftover time through as
+        many stages as it covers. Returns the last ``update_building`` result.
+        """
+        result = {"in_progress": bool(self.current_build)}
+        while self.current_build and seconds > 0:
+            structure = self.current_build.structure
+            blueprint = structure.blueprint
+            if not blueprint:
+                return self.update_building(inventory, 0.0)
+            rate = (1.0 / blueprint.build_time) * (1.0 + (self.building_skill - 1) * 0.1)
+            stage_seconds = (1.0 - structure.stage_progress) / rate
+            if seconds < stage_seconds:
+                return self.update_building(inventory, seconds)
+            seconds -= stage_seconds
+            structure.stage_progress = 1.0
+            result = self.update_building(inventory, 0.0)
+        return result
+
     def _get_build_commentary(self, structure: "Structure") -> str:
         """Get Cheese's commentary on background building progress."""
         import random as _rng
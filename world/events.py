@@ -2,16 +2,19 @@
 Event system - random and scheduled events that happen to the duck.
 Animal Crossing-style special days and seasonal events included.
 """
+import heapq
 import logging
 import random
 import time
-from typing import Dict, List, Optional, Callable, TYPE_CHECKING
+from bisect import bisect_right
+from typing import Dict, List, Optional, Callable, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+from core.content_pack import content_table
 from core.event_bus import event_bus, TimeChangedEvent, SeasonChangedEvent
 
 if TYPE_CHECKING:
@@ -1959,6 +1962,130 @@ SPECIAL_DAY_EVENTS = {
 # Prevents the huge pool of 590+ events from overwhelming the player.
 GLOBAL_EVENT_MIN_GAP = 120  # 2 minutes between events
 
+# Event types that check_random_events may fire
+RANDOM_EVENT_TYPES = (
+    EventType.RANDOM, EventType.WEATHER, EventType.VISITOR,
+    EventType.SEASONAL, EventType.DISCOVERY,
+)
+
+TIME_PERIODS = ("dawn", "morning", "midday", "afternoon",
+                "evening", "dusk", "night", "late_night")
+
+
+def _stage_index(stage: Optional[str]) -> int:
+    """Position of *stage* in SIMPLE_GROWTH_STAGES (unknown stages count as 0)."""
+    return SIMPLE_GROWTH_STAGES.index(stage) if stage in SIMPLE_GROWTH_STAGES else 0
+
+
+class _EventBucket:
+    """
+    The random events that can fire for one (time period, weather group,
+    stage) combination, laid out for a single weighted draw.
+    """
+
+    def __init__(self, events: List[Tuple[str, float]]):
+        self.ids: List[str] = []
+        self.starts: List[float] = []   # cumulative weight before each event
+        self.weights: Dict[str, float] = {}
+        self.position: Dict[str, int] = {}
+        self.total = 0.0
+        self.miss = 1.0      # chance that no uncertain event fires
+        self.certain = 0     # events with probability >= 1
+        for event_id, probability in events:
+            p = min(1.0, probability)
+            if p <= 0:
+                continue
+            self.position[event_id] = len(self.ids)
+            self.ids.append(event_id)
+            self.starts.append(self.total)
+            self.weights[event_id] = p
+            self.total += p
+            if p >= 1.0:
+                self.certain += 1
+            else:
+                self.miss *= 1.0 - p
+
+    def draw(self, excluded, rng=random) -> Optional[str]:
+        """
+        Pick the event that fires, if any, skipping *excluded* ids.
+
+        Approximates rolling every remaining event independently: the
+        chance that some event fires matches those rolls, but the event is
+        then picked in proportion to its probability rather than from the
+        actual hits. Takes two random numbers instead of one per event.
+        """
+        skipped = sorted((self.starts[self.position[event_id]], self.weights[event_id])
+                         for event_id in excluded if event_id in self.position)
+        weight, miss, certain = self.total, self.miss, self.certain
+        for _start, p in skipped:
+            weight -= p
+            if p >= 1.0:
+                certain -= 1
+            else:
+                miss /= 1.0 - p
+        if weight <= 1e-12:
+            return None
+        if not certain and rng.random() >= 1.0 - miss:
+            return None
+
+        # Draw over the remaining weight, then step over excluded intervals
+        r = rng.random() * weight
+        for start, p in skipped:
+            if start > r:
+                break
+            r += p
+        i = min(bisect_right(self.starts, r), len(self.ids)) - 1
+        event_id = self.ids[i]
+        return None if event_id in excluded else event_id
+
+
+class _EventIndex:
+    """
+    Random events pre-bucketed by (time period, weather group, stage index).
+
+    Buckets are built lazily on first use and the whole index is rebuilt
+    when the EVENTS table is replaced or grows.
+    """
+
+    def __init__(self):
+        self._source: Optional[Dict[str, Event]] = None
+        self._size = -1
+        self._candidates: List[Tuple[str, Event, frozenset, Optional[str], int]] = []
+        self._buckets: Dict[Tuple[str, Optional[str], int], _EventBucket] = {}
+        self.encounter_ids: frozenset = frozenset()
+
+    def _sync(self) -> None:
+        if self._source is EVENTS and self._size == len(EVENTS):
+            return
+        self._source, self._size = EVENTS, len(EVENTS)
+        self._buckets = {}
+        self._candidates = [
+            (event_id, event, frozenset(event.required_time or TIME_PERIODS),
+             event.weather_group, _stage_index(event.requires_stage))
+            for event_id, event in EVENTS.items() if event.event_type in RANDOM_EVENT_TYPES
+        ]
+        self.encounter_ids = frozenset(
+            candidate[0] for candidate in self._candidates
+            if candidate[1].encounter_id in ENCOUNTERS)
+
+    def bucket(self, period: str, weather_group: Optional[str], stage: int) -> _EventBucket:
+        """Events allowed in this period, weather group and stage, before cooldowns."""
+        self._sync()
+        key = (period, weather_group, stage)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _EventBucket([
+                (event_id, event.probability)
+                for event_id, event, times, group, min_stage in self._candidates
+                if period in times and (not group or group == weather_group)
+                and min_stage <= stage
+            ])
+            self._buckets[key] = bucket
+        return bucket
+
+
+_event_index = _EventIndex()
+
 
 class EventSystem:
     """
@@ -1977,15 +2104,20 @@ class EventSystem:
         self._completed_chains: set = set()  # chain_ids that completed (for cooldown)
         # Encounter tracking (negative events with player agency)
         self._active_encounter: Optional[Dict] = None  # {encounter_id, started_at}
+        # Events still cooling down: min-heap of (ready_at, event_id) plus the
+        # live ready time per id (heap entries that disagree are stale)
+        self._cooldown_heap: List[Tuple[float, str]] = []
+        self._cooling: Dict[str, float] = {}
+        self._cooldown_source: Optional[Dict[str, float]] = None
 
     def set_current_weather(self, weather: str):
         """Set the current weather for weather-based events."""
         self._current_weather = weather
 
-    def _weather_group_matches(self, required_group: str) -> bool:
-        """Check if the current weather matches a required weather group."""
+    def _current_weather_group(self) -> Optional[str]:
+        """The weather group of the current weather, or None if unknown."""
         if not self._current_weather:
-            return False
+            return None
         try:
             from world.atmosphere import WeatherType, _WEATHER_TYPE_TO_GROUP
             # _current_weather may be a string value or a WeatherType
@@ -1993,9 +2125,65 @@ class EventSystem:
                 weather_type = WeatherType(self._current_weather)
             else:
                 weather_type = self._current_weather
-            return _WEATHER_TYPE_TO_GROUP.get(weather_type) == required_group
+            return _WEATHER_TYPE_TO_GROUP.get(weather_type)
         except (ValueError, KeyError):
-            return False
+            return None
+
+    def _weather_group_matches(self, required_group: str) -> bool:
+        """Check if the current weather matches a required weather group."""
+        return self._current_weather_group() == required_group
+
+    # ── Cooldown tracking ────────────────────────────────────────────
+
+    def _mark_fired(self, event_id: str, when: float):
+        """Record that *event_id* fired and start its cooldown."""
+        self._sync_cooldowns(when)
+        self._last_event_times[event_id] = when
+        event = EVENTS.get(event_id)
+        if event is not None:
+            ready_at = when + event.cooldown
+            self._cooling[event_id] = ready_at
+            heapq.heappush(self._cooldown_heap, (ready_at, event_id))
+
+    def _sync_cooldowns(self, now: float):
+        """Release events whose cooldown has passed."""
+        if self._cooldown_source is not self._last_event_times:
+            # Loaded from a save: rebuild the heap from the stored times
+            self._cooldown_source = self._last_event_times
+            self._cooling = {}
+            for event_id, last in self._last_event_times.items():
+                event = EVENTS.get(event_id)
+                if event is not None and last + event.cooldown > now:
+                    self._cooling[event_id] = last + event.cooldown
+            self._cooldown_heap = [(ready, eid) for eid, ready in self._cooling.items()]
+            heapq.heapify(self._cooldown_heap)
+            return
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            ready_at, event_id = heapq.heappop(heap)
+            if self._cooling.get(event_id) == ready_at:
+                del self._cooling[event_id]
+
+    def reset_cooldowns(self, event_ids):
+        """Forget the last-fired time of *event_ids* so they can fire again."""
+        for event_id in event_ids:
+            self._last_event_times.pop(event_id, None)
+            self._cooling.pop(event_id, None)
+
+    def get_eligible_events(self, duck: "Duck") -> List[str]:
+        """Ids of the random events that could fire right now."""
+        self._sync_cooldowns(time.time())
+        bucket = _event_index.bucket(_get_current_time_period(),
+                                     self._current_weather_group(),
+                                     _stage_index(duck.growth_stage))
+        excluded = self._excluded_events()
+        return [event_id for event_id in bucket.ids if event_id not in excluded]
+
+    def _excluded_events(self):
+        """Ids that are in their bucket but cannot fire yet."""
+        if self._active_encounter and _event_index.encounter_ids:
+            return self._cooling.keys() | _event_index.encounter_ids
+        return self._cooling.keys()
 
     def check_random_events(self, duck: "Duck") -> Optional[Event]:
         """
@@ -2013,56 +2201,33 @@ class EventSystem:
         if current_time - self._last_any_event_time < GLOBAL_EVENT_MIN_GAP:
             return None
 
-        for event_id, event in EVENTS.items():
-            if event.event_type not in [EventType.RANDOM, EventType.WEATHER, EventType.VISITOR, EventType.SEASONAL, EventType.DISCOVERY]:
-                continue
-
-            # Check cooldown
-            last_time = self._last_event_times.get(event_id, 0)
-            if current_time - last_time < event.cooldown:
-                continue
-
-            # Check weather group requirement
-            if event.weather_group:
-                if not self._weather_group_matches(event.weather_group):
-                    continue
+        # Only events allowed in this period, weather and stage are considered;
+        # cooling events (and encounters while one is active) are skipped
+        self._sync_cooldowns(current_time)
+        bucket = _event_index.bucket(_get_current_time_period(),
+                                     self._current_weather_group(),
+                                     _stage_index(duck.growth_stage))
+        event_id = bucket.draw(self._excluded_events())
+        if event_id is None:
+            return None
 
-            # Check time-of-day requirement
-            if event.required_time:
-                if _get_current_time_period() not in event.required_time:
-                    continue
+        event = EVENTS[event_id]
+        self._mark_fired(event_id, current_time)
+        self._last_any_event_time = current_time  # global cooldown
 
-            # Check stage requirement
-            if event.requires_stage:
-                required_idx = SIMPLE_GROWTH_STAGES.index(event.requires_stage) if event.requires_stage in SIMPLE_GROWTH_STAGES else 0
-                current_idx = SIMPLE_GROWTH_STAGES.index(duck.growth_stage) if duck.growth_stage in SIMPLE_GROWTH_STAGES else 0
-                if current_idx < required_idx:
-                    continue
+        # If this event starts an encounter, activate the encounter
+        if event.encounter_id and event.encounter_id in ENCOUNTERS:
+            self.start_encounter(event.encounter_id)
 
-            # Roll for event
-            if random.random() < event.probability:
-                self._last_event_times[event_id] = current_time
-                self._last_any_event_time = current_time  # global cooldown
-                
-                # If this event starts an encounter, activate the encounter
-                if event.encounter_id and event.encounter_id in ENCOUNTERS:
-                    # Don't start if an encounter is already active
-                    if self._active_encounter:
-                        continue
-                    self.start_encounter(event.encounter_id)
-                
-                # If this event starts a chain, activate the chain
-                elif event.chain_id and event.chain_id in EVENT_CHAINS:
-                    chain = EVENT_CHAINS[event.chain_id]
-                    self._active_chains[event.chain_id] = {
-                        "stage": 0,
-                        "started_at": current_time,
-                        "last_stage_at": current_time,
-                    }
-                
-                return event
+        # If this event starts a chain, activate the chain
+        elif event.chain_id and event.chain_id in EVENT_CHAINS:
+            self._active_chains[event.chain_id] = {
+                "stage": 0,
+                "started_at": current_time,
+                "last_stage_at": current_time,
+            }
 
-        return None
+        return event
 
     def check_chain_progress(self, duck: "Duck") -> Optional[Event]:
         """
@@ -2087,7 +2252,7 @@ class EventSystem:
             if next_stage >= len(chain.stages):
                 chains_to_remove.append(chain_id)
                 self._completed_chains.add(chain_id)
-                self._last_event_times[chain_id] = current_time
+                self._mark_fired(chain_id, current_time)
                 continue
             
             # Wait between stages
@@ -2105,7 +2270,7 @@ class EventSystem:
             if next_stage >= len(chain.stages) - 1:
                 chains_to_remove.append(chain_id)
                 self._completed_chains.add(chain_id)
-                self._last_event_times[chain_id] = current_time
+                self._mark_fired(chain_id, current_time)
             
             return stage_event
         
@@ -2161,7 +2326,7 @@ class EventSystem:
         
         # Player helped!
         self._active_encounter = None
-        self._last_event_times[encounter.id] = time.time()
+        self._mark_fired(encounter.id, time.time())
         return {
             "resolved": True,
             "message": encounter.help_message,
@@ -2187,7 +2352,7 @@ class EventSystem:
         
         # Timed out — negative outcome
         self._active_encounter = None
-        self._last_event_times[encounter.id] = time.time()
+        self._mark_fired(encounter.id, time.time())
         return {
             "resolved": False,
             "message": encounter.ignore_message,
@@ -2383,15 +2548,12 @@ class EventSystem:
 # ═══════════════════════════════════════════════════════════════════
 #  Merge expanded events into main dictionaries
 # ═══════════════════════════════════════════════════════════════════
+# Read from the expanded_events content pack when one is built: the merged
+# entries are then read-only records that decode fields on access.
 try:
-    from world.expanded_events import (
-        EXPANDED_EVENTS,
-        EXPANDED_ENCOUNTERS,
-        EXPANDED_CHAINS,
-    )
-    EVENTS.update(EXPANDED_EVENTS)
-    ENCOUNTERS.update(EXPANDED_ENCOUNTERS)
-    EVENT_CHAINS.update(EXPANDED_CHAINS)
+    EVENTS.update(content_table("world.expanded_events", "EXPANDED_EVENTS").items())
+    ENCOUNTERS.update(content_table("world.expanded_events", "EXPANDED_ENCOUNTERS").items())
+    EVENT_CHAINS.update(content_table("world.expanded_events", "EXPANDED_CHAINS").items())
 except ImportError:
     pass  # expanded_events module not available
 
@@ -2435,9 +2597,8 @@ def _on_season_changed_events(event):
         default_weather = season_weather_map.get(new_season.lower(), "sunny")
         event_system.set_current_weather(default_weather)
         # Reset seasonal event cooldowns so new-season events can fire promptly
-        for event_id, ev in EVENTS.items():
-            if ev.event_type == EventType.SEASONAL:
-                event_system._last_event_times.pop(event_id, None)
+        event_system.reset_cooldowns(
+            [event_id for event_id, ev in EVENTS.items() if ev.event_type == EventType.SEASONAL])
         logger.debug("Seasonal event cooldowns reset for %s", new_season)
     except Exception:
         logger.debug("Error in _on_season_changed_events", exc_info=True)
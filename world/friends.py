@@ -1293,6 +1293,8 @@ class FriendsSystem:
         self.on_friendship_level_up: Optional[callable] = None  # Callback for level ups
         self.cheese_is_away: bool = False
         self._visitor_notes: list = []  # Notes left by visitors when cheese was away
+        # Bumped on every change to saved state; lets autosave skip idle friends
+        self.save_revision: int = 0
     
     def generate_new_friend(self) -> DuckFriend:
         """Generate a new random friend duck."""
@@ -1322,6 +1324,7 @@ class FriendsSystem:
         )
         
         self.friends[friend_id] = friend
+        self.save_revision += 1
         return friend
     
     def get_friend_by_id(self, friend_id: str) -> Optional[DuckFriend]:
@@ -1376,6 +1379,7 @@ class FriendsSystem:
         friend.last_visit = datetime.now().isoformat()
         self.total_visits += 1
         self.last_visitor_time = datetime.now().isoformat()
+        self.save_revision += 1
         
         gift_msg = f" They brought you a {gift}!" if gift else ""
 
@@ -1407,6 +1411,7 @@ class FriendsSystem:
         
         # Record activity
         self.current_visit.activities_done.append(activity)
+        self.save_revision += 1
         
         # Add to shared experiences memory (for returning visitor context)
         if activity not in friend.shared_experiences:
@@ -1464,6 +1469,7 @@ class FriendsSystem:
         friend.friendship_points += points
         friend.gifts_received += 1
         self.total_gifts_exchanged += 1
+        self.save_revision += 1
         
         # Record gift in memory for context-aware conversations
         gift_memory = f"received {item} as gift"
@@ -1481,6 +1487,7 @@ class FriendsSystem:
         
         gift = self.current_visit.gift_brought
         self.current_visit.gift_brought = None
+        self.save_revision += 1
         
         friend = self.friends.get(self.current_visit.friend_id)
         if friend:
@@ -1502,6 +1509,7 @@ class FriendsSystem:
             return False, "No active visit to end!", {}
         
         friend = self.friends.get(self.current_visit.friend_id)
+        self.save_revision += 1
         if not friend:
             self.current_visit = None
             return False, "Friend not found!", {}
@@ -1554,12 +1562,15 @@ class FriendsSystem:
             "timestamp": _time.time(),
         }
         self._visitor_notes.append(note)
+        self.save_revision += 1
         return note
 
     def get_pending_notes(self) -> list:
         """Get and clear all pending visitor notes."""
         notes = list(self._visitor_notes)
-        self._visitor_notes.clear()
+        if notes:
+            self._visitor_notes.clear()
+            self.save_revision += 1
         return notes
 
     def has_pending_notes(self) -> bool:
@@ -1819,6 +1830,7 @@ try:
             _friends_logger.debug("Visitor departed: %s", visitor_name)
             # Update visit stats
             friends_system.total_visits += 1
+            friends_system.save_revision += 1
         except Exception:
             _friends_logger.debug("Error in _on_visitor_departed", exc_info=True)
 
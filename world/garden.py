@@ -480,22 +480,64 @@ class Garden:
             
             # Growth progress
             if not plant.is_withered and plant.water_level > 20:
-                planted_time = datetime.fromisoformat(plant.planted_at)
-                hours_since_planting = (datetime.now() - planted_time).total_seconds() / 3600
-                growth_percent = hours_since_planting / plant_def.growth_time_hours
-                
-                # Determine growth stage
-                if growth_percent >= 1.0:
-                    plant.growth_stage = GrowthStage.HARVESTABLE
-                elif growth_percent >= 0.8:
-                    plant.growth_stage = GrowthStage.FLOWERING if PlantType.FLOWER == plant_def.plant_type else GrowthStage.MATURE
-                elif growth_percent >= 0.5:
-                    plant.growth_stage = GrowthStage.MATURE
-                elif growth_percent >= 0.3:
-                    plant.growth_stage = GrowthStage.GROWING
-                elif growth_percent >= 0.1:
-                    plant.growth_stage = GrowthStage.SPROUT
-    
+                self._update_growth_stage(plant, plant_def, datetime.now())
+
+    def catch_up(self, delta_hours: float, now: Optional[datetime] = None):
+        """
+        Advance all plants by *delta_hours* in one step.
+
+        Equivalent to many small ``update_plants`` calls: health recovers
+        while the soil is wet and only drops after it dries out, and growth
+        is judged at the last moment the plant was still watered and alive.
+        """
+        now = now or datetime.now()
+        for plot in self.plots.values():
+            plant = plot.plant
+            if plant is None:
+                continue
+            plant_def = PLANTS.get(plant.plant_id)
+            if not plant_def:
+                continue
+
+            drain = plant_def.water_needs * 5  # water lost per hour
+            water = plant.water_level
+            wet_hours = min(delta_hours, water / drain) if drain > 0 else delta_hours
+            dry_hours = delta_hours - wet_hours
+            plant.water_level = max(0, water - drain * delta_hours)
+
+            was_withered = plant.is_withered
+            plant.health = min(100, plant.health + wet_hours * 2)
+            if dry_hours > 0:
+                if not was_withered and plant.health - dry_hours * 10 <= 0:
+                    plant.is_withered = True
+                    plant.growth_stage = GrowthStage.WITHERED
+                plant.health -= dry_hours * 10
+
+            if plant.is_withered or water <= 20:
+                continue
+            watered_hours = (water - 20) / drain if drain > 0 else delta_hours
+            judged_at = now - timedelta(hours=delta_hours - min(delta_hours, watered_hours))
+            self._update_growth_stage(plant, plant_def, judged_at)
+
+    @staticmethod
+    def _update_growth_stage(plant: PlantedPlant, plant_def: PlantDefinition, at: datetime):
+        """Set the growth stage from how long the plant has grown by *at*."""
+        planted_time = datetime.fromisoformat(plant.planted_at)
+        hours_since_planting = (at - planted_time).total_seconds() / 3600
+        growth_percent = hours_since_planting / plant_def.growth_time_hours
+
+        # Determine growth stage
+        if growth_percent >= 1.0:
+            plant.growth_stage = GrowthStage.HARVESTABLE
+        elif growth_percent >= 0.8:
+            plant.growth_stage = GrowthStage.FLOWERING if PlantType.FLOWER == plant_def.plant_type else GrowthStage.MATURE
+        elif growth_percent >= 0.5:
+            plant.growth_stage = GrowthStage.MATURE
+        elif growth_percent >= 0.3:
+            plant.growth_stage = GrowthStage.GROWING
+        elif growth_percent >= 0.1:
+            plant.growth_stage = GrowthStage.SPROUT
+
     def harvest_plant(self, plot_id: int) -> Tuple[bool, str, Dict[str, int]]:
         """Harvest a mature plant."""
         if plot_id not in self.plots:
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from core.content_pack import content_table
 from world.shop import ItemCategory, get_item
 
 
@@ -54,4221 +55,25 @@ class InteractionResult:
     sound: Optional[str] = None  # Sound to play
 
 
-# Animation frames for duck interacting with items
-# Each animation is a list of frames, each frame is a list of strings
+# Animation frames for duck interacting with items live in
+# interaction_animation_data.py (compiled into a content pack when built)
+_interaction_animations = None
 
-INTERACTION_ANIMATIONS = {
-    # Ball - "The Chase" - duck kicks ball, chases, catches with joy
-    # Animations organized by life stage group
-    "toy_ball": {
-        # YOUNG (hatchling, duckling, juvenile) - small 4-char sprite
-        "play_young": [
-            # Frame 1: Duckling spots ball
-            [
-                "  O      ",
-                "  __ (o>)",
-                "     /'/) ",
-            ],
-            # Frame 2: Waddle kick!
-            [
-                "    O    ",
-                " (o>)\\   ",
-                " /'/)==  ",
-            ],
-            # Frame 3: Ball rolling away
-            [
-                "       O ",
-                " (o>)    ",
-                " /'/)    ",
-            ],
-            # Frame 4: Chase!
-            [
-                "        O",
-                "   (O>)!!",
-                "   /'/)  ",
-            ],
-            # Frame 5: Catch! Happy duckling
-            [
-                "   O     ",
-                "  (^>)   ",
-                "  /^\\)   ",
-            ],
-        ],
-        # MATURE (adult, mature, elder) - medium 6-char sprite
-        "play_mature": [
-            # Frame 1: Adult duck approaches
-            [
-                " O        ",
-                "  ___     ",
-                " (o__)>   ",
-                " /'__\\    ",
-            ],
-            # Frame 2: Wind-up kick
-            [
-                "   O      ",
-                "  ___     ",
-                " (o__)>\\  ",
-                " /'__\\==  ",
-            ],
-            # Frame 3: Ball flying
-            [
-                "       O  ",
-                "  ___     ",
-                " (o__)>   ",
-                " /'__\\    ",
-            ],
-            # Frame 4: Duck chasing
-            [
-                "         O",
-                "    ___   ",
-                "   (O__)>!",
-                "   /'__\\  ",
-            ],
-            # Frame 5: Triumphant catch
-            [
-                "    O     ",
-                "   ___    ",
-                "  (^__)>  ",
-                "  /'^'\\   ",
-            ],
-        ],
-        # LEGENDARY - special 7-char sprite with crown
-        "play_legendary": [
-            # Frame 1: Legendary duck considers ball
-            [
-                "*~___~*   ",
-                "(^_^)> O  ",
-                "/'=='\\_   ",
-            ],
-            # Frame 2: Majestic kick
-            [
-                "*~___~*   ",
-                "(^_^)>  O ",
-                "/'=='\\ == ",
-            ],
-            # Frame 3: Ball soars
-            [
-                "*~___~*  O",
-                "(^_^)>    ",
-                "/'=='\\_   ",
-            ],
-            # Frame 4: Legendary pursuit
-            [
-                "  *~___~* ",
-                "  (^o^)> O",
-                "  /'=='\\ !",
-            ],
-            # Frame 5: Victorious catch
-            [
-                "   *~O~*  ",
-                "   (^v^)> ",
-                "   /'=='\\ ",
-            ],
-        ],
-        # Fallback for old code (will be deprecated)
-        "play": [
-            [
-                "  O      ",
-                "  __ (o>)",
-                "     /'/) ",
-            ],
-            [
-                "    O    ",
-                " (o>)\\   ",
-                " /'/)==  ",
-            ],
-            [
-                "       O ",
-                " (o>)    ",
-                " /'/)    ",
-            ],
-            [
-                "        O",
-                "   (O>)!!",
-                "   /'/)  ",
-            ],
-            [
-                "   O     ",
-                "  (^>)   ",
-                "  /^\\)   ",
-            ],
-        ],
-    },
-    
-    # Blocks - "Tower Builder" - duck stacks blocks into tower
-    "toy_blocks": {
-        # YOUNG (hatchling, duckling, juvenile)
-        "play_young": [
-            # Frame 1: Duckling spots blocks
-            [
-                " □□       ",
-                "  __ (o>) ",
-                "     /'/) ",
-            ],
-            # Frame 2: Picks up block
-            [
-                " □        ",
-                " (o>)□    ",
-                " /'/)     ",
-            ],
-            # Frame 3: Stacking
-            [
-                "  □       ",
-                " □(o>)    ",
-                "  /'/)    ",
-            ],
-            # Frame 4: Tower grows
-            [
-                "  □       ",
-                " □□       ",
-                " (^>)     ",
-                " /'/)     ",
-            ],
-            # Frame 5: Proud duckling!
-            [
-                "  □!      ",
-                " □□       ",
-                "  (^>)    ",
-                "  /^\\)    ",
-            ],
-        ],
-        # MATURE (adult, mature, elder)
-        "play_mature": [
-            # Frame 1: Adult surveys blocks
-            [
-                " □□□       ",
-                "  ___      ",
-                " (o__)>    ",
-                " /'__\\     ",
-            ],
-            # Frame 2: Building begins
-            [
-                " □□        ",
-                " (o__)>□   ",
-                " /'__\\     ",
-            ],
-            # Frame 3: Tower taking shape
-            [
-                "  □        ",
-                " □□        ",
-                "  (o__)>   ",
-                "  /'__\\    ",
-            ],
-            # Frame 4: Final block
-            [
-                "  □        ",
-                " □□□       ",
-                "   (o__)>  ",
-                "   /'__\\   ",
-            ],
-            # Frame 5: Admiring handiwork
-            [
-                "   □!      ",
-                "  □□□      ",
-                "   (^__)>  ",
-                "   /'^'\\   ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            # Frame 1: Legendary architect
-            [
-                "*~___~*    ",
-                "(^_^)> □□□ ",
-                "/'=='\\_    ",
-            ],
-            # Frame 2: Speed building
-            [
-                "*~___~* □  ",
-                "(^_^)>□□   ",
-                "/'=='\\_    ",
-            ],
-            # Frame 3: Castle forming
-            [
-                "   ⌂      ",
-                "*~___~*□□ ",
-                "(^_^)>     ",
-                "/'=='\\_   ",
-            ],
-            # Frame 4: Grand castle
-            [
-                "  ⌂⌂⌂     ",
-                " □□□□□    ",
-                "*~___~*   ",
-                "(^v^)>    ",
-                "/'=='\\_   ",
-            ],
-            # Frame 5: Majestic!
-            [
-                "  ⌂★⌂     ",
-                " □□□□□    ",
-                " *~___~*  ",
-                " (^v^)>!  ",
-                " /'=='\\_  ",
-            ],
-        ],
-        # Fallback
-        "play": [
-            [
-                " □□       ",
-                "  __ (o>) ",
-                "     /'/) ",
-            ],
-            [
-                " □        ",
-                " (o>)□    ",
-                " /'/)     ",
-            ],
-            [
-                "  □       ",
-                " □□       ",
-                " (^>)     ",
-                " /'/)     ",
-            ],
-        ],
-    },
-    
-    # Trampoline - duck bouncing
-    "toy_trampoline": {
-        # YOUNG
-        "play_young": [
-            # Frame 1: On trampoline
-            [
-                "  __      ",
-                " (o>)     ",
-                " [====]   ",
-                "  \\  /    ",
-            ],
-            # Frame 2: Bounce up
-            [
-                " (^>)     ",
-                " /'/)     ",
-                "          ",
-                " [====]   ",
-            ],
-            # Frame 3: High!
-            [
-                " (^>)!!   ",
-                " /'/)     ",
-                "          ",
-                " [====]   ",
-            ],
-            # Frame 4: Coming down
-            [
-                "          ",
-                " (o>)     ",
-                " /'/)     ",
-                " [====]   ",
-            ],
-            # Frame 5: Land
-            [
-                "  __      ",
-                " (^>)     ",
-                " [====]   ",
-                "  \\  /    ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            # Frame 1: On trampoline
-            [
-                "  ___     ",
-                " (o__)>   ",
-                " [=====]  ",
-                "  \\   /   ",
-            ],
-            # Frame 2: Launch
-            [
-                " (^__)>   ",
-                " /'__\\    ",
-                "          ",
-                " [=====]  ",
-            ],
-            # Frame 3: Airborne
-            [
-                " (^__)>!! ",
-                " /'__\\    ",
-                " WHEEE!   ",
-                " [=====]  ",
-            ],
-            # Frame 4: Descent
-            [
-                "          ",
-                " (o__)>   ",
-                " /'__\\    ",
-                " [=====]  ",
-            ],
-            # Frame 5: Bounce land
-            [
-                "  ___     ",
-                " (^__)>   ",
-                " [=====]  ",
-                "  \\   /   ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            # Frame 1: Ready
-            [
-                "*~___~*   ",
-                "(^_^)>    ",
-                "[======]  ",
-                " \\    /   ",
-            ],
-            # Frame 2: LAUNCH
-            [
-                "*~___~*   ",
-                "(^_^)>    ",
-                "/'=='\\_   ",
-                "[======]  ",
-            ],
-            # Frame 3: SOARING
-            [
-                "*~___~*!! ",
-                "(^v^)>    ",
-                "/'=='\\_   ",
-                "          ",
-                "[======]  ",
-            ],
-            # Frame 4: Graceful descent
-            [
-                "          ",
-                "*~___~*   ",
-                "(^_^)>    ",
-                "/'=='\\_   ",
-                "[======]  ",
-            ],
-            # Frame 5: Perfect landing
-            [
-                " ★        ",
-                "*~___~*   ",
-                "(^v^)>    ",
-                "[======]  ",
-            ],
-        ],
-        # Fallback
-        "play": [
-            [
-                "   __    ",
-                "  (o )>  ",
-                " /|\\|    ",
-                " [====]  ",
-                "  \\  /   ",
-            ],
-            [
-                "   __    ",
-                "  (^o)>  ",
-                " /|\\| !! ",
-                "         ",
-                " [====]  ",
-            ],
-            [
-                "  (^o)>  ",
-                " /|\\|    ",
-                "  WHEEE! ",
-                "         ",
-                " [====]  ",
-            ],
-            [
-                "         ",
-                "   __    ",
-                "  (o )>  ",
-                " /|\\|    ",
-                " [====]  ",
-            ],
-            [
-                "         ",
-                "   __    ",
-                "  (oo)>  ",
-                " [====]  ",
-                "  \\  /   ",
-            ],
-        ],
-    },
-    
-    # Pool - duck swimming
-    "pool_kiddie": {
-        # YOUNG - splash and paddle
-        "splash_young": [
-            [
-                " (o>)      ",
-                " /'/)  [~] ",
-            ],
-            [
-                "   (^>)    ",
-                "   /'/)    ",
-                "   [~~~]   ",
-            ],
-            [
-                " SPLASH!   ",
-                " * (o>) *  ",
-                "  [~~~~]   ",
-            ],
-            [
-                "   __      ",
-                " ~(^>)~    ",
-                "  [~~~~]   ",
-            ],
-            [
-                "   !!      ",
-                " ~~(^>)~~  ",
-                "  [~~~~]   ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "  ___      ",
-                " (o__)>    ",
-                " /'__\\ [~] ",
-            ],
-            [
-                "   (^__)>  ",
-                "   /'__\\   ",
-                "   [~~~~]  ",
-            ],
-            [
-                " SPLASH!   ",
-                " *(o__)>*  ",
-                "  [~~~~~]  ",
-            ],
-            [
-                "           ",
-                " ~~(^__)>~~",
-                "  [~~~~~]  ",
-            ],
-            [
-                "    !!     ",
-                " ~~~(^-)~~~",
-                "  [~~~~~]  ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                "*~___~*    ",
-                "(^_^)> [~] ",
-                "/'=='\\_    ",
-            ],
-            [
-                "  *~___~*  ",
-                "  (^_^)>   ",
-                "   [~~~~]  ",
-            ],
-            [
-                " *SPLASH!* ",
-                " *(^_^)>*  ",
-                "  [~~~~~]  ",
-            ],
-            [
-                "           ",
-                "~~*~___~*~~",
-                " ~(^v^)>~  ",
-                "  [~~~~~]  ",
-            ],
-            [
-                "    !!     ",
-                "~~~(^v^)~~~",
-                "  [~~~~~]  ",
-            ],
-        ],
-        "splash": [
-            # Frame 1: Duck approaching
-            [
-                "   __      ",
-                "  (o )>    ",
-                " /|\\|      ",
-                " (__)  [~] ",
-            ],
-            # Frame 2: Duck jumping in
-            [
-                "      __   ",
-                "     (^o)> ",
-                "      !!   ",
-                "    [~~~~] ",
-            ],
-            # Frame 3: SPLASH!
-            [
-                "   SPLASH! ",
-                "  * (oo) * ",
-                " *  ~~   * ",
-                "  [~~~~~~] ",
-            ],
-            # Frame 4: Duck swimming
-            [
-                "           ",
-                "   __      ",
-                " ~(^o)>~   ",
-                "  [~~~~~~] ",
-            ],
-            # Frame 5: Happy duck paddling
-            [
-                "    !!     ",
-                "   __      ",
-                " ~~(^-)~~  ",
-                "  [~~~~~~] ",
-            ],
-        ],
-    },
-    
-    "pool_large": {
-        # YOUNG - cannonball!
-        "splash_young": [
-            [
-                " (o>)          ",
-                " /'/)          ",
-                "  [~~~~~~~~]   ",
-            ],
-            [
-                "  CANNONBALL!  ",
-                "    (^>)       ",
-                "    /'/)       ",
-                "  [~~~~~~~~]   ",
-            ],
-            [
-                " * SPLASH! *   ",
-                "  * (o>) *     ",
-                "  [~~~~~~~~]   ",
-            ],
-            [
-                "               ",
-                " ~~~(^>)~~~    ",
-                "  [~~~~~~~~]   ",
-            ],
-            [
-                "     :)        ",
-                " ~~~~(^>)~~~~  ",
-                "  [~~~~~~~~]   ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "   ___         ",
-                "  (o__)>       ",
-                "  /'__\\        ",
-                "  [~~~~~~~~~]  ",
-            ],
-            [
-                "   CANNONBALL! ",
-                "    (^__)>     ",
-                "    /'__\\      ",
-                "  [~~~~~~~~~]  ",
-            ],
-            [
-                " * * SPLASH! * ",
-                "   * (o__)> *  ",
-                "  [~~~~~~~~~~] ",
-            ],
-            [
-                "               ",
-                " ~~~(^__)>~~~  ",
-                "  [~~~~~~~~~~] ",
-            ],
-            [
-                "      :)       ",
-                " ~~~~(^-)~~~~  ",
-                "  [~~~~~~~~~~] ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                " *~___~*       ",
-                " (^_^)>        ",
-                " /'=='\\_       ",
-                "  [~~~~~~~~~]  ",
-            ],
-            [
-                "  LEGENDARY!   ",
-                "   *~___~*     ",
-                "   (^_^)>      ",
-                "  [~~~~~~~~~]  ",
-            ],
-            [
-                " * *SPLASH!* * ",
-                "  **~___~**    ",
-                "   *(^v^)>*    ",
-                "  [~~~~~~~~~~] ",
-            ],
-            [
-                "               ",
-                " ~~*~___~*~~   ",
-                " ~~~(^v^)>~~~  ",
-                "  [~~~~~~~~~~] ",
-            ],
-            [
-                "     *!*       ",
-                " ~~~~(^v^)~~~~ ",
-                "  [~~~~~~~~~~] ",
-            ],
-        ],
-        "splash": [
-            [
-                "       __         ",
-                "      (o )>       ",
-                "      /|\\|        ",
-                "   [~~~~~~~~~]    ",
-            ],
-            [
-                "          CANNONBALL!",
-                "        __    ",
-                "       (^o)>  ",
-                "         \\\\   ",
-                "   [~~~~~~~~~]",
-            ],
-            [
-                "    * * SPLASH! * *",
-                "      * (OO) *    ",
-                "   [~~~~~~~~~~]   ",
-            ],
-            [
-                "                  ",
-                "        __        ",
-                "   ~~~(^o)>~~~    ",
-                "   [~~~~~~~~~~]   ",
-            ],
-            [
-                "       :)         ",
-                "        __        ",
-                "   ~~~~~(^-)~~~~  ",
-                "   [~~~~~~~~~~~]  ",
-            ],
-        ],
-    },
-    
-    # Swing set
-    "toy_swing": {
-        # YOUNG - gentle swinging
-        "play_young": [
-            [
-                "  |---|    ",
-                "  | | |    ",
-                " (o>)      ",
-                "  /'/)     ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "    (o>)   ",
-                "    /'/)   ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "      (^>) ",
-                "      /'/) ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "    (o>)   ",
-                "    /'/)   ",
-            ],
-            [
-                "  |---|    ",
-                "  | | |    ",
-                " (^>)  !   ",
-                "  /'/)     ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "  |---|    ",
-                "  | | |    ",
-                " (o__)>    ",
-                " /'__\\     ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "   (o__)>  ",
-                "   /'__\\   ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "     (^__)>",
-                "     /'__\\ ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "   (o__)>  ",
-                "   /'__\\   ",
-            ],
-            [
-                "  |---|    ",
-                "  | | |    ",
-                " (^__)> !  ",
-                " /'__\\     ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            [
-                "  |---|    ",
-                "  | | |    ",
-                "*~___~*    ",
-                "(^_^)>     ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                " *~___~*   ",
-                " (^_^)>    ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                "   *~___~* ",
-                "   (^v^)>  ",
-            ],
-            [
-                "  |---|    ",
-                "  |   |    ",
-                " *~___~*   ",
-                " (^_^)>    ",
-            ],
-            [
-                "  |---|    ",
-                "  | | |    ",
-                "*~___~* !  ",
-                "(^v^)>     ",
-            ],
-        ],
-        "play": [
-            [
-                "   |---|   ",
-                "   | | |   ",
-                "   |___|   ",
-                "  (o_)     ",
-                "    \\      ",
-            ],
-            [
-                "   |---|   ",
-                "   |   |   ",
-                "     (o_)  ",
-                "       \\   ",
-                "   |___|   ",
-            ],
-            [
-                "   |---|   ",
-                "   |   |   ",
-                "   |   |   ",
-                "      (^o) ",
-                "         \\ ",
-            ],
-            [
-                "   |---|   ",
-                "   |   |   ",
-                "     (o_)  ",
-                "       \\   ",
-                "   |___|   ",
-            ],
-            [
-                "   |---|   ",
-                "   | | |   ",
-                " (o_)      ",
-                "   \\       ",
-                "   |___|   ",
-            ],
-        ],
-    },
-    
-    # Slide
-    "toy_slide": {
-        # YOUNG - wheee down the slide!
-        "play_young": [
-            [
-                "    /|     ",
-                "   / |     ",
-                "  /  |     ",
-                " /___|     ",
-                " (o>)      ",
-            ],
-            [
-                " (o>)/|    ",
-                "   / |     ",
-                "  /  |     ",
-                " /___|     ",
-            ],
-            [
-                "    /|     ",
-                " (^>)/ |   ",
-                "  /  |     ",
-                " /___|     ",
-            ],
-            [
-                "    /|     ",
-                "   / |     ",
-                "WHEE/(o>)  ",
-                " /___|     ",
-            ],
-            [
-                "    /|     ",
-                "   / |     ",
-                "  /  |     ",
-                " /___(^>)! ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "    /|      ",
-                "   / |      ",
-                "  /  |      ",
-                " /___|      ",
-                " (o__)>     ",
-            ],
-            [
-                "(o__)>/|    ",
-                "   / |      ",
-                "  /  |      ",
-                " /___|      ",
-            ],
-            [
-                "    /|      ",
-                "(^__)>|     ",
-                "  /  |      ",
-                " /___|      ",
-            ],
-            [
-                "    /|      ",
-                "   / |      ",
-                "WHEE/(o__)> ",
-                " /___|      ",
-            ],
-            [
-                "    /|      ",
-                "   / |      ",
-                "  /  |      ",
-                " /___(^__)>!",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            [
-                "    /|       ",
-                "   / |       ",
-                "  /  |       ",
-                " /___|       ",
-                "*~___~*      ",
-                "(^_^)>       ",
-            ],
-            [
-                "*~___~*/|    ",
-                "(^_^)>/ |    ",
-                "  /  |       ",
-                " /___|       ",
-            ],
-            [
-                "    /|       ",
-                "*~___~*|     ",
-                "(^v^)>/|     ",
-                " /___|       ",
-            ],
-            [
-                "    /|       ",
-                "   / |       ",
-                "WHEE/*~___~* ",
-                " /___(^v^)>  ",
-            ],
-            [
-                "    /|       ",
-                "   / |       ",
-                "  /  |       ",
-                " /___*~___~* ",
-                "     (^v^)>! ",
-            ],
-        ],
-        "play": [
-            [
-                "     /|    ",
-                "    / |    ",
-                "   /  |    ",
-                "  /___|    ",
-                "  (o_)     ",
-            ],
-            [
-                "   (o_)/|  ",
-                "    / |    ",
-                "   /  |    ",
-                "  /___|    ",
-            ],
-            [
-                "     /|    ",
-                " (^o)/ |   ",
-                "   /  |    ",
-                "  /___|    ",
-            ],
-            [
-                "     /|    ",
-                "    / |    ",
-                "WHEE/(o_)  ",
-                "  /___|    ",
-            ],
-            [
-                "     /|    ",
-                "    / |    ",
-                "   /  |    ",
-                "  /___ (^o)",
-            ],
-        ],
-    },
-    
-    # Sandbox
-    "toy_sandbox": {
-        # YOUNG - dig dig dig!
-        "play_young": [
-            [
-                " [     ]   ",
-                " | . . |   ",
-                " [_____]   ",
-                "  (o>)     ",
-            ],
-            [
-                " [     ]   ",
-                " | (o>)|   ",
-                " [_____]   ",
-            ],
-            [
-                " *dig dig* ",
-                " [     ]   ",
-                " (o>)...   ",
-                " [_____]   ",
-            ],
-            [
-                "    ^      ",
-                " [ /|\\  ]  ",
-                " (o>) SAND ",
-                " [_____]   ",
-            ],
-            [
-                " CASTLE!   ",
-                " [  ^  ]   ",
-                " [ /|\\ ]   ",
-                " [_____]   ",
-                "  (^>)     ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                " [      ]   ",
-                " | . .  |   ",
-                " [______]   ",
-                "  (o__)>    ",
-            ],
-            [
-                " [      ]   ",
-                " |(o__)>|   ",
-                " [______]   ",
-            ],
-            [
-                " *dig dig*  ",
-                " [      ]   ",
-                " (o__)>...  ",
-                " [______]   ",
-            ],
-            [
-                "    ^       ",
-                " [ /|\\   ]  ",
-                " (o__)>SAND ",
-                " [______]   ",
-            ],
-            [
-                "  CASTLE!   ",
-                " [   ^   ]  ",
-                " [  /|\\  ]  ",
-                " [______]   ",
-                "  (^__)>    ",
-            ],
-        ],
-        # LEGENDARY - builds epic fortress
-        "play_legendary": [
-            [
-                " [       ]  ",
-                " |  . .  |  ",
-                " [_______]  ",
-                " *~___~*    ",
-                " (^_^)>     ",
-            ],
-            [
-                " [       ]  ",
-                " |*~___~*|  ",
-                " |(^_^)> |  ",
-                " [_______]  ",
-            ],
-            [
-                " *DIGGING*  ",
-                " [       ]  ",
-                " *~___~*... ",
-                " [_______]  ",
-            ],
-            [
-                "   ^  ^     ",
-                " [/|\\/|\\]   ",
-                " *~___~*    ",
-                " [_______]  ",
-            ],
-            [
-                " FORTRESS!  ",
-                " [ ^  ^ ]   ",
-                " [/|\\/|\\]   ",
-                " [_______]  ",
-                " *~___~*    ",
-                " (^v^)>     ",
-            ],
-        ],
-        "play": [
-            [
-                "  [     ]  ",
-                "  | . . |  ",
-                "  [_____]  ",
-                "   (o_)    ",
-            ],
-            [
-                "  [     ]  ",
-                "  | (o_)|  ",
-                "  [_____]  ",
-            ],
-            [
-                "  *dig dig*",
-                "  [     ]  ",
-                " (o_)...   ",
-                "  [_____]  ",
-            ],
-            [
-                "    ^      ",
-                "  [/|\\   ] ",
-                " (o_) SAND ",
-                "  [_____]  ",
-            ],
-            [
-                "  CASTLE!  ",
-                "  [  ^  ]  ",
-                "  [ /|\\ ]  ",
-                "  [_____]  ",
-                "   (^o)    ",
-            ],
-        ],
-    },
-    
-    # Piano
-    "toy_piano": {
-        # YOUNG - plink plink concert
-        "music_young": [
-            [
-                " [|||||]   ",
-                "  (o>)     ",
-                "  /'/)     ",
-            ],
-            [
-                " [|||||]   ",
-                "  (o>)*    ",
-                "  /'/) #   ",
-            ],
-            [
-                " [|||||]   ",
-                "   *(o>)   ",
-                "   /'/) #  ",
-            ],
-            [
-                " [|||||]   ",
-                "  *(o>)*   ",
-                "  /'/)# #  ",
-            ],
-            [
-                " CONCERT!  ",
-                " [|||||]   ",
-                "  (^>)     ",
-                "  /'/)# # #",
-            ],
-        ],
-        # MATURE
-        "music_mature": [
-            [
-                " [|||||]   ",
-                "  (o__)>   ",
-                "  /'__\\    ",
-            ],
-            [
-                " [|||||]   ",
-                "  (o__)>*  ",
-                "  /'__\\ #  ",
-            ],
-            [
-                " [|||||]   ",
-                "   *(o__)> ",
-                "   /'__\\ # ",
-            ],
-            [
-                " [|||||]   ",
-                "  *(o__)>* ",
-                "  /'__\\# # ",
-            ],
-            [
-                " CONCERT!  ",
-                " [|||||]   ",
-                "  (^__)>   ",
-                "  /'__\\# # ",
-            ],
-        ],
-        # LEGENDARY - maestro performance
-        "music_legendary": [
-            [
-                " [|||||]   ",
-                " *~___~*   ",
-                " (^_^)>    ",
-                " /'=='\\_   ",
-            ],
-            [
-                " [|||||] # ",
-                " *~___~*   ",
-                " (^_^)>*   ",
-                " /'=='\\_   ",
-            ],
-            [
-                " [|||||]## ",
-                " *~___~*   ",
-                "  *(^_^)>  ",
-                "  /'=='\\_  ",
-            ],
-            [
-                " [|||||]###",
-                " *~___~*   ",
-                " *(^v^)>*  ",
-                " /'=='\\_   ",
-            ],
-            [
-                " MAESTRO!  ",
-                " [|||||]###",
-                " *~___~*   ",
-                " (^v^)>    ",
-                " /'=='\\_###",
-            ],
-        ],
-        "music": [
-            [
-                " [|||||]   ",
-                "  (o_)     ",
-            ],
-            [
-                " [|||||]   ",
-                "  (o_)*    ",
-                "   plink!  ",
-            ],
-            [
-                " [|||||]   ",
-                "   *(o_)   ",
-                " plink!    ",
-            ],
-            [
-                " [|||||]   ",
-                "  *(o_)*   ",
-                " # # #     ",
-            ],
-            [
-                " CONCERT!  ",
-                " [|||||]   ",
-                "  (^o)     ",
-                " # # # #   ",
-            ],
-        ],
-    },
-    
-    # Trumpet - Jazz Solo style
-    "toy_trumpet": {
-        # YOUNG - learning to toot
-        "music_young": [
-            [
-                "  <)       ",
-                "  (o>)     ",
-                "  /'/)     ",
-            ],
-            [
-                " (o>)<)    ",
-                " /'/)      ",
-            ],
-            [
-                "  TOOT!    ",
-                " (O>)<) #  ",
-                " /'/)      ",
-            ],
-            [
-                "  TOOT!    ",
-                " (O>)<) ## ",
-                " /'/) #    ",
-            ],
-            [
-                " *jazz*    ",
-                " (^>)<) ## ",
-                " /'/)  ##  ",
-            ],
-        ],
-        # MATURE
-        "music_mature": [
-            [
-                "   <)      ",
-                "  (o__)>   ",
-                "  /'__\\    ",
-            ],
-            [
-                " (o__)><)  ",
-                " /'__\\     ",
-            ],
-            [
-                "   TOOT!   ",
-                " (O__)><) #",
-                " /'__\\     ",
-            ],
-            [
-                "  TOOT! ## ",
-                " (O__)><)  ",
-                " /'__\\ #   ",
-            ],
-            [
-                "  *jazz* ##",
-                " (^__)><)  ",
-                " /'^'\\ ##  ",
-            ],
-        ],
-        # LEGENDARY - legendary jazz
-        "music_legendary": [
-            [
-                "   <)      ",
-                " *~___~*   ",
-                " (^_^)>    ",
-                " /'=='\\_   ",
-            ],
-            [
-                " *~___~*<) ",
-                " (^_^)>    ",
-                " /'=='\\_   ",
-            ],
-            [
-                "  HONK! #  ",
-                " *~___~*<) ",
-                " (^O^)>    ",
-                " /'=='\\_   ",
-            ],
-            [
-                " HONK! ## #",
-                " *~___~*<) ",
-                " (^O^)>    ",
-                " /'=='\\_ # ",
-            ],
-            [
-                " *JAZZ* ###",
-                " *~___~*<) ",
-                " (^v^)>    ",
-                " /'=='\\_ ##",
-            ],
-        ],
-        "music": [
-            [
-                "         ",
-                "   (o_)  ",
-                "   /|\\|  ",
-            ],
-            [
-                "  ===|   ",
-                "   (o_)> ",
-            ],
-            [
-                " HONK!   ",
-                "  ===|   ",
-                "   (O_)> ",
-            ],
-            [
-                "  HONK!  ",
-                " ===|    ",
-                "  (O_)>  ",
-                "  HONK!  ",
-            ],
-            [
-                " *jazz*  ",
-                "  ===|   ",
-                "   (^o)> ",
-                "  # #    ",
-            ],
-        ],
-    },
-    
-    # Chair - sit on it
-    "chair_wood": {
-        # YOUNG
-        "sit_young": [
-            [
-                " [  ]    ",
-                " |  |    ",
-                " |__|    ",
-                " (o>)    ",
-            ],
-            [
-                " [  ]    ",
-                " |(o>)   ",
-                " |__|    ",
-            ],
-            [
-                " [  ]    ",
-                " |(^>)   ",
-                " |__|    ",
-                " Ahh...  ",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                " [  ]     ",
-                " |  |     ",
-                " |__|     ",
-                " (o__)>   ",
-            ],
-            [
-                " [  ]     ",
-                " |(o__)>  ",
-                " |__|     ",
-            ],
-            [
-                " [  ]     ",
-                " |(^__)>  ",
-                " |__|     ",
-                " Ahh...   ",
-            ],
-        ],
-        # LEGENDARY
-        "sit_legendary": [
-            [
-                " [  ]     ",
-                " |  |     ",
-                " |__|     ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                " [  ]     ",
-                " |*~___~* ",
-                " |(^_^)>  ",
-                " |__|     ",
-            ],
-            [
-                " [  ]     ",
-                " |*~___~* ",
-                " |(^v^)>  ",
-                " |__|     ",
-                "  Ahh...  ",
-            ],
-        ],
-        "sit": [
-            [
-                " [  ]    ",
-                " |  |    ",
-                " |__|    ",
-                "  (o_)   ",
-            ],
-            [
-                " [  ]    ",
-                " |(o_)   ",
-                " |__|    ",
-            ],
-            [
-                " [  ]    ",
-                " |(^o)   ",
-                " |__|    ",
-                " Ahh...  ",
-            ],
-        ],
-    },
-    
-    # Bed - sleep on it
-    "bed": {
-        # YOUNG - sleepy duckling
-        "sleep_young": [
-            [
-                " ______  ",
-                " |    |  ",
-                " |____|  ",
-                " (o>)    ",
-            ],
-            [
-                " ______  ",
-                " |(o>) |  ",
-                " |____|  ",
-            ],
-            [
-                " ______  ",
-                " |(->) |  ",
-                " |____|  ",
-                "   zzz   ",
-            ],
-            [
-                " ______  ",
-                " |(->)|z ",
-                " |____|Z ",
-                "   ZZZ   ",
-            ],
-        ],
-        # MATURE
-        "sleep_mature": [
-            [
-                " ______   ",
-                " |    |   ",
-                " |____|   ",
-                " (o__)>   ",
-            ],
-            [
-                " ______   ",
-                " |(o__)>| ",
-                " |____|   ",
-            ],
-            [
-                " ______   ",
-                " |(-__)>| ",
-                " |____|   ",
-                "   zzz    ",
-            ],
-            [
-                " ______   ",
-                " |(-__)|z ",
-                " |____|Z  ",
-                "   ZZZ    ",
-            ],
-        ],
-        # LEGENDARY - royal slumber
-        "sleep_legendary": [
-            [
-                " ______    ",
-                " |    |    ",
-                " |____|    ",
-                " *~___~*   ",
-                " (^_^)>    ",
-            ],
-            [
-                " ______    ",
-                " |*~___~*| ",
-                " |(^_^)> | ",
-                " |____|    ",
-            ],
-            [
-                " ______    ",
-                " |*~___~*| ",
-                " |(-v-) | ",
-                " |____|    ",
-                "   zzz     ",
-            ],
-            [
-                " ______    ",
-                " |*~___~*|z",
-                " |(-v-)>|Z ",
-                " |____|    ",
-                "   ZZZ     ",
-            ],
-        ],
-        "sleep": [
-            [
-                " ______  ",
-                " |    |  ",
-                " |____|  ",
-                "  (o_)   ",
-            ],
-            [
-                " ______  ",
-                " |(o_)|  ",
-                " |____|  ",
-            ],
-            [
-                " ______  ",
-                " |(-_)|  ",
-                " |____|  ",
-                "   zzz   ",
-            ],
-            [
-                " ______  ",
-                " |(-_)|z ",
-                " |____|Z ",
-                "   ZZZ   ",
-            ],
-        ],
-    },
-    
-    # Hot tub
-    "hot_tub": {
-        # YOUNG
-        "splash_young": [
-            [
-                " (o>)       ",
-                " /'/)       ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  Ahhh...   ",
-                " ~ (o>) ~   ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  ~ ~ ~     ",
-                " ~ (^>) ~   ",
-                "[~~~~~~~~~] ",
-                " so warm... ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                " (o__)>     ",
-                " /'__\\      ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  Ahhh...   ",
-                " ~ (o__)> ~ ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  ~ ~ ~     ",
-                " ~ (^-)> ~  ",
-                "[~~~~~~~~~] ",
-                " so warm... ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                " *~___~*    ",
-                " (^_^)>     ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  Ahhh...   ",
-                " ~*~___~*~  ",
-                " ~ (^_^)> ~ ",
-                "[~~~~~~~~~] ",
-            ],
-            [
-                "  ~ ~ ~     ",
-                " ~*~___~*~  ",
-                " ~ (^v^) ~  ",
-                "[~~~~~~~~~] ",
-                " luxurious..",
-            ],
-        ],
-        "splash": [
-            [
-                "  (o_)       ",
-                " /|\\|        ",
-                "[  steam  ]  ",
-                "[~~~~~~~~~]  ",
-            ],
-            [
-                "     Ahhh... ",
-                "   ~ (o_) ~  ",
-                "[~~~~~~~~~]  ",
-                "   steam     ",
-            ],
-            [
-                "   ~ ~ ~     ",
-                "   ~ (^-) ~  ",
-                "[~~~~~~~~~]  ",
-                "  so warm... ",
-            ],
-        ],
-    },
-    
-    # Sprinkler
-    "sprinkler": {
-        # YOUNG
-        "splash_young": [
-            [
-                "   |     ",
-                " (o>)    ",
-                " /'/)    ",
-            ],
-            [
-                " * | *   ",
-                " *(o>)*  ",
-                " /'/) !  ",
-            ],
-            [
-                " *  |  * ",
-                " *(O>)*  ",
-                " /'/) !! ",
-            ],
-            [
-                " * | *   ",
-                " *(^>)*  ",
-                " /'/)    ",
-                " Wheee!  ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "    |     ",
-                " (o__)>   ",
-                " /'__\\    ",
-            ],
-            [
-                "  * | *   ",
-                " *(o__)>* ",
-                " /'__\\ !  ",
-            ],
-            [
-                " *  |  *  ",
-                " *(O__)>* ",
-                " /'__\\ !! ",
-            ],
-            [
-                "  * | *   ",
-                " *(^__)>* ",
-                " /'__\\    ",
-                "  Wheee!  ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                "    |      ",
-                " *~___~*   ",
-                " (^_^)>    ",
-                " /'=='\\_   ",
-            ],
-            [
-                "  * | *    ",
-                " **~___~** ",
-                " *(^_^)>*  ",
-                " /'=='\\_   ",
-            ],
-            [
-                " *  |  *   ",
-                " **~___~** ",
-                " *(^O^)>*  ",
-                " /'=='\\_!! ",
-            ],
-            [
-                "  * | *    ",
-                " **~___~** ",
-                " *(^v^)>*  ",
-                " /'=='\\_   ",
-                "  Glorious!",
-            ],
-        ],
-        "splash": [
-            [
-                "    |    ",
-                "   (o_)  ",
-            ],
-            [
-                "  * | *  ",
-                " * (o_)* ",
-                "    !    ",
-            ],
-            [
-                " *  |  * ",
-                "* (OO) * ",
-                "   !!!   ",
-            ],
-            [
-                "  * | *  ",
-                " * (^o)* ",
-                "  Wheee! ",
-            ],
-        ],
-    },
-    
-    # Skateboard
-    "toy_skateboard": {
-        # YOUNG - learning to ride
-        "ride_young": [
-            [
-                " (o>)    ",
-                " [====]  ",
-                "  O  O   ",
-            ],
-            [
-                "  (o>)   ",
-                "  [====] ",
-                "   O  O  ",
-            ],
-            [
-                "   (o>)  ",
-                "   [====]",
-                "    O  O ",
-            ],
-            [
-                "    (^>)!",
-                "   [====]",
-                "    O  O ",
-                " Radical!",
-            ],
-        ],
-        # MATURE
-        "ride_mature": [
-            [
-                " (o__)>  ",
-                " [====]  ",
-                "  O  O   ",
-            ],
-            [
-                "  (o__)> ",
-                "  [====] ",
-                "   O  O  ",
-            ],
-            [
-                "   (o__)>",
-                "   [====]",
-                "    O  O ",
-            ],
-            [
-                "    (^__)>!",
-                "    [====] ",
-                "     O  O  ",
-                "  Radical! ",
-            ],
-        ],
-        # LEGENDARY - pro tricks
-        "ride_legendary": [
-            [
-                " *~___~* ",
-                " (^_^)>  ",
-                " [====]  ",
-                "  O  O   ",
-            ],
-            [
-                "  *~___~*",
-                "  (^_^)> ",
-                "  [====] ",
-                "   O  O  ",
-            ],
-            [
-                " *~___~* ",
-                " (^v^)>  ",
-                "  [====] ",
-                "   O  O  ",
-                "  FLIP!  ",
-            ],
-            [
-                "   *~___~*!",
-                "   (^v^)>  ",
-                "   [====]  ",
-                "    O  O   ",
-                "  LEGEND!  ",
-            ],
-        ],
-        "ride": [
-            [
-                "   (o_)  ",
-                "  [====] ",
-                "   O  O  ",
-            ],
-            [
-                "    (o_) ",
-                "   [====]",
-                "    O  O ",
-            ],
-            [
-                "      (o_)  ",
-                "     [====] ",
-                "      O  O  ",
-            ],
-            [
-                "        (^o) ",
-                "       [====]",
-                "        O  O ",
-                "  Radical!   ",
-            ],
-        ],
-    },
-    
-    # Boombox
-    "toy_boombox": {
-        # YOUNG - dance party
-        "music_young": [
-            [
-                " [|O|O|] ",
-                " (o>)    ",
-                " /'/)    ",
-            ],
-            [
-                " *click* ",
-                " [|O|O|] ",
-                " (o>)    ",
-            ],
-            [
-                "  # # #  ",
-                " [|O|O|] ",
-                " (^>)    ",
-            ],
-            [
-                "  # # #  ",
-                " [|O|O|] ",
-                " \\(^>)/  ",
-                "  dance! ",
-            ],
-        ],
-        # MATURE
-        "music_mature": [
-            [
-                " [|O|O|]  ",
-                " (o__)>   ",
-                " /'__\\    ",
-            ],
-            [
-                " *click*  ",
-                " [|O|O|]  ",
-                " (o__)>   ",
-            ],
-            [
-                "  # # #   ",
-                " [|O|O|]  ",
-                " (^__)>   ",
-            ],
-            [
-                "  # # #   ",
-                " [|O|O|]  ",
-                " \\(^__)>/ ",
-                "  dance!  ",
-            ],
-        ],
-        # LEGENDARY - disco fever
-        "music_legendary": [
-            [
-                " [|O|O|]  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                " *click*  ",
-                " [|O|O|]  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "  # # # # ",
-                " [|O|O|]  ",
-                " *~___~*  ",
-                " (^v^)>   ",
-            ],
-            [
-                "  # # # # ",
-                " [|O|O|]  ",
-                " *~___~*  ",
-                " \\(^v^)/  ",
-                " DISCO!   ",
-            ],
-        ],
-        "music": [
-            [
-                " [|O|O|] ",
-                "  (o_)   ",
-            ],
-            [
-                " *click* ",
-                " [|O|O|] ",
-                "  (o_)   ",
-            ],
-            [
-                " # # #   ",
-                " [|O|O|] ",
-                "  (^o)   ",
-            ],
-            [
-                " # # #   ",
-                " [|O|O|] ",
-                "  \\(^o)/ ",
-                "  dance! ",
-            ],
-        ],
-    },
-    
-    # Fountain
-    "fountain_small": {
-        # YOUNG - sip sip
-        "splash_young": [
-            [
-                "   |     ",
-                "  ~~~    ",
-                " (o>)    ",
-            ],
-            [
-                "  *|*    ",
-                "  ~~~    ",
-                "  (o>)   ",
-            ],
-            [
-                " *sip*   ",
-                "  ~~~    ",
-                " (o>)>|  ",
-            ],
-            [
-                "  Ahh!   ",
-                "  ~~~    ",
-                " (^>)    ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "    |     ",
-                "   ~~~    ",
-                " (o__)>   ",
-            ],
-            [
-                "   *|*    ",
-                "   ~~~    ",
-                "  (o__)>  ",
-            ],
-            [
-                "  *sip*   ",
-                "   ~~~    ",
-                " (o__)>>| ",
-            ],
-            [
-                "   Ahh!   ",
-                "   ~~~    ",
-                " (^__)>   ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                "    |     ",
-                "   ~~~    ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "   *|*    ",
-                "   ~~~    ",
-                " *~___~*  ",
-                "  (^_^)>  ",
-            ],
-            [
-                "  *sip*   ",
-                "   ~~~    ",
-                " *~___~*  ",
-                " (^_^)>>| ",
-            ],
-            [
-                "   Ahh!   ",
-                "   ~~~    ",
-                " *~___~*  ",
-                " (^v^)>   ",
-            ],
-        ],
-        "splash": [
-            [
-                "    |    ",
-                "   ~~~   ",
-                "  (o_)   ",
-            ],
-            [
-                "   *|*   ",
-                "   ~~~   ",
-                "   (o_)  ",
-            ],
-            [
-                "  *sip*  ",
-                "   ~~~   ",
-                "  (o_)>| ",
-            ],
-            [
-                "   Ahh!  ",
-                "   ~~~   ",
-                "  (^o)   ",
-            ],
-        ],
-    },
-    
-    # Hammock
-    "hammock": {
-        # YOUNG - cozy nap
-        "sleep_young": [
-            [
-                " \\___/   ",
-                " (o>)    ",
-            ],
-            [
-                " \\(o>)/  ",
-            ],
-            [
-                " \\(->)/  ",
-                "   zzz   ",
-            ],
-        ],
-        # MATURE
-        "sleep_mature": [
-            [
-                " \\____/  ",
-                " (o__)>  ",
-            ],
-            [
-                " \\(o__)>/",
-            ],
-            [
-                " \\(-__)>/",
-                "   zzz   ",
-            ],
-        ],
-        # LEGENDARY - luxurious rest
-        "sleep_legendary": [
-            [
-                " \\_____/ ",
-                " *~___~* ",
-                " (^_^)>  ",
-            ],
-            [
-                " \\*~___~*/",
-                "  (^_^)>  ",
-            ],
-            [
-                " \\*~___~*/",
-                "  (-v-)>  ",
-                "   ZzZz   ",
-            ],
-        ],
-        "sleep": [
-            [
-                "  \\___/  ",
-                "   (o_)  ",
-            ],
-            [
-                "  \\(o_)/ ",
-            ],
-            [
-                "  \\(-_)/ ",
-                "   zzz   ",
-            ],
-        ],
-    },
-    
-    # Tire swing
-    "tire_swing": {
-        # YOUNG
-        "play_young": [
-            [
-                "   |     ",
-                "   O     ",
-                " (o>)    ",
-            ],
-            [
-                "  \\|     ",
-                "   O     ",
-                "   (o>)  ",
-            ],
-            [
-                "   |/    ",
-                "   O     ",
-                "(o>)     ",
-            ],
-            [
-                "   |     ",
-                " (^>)    ",
-                "   O     ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "    |     ",
-                "    O     ",
-                " (o__)>   ",
-            ],
-            [
-                "   \\|     ",
-                "    O     ",
-                "    (o__)>",
-            ],
-            [
-                "    |/    ",
-                "    O     ",
-                "(o__)>    ",
-            ],
-            [
-                "    |     ",
-                " (^__)>   ",
-                "    O     ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            [
-                "    |     ",
-                "    O     ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "   \\|     ",
-                "    O     ",
-                "  *~___~* ",
-                "  (^_^)>  ",
-            ],
-            [
-                "    |/    ",
-                "    O     ",
-                "*~___~*   ",
-                "(^_^)>    ",
-            ],
-            [
-                "    |     ",
-                " *~___~*  ",
-                " (^v^)>   ",
-                "    O     ",
-            ],
-        ],
-        "play": [
-            [
-                "    |    ",
-                "    O    ",
-                "   (o_)  ",
-            ],
-            [
-                "   \\|    ",
-                "    O    ",
-                "     (o_)",
-            ],
-            [
-                "    |/   ",
-                "    O    ",
-                "(o_)     ",
-            ],
-            [
-                "    |    ",
-                "  (^o)   ",
-                "    O    ",
-            ],
-        ],
-    },
-    
-    # Frisbee
-    "frisbee": {
-        # YOUNG - catch!
-        "play_young": [
-            [
-                "      ===  ",
-                " (o>)  ->  ",
-                " /'/)      ",
-            ],
-            [
-                "        ===",
-                " (o>)   -> ",
-                " /'/)      ",
-            ],
-            [
-                "          =",
-                "   (o>)  !!",
-                "   /'/)    ",
-            ],
-            [
-                "  (^>)==   ",
-                "  /'/)     ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "       ===  ",
-                " (o__)> ->  ",
-                " /'__\\      ",
-            ],
-            [
-                "         ===",
-                " (o__)>  -> ",
-                " /'__\\      ",
-            ],
-            [
-                "           =",
-                "   (o__)> !!",
-                "   /'__\\    ",
-            ],
-            [
-                "  (^__)>===  ",
-                "  /'__\\      ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            [
-                "        === ",
-                " *~___~* -> ",
-                " (^_^)>     ",
-                " /'=='\\_    ",
-            ],
-            [
-                "          ==",
-                " *~___~*  ->",
-                " (^_^)>     ",
-                " /'=='\\_    ",
-            ],
-            [
-                "            ",
-                "  *~___~* !!",
-                "  (^_^)>=== ",
-                "  /'=='\\_   ",
-            ],
-            [
-                " *~___~*=== ",
-                " (^v^)>     ",
-                " /'=='\\_    ",
-            ],
-        ],
-        "play": [
-            [
-                "         ====    ",
-                "   __          ",
-                "  (o )>  ->    ",
-                "  /|\\|         ",
-            ],
-            [
-                "              ====",
-                "   __            ",
-                "  (o )>    ->    ",
-                "  /|\\|           ",
-            ],
-            [
-                "                 ====",
-                "      __          ",
-                "     (o )>  !!    ",
-                "     /|\\|         ",
-            ],
-            [
-                "         __  ====",
-                "        (^o)>|   ",
-                "        /|\\|     ",
-            ],
-        ],
-    },
-    
-    # Water slide
-    "water_slide": {
-        # YOUNG - whoooosh!
-        "splash_young": [
-            [
-                "    /|    ",
-                "   / |    ",
-                "  (o>)    ",
-                " /   |    ",
-            ],
-            [
-                "     /|   ",
-                "  (o>)/   ",
-                " /    |   ",
-            ],
-            [
-                "      /|  ",
-                " (^>)~~!  ",
-            ],
-            [
-                " SPLASH!  ",
-                "  ~~~~    ",
-                "  (^>)    ",
-                "  ~~~~    ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "     /|    ",
-                "    / |    ",
-                " (o__)>    ",
-                "  /   |    ",
-            ],
-            [
-                "      /|   ",
-                " (o__)>/   ",
-                "  /    |   ",
-            ],
-            [
-                "       /|  ",
-                "(^__)>~~!  ",
-            ],
-            [
-                " SPLASH!!  ",
-                "  ~~~~~    ",
-                " (^__)>    ",
-                "  ~~~~~    ",
-            ],
-        ],
-        # LEGENDARY
-        "splash_legendary": [
-            [
-                "      /|   ",
-                "     / |   ",
-                " *~___~*   ",
-                " (^_^)>    ",
-                "  /   |    ",
-            ],
-            [
-                "       /|  ",
-                " *~___~*/  ",
-                " (^_^)>    ",
-                "  /    |   ",
-            ],
-            [
-                "        /| ",
-                " *~___~*~! ",
-                " (^v^)>    ",
-            ],
-            [
-                " PERFECT!! ",
-                "  ~~~~~    ",
-                " *~___~*   ",
-                " (^v^)>    ",
-                "  ~~~~~    ",
-            ],
-        ],
-        "splash": [
-            [
-                "      /|   ",
-                "     / |   ",
-                "    (o_)   ",
-                "   /   |   ",
-            ],
-            [
-                "          ",
-                "      /|  ",
-                "  (o_)/   ",
-                " /    |   ",
-            ],
-            [
-                "          ",
-                "          ",
-                "      /|  ",
-                " (^o)~~ ! ",
-            ],
-            [
-                "  SPLASH! ",
-                "   ~~~    ",
-                "  (^o)    ",
-                "   ~~~    ",
-            ],
-        ],
-    },
-    
-    # Kite
-    "kite": {
-        # YOUNG - string flying
-        "play_young": [
-            [
-                "       <>   ",
-                "      /     ",
-                " (o>)/      ",
-                " /'/)       ",
-            ],
-            [
-                "         <> ",
-                "        /   ",
-                " (o>)  /    ",
-                " /'/)       ",
-            ],
-            [
-                "     <>     ",
-                "    /       ",
-                " (^>)       ",
-                " /'/)       ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "        <>   ",
-                "       /     ",
-                " (o__)>/     ",
-                " /'__\\       ",
-            ],
-            [
-                "          <> ",
-                "         /   ",
-                " (o__)> /    ",
-                " /'__\\       ",
-            ],
-            [
-                "      <>     ",
-                "     /       ",
-                " (^__)>      ",
-                " /'__\\       ",
-            ],
-        ],
-        # LEGENDARY
-        "play_legendary": [
-            [
-                "         <*>  ",
-                "        /     ",
-                " *~___~*/     ",
-                " (^_^)>       ",
-                " /'=='\\_      ",
-            ],
-            [
-                "           <*>",
-                "          /   ",
-                " *~___~* /    ",
-                " (^_^)>       ",
-                " /'=='\\_      ",
-            ],
-            [
-                "       <*>    ",
-                "      /       ",
-                " *~___~*      ",
-                " (^v^)>       ",
-                " /'=='\\_      ",
-            ],
-        ],
-        "play": [
-            [
-                "           <>  ",
-                "          /    ",
-                "   __    /     ",
-                "  (o )> /      ",
-            ],
-            [
-                "             <>",
-                "            /  ",
-                "   __      /   ",
-                "  (^o)>   /    ",
-            ],
-            [
-                "        <>     ",
-                "       /       ",
-                "   __ /        ",
-                "  (o )>        ",
-            ],
-        ],
-    },
-    
-    # Drums
-    "drums": {
-        # YOUNG - drum baby drum
-        "music_young": [
-            [
-                "  ! !    ",
-                "  | |    ",
-                " [===]   ",
-                " (o>)    ",
-            ],
-            [
-                " \\ /     ",
-                "  | |    ",
-                " [===]   ",
-                " (^>)    ",
-            ],
-            [
-                "  ! !    ",
-                "  | |    ",
-                " [===]   ",
-                " (o>)    ",
-            ],
-        ],
-        # MATURE
-        "music_mature": [
-            [
-                "   !  !   ",
-                "   |  |   ",
-                "  [====]  ",
-                " (o__)>   ",
-            ],
-            [
-                "  \\    /  ",
-                "   |  |   ",
-                "  [====]  ",
-                " (^__)>   ",
-            ],
-            [
-                "   !  !   ",
-                "   |  |   ",
-                "  [====]  ",
-                " (o__)>   ",
-            ],
-        ],
-        # LEGENDARY - drum master
-        "music_legendary": [
-            [
-                "   !!  !!  ",
-                "   |    |  ",
-                "  [=====]  ",
-                " *~___~*   ",
-                " (^_^)>    ",
-            ],
-            [
-                "  \\      / ",
-                "   |    |  ",
-                "  [=====]  ",
-                " *~___~*   ",
-                " (^v^)>    ",
-            ],
-            [
-                "   !!  !!  ",
-                "   |    |  ",
-                "  [=====]  ",
-                " *~___~*   ",
-                " (^_^)>    ",
-            ],
-        ],
-        "music": [
-            [
-                "   !  !   ",
-                "   |  |   ",
-                "  [====]  ",
-                "  (o_)    ",
-            ],
-            [
-                "  \\    /  ",
-                "   |  |   ",
-                "  [====]  ",
-                "  (^o)    ",
-            ],
-            [
-                "   !  !   ",
-                "   |  |   ",
-                "  [====]  ",
-                "  (o_)    ",
-            ],
-        ],
-    },
-    
-    # Telescope
-    "telescope": {
-        # YOUNG - stargazing
-        "use_young": [
-            [
-                "     * *  ",
-                "   ===>   ",
-                "  /       ",
-                " (o>)     ",
-            ],
-            [
-                "   * O *  ",
-                "   ===>   ",
-                "  /       ",
-                " (^>)     ",
-            ],
-            [
-                "    *  *  ",
-                "   ===>   ",
-                "  /       ",
-                " (o>) wow!",
-            ],
-        ],
-        # MATURE
-        "use_mature": [
-            [
-                "      * *  ",
-                "   ====>   ",
-                "   /       ",
-                " (o__)>    ",
-            ],
-            [
-                "    * O *  ",
-                "   ====>   ",
-                "   /       ",
-                " (^__)>    ",
-            ],
-            [
-                "     *  *  ",
-                "   ====>   ",
-                "   /       ",
-                " (o__)>wow!",
-            ],
-        ],
-        # LEGENDARY - cosmic discovery
-        "use_legendary": [
-            [
-                "     * * *  ",
-                "   =====>   ",
-                "   /        ",
-                " *~___~*    ",
-                " (^_^)>     ",
-            ],
-            [
-                "   * * O *  ",
-                "   =====>   ",
-                "   /        ",
-                " *~___~*    ",
-                " (^_^)>     ",
-            ],
-            [
-                "    *  * *  ",
-                "   =====>   ",
-                "   /        ",
-                " *~___~*    ",
-                " (^v^)>amaze",
-            ],
-        ],
-        "use": [
-            [
-                "          * * ",
-                "       ====>  ",
-                "      /       ",
-                "   (o_)       ",
-            ],
-            [
-                "       * O *  ",
-                "       ====>  ",
-                "      /       ",
-                "   (^o)       ",
-            ],
-            [
-                "       *  *   ",
-                "       ====>  ",
-                "      /       ",
-                "   (o_) wow!  ",
-            ],
-        ],
-    },
-    
-    # Easel/painting
-    "easel": {
-        # YOUNG - little artist
-        "use_young": [
-            [
-                " [---]    ",
-                " |   | /  ",
-                " |   |/   ",
-                " (o>)     ",
-            ],
-            [
-                " [~-~]    ",
-                " |   | /  ",
-                " |   |/   ",
-                " (o>)     ",
-            ],
-            [
-                " [:D:]    ",
-                " |   | /  ",
-                " |   |/   ",
-                " (^>)     ",
-            ],
-        ],
-        # MATURE
-        "use_mature": [
-            [
-                " [----]   ",
-                " |    | / ",
-                " |    |/  ",
-                " (o__)>   ",
-            ],
-            [
-                " [~~-~]   ",
-                " |    | / ",
-                " |    |/  ",
-                " (o__)>   ",
-            ],
-            [
-                " [:D: ]   ",
-                " |    | / ",
-                " |    |/  ",
-                " (^__)>   ",
-            ],
-        ],
-        # LEGENDARY - master painter
-        "use_legendary": [
-            [
-                " [-----]  ",
-                " |     |/ ",
-                " |     |  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                " [~*~*~]  ",
-                " |     |/ ",
-                " |     |  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                " [*ART*]  ",
-                " |     |/ ",
-                " |     |  ",
-                " *~___~*  ",
-                " (^v^)>   ",
-            ],
-        ],
-        "use": [
-            [
-                "  [---]   ",
-                "  |   | / ",
-                "  |   |/  ",
-                "   (o_)   ",
-            ],
-            [
-                "  [~-~]   ",
-                "  |   | / ",
-                "  |   |/  ",
-                "   (o_)   ",
-            ],
-            [
-                "  [:D:]   ",
-                "  |   | / ",
-                "  |   |/  ",
-                "   (^o)   ",
-            ],
-        ],
-    },
-    
-    # Mirror
-    "mirror": {
-        # YOUNG - who is that?
-        "admire_young": [
-            [
-                " [   ]    ",
-                " |(o>)|   ",
-                " [   ]    ",
-            ],
-            [
-                " [   ]    ",
-                " |(^>)|   ",
-                " [   ]    ",
-            ],
-            [
-                " [ * ]    ",
-                " |(o>)|   ",
-                " [   ]    ",
-            ],
-        ],
-        # MATURE
-        "admire_mature": [
-            [
-                " [    ]   ",
-                " |(o__)>| ",
-                " [    ]   ",
-            ],
-            [
-                " [    ]   ",
-                " |(^__)>| ",
-                " [    ]   ",
-            ],
-            [
-                " [ *  ]   ",
-                " |(o__)>| ",
-                " [    ]   ",
-            ],
-        ],
-        # LEGENDARY - royalty
-        "admire_legendary": [
-            [
-                " [     ]  ",
-                " |*~_~*|  ",
-                " |(^_^)>| ",
-                " [     ]  ",
-            ],
-            [
-                " [  *  ]  ",
-                " |*~_~*|  ",
-                " |(^v^)>| ",
-                " [     ]  ",
-            ],
-            [
-                " [ * * ]  ",
-                " |*~_~*|  ",
-                " |(^_^)>| ",
-                " [     ]  ",
-            ],
-        ],
-        "admire": [
-            [
-                "  [   ]   ",
-                "  |(o_)|  ",
-                "  [   ]   ",
-            ],
-            [
-                "  [   ]   ",
-                "  |(^o)|  ",
-                "  [   ]   ",
-            ],
-            [
-                "  [ * ]   ",
-                "  |(o_)|  ",
-                "  [   ]   ",
-            ],
-        ],
-    },
-    
-    # Throne
-    "chair_throne": {
-        # YOUNG - baby royalty
-        "sit_young": [
-            [
-                "  ___     ",
-                " |   |    ",
-                " |(o>)|   ",
-                " |___|    ",
-            ],
-            [
-                "  ___     ",
-                " |   |    ",
-                " |(^>)|   ",
-                " |___|    ",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                "  ____    ",
-                " |    |   ",
-                " |(o__)>| ",
-                " |____|   ",
-            ],
-            [
-                "  ____    ",
-                " |    |   ",
-                " |(^__)>| ",
-                " |____|   ",
-            ],
-        ],
-        # LEGENDARY - true royalty
-        "sit_legendary": [
-            [
-                "  _*_*_   ",
-                " | * * |  ",
-                " |*~_~*|  ",
-                " |(^_^)>| ",
-                " |_____|  ",
-            ],
-            [
-                "  _*_*_   ",
-                " | * * |  ",
-                " |*~_~*|  ",
-                " |(^v^)>| ",
-                " |_____|  ",
-            ],
-        ],
-        "sit": [
-            [
-                "   ___    ",
-                "  |   |   ",
-                "  |(o_)|  ",
-                "  |___|   ",
-            ],
-            [
-                "  ___     ",
-                "  |   |   ",
-                "  |(^o)|  ",
-                "  |___|   ",
-            ],
-        ],
-    },
-    
-    # Seesaw
-    "toy_seesaw": {
-        # YOUNG - needs a friend
-        "play_young": [
-            [
-                " (o>)     ",
-                " \\___/    ",
-                "   ^      ",
-            ],
-            [
-                "      ?   ",
-                " (o>)     ",
-                "  \\___/   ",
-                "    ^     ",
-            ],
-            [
-                " (->)     ",
-                "   \\___/  ",
-                "     ^    ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                " (o__)>   ",
-                "  \\___/   ",
-                "    ^     ",
-            ],
-            [
-                "       ?  ",
-                " (o__)>   ",
-                "   \\___/  ",
-                "     ^    ",
-            ],
-            [
-                " (-__)>   ",
-                "    \\___/ ",
-                "      ^   ",
-            ],
-        ],
-        # LEGENDARY - imaginary friend
-        "play_legendary": [
-            [
-                " *~___~*  ",
-                " (^_^)>   ",
-                "  \\___/   ",
-                "    ^     ",
-            ],
-            [
-                "       *  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-                "   \\___/  ",
-                "     ^    ",
-            ],
-            [
-                " *~___~*  ",
-                " (^v^)>   ",
-                "    \\___/ ",
-                "      ^   ",
-            ],
-        ],
-        "play": [
-            [
-                "  (o_)    ",
-                "  \\___/   ",
-                "    ^     ",
-            ],
-            [
-                "       ?  ",
-                "  (o_)    ",
-                "   \\___/  ",
-                "     ^    ",
-            ],
-        ],
-    },
-    
-    # Fountain grand
-    "fountain_grand": {
-        # YOUNG - awestruck
-        "admire_young": [
-            [
-                "   ~~~    ",
-                "  |   |   ",
-                "  |   |   ",
-                " (o>) wow!",
-            ],
-            [
-                "  ~~~~~   ",
-                "  |   |   ",
-                "  |   |   ",
-                " (^>) ooh!",
-            ],
-            [
-                "   ~~~    ",
-                "  |   |   ",
-                " (o>)     ",
-                "  ~~~~    ",
-            ],
-        ],
-        # MATURE
-        "admire_mature": [
-            [
-                "    ~~~    ",
-                "   |   |   ",
-                "   |   |   ",
-                " (o__)> wow",
-            ],
-            [
-                "   ~~~~~   ",
-                "   |   |   ",
-                "   |   |   ",
-                " (^__)> ooh",
-            ],
-            [
-                "    ~~~    ",
-                "   |   |   ",
-                " (o__)>    ",
-                "   ~~~~    ",
-            ],
-        ],
-        # LEGENDARY - royalty admiring
-        "admire_legendary": [
-            [
-                "     ~~~    ",
-                "    |   |   ",
-                "    |   |   ",
-                " *~___~*    ",
-                " (^_^)> ahh!",
-            ],
-            [
-                "    ~~~~~   ",
-                "    |   |   ",
-                "    |   |   ",
-                " *~___~*    ",
-                " (^v^)> ooh!",
-            ],
-            [
-                "     ~~~    ",
-                "    |   |   ",
-                " *~___~*    ",
-                " (^_^)>     ",
-                "    ~~~~    ",
-            ],
-        ],
-        "admire": [
-            [
-                "    ~~~    ",
-                "   |   |   ",
-                "   |   |   ",
-                "  (o_) wow!",
-            ],
-            [
-                "   ~~~~~   ",
-                "   |   |   ",
-                "   |   |   ",
-                "  (^o) ooh!",
-            ],
-        ],
-    },
-    
-    # Pond
-    "pond": {
-        # YOUNG - home!
-        "splash_young": [
-            [
-                " ~~~~~    ",
-                " ~(o>)~   ",
-                " ~~~~~    ",
-            ],
-            [
-                " ~~~~~~   ",
-                " ~~(^>)~~ ",
-                " ~~~~~~   ",
-            ],
-            [
-                "  ~~~~~   ",
-                "  (o>)~~  ",
-                "  ~~~~~   ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                " ~~~~~~   ",
-                " ~(o__)>~ ",
-                " ~~~~~~   ",
-            ],
-            [
-                " ~~~~~~~  ",
-                " ~~(^__)>~",
-                " ~~~~~~~  ",
-            ],
-            [
-                "  ~~~~~~  ",
-                " (o__)>~~ ",
-                "  ~~~~~~  ",
-            ],
-        ],
-        # LEGENDARY - majestic float
-        "splash_legendary": [
-            [
-                " ~~~~~~~  ",
-                " *~___~*  ",
-                " ~(^_^)>~ ",
-                " ~~~~~~~  ",
-            ],
-            [
-                " ~~~~~~~~ ",
-                " ~*~___~* ",
-                " ~~(^v^)>~",
-                " ~~~~~~~~ ",
-            ],
-            [
-                "  ~~~~~~~ ",
-                " *~___~*  ",
-                " (^_^)>~~ ",
-                "  ~~~~~~~ ",
-            ],
-        ],
-        "splash": [
-            [
-                " ~~~~~~   ",
-                " ~(o_)~~  ",
-                " ~~~~~~   ",
-            ],
-            [
-                "  ~~~~~~  ",
-                " ~~(^o)~~ ",
-                "  ~~~~~~  ",
-            ],
-        ],
-    },
-    
-    # Waterfall
-    "waterfall": {
-        # YOUNG - intense!
-        "splash_young": [
-            [
-                " ||||     ",
-                " ||||     ",
-                " (o>)     ",
-            ],
-            [
-                " ||||     ",
-                " |(^>)|   ",
-                " ||||     ",
-            ],
-            [
-                " ||||     ",
-                " ||||     ",
-                " (->)~zen ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                " |||||    ",
-                " |||||    ",
-                " (o__)>   ",
-            ],
-            [
-                " |||||    ",
-                " |(^__)>| ",
-                " |||||    ",
-            ],
-            [
-                " |||||    ",
-                " |||||    ",
-                " (-__)>zen",
-            ],
-        ],
-        # LEGENDARY - meditation master
-        "splash_legendary": [
-            [
-                "  |||||   ",
-                "  |||||   ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "  |||||   ",
-                " |*~_~*|  ",
-                " |(^_^)>| ",
-                "  |||||   ",
-            ],
-            [
-                "  |||||   ",
-                "  |||||   ",
-                " *~___~*  ",
-                " (-v-)>om ",
-            ],
-        ],
-        "splash": [
-            [
-                " |||||    ",
-                " |||||    ",
-                "  (o_)    ",
-            ],
-            [
-                " |||||    ",
-                " |(^o)|   ",
-                " |||||    ",
-            ],
-        ],
-    },
-    
-    # Birdbath
-    "birdbath": {
-        # YOUNG - splashy bath
-        "splash_young": [
-            [
-                "  ~~~     ",
-                " (---)    ",
-                " (o>)     ",
-            ],
-            [
-                " ~~~~~    ",
-                " (---)    ",
-                "  (^>)    ",
-            ],
-            [
-                "  ~~~     ",
-                " (---)    ",
-                " (o>) *   ",
-            ],
-        ],
-        # MATURE
-        "splash_mature": [
-            [
-                "  ~~~~    ",
-                " (----)   ",
-                " (o__)>   ",
-            ],
-            [
-                " ~~~~~~   ",
-                " (----)   ",
-                "  (^__)>  ",
-            ],
-            [
-                "  ~~~~    ",
-                " (----)   ",
-                " (o__)> * ",
-            ],
-        ],
-        # LEGENDARY - royal bath
-        "splash_legendary": [
-            [
-                "   ~~~~   ",
-                "  (----)  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "  ~~~~~~  ",
-                "  (----)  ",
-                " *~___~*  ",
-                "  (^v^)>  ",
-            ],
-            [
-                "   ~~~~   ",
-                "  (----)  ",
-                " *~___~* *",
-                " (^_^)>   ",
-            ],
-        ],
-        "splash": [
-            [
-                "  ~~~~    ",
-                " (----)   ",
-                "  (o_)    ",
-            ],
-            [
-                " ~~~~~~   ",
-                " (----)   ",
-                "  (^o) *  ",
-            ],
-        ],
-    },
-    
-    # Fancy chair
-    "chair_fancy": {
-        # YOUNG - feeling fancy
-        "sit_young": [
-            [
-                " [~~~]    ",
-                " |(o>)|   ",
-                " [___]    ",
-            ],
-            [
-                " [~~~]    ",
-                " |(^>)|   ",
-                " [___]    ",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                " [~~~~]   ",
-                " |(o__)>| ",
-                " [____]   ",
-            ],
-            [
-                " [~~~~]   ",
-                " |(^__)>| ",
-                " [____]   ",
-            ],
-        ],
-        # LEGENDARY
-        "sit_legendary": [
-            [
-                " [~*~*~]  ",
-                " |*~_~*|  ",
-                " |(^_^)>| ",
-                " [_____]  ",
-            ],
-            [
-                " [~*~*~]  ",
-                " |*~_~*|  ",
-                " |(^v^)>| ",
-                " [_____]  ",
-            ],
-        ],
-        "sit": [
-            [
-                " [~~~~]   ",
-                " |(o_)|   ",
-                " [____]   ",
-            ],
-            [
-                " [~~~~]   ",
-                " |(^o)|   ",
-                " [____]   ",
-            ],
-        ],
-    },
-    
-    # Disco ball
-    "disco_ball": {
-        # YOUNG - baby disco
-        "play_young": [
-            [
-                "    *     ",
-                "   (*)    ",
-                "    *     ",
-                " (o>) ~   ",
-            ],
-            [
-                "   *      ",
-                "   (*)    ",
-                "     *    ",
-                "  (^>) ~~ ",
-            ],
-            [
-                "    * *   ",
-                "   (*)    ",
-                "  *       ",
-                " ~(o>)~   ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "     *     ",
-                "    (*)    ",
-                "     *     ",
-                " (o__)> ~  ",
-            ],
-            [
-                "    *      ",
-                "    (*)    ",
-                "      *    ",
-                "  (^__)> ~~",
-            ],
-            [
-                "     * *   ",
-                "    (*)    ",
-                "   *       ",
-                " ~(o__)>~  ",
-            ],
-        ],
-        # LEGENDARY - dance king
-        "play_legendary": [
-            [
-                "      *    ",
-                "     (*)   ",
-                "      *    ",
-                " *~___~* ~ ",
-                " (^_^)>    ",
-            ],
-            [
-                "     *     ",
-                "     (*)   ",
-                "       *   ",
-                " *~___~* ~~",
-                "  (^v^)>   ",
-            ],
-            [
-                "      * *  ",
-                "     (*)   ",
-                "    *      ",
-                " ~*~___~*~ ",
-                " ~(^_^)>~  ",
-            ],
-        ],
-        "play": [
-            [
-                "    *     ",
-                "   (*)    ",
-                "    *     ",
-                "  (o_) ~  ",
-            ],
-            [
-                "   *      ",
-                "   (*)    ",
-                "     *    ",
-                " ~(^o)~~  ",
-            ],
-        ],
-    },
-    
-    # Campfire
-    "campfire": {
-        # YOUNG - warming up
-        "sit_young": [
-            [
-                "   *      ",
-                "  ***     ",
-                " *****    ",
-                " (o>) ahh ",
-            ],
-            [
-                "    *     ",
-                "  * * *   ",
-                " *******  ",
-                " (^>) cozy",
-            ],
-            [
-                "   * *    ",
-                "  *****   ",
-                " * * * *  ",
-                " (->) zzz ",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                "    *      ",
-                "   ***     ",
-                "  *****    ",
-                " (o__)> ahh",
-            ],
-            [
-                "     *     ",
-                "   * * *   ",
-                "  *******  ",
-                " (^__)>cozy",
-            ],
-            [
-                "    * *    ",
-                "   *****   ",
-                "  * * * *  ",
-                " (-__)> zzz",
-            ],
-        ],
-        # LEGENDARY - fireside king
-        "sit_legendary": [
-            [
-                "     *     ",
-                "    ***    ",
-                "   *****   ",
-                " *~___~*   ",
-                " (^_^)> ahh",
-            ],
-            [
-                "      *    ",
-                "    * * *  ",
-                "   *******  ",
-                " *~___~*   ",
-                " (^v^)>cozy",
-            ],
-            [
-                "     * *   ",
-                "    *****  ",
-                "   * * * * ",
-                " *~___~*   ",
-                " (-v-)> zzz",
-            ],
-        ],
-        "sit": [
-            [
-                "    *     ",
-                "   ***    ",
-                "  *****   ",
-                "  (o_) ahh",
-            ],
-            [
-                "     *    ",
-                "   * * *  ",
-                "  *******  ",
-                "  (^o)cozy",
-            ],
-        ],
-    },
-    
-    # Toy car
-    "toy_car": {
-        # YOUNG - vroom!
-        "play_young": [
-            [
-                " (o>)     ",
-                " [__]o o  ",
-            ],
-            [
-                "  (o>)    ",
-                "  [__]o o ",
-            ],
-            [
-                "   (^>)   ",
-                "   [__]o o",
-                "     vroom",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                " (o__)>   ",
-                " [___]o o ",
-            ],
-            [
-                "  (o__)>  ",
-                "  [___]o o",
-            ],
-            [
-                "   (^__)> ",
-                "   [___]oo",
-                "    vroom!",
-            ],
-        ],
-        # LEGENDARY - race champion
-        "play_legendary": [
-            [
-                " *~___~*  ",
-                " (^_^)>   ",
-                " [____]o o",
-            ],
-            [
-                "  *~___~* ",
-                "  (^_^)>  ",
-                "  [____]oo",
-            ],
-            [
-                "   *~___~*",
-                "   (^v^)> ",
-                "  [____]oo",
-                "   ZOOM!  ",
-            ],
-        ],
-        "play": [
-            [
-                "  (o_)    ",
-                " [___]o o ",
-            ],
-            [
-                "   (^o)   ",
-                "  [___]o o",
-                "    vroom ",
-            ],
-        ],
-    },
-    
-    # Yo-yo
-    "yo_yo": {
-        # YOUNG - learning
-        "play_young": [
-            [
-                " (o>)     ",
-                "  |       ",
-                "  O       ",
-            ],
-            [
-                " (o>)     ",
-                "  |       ",
-                "  |       ",
-                "  O       ",
-            ],
-            [
-                " (^>)     ",
-                "  O       ",
-            ],
-            [
-                " (->)     ",
-                "  {tangled",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                " (o__)>   ",
-                "   |      ",
-                "   O      ",
-            ],
-            [
-                " (o__)>   ",
-                "   |      ",
-                "   |      ",
-                "   O      ",
-            ],
-            [
-                " (^__)>   ",
-                "   O      ",
-            ],
-            [
-                " (-__)>   ",
-                "  {tangled",
-            ],
-        ],
-        # LEGENDARY - yo-yo master
-        "play_legendary": [
-            [
-                " *~___~*  ",
-                " (^_^)>   ",
-                "    |     ",
-                "    O     ",
-            ],
-            [
-                " *~___~*  ",
-                " (^_^)>   ",
-                "    |     ",
-                "    |     ",
-                "    O spin",
-            ],
-            [
-                " *~___~*  ",
-                " (^v^)>   ",
-                "    O     ",
-                "   trick! ",
-            ],
-        ],
-        "play": [
-            [
-                "  (o_)    ",
-                "   |      ",
-                "   O      ",
-            ],
-            [
-                "  (^o)    ",
-                "   O      ",
-                " tangled! ",
-            ],
-        ],
-    },
-    
-    # Jump rope
-    "jump_rope": {
-        # YOUNG - hoppy!
-        "play_young": [
-            [
-                "  /   \\   ",
-                " (o>)     ",
-                "  /'/)    ",
-            ],
-            [
-                " /     \\  ",
-                "   (^>)   ",
-                "   /'/)   ",
-            ],
-            [
-                " (   )    ",
-                "  (o>)    ",
-                "  /'/)    ",
-            ],
-            [
-                "  \\   /   ",
-                "   (^>)!  ",
-                "   /'/)   ",
-            ],
-        ],
-        # MATURE
-        "play_mature": [
-            [
-                "  /    \\  ",
-                " (o__)>   ",
-                " /'__\\    ",
-            ],
-            [
-                " /      \\ ",
-                "   (^__)> ",
-                "   /'__\\  ",
-            ],
-            [
-                " (    )   ",
-                "  (o__)>  ",
-                "  /'__\\   ",
-            ],
-            [
-                "  \\    /  ",
-                "   (^__)>!",
-                "   /'__\\  ",
-            ],
-        ],
-        # LEGENDARY - skip king
-        "play_legendary": [
-            [
-                "  /     \\ ",
-                " *~___~*  ",
-                " (^_^)>   ",
-                " /'=='\\_  ",
-            ],
-            [
-                " /       \\",
-                "  *~___~* ",
-                "  (^v^)>  ",
-                "  /'=='\\_",
-            ],
-            [
-                " (     )  ",
-                " *~___~*  ",
-                " (^_^)>   ",
-                " /'=='\\_  ",
-            ],
-            [
-                "  \\     / ",
-                " *~___~*! ",
-                " (^v^)>   ",
-                " /'=='\\_  ",
-            ],
-        ],
-        "play": [
-            [
-                "  /   \\   ",
-                "  (o_)    ",
-            ],
-            [
-                " /     \\  ",
-                "   (^o)   ",
-            ],
-            [
-                " (   )    ",
-                "  (o_)    ",
-            ],
-        ],
-    },
-    
-    # Couch
-    "couch": {
-        # YOUNG - sink in
-        "sit_young": [
-            [
-                " [=====]  ",
-                " |(o>) |  ",
-                " [_____]  ",
-            ],
-            [
-                " [=====]  ",
-                " | (^>)|  ",
-                " [_____]  ",
-            ],
-            [
-                " [=====]  ",
-                " |(->)zzz|",
-                " [_____]  ",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                " [======] ",
-                " |(o__)>| ",
-                " [______] ",
-            ],
-            [
-                " [======] ",
-                " | (^__)>|",
-                " [______] ",
-            ],
-            [
-                " [======] ",
-                " |(-__)>zz",
-                " [______] ",
-            ],
-        ],
-        # LEGENDARY - royal lounging
-        "sit_legendary": [
-            [
-                " [=======]",
-                " |*~___~*|",
-                " |(^_^)> |",
-                " [_______]",
-            ],
-            [
-                " [=======]",
-                " | *~___~*",
-                " | (^v^)>|",
-                " [_______]",
-            ],
-            [
-                " [=======]",
-                " |*~___~* ",
-                " |(-v-)>zz",
-                " [_______]",
-            ],
-        ],
-        "sit": [
-            [
-                " [======] ",
-                " | (o_) | ",
-                " [______] ",
-            ],
-            [
-                " [======] ",
-                " |(^o)zzz|",
-                " [______] ",
-            ],
-        ],
-    },
-    
-    # Bed small
-    "bed_small": {
-        # YOUNG - cozy curl
-        "sleep_young": [
-            [
-                " [----]   ",
-                " |(o>)|   ",
-                " [____]   ",
-            ],
-            [
-                " [----]   ",
-                " |(->) zzz",
-                " [____]   ",
-            ],
-        ],
-        # MATURE
-        "sleep_mature": [
-            [
-                " [-----]  ",
-                " |(o__)>| ",
-                " [_____]  ",
-            ],
-            [
-                " [-----]  ",
-                " |(-__)>zz",
-                " [_____]  ",
-            ],
-        ],
-        # LEGENDARY
-        "sleep_legendary": [
-            [
-                " [------] ",
-                " |*~___~*|",
-                " |(^_^)> |",
-                " [______] ",
-            ],
-            [
-                " [------] ",
-                " |*~___~* ",
-                " |(-v-)>Zz",
-                " [______] ",
-            ],
-        ],
-        "sleep": [
-            [
-                " [-----]  ",
-                " | (o_) | ",
-                " [_____]  ",
-            ],
-            [
-                " [-----]  ",
-                " |(-_)zzz|",
-                " [_____]  ",
-            ],
-        ],
-    },
-    
-    # Bed king
-    "bed_king": {
-        # YOUNG - so much room!
-        "sleep_young": [
-            [
-                " [========]",
-                " |(o>)    |",
-                " [________]",
-            ],
-            [
-                " [========]",
-                " |   (o>) |",
-                " [________]",
-            ],
-            [
-                " [========]",
-                " | (->)zzz|",
-                " [________]",
-            ],
-        ],
-        # MATURE
-        "sleep_mature": [
-            [
-                " [=========]",
-                " |(o__)>   |",
-                " [_________]",
-            ],
-            [
-                " [=========]",
-                " |   (o__)>|",
-                " [_________]",
-            ],
-            [
-                " [=========]",
-                " | (-__)>Zz|",
-                " [_________]",
-            ],
-        ],
-        # LEGENDARY - royal slumber
-        "sleep_legendary": [
-            [
-                " [==========]",
-                " |*~___~*   |",
-                " |(^_^)>    |",
-                " [__________]",
-            ],
-            [
-                " [==========]",
-                " |    *~___~*",
-                " |    (^v^)>|",
-                " [__________]",
-            ],
-            [
-                " [==========]",
-                " |  *~___~* |",
-                " |  (-v-)>Zz|",
-                " [__________]",
-            ],
-        ],
-        "sleep": [
-            [
-                " [=========]",
-                " |  (o_)   |",
-                " [_________]",
-            ],
-            [
-                " [=========]",
-                " | (-_) zzz|",
-                " [_________]",
-            ],
-        ],
-    },
-    
-    # Bookshelf
-    "bookshelf": {
-        # YOUNG - picture books!
-        "use_young": [
-            [
-                " [|||]    ",
-                " [|||]    ",
-                " (o>)?    ",
-            ],
-            [
-                " [|||]    ",
-                " [| |]    ",
-                " (o>)[=]  ",
-            ],
-            [
-                " [|||]    ",
-                " [|||]    ",
-                " (^>)[=]! ",
-            ],
-        ],
-        # MATURE
-        "use_mature": [
-            [
-                " [||||]   ",
-                " [||||]   ",
-                " (o__)>?  ",
-            ],
-            [
-                " [||||]   ",
-                " [|  |]   ",
-                " (o__)>[=]",
-            ],
-            [
-                " [||||]   ",
-                " [||||]   ",
-                " (^__)>[=]",
-            ],
-        ],
-        # LEGENDARY - scholar
-        "use_legendary": [
-            [
-                " [|||||]  ",
-                " [|||||]  ",
-                " *~___~*? ",
-                " (^_^)>   ",
-            ],
-            [
-                " [|||||]  ",
-                " [|   |]  ",
-                " *~___~*  ",
-                " (^_^)>[=]",
-            ],
-            [
-                " [|||||]  ",
-                " [|||||]  ",
-                " *~___~*  ",
-                " (^v^)>[=]",
-            ],
-        ],
-        "use": [
-            [
-                " [||||]   ",
-                " [||||]   ",
-                "  (o_) ?  ",
-            ],
-            [
-                " [||||]   ",
-                " [||||]   ",
-                "  (^o)[=] ",
-            ],
-        ],
-    },
-    
-    # Floor lamp
-    "lamp_floor": {
-        # YOUNG - ooh light!
-        "use_young": [
-            [
-                "  ___     ",
-                "  | |     ",
-                "  | |     ",
-                " (o>)     ",
-            ],
-            [
-                "  _*_     ",
-                "  |*|     ",
-                "  | |     ",
-                " (^>)     ",
-            ],
-            [
-                " ***** glow",
-                "  |*|     ",
-                "  | |     ",
-                " (o>) ahh ",
-            ],
-        ],
-        # MATURE
-        "use_mature": [
-            [
-                "   ___    ",
-                "   | |    ",
-                "   | |    ",
-                " (o__)>   ",
-            ],
-            [
-                "   _*_    ",
-                "   |*|    ",
-                "   | |    ",
-                " (^__)>   ",
-            ],
-            [
-                " ****** glow",
-                "   |*|    ",
-                "   | |    ",
-                " (o__)>ahh",
-            ],
-        ],
-        # LEGENDARY
-        "use_legendary": [
-            [
-                "    ___   ",
-                "    | |   ",
-                "    | |   ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "    _*_   ",
-                "    |*|   ",
-                "    | |   ",
-                " *~___~*  ",
-                " (^v^)>   ",
-            ],
-            [
-                " ******* glow",
-                "    |*|   ",
-                "    | |   ",
-                " *~___~*  ",
-                " (^_^)>ahh",
-            ],
-        ],
-        "use": [
-            [
-                "   ___    ",
-                "   | |    ",
-                "   | |    ",
-                "  (o_)    ",
-            ],
-            [
-                "   _*_    ",
-                "   |*|    ",
-                "   | |    ",
-                "  (^o) ahh",
-            ],
-        ],
-    },
-    
-    # Small table
-    "table_small": {
-        # YOUNG - proper sitting
-        "sit_young": [
-            [
-                " [___]    ",
-                "   |      ",
-                " (o>)     ",
-            ],
-            [
-                " [___]    ",
-                "   |      ",
-                " (^>)*sip*",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                " [____]   ",
-                "    |     ",
-                " (o__)>   ",
-            ],
-            [
-                " [____]   ",
-                "    |     ",
-                " (^__)>sip",
-            ],
-        ],
-        # LEGENDARY - tea time
-        "sit_legendary": [
-            [
-                "  [____]  ",
-                "     |    ",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                "  [____]  ",
-                "     |    ",
-                " *~___~*  ",
-                " (^v^)>sip",
-            ],
-        ],
-        "sit": [
-            [
-                " [____]   ",
-                "   |      ",
-                "  (o_)    ",
-            ],
-            [
-                " [____]   ",
-                "   |      ",
-                "  (^o)*sip",
-            ],
-        ],
-    },
-    
-    # Desk
-    "desk": {
-        # YOUNG - working hard
-        "sit_young": [
-            [
-                " [=====]  ",
-                " | . . |  ",
-                " (o>)     ",
-            ],
-            [
-                " [=====]  ",
-                " | . . |  ",
-                " (^>)work!",
-            ],
-        ],
-        # MATURE
-        "sit_mature": [
-            [
-                " [======] ",
-                " | . . |  ",
-                " (o__)>   ",
-            ],
-            [
-                " [======] ",
-                " | . . |  ",
-                " (^__)>!! ",
-            ],
-        ],
-        # LEGENDARY - CEO duck
-        "sit_legendary": [
-            [
-                " [=======]",
-                " |  . .  |",
-                " *~___~*  ",
-                " (^_^)>   ",
-            ],
-            [
-                " [=======]",
-                " |  . .  |",
-                " *~___~*  ",
-                " (^v^)>CEO",
-            ],
-        ],
-        "sit": [
-            [
-                " [======] ",
-                " | . . |  ",
-                "  (o_)    ",
-            ],
-            [
-                " [======] ",
-                " | . . |  ",
-                "  (^o)work",
-            ],
-        ],
-    },
-}
+
+def _animations():
+    """Animation frames by item id, from their content pack if built."""
+    global _interaction_animations
+    if _interaction_animations is None:
+        _interaction_animations = content_table(
+            "world.interaction_animation_data", "INTERACTION_ANIMATIONS")
+    return _interaction_animations
+
+
+def __getattr__(name: str):
+    # INTERACTION_ANIMATIONS used to be defined here; keep the name importable
+    if name == "INTERACTION_ANIMATIONS":
+        return _animations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Interaction definitions for each item type
@@ -4938,7 +743,7 @@ def execute_interaction(item_id: str, duck_state: Dict = None) -> Optional[Inter
         message = random.choice(messages)
     
     # Get animation frames with life-stage support
-    animation_data = INTERACTION_ANIMATIONS.get(item_id, {})
+    animation_data = _animations().get(item_id, {})
     interaction_type = interaction.get("type", InteractionType.USE)
     animation_key = interaction_type.value
     
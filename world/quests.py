@@ -520,6 +520,8 @@ class QuestSystem:
         self.choices_history: Dict[str, List[str]] = {}
         self.earned_titles: List[str] = []
         self.quest_chain_progress: Dict[str, int] = {}
+        # Bumped on every change to saved state; lets autosave skip idle quests
+        self.save_revision: int = 0
     
     def get_available_quests(self, player_level: int = 1) -> List[Quest]:
         """Get list of quests available to start."""
@@ -574,6 +576,7 @@ class QuestSystem:
         )
         
         self.active_quests[quest_id] = active
+        self.save_revision += 1
         
         # Get first step dialogue
         first_step = next((s for s in quest.steps if s.step_id == 1), None)
@@ -661,6 +664,7 @@ class QuestSystem:
                 # Update progress (tracked in active quest, NOT on shared template)
                 new_progress = min(current_progress + amount, objective.required_amount)
                 active.step_progress[obj_key] = new_progress
+                self.save_revision += 1
                 
                 # Check completion
                 completed = new_progress >= objective.required_amount
@@ -698,6 +702,7 @@ class QuestSystem:
         
         next_step = current_step.choices[choice]
         active.choices_made.append(choice)
+        self.save_revision += 1
         
         # Track in history
         if quest_id not in self.choices_history:
@@ -763,6 +768,7 @@ class QuestSystem:
         # Step complete!
         if current_step.next_step_id:
             active.current_step = current_step.next_step_id
+            self.save_revision += 1
             if current_step.rewards:
                 return (quest_id, current_step.rewards)
             return None
@@ -780,6 +786,7 @@ class QuestSystem:
             return None
         
         active.completed = True
+        self.save_revision += 1
         
         quest = QUESTS.get(quest_id)
         if not quest: